@@ -8,10 +8,13 @@ the exceptions.yaml file, reducing false positives.
 
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
 # This now correctly inherits from your main rules.base_rule
 from rules.base_rule import BaseRule
+from nlp_processing import cached_nlp
 
 # Local imports for ambiguity-specific types
 from .types import (
@@ -20,6 +23,10 @@ from .types import (
     ResolutionStrategy, AmbiguityConfig
 )
 
+# Sentence-parallel detection (0 or 1 workers keeps detection in-process)
+SENTENCE_WORKERS = int(os.getenv('AMBIGUITY_SENTENCE_WORKERS', '0'))
+PARALLEL_MIN_SENTENCES = int(os.getenv('AMBIGUITY_PARALLEL_MIN_SENTENCES', '8'))
+
 
 class BaseAmbiguityRule(BaseRule):
     """
@@ -27,6 +34,10 @@ class BaseAmbiguityRule(BaseRule):
     detectors and now provides them with access to the central exception framework.
     """
     
+    # Shared by all ambiguity rules; detectors are stateless between sentences
+    _sentence_executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
     def __init__(self):
         # Initialize the parent BaseRule, which loads exceptions.yaml
         super().__init__()
@@ -69,6 +80,11 @@ class BaseAmbiguityRule(BaseRule):
         """
         Analyze text for ambiguity by running all enabled detectors.
         
+        Every sentence is parsed once (in one batched ``nlp.pipe`` call) and the
+        Doc is shared by all detectors, including lookups of neighbouring
+        sentences. With ``AMBIGUITY_SENTENCE_WORKERS`` set, sentences are
+        examined concurrently; errors are still returned in sentence order.
+        
         Args:
             text: Full text being analyzed
             sentences: List of sentences (either strings or SpaCy Doc objects)
@@ -84,42 +100,65 @@ class BaseAmbiguityRule(BaseRule):
         errors = []
         
         try:
-            for i, sentence in enumerate(sentences):
-                # Handle both string and SpaCy Doc inputs for compatibility
-                if hasattr(sentence, 'text'):
-                    # SpaCy Doc object
-                    sentence_text = sentence.text
-                else:
-                    # String
-                    sentence_text = sentence
-                
-                # Skip empty sentences
-                if not sentence_text or not sentence_text.strip():
-                    continue
-                
-                # Convert sentences to string format for context creation
-                sentences_text = []
-                for s in sentences:
-                    if hasattr(s, 'text'):
-                        sentences_text.append(s.text)
-                    else:
-                        sentences_text.append(str(s))
-                
+            # Handle both string and SpaCy Doc inputs for compatibility
+            sentences_text = [s.text if hasattr(s, 'text') else str(s) for s in sentences]
+            detectors = [detector for detector in self.detectors.values()
+                         if detector and detector.is_enabled()]
+            
+            parser = cached_nlp(nlp, max_entries=max(256, len(sentences_text)))
+            # Skip empty sentences
+            indices = [i for i, sentence_text in enumerate(sentences_text)
+                       if sentence_text and sentence_text.strip()]
+            if not detectors or not indices:
+                return errors
+            # Docs evicted from a small shared cache come back as None and are parsed on demand
+            docs = parser.prime([sentences_text[i] for i in indices])
+            
+            sentence_contexts = []
+            for i, doc in zip(indices, docs):
                 sentence_context = self._create_sentence_context(
-                    sentence_text, i, sentences_text, text, context
+                    sentences_text[i], i, sentences_text, text, context
                 )
-                
-                for detector_type, detector in self.detectors.items():
-                    if detector and detector.is_enabled():
-                        ambiguity_detections = detector.detect(sentence_context, nlp)
-                        for detection in ambiguity_detections:
-                            errors.append(detection.to_error_dict())
+                sentence_context.doc = doc
+                sentence_contexts.append(sentence_context)
+            
+            executor = self._get_sentence_executor(len(sentence_contexts))
+            if executor is None:
+                for sentence_context in sentence_contexts:
+                    errors.extend(self._detect_in_sentence(detectors, sentence_context, parser))
+            else:
+                futures = [executor.submit(self._detect_in_sentence, detectors, sentence_context, parser)
+                           for sentence_context in sentence_contexts]
+                for future in futures:
+                    errors.extend(future.result())
             
         except Exception as e:
             print(f"Error in ambiguity analysis: {e}")
         
         return errors
     
+    @staticmethod
+    def _detect_in_sentence(detectors: List['AmbiguityDetector'], sentence_context: AmbiguityContext,
+                            nlp) -> List[Dict[str, Any]]:
+        """Run every detector over one sentence."""
+        errors = []
+        for detector in detectors:
+            for detection in detector.detect(sentence_context, nlp):
+                errors.append(detection.to_error_dict())
+        return errors
+    
+    @classmethod
+    def _get_sentence_executor(cls, sentence_count: int) -> Optional[ThreadPoolExecutor]:
+        """Shared sentence worker pool, or None when sentences should run in-process."""
+        if SENTENCE_WORKERS <= 1 or sentence_count < PARALLEL_MIN_SENTENCES:
+            return None
+        with cls._executor_lock:
+            if cls._sentence_executor is None:
+                cls._sentence_executor = ThreadPoolExecutor(
+                    max_workers=SENTENCE_WORKERS, thread_name_prefix='ambiguity-sentences'
+                )
+            return cls._sentence_executor
+    
     # (Helper methods like _create_sentence_context, add_detector, etc. remain the same)
     # ... Omitted for brevity ...
 
@@ -157,20 +196,20 @@ class AmbiguityDetector:
         """Detect ambiguities in the given context."""
         raise NotImplementedError("Subclasses must implement detect method")
 
+    def _parse_sentence(self, context: AmbiguityContext, nlp):
+        """Return the shared parse of the context sentence, parsing only if none was provided."""
+        if context.doc is not None:
+            return context.doc
+        return nlp(context.sentence)
+
     def _is_excepted(self, text_span: str) -> bool:
         """
         Convenience method to check for exceptions using the parent rule's logic.
         This is the key integration point for the exception framework.
         """
-        # We need to set the parent's rule_type temporarily to check the correct
-        # section in exceptions.yaml. This is a bit of a workaround but effective.
-        # A more advanced solution would be to pass the subtype to the parent.
-        original_type = self.parent_rule.rule_type
         # For now, we assume all ambiguity subtypes can check against a 'claims' or global list
         # This can be made more specific if needed.
-        self.parent_rule.rule_type = 'claims' # Check against the 'claims' exception list
-        is_claim_exception = self.parent_rule._is_excepted(text_span)
-        self.parent_rule.rule_type = original_type # Restore original type
+        is_claim_exception = self.parent_rule._is_excepted(text_span, rule_type='claims')
         
         # Also check global exceptions
         is_global_exception = self.parent_rule._is_excepted(text_span)
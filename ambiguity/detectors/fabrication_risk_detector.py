@@ -102,7 +102,7 @@ class FabricationRiskDetector(AmbiguityDetector):
             return detections
         
         try:
-            doc = nlp(context.sentence)
+            doc = self._parse_sentence(context, nlp)
             
             # Detect various types of fabrication risks
             vague_actions = self._detect_vague_actions(doc, context)
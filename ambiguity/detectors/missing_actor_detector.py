@@ -189,7 +189,7 @@ class MissingActorDetector(AmbiguityDetector):
         
         try:
             # Parse the sentence
-            doc = nlp(context.sentence)
+            doc = self._parse_sentence(context, nlp)
             
             # Use self-contained analyzer to find passive constructions
             passive_constructions = self.passive_analyzer.find_passive_constructions(doc)
@@ -87,7 +87,7 @@ class PronounAmbiguityDetector(AmbiguityDetector):
             return detections
         
         try:
-            doc = nlp(context.sentence)
+            doc = self._parse_sentence(context, nlp)
             for token in doc:
                 if self._is_ambiguous_pronoun(token):
                     # Apply linguistic anchors to prevent false positives
@@ -686,7 +686,7 @@ class PronounAmbiguityDetector(AmbiguityDetector):
     def _create_pronoun_detection(self, pronoun_token, evidence_score: float, context: AmbiguityContext, nlp) -> AmbiguityDetection:
         """Create pronoun ambiguity detection with evidence-based confidence."""
         # Get referent analysis for detection details
-        ambiguity_info = self._analyze_pronoun_ambiguity(pronoun_token, doc=nlp(context.sentence), context=context, nlp=nlp)
+        ambiguity_info = self._analyze_pronoun_ambiguity(pronoun_token, doc=pronoun_token.doc, context=context, nlp=nlp)
         if not ambiguity_info:
             # Fallback if analysis fails
             ambiguity_info = {
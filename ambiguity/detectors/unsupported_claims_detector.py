@@ -87,7 +87,7 @@ class UnsupportedClaimsDetector(AmbiguityDetector):
             return detections
         
         try:
-            doc = nlp(context.sentence)
+            doc = self._parse_sentence(context, nlp)
             
             for token in doc:
                 word_lemma = token.lemma_.lower()
@@ -81,6 +81,7 @@ class AmbiguityContext:
     preceding_sentences: Optional[List[str]] = None
     following_sentences: Optional[List[str]] = None
     document_context: Optional[Dict[str, Any]] = None
+    doc: Optional[Any] = None  # Shared SpaCy parse of the sentence (read-only)
     
     def __post_init__(self):
         if self.preceding_sentences is None:
@@ -4,7 +4,6 @@ Contains all Flask route handlers for the web application.
 Handles file uploads, text analysis, AI rewriting, and health checks.
 """
 
-import os
 import time
 import logging
 from datetime import datetime
@@ -14,14 +13,21 @@ from werkzeug.exceptions import RequestEntityTooLarge
 from io import BytesIO
 
 from config import Config
+from style_analyzer import AnalysisOptions
 from .websocket_handlers import emit_progress, emit_completion
+from .job_queue import JobQueue, JobQueueFullError, COMPLETED as JOB_COMPLETED, QUEUED as JOB_QUEUED
 
 logger = logging.getLogger(__name__)
 
 
-def setup_routes(app, document_processor, style_analyzer, ai_rewriter):
+def setup_routes(app, document_processor, style_analyzer, ai_rewriter, job_queue=None):
     """Setup all API routes for the Flask application."""
     
+    # Worker pool behind the asynchronous /jobs endpoints
+    if job_queue is None:
+        job_queue = JobQueue(**Config.get_job_queue_config())
+    app.job_queue = job_queue
+    
     @app.route('/')
     def index():
         """Main application page."""
@@ -49,21 +55,9 @@ def setup_routes(app, document_processor, style_analyzer, ai_rewriter):
             if file and document_processor.allowed_file(file.filename):
                 filename = secure_filename(file.filename)
                 
-                # Ensure upload directory exists
-                upload_folder = app.config['UPLOAD_FOLDER']
-                os.makedirs(upload_folder, exist_ok=True)
-                
-                filepath = os.path.join(upload_folder, filename)
-                file.save(filepath)
-                
-                # Extract text
-                content = document_processor.extract_text(filepath)
-                
-                # Clean up file
-                try:
-                    os.remove(filepath)
-                except:
-                    pass  # Don't fail if cleanup fails
+                # Extract text straight from the upload stream (Werkzeug spools
+                # large uploads to a temporary file) instead of saving a copy first
+                content = document_processor.extract_text(file.stream, file.filename)
                 
                 if content:
                     return jsonify({
@@ -82,114 +76,191 @@ def setup_routes(app, document_processor, style_analyzer, ai_rewriter):
             logger.error(f"Upload error: {str(e)}")
             return jsonify({'error': f'Upload failed: {str(e)}'}), 500
     
+    def parse_analysis_request(data):
+        """Validate an analysis request body; raises ValueError with the client-facing message."""
+        content = data.get('content', '')
+        if not content:
+            raise ValueError('No content provided')
+        
+        # Enhanced: Support confidence threshold parameter
+        try:
+            options = AnalysisOptions(confidence_threshold=data.get('confidence_threshold', None))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f'Invalid confidence_threshold: {str(e)}')
+        
+        # If no session_id provided, generate one for this request
+        session_id = data.get('session_id', '')
+        if not session_id or not session_id.strip():
+            import uuid
+            session_id = str(uuid.uuid4())
+        
+        return {
+            'content': content,
+            'format_hint': data.get('format_hint', 'auto'),
+            'session_id': session_id,
+            'options': options,
+            'include_confidence_details': data.get('include_confidence_details', True),
+            'incremental': bool(data.get('incremental', False))
+        }
+    
+    def run_analysis(content, format_hint, session_id, options, include_confidence_details, incremental=False):
+        """Analyze content and build the /analyze response; shared by the route and analysis jobs."""
+        start_time = time.time()  # Track processing time
+        
+        # Start analysis with progress updates
+        logger.info(f"Starting analysis for session {session_id} with confidence_threshold={options.confidence_threshold}")
+        emit_progress(session_id, 'analysis_start', 'Initializing analysis...', 'Setting up analysis pipeline', 10)
+        
+        # Analyze with structural blocks; the threshold applies to this request only,
+        # the shared analyzer is left untouched. Only clients in incremental mode
+        # get a stored baseline (and result_id) to diff later edits against
+        analysis_result = style_analyzer.analyze_with_blocks(content, format_hint, options=options,
+                                                             incremental=incremental)
+        analysis = analysis_result.get('analysis', {})
+        structural_blocks = analysis_result.get('structural_blocks', [])
+        
+        emit_progress(session_id, 'analysis_complete', 'Analysis complete!', f'Analysis completed successfully', 100)
+        
+        # Calculate processing time
+        processing_time = time.time() - start_time
+        analysis['processing_time'] = processing_time
+        
+        logger.info(f"Analysis completed in {processing_time:.2f}s for session {session_id}")
+        
+        # Enhanced: Prepare confidence metadata
+        confidence_metadata = {
+            'confidence_threshold_used': (analysis.get('confidence_threshold', 0.43)
+                                          if options.confidence_threshold is None
+                                          else options.confidence_threshold),
+            'enhanced_validation_enabled': analysis.get('enhanced_validation_enabled', False),
+            'confidence_filtering_applied': options.confidence_threshold is not None
+        }
+        
+        # Enhanced: Add validation performance if available
+        if analysis.get('validation_performance'):
+            confidence_metadata['validation_performance'] = analysis.get('validation_performance')
+        
+        # Enhanced: Add enhanced error statistics if available
+        if analysis.get('enhanced_error_stats'):
+            confidence_metadata['enhanced_error_stats'] = analysis.get('enhanced_error_stats')
+        
+        # Return enhanced results with confidence data
+        response_data = {
+            'success': True,
+            'analysis': analysis,
+            'processing_time': processing_time,
+            'session_id': session_id,
+            'confidence_metadata': confidence_metadata,
+            'api_version': '2.0'  # Indicate enhanced API version
+        }
+        
+        # Include detailed confidence information if requested
+        if include_confidence_details:
+            response_data['confidence_details'] = {
+                'confidence_system_available': True,
+                'threshold_range': {'min': 0.0, 'max': 1.0, 'default': 0.43},
+                'confidence_levels': {
+                    'HIGH': {'threshold': 0.7, 'description': 'High confidence errors - very likely to be correct'},
+                    'MEDIUM': {'threshold': 0.5, 'description': 'Medium confidence errors - likely to be correct'},
+                    'LOW': {'threshold': 0.0, 'description': 'Low confidence errors - may need review'}
+                }
+            }
+        
+        # Include structural blocks if available
+        if structural_blocks:
+            response_data['structural_blocks'] = structural_blocks
+        
+        # Baseline for later /analyze/incremental requests
+        if analysis_result.get('result_id'):
+            response_data['result_id'] = analysis_result['result_id']
+            
+        # Enhanced: Add backward compatibility flag
+        response_data['backward_compatible'] = True
+        
+        return response_data
+    
     @app.route('/analyze', methods=['POST'])
     def analyze_content():
         """Analyze text content for style issues with confidence data and real-time progress."""
-        start_time = time.time()  # Track processing time
+        session_id = ''
         try:
             data = request.get_json()
-            content = data.get('content', '')
-            format_hint = data.get('format_hint', 'auto')
             session_id = data.get('session_id', '') if data else ''
             
-            # Enhanced: Support confidence threshold parameter
-            confidence_threshold = data.get('confidence_threshold', None)
-            include_confidence_details = data.get('include_confidence_details', True)
-            
-            if not content:
-                return jsonify({'error': 'No content provided'}), 400
-            
-            # If no session_id provided, generate one for this request
-            if not session_id or not session_id.strip():
-                import uuid
-                session_id = str(uuid.uuid4())
+            try:
+                params = parse_analysis_request(data)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            session_id = params['session_id']
             
-            # Start analysis with progress updates
-            logger.info(f"Starting analysis for session {session_id} with confidence_threshold={confidence_threshold}")
-            emit_progress(session_id, 'analysis_start', 'Initializing analysis...', 'Setting up analysis pipeline', 10)
+            response_data = run_analysis(**params)
+            emit_completion(session_id, True, response_data)
             
-            # Enhanced: Configure analyzer with confidence threshold if provided
-            if confidence_threshold is not None:
-                # Temporarily adjust the confidence threshold for this request
-                original_threshold = style_analyzer.structural_analyzer.confidence_threshold
-                style_analyzer.structural_analyzer.confidence_threshold = confidence_threshold
-                style_analyzer.structural_analyzer.rules_registry.set_confidence_threshold(confidence_threshold)
+            return jsonify(response_data)
             
-            # Analyze with structural blocks
-            analysis_result = style_analyzer.analyze_with_blocks(content, format_hint)
-            analysis = analysis_result.get('analysis', {})
-            structural_blocks = analysis_result.get('structural_blocks', [])
+        except Exception as e:
+            logger.error(f"Analysis error for session {session_id}: {str(e)}")
+            error_response = {
+                'success': False,
+                'error': f'Analysis failed: {str(e)}',
+                'session_id': session_id
+            }
+            emit_completion(session_id, False, error_response)
+            return jsonify(error_response), 500
+    
+    @app.route('/analyze/incremental', methods=['POST'])
+    def analyze_incremental():
+        """Re-analyze an edited document and return the errors added and removed since a previous result."""
+        start_time = time.time()
+        session_id = ''
+        try:
+            data = request.get_json() or {}
+            content = data.get('content', '')
+            previous_result_id = data.get('previous_result_id')
+            format_hint = data.get('format_hint')
+            session_id = data.get('session_id', '')
             
-            # Enhanced: Restore original threshold if it was modified
-            if confidence_threshold is not None:
-                style_analyzer.structural_analyzer.confidence_threshold = original_threshold
-                style_analyzer.structural_analyzer.rules_registry.set_confidence_threshold(original_threshold)
+            if not content:
+                return jsonify({'error': 'No content provided'}), 400
             
-            emit_progress(session_id, 'analysis_complete', 'Analysis complete!', f'Analysis completed successfully', 100)
+            # Without a confidence_threshold the previous result's options are reused
+            options = None
+            if data.get('confidence_threshold') is not None:
+                try:
+                    options = AnalysisOptions(confidence_threshold=data['confidence_threshold'])
+                except (TypeError, ValueError) as e:
+                    return jsonify({'error': f'Invalid confidence_threshold: {str(e)}'}), 400
             
-            # Calculate processing time
+            result = style_analyzer.analyze_incremental(previous_result_id, content, format_hint, options)
             processing_time = time.time() - start_time
-            analysis['processing_time'] = processing_time
-            
-            logger.info(f"Analysis completed in {processing_time:.2f}s for session {session_id}")
             
-            # Enhanced: Prepare confidence metadata
-            confidence_metadata = {
-                'confidence_threshold_used': confidence_threshold or analysis.get('confidence_threshold', 0.43),
-                'enhanced_validation_enabled': analysis.get('enhanced_validation_enabled', False),
-                'confidence_filtering_applied': confidence_threshold is not None
-            }
+            logger.info(f"Incremental analysis completed in {processing_time:.2f}s for session {session_id} "
+                        f"(+{len(result.get('added_errors', []))}/-{len(result.get('removed_errors', []))} errors)")
             
-            # Enhanced: Add validation performance if available
-            if analysis.get('validation_performance'):
-                confidence_metadata['validation_performance'] = analysis.get('validation_performance')
-            
-            # Enhanced: Add enhanced error statistics if available
-            if analysis.get('enhanced_error_stats'):
-                confidence_metadata['enhanced_error_stats'] = analysis.get('enhanced_error_stats')
-            
-            # Return enhanced results with confidence data
             response_data = {
                 'success': True,
-                'analysis': analysis,
+                'result_id': result.get('result_id'),
+                'previous_result_id': previous_result_id,
+                'previous_result_found': result.get('previous_result_found', False),
+                'changed_regions': result.get('changed_regions', []),
+                'added_errors': result.get('added_errors', []),
+                'removed_errors': result.get('removed_errors', []),
+                'unchanged_error_count': result.get('unchanged_error_count', 0),
+                'analysis': result.get('analysis', {}),
+                'structural_blocks': result.get('structural_blocks', []),
                 'processing_time': processing_time,
                 'session_id': session_id,
-                'confidence_metadata': confidence_metadata,
-                'api_version': '2.0'  # Indicate enhanced API version
+                'api_version': '2.0'
             }
-            
-            # Include detailed confidence information if requested
-            if include_confidence_details:
-                response_data['confidence_details'] = {
-                    'confidence_system_available': True,
-                    'threshold_range': {'min': 0.0, 'max': 1.0, 'default': 0.43},
-                    'confidence_levels': {
-                        'HIGH': {'threshold': 0.7, 'description': 'High confidence errors - very likely to be correct'},
-                        'MEDIUM': {'threshold': 0.5, 'description': 'Medium confidence errors - likely to be correct'},
-                        'LOW': {'threshold': 0.0, 'description': 'Low confidence errors - may need review'}
-                    }
-                }
-            
-            # Include structural blocks if available
-            if structural_blocks:
-                response_data['structural_blocks'] = structural_blocks
-                
-            # Enhanced: Add backward compatibility flag
-            response_data['backward_compatible'] = True
-            
-            emit_completion(session_id, True, response_data)
-            
             return jsonify(response_data)
             
         except Exception as e:
-            logger.error(f"Analysis error for session {session_id}: {str(e)}")
-            error_response = {
+            logger.error(f"Incremental analysis error for session {session_id}: {str(e)}")
+            return jsonify({
                 'success': False,
-                'error': f'Analysis failed: {str(e)}',
+                'error': f'Incremental analysis failed: {str(e)}',
                 'session_id': session_id
-            }
-            emit_completion(session_id, False, error_response)
-            return jsonify(error_response), 500
+            }), 500
     
     @app.route('/generate-pdf-report', methods=['POST'])
     def generate_pdf_report():
@@ -246,68 +317,86 @@ def setup_routes(app, document_processor, style_analyzer, ai_rewriter):
             logger.error(f"PDF generation error: {str(e)}")
             return jsonify({'error': f'PDF generation failed: {str(e)}'}), 500
     
+    def run_block_rewrite(block_content, block_errors, block_type, block_id, session_id):
+        """Rewrite a single block through the assembly line; shared by the route and rewrite jobs."""
+        start_time = time.time()
+        logger.info(f"Starting block rewrite for session {session_id}, block {block_id}, type: {block_type}")
+        
+        # Emit progress start via WebSocket
+        if session_id:
+            emit_progress(session_id, 'block_processing_start', 
+                        f'Starting rewrite for {block_type}', 
+                        f'Processing block {block_id}', 0)
+        
+        # Process single block through assembly line
+        if hasattr(ai_rewriter, 'ai_rewriter') and hasattr(ai_rewriter.ai_rewriter, 'assembly_line'):
+            # Full DocumentRewriter with assembly line support - PASS session_id and block_id for live updates
+            result = ai_rewriter.ai_rewriter.assembly_line.apply_block_level_assembly_line_fixes(
+                block_content, block_errors, block_type, session_id=session_id, block_id=block_id
+            )
+        elif hasattr(ai_rewriter, 'assembly_line'):
+            # Direct AIRewriter with assembly line support - PASS session_id and block_id for live updates
+            result = ai_rewriter.assembly_line.apply_block_level_assembly_line_fixes(
+                block_content, block_errors, block_type, session_id=session_id, block_id=block_id
+            )
+        else:
+            # Fallback SimpleAIRewriter - use basic rewrite method
+            result = ai_rewriter.rewrite(block_content, block_errors, block_type)
+            # Add missing fields for consistency
+            result.update({
+                'applicable_stations': ['fallback'],
+                'block_type': block_type,
+                'assembly_line_used': False
+            })
+        
+        # Add request metadata
+        processing_time = time.time() - start_time
+        result.update({
+            'block_id': block_id,
+            'session_id': session_id,
+            'processing_time': processing_time,
+            'success': 'error' not in result
+        })
+        
+        logger.info(f"Block rewrite completed in {processing_time:.2f}s - {result.get('errors_fixed', 0)} errors fixed")
+        return result
+    
+    def parse_rewrite_request(data):
+        """Validate a block rewrite request body; raises ValueError with the client-facing message."""
+        block_content = data.get('block_content', '')
+        block_id = data.get('block_id', '')
+        
+        # Validate required inputs
+        if not block_content or not block_content.strip():
+            raise ValueError('No block content provided')
+        
+        if not block_id:
+            raise ValueError('Block ID is required')
+        
+        return {
+            'block_content': block_content,
+            'block_errors': data.get('block_errors', []),
+            'block_type': data.get('block_type', 'paragraph'),
+            'block_id': block_id,
+            'session_id': data.get('session_id', '')
+        }
+    
     @app.route('/rewrite-block', methods=['POST'])
     def rewrite_block():
         """AI-powered single block rewriting."""
-        start_time = time.time()
         try:
             data = request.get_json()
-            block_content = data.get('block_content', '')
-            block_errors = data.get('block_errors', [])
-            block_type = data.get('block_type', 'paragraph')
-            block_id = data.get('block_id', '')
-            session_id = data.get('session_id', '')
-            
-            # Validate required inputs
-            if not block_content or not block_content.strip():
-                return jsonify({'error': 'No block content provided'}), 400
-            
-            if not block_id:
-                return jsonify({'error': 'Block ID is required'}), 400
-            
-            logger.info(f"Starting block rewrite for session {session_id}, block {block_id}, type: {block_type}")
-            
-            # Emit progress start via WebSocket
-            if session_id:
-                emit_progress(session_id, 'block_processing_start', 
-                            f'Starting rewrite for {block_type}', 
-                            f'Processing block {block_id}', 0)
-            
-            # Process single block through assembly line
-            if hasattr(ai_rewriter, 'ai_rewriter') and hasattr(ai_rewriter.ai_rewriter, 'assembly_line'):
-                # Full DocumentRewriter with assembly line support - PASS session_id and block_id for live updates
-                result = ai_rewriter.ai_rewriter.assembly_line.apply_block_level_assembly_line_fixes(
-                    block_content, block_errors, block_type, session_id=session_id, block_id=block_id
-                )
-            elif hasattr(ai_rewriter, 'assembly_line'):
-                # Direct AIRewriter with assembly line support - PASS session_id and block_id for live updates
-                result = ai_rewriter.assembly_line.apply_block_level_assembly_line_fixes(
-                    block_content, block_errors, block_type, session_id=session_id, block_id=block_id
-                )
-            else:
-                # Fallback SimpleAIRewriter - use basic rewrite method
-                result = ai_rewriter.rewrite(block_content, block_errors, block_type)
-                # Add missing fields for consistency
-                result.update({
-                    'applicable_stations': ['fallback'],
-                    'block_type': block_type,
-                    'assembly_line_used': False
-                })
+            try:
+                params = parse_rewrite_request(data)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
             
-            # Add request metadata
-            processing_time = time.time() - start_time
-            result.update({
-                'block_id': block_id,
-                'session_id': session_id,
-                'processing_time': processing_time,
-                'success': 'error' not in result
-            })
+            result = run_block_rewrite(**params)
             
             # Emit completion via WebSocket
-            if session_id:
-                emit_completion(session_id, 'block_processing_complete', result)
+            if params['session_id']:
+                emit_completion(params['session_id'], 'block_processing_complete', result)
             
-            logger.info(f"Block rewrite completed in {processing_time:.2f}s - {result.get('errors_fixed', 0)} errors fixed")
             return jsonify(result)
             
         except Exception as e:
@@ -319,9 +408,93 @@ def setup_routes(app, document_processor, style_analyzer, ai_rewriter):
                 'session_id': data.get('session_id', '') if 'data' in locals() else ''
             }
             return jsonify(error_result), 500
-
-
     
+    def submit_job(kind, params, data, completion_event):
+        """
+        Queue ``kind`` work for a worker and answer 202 with the job id.
+        
+        The job reports progress and completion over the same WebSocket events as
+        the synchronous route; the result is also fetched from GET /jobs/<job_id>.
+        """
+        session_id = params['session_id']
+        run = run_analysis if kind == 'analysis' else run_block_rewrite
+        
+        def on_finish(job):
+            if not session_id:
+                return
+            if job.status == JOB_COMPLETED:
+                emit_completion(session_id, completion_event, job.result)
+            else:
+                emit_completion(session_id, False, {
+                    'success': False,
+                    'job_id': job.job_id,
+                    'status': job.status,
+                    'error': job.error or 'Job cancelled',
+                    'session_id': session_id
+                })
+        
+        try:
+            job = job_queue.submit(kind, lambda job: run(**params), priority=data.get('priority', 'normal'),
+                                   session_id=session_id, on_finish=on_finish)
+        except JobQueueFullError as e:
+            response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+            response.headers['Retry-After'] = str(e.retry_after)
+            return response, 429
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        position = job_queue.position(job.job_id)
+        if session_id:
+            emit_progress(session_id, 'job_queued', 'Waiting for a free worker...',
+                          f'{position} job(s) ahead', 0)
+        
+        response_data = job.to_dict()
+        response_data.update({'success': True, 'position': position, 'status_url': f'/jobs/{job.job_id}'})
+        response = jsonify(response_data)
+        response.headers['Location'] = f'/jobs/{job.job_id}'
+        return response, 202
+    
+    @app.route('/jobs/analyze', methods=['POST'])
+    def submit_analysis_job():
+        """Queue an analysis; accepts the /analyze body plus an optional priority (high, normal, low)."""
+        data = request.get_json(silent=True) or {}
+        try:
+            params = parse_analysis_request(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return submit_job('analysis', params, data, True)
+    
+    @app.route('/jobs/rewrite-block', methods=['POST'])
+    def submit_rewrite_job():
+        """Queue a block rewrite; accepts the /rewrite-block body plus an optional priority."""
+        data = request.get_json(silent=True) or {}
+        try:
+            params = parse_rewrite_request(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return submit_job('rewrite_block', params, data, 'block_processing_complete')
+    
+    @app.route('/jobs/<job_id>', methods=['GET'])
+    def get_job(job_id):
+        """Job status, plus the result once the job has completed."""
+        job = job_queue.get(job_id)
+        if job is None:
+            return jsonify({'error': 'Job not found'}), 404
+        response_data = job.to_dict()
+        if job.status == JOB_QUEUED:
+            response_data['position'] = job_queue.position(job_id)
+        return jsonify(response_data)
+    
+    @app.route('/jobs/<job_id>', methods=['DELETE'])
+    def cancel_job(job_id):
+        """Cancel a queued job, or discard the result of a running one."""
+        job = job_queue.cancel(job_id)
+        if job is None:
+            return jsonify({'error': 'Job not found'}), 404
+        if not job.cancel_requested:
+            return jsonify({'error': f'Job already {job.status}', **job.to_dict(include_result=False)}), 409
+        return jsonify(job.to_dict(include_result=False))
+
     @app.route('/refine', methods=['POST'])
     def refine_content():
         """AI-powered content refinement (Pass 2)."""
@@ -467,7 +640,8 @@ def setup_routes(app, document_processor, style_analyzer, ai_rewriter):
                 'style_analyzer': style_analyzer is not None,
                 'ai_rewriter': ai_rewriter is not None,
                 'feedback_storage': True  # Feedback storage is always available
-            }
+            },
+            'job_queue': job_queue.get_stats()
         })
     
     @app.errorhandler(404)
@@ -20,13 +20,15 @@ class SimpleDocumentProcessor:
         """Check if file type is supported."""
         return '.' in filename and filename.rsplit('.', 1)[1].lower() in {'txt', 'md'}
     
-    def extract_text(self, filepath: str) -> Optional[str]:
-        """Extract text from file with basic error handling."""
+    def extract_text(self, source, filename: Optional[str] = None) -> Optional[str]:
+        """Extract text from a file path or binary file object with basic error handling."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
+            if hasattr(source, 'read'):
+                return source.read().decode('utf-8')
+            with open(source, 'r', encoding='utf-8') as f:
                 return f.read()
         except Exception as e:
-            logger.error(f"Error extracting text from {filepath}: {e}")
+            logger.error(f"Error extracting text from {filename or source}: {e}")
             return None
 
 
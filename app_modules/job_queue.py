@@ -0,0 +1,292 @@
+"""
+Job Queue Module
+Bounded in-process worker pool for long-running analysis and rewrite requests.
+
+Instead of holding a Flask request thread for the whole analysis or LLM
+rewrite, a route submits a job and returns its id straight away. Jobs wait in
+a priority queue and run on a fixed number of worker threads; progress and
+completion still go out over Socket.IO, and the result is fetched by job id.
+Admission control rejects new jobs once too many are waiting (overall or for
+one session), which the routes report as HTTP 429.
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Lower value runs first
+JOB_PRIORITIES = {'high': 0, 'normal': 1, 'low': 2}
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is rejected by admission control."""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class Job:
+    """A submitted unit of work and its outcome."""
+    job_id: str
+    kind: str
+    priority: str
+    session_id: str = ''
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    sequence: int = 0
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """Serializable job status for the API."""
+        data = {
+            'job_id': self.job_id,
+            'kind': self.kind,
+            'priority': self.priority,
+            'session_id': self.session_id,
+            'status': self.status,
+            'cancel_requested': self.cancel_requested,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'queue_time': (self.started_at or time.time()) - self.created_at,
+        }
+        if self.error:
+            data['error'] = self.error
+        if include_result and self.status == COMPLETED:
+            data['result'] = self.result
+        return data
+
+
+class JobQueue:
+    """
+    Priority job queue served by a fixed pool of worker threads.
+
+    Jobs of equal priority run in submission order. Cancelling a queued job
+    removes it before it starts. A running job is not interrupted: cancelling
+    it sets ``job.cancel_requested``, which ``func`` may poll to stop early,
+    and its result is discarded when it finishes as cancelled. Finished jobs
+    are kept for ``result_ttl`` seconds so clients can fetch the result.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 32,
+                 max_pending_per_session: int = 0, result_ttl: float = 600.0):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self.max_pending_per_session = max_pending_per_session
+        self.result_ttl = result_ttl
+
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._jobs: Dict[str, Job] = {}
+        self._on_finish: Dict[str, Callable[[Job], None]] = {}
+        self._lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+        self._running = 0
+        self._shutdown = False
+        self._stats = {'submitted': 0, 'rejected': 0, 'completed': 0, 'failed': 0, 'cancelled': 0}
+        self._run_time_total = 0.0
+
+    def submit(self, kind: str, func: Callable[[Job], Any], priority: str = 'normal',
+               session_id: str = '', on_finish: Optional[Callable[[Job], None]] = None) -> Job:
+        """
+        Queue ``func(job)`` to run on a worker.
+
+        ``func`` can check ``job.cancel_requested`` to stop early once the job
+        is cancelled. ``on_finish(job)`` is called once the job has completed,
+        failed or been cancelled: on the worker, or in the cancelling thread
+        for a job cancelled while still queued.
+
+        Raises:
+            ValueError: Unknown priority
+            JobQueueFullError: The queue or the session's share of it is full
+        """
+        if priority not in JOB_PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}', expected one of {', '.join(JOB_PRIORITIES)}")
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Job queue is shut down")
+            self._prune_finished()
+
+            pending = [job for job in self._jobs.values() if job.status == QUEUED]
+            if len(pending) >= self.max_pending:
+                self._stats['rejected'] += 1
+                raise JobQueueFullError("Job queue is full, try again later",
+                                        retry_after=self._estimate_wait(len(pending)))
+            if session_id and self.max_pending_per_session > 0:
+                session_jobs = sum(1 for job in self._jobs.values()
+                                   if job.session_id == session_id and not job.is_finished)
+                if session_jobs >= self.max_pending_per_session:
+                    self._stats['rejected'] += 1
+                    raise JobQueueFullError("Too many active jobs for this session, try again later",
+                                            retry_after=self._estimate_wait(len(pending)))
+
+            job = Job(job_id=str(uuid.uuid4()), kind=kind, priority=priority, session_id=session_id,
+                      sequence=next(self._sequence))
+            self._jobs[job.job_id] = job
+            self._stats['submitted'] += 1
+            if on_finish is not None:
+                self._on_finish[job.job_id] = on_finish
+            self._queue.put((JOB_PRIORITIES[priority], job.sequence, job, func))
+            self._ensure_workers()
+
+        logger.debug(f"Queued {kind} job {job.job_id} with {priority} priority")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            self._prune_finished()
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a job; returns it, or None if it is unknown."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.is_finished:
+                return job
+            job.cancel_requested = True
+            if job.status != QUEUED:
+                # The worker finishes it as cancelled once func returns
+                return job
+            # Left in the queue; workers skip it
+            self._finish(job, CANCELLED)
+            on_finish = self._on_finish.pop(job.job_id, None)
+        self._notify(job, on_finish)
+        return job
+
+    def position(self, job_id: str) -> int:
+        """Number of queued jobs that will start before ``job_id`` (0 once it runs)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != QUEUED:
+                return 0
+            rank = (JOB_PRIORITIES[job.priority], job.sequence)
+            return sum(1 for other in self._jobs.values()
+                       if other.status == QUEUED and (JOB_PRIORITIES[other.priority], other.sequence) < rank)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            finished = self._stats['completed'] + self._stats['failed']
+            return {
+                **self._stats,
+                'queued': sum(1 for job in self._jobs.values() if job.status == QUEUED),
+                'running': self._running,
+                'workers': self.max_workers,
+                'max_pending': self.max_pending,
+                'average_run_time': self._run_time_total / finished if finished else 0.0,
+            }
+
+    def shutdown(self, wait: bool = False):
+        """Stop the workers after the jobs that are already running."""
+        cancelled = []
+        with self._lock:
+            self._shutdown = True
+            workers = list(self._workers)
+            for job in self._jobs.values():
+                if job.status == QUEUED:
+                    job.cancel_requested = True
+                    self._finish(job, CANCELLED)
+                    cancelled.append((job, self._on_finish.pop(job.job_id, None)))
+        for job, on_finish in cancelled:
+            self._notify(job, on_finish)
+        for _ in workers:
+            # Sentinels sort after every real job
+            self._queue.put((len(JOB_PRIORITIES), next(self._sequence), None, None))
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def _ensure_workers(self):
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._work, name=f"job-worker-{len(self._workers)}", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _work(self):
+        while True:
+            _, _, job, func = self._queue.get()
+            if job is None:
+                return
+
+            with self._lock:
+                if job.status != QUEUED:
+                    continue
+                job.status = RUNNING
+                job.started_at = time.time()
+                self._running += 1
+
+            result, error = None, None
+            try:
+                result = func(job)
+            except Exception as e:
+                logger.error(f"{job.kind} job {job.job_id} failed: {e}")
+                error = str(e)
+
+            with self._lock:
+                self._running -= 1
+                self._run_time_total += time.time() - job.started_at
+                if job.cancel_requested:
+                    self._finish(job, CANCELLED)
+                elif error is not None:
+                    job.error = error
+                    self._finish(job, FAILED)
+                else:
+                    job.result = result
+                    self._finish(job, COMPLETED)
+                on_finish = self._on_finish.pop(job.job_id, None)
+
+            self._notify(job, on_finish)
+
+    def _notify(self, job: Job, on_finish: Optional[Callable[[Job], None]]):
+        # Called without self._lock held
+        if on_finish is None:
+            return
+        try:
+            on_finish(job)
+        except Exception as e:
+            logger.error(f"Completion callback for job {job.job_id} failed: {e}")
+
+    def _finish(self, job: Job, status: str):
+        # Callers hold self._lock
+        job.status = status
+        job.finished_at = time.time()
+        self._stats[status] += 1
+
+    def _prune_finished(self):
+        # Callers hold self._lock
+        cutoff = time.time() - self.result_ttl
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.is_finished and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _estimate_wait(self, pending: int) -> int:
+        # Callers hold self._lock
+        finished = self._stats['completed'] + self._stats['failed']
+        average = self._run_time_total / finished if finished else 1.0
+        return max(1, int(average * (pending + 1) / self.max_workers + 0.5))
@@ -59,6 +59,12 @@ class Config:
     ERROR_RATE_THRESHOLD = float(os.environ.get('ERROR_RATE_THRESHOLD', 0.05))  # 5% error rate threshold
     ERROR_RATE_WINDOW_MINUTES = int(os.environ.get('ERROR_RATE_WINDOW_MINUTES', 15))  # 15 minute window
     
+    # Job Queue Configuration (asynchronous /jobs endpoints)
+    JOB_QUEUE_WORKERS = int(os.environ.get('JOB_QUEUE_WORKERS', 2))
+    JOB_QUEUE_MAX_PENDING = int(os.environ.get('JOB_QUEUE_MAX_PENDING', 32))  # queued jobs before 429
+    JOB_QUEUE_MAX_PENDING_PER_SESSION = int(os.environ.get('JOB_QUEUE_MAX_PENDING_PER_SESSION', 4))  # 0 = no limit
+    JOB_RESULT_TTL_SECONDS = int(os.environ.get('JOB_RESULT_TTL_SECONDS', 600))  # seconds results stay fetchable
+    
     @staticmethod
     def init_app(app):
         """Initialize application with this configuration."""
@@ -90,6 +96,16 @@ class Config:
             'batch_size': cls.BLOCK_PROCESSING_BATCH_SIZE
         }
     
+    @classmethod
+    def get_job_queue_config(cls) -> Dict[str, Any]:
+        """Get job queue configuration."""
+        return {
+            'max_workers': cls.JOB_QUEUE_WORKERS,
+            'max_pending': cls.JOB_QUEUE_MAX_PENDING,
+            'max_pending_per_session': cls.JOB_QUEUE_MAX_PENDING_PER_SESSION,
+            'result_ttl': cls.JOB_RESULT_TTL_SECONDS
+        }
+    
     @classmethod
     def get_performance_monitoring_config(cls) -> Dict[str, Any]:
         """Get performance monitoring configuration."""
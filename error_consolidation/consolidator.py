@@ -13,6 +13,8 @@ import yaml
 import os
 import logging
 
+from .text_span_analyzer import SpanIndex
+
 # Enhanced validation imports (with graceful fallbacks)
 try:
     from validation.confidence.confidence_calculator import ConfidenceCalculator
@@ -76,6 +78,8 @@ class ErrorConsolidator:
         if priority_config:
             self._merge_custom_config(priority_config)
         
+        self._build_semantic_group_index()
+        
         # Initialize statistics tracking
         self.stats = {}
         self.confidence_stats = {
@@ -189,6 +193,25 @@ class ErrorConsolidator:
         if 'global_parameters' in custom_config:
             for key, value in custom_config['global_parameters'].items():
                 setattr(self, key, value)
+        
+        self._build_semantic_group_index()
+    
+    def _build_semantic_group_index(self):
+        """
+        Precompute the rule type -> semantic group lookup used when grouping errors.
+        
+        Each entry keeps the configured group order, so checking only the groups
+        that contain an error's type gives the same answer as scanning them all.
+        Must be called again whenever semantic_groups, special_rules or the
+        proximity settings change.
+        """
+        self._groups_by_type = defaultdict(list)
+        for group_name, group_config in self.semantic_groups.items():
+            group_types = set(group_config.get('types', []))
+            for rule_type in group_types:
+                self._groups_by_type[rule_type].append((group_types, group_config))
+        # Farthest apart two error types can be and still be grouped, by type pair
+        self._pair_reach_cache = {}
 
     def consolidate(self, errors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -316,48 +339,70 @@ class ErrorConsolidator:
     def _consolidate_sentence_errors(self, sentence_errors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Consolidate errors within a single sentence based on semantic relationships and proximity.
+        
+        Errors are considered in order. An error joins the remaining error with
+        the same span, else the first group whose lead error it relates to, else
+        forms a group with the first related remaining error. Span indexes over
+        the group leads and remaining errors limit each lookup to the errors
+        close enough (or typed so) that they could relate.
         """
         if len(sentence_errors) <= 1:
             return sentence_errors
         
-        # Group by exact span first (original behavior)
-        errors_by_exact_span = defaultdict(list)
-        remaining_errors = []
+        # Groups keep their first-insertion position, like the dict they are built in
+        errors_by_exact_span = {}
+        group_keys = []
+        group_ids = {}
+        group_leads = SpanIndex()
+        
+        remaining = {}
+        remaining_by_span = {}
+        remaining_index = SpanIndex()
+        
+        def set_group(span_key, group):
+            if span_key not in group_ids:
+                group_ids[span_key] = len(group_keys)
+                group_keys.append(span_key)
+            group_id = group_ids[span_key]
+            errors_by_exact_span[span_key] = group
+            group_leads.add(group_id, group[0]['span'][0], group[0]['span'][1], group[0].get('type', ''))
+        
+        def take_remaining(error_id):
+            error = remaining.pop(error_id)
+            remaining_index.remove(error_id)
+            del remaining_by_span[(error['span'][0], error['span'][1])]
+            return error
         
-        for error in sentence_errors:
+        for error_id, error in enumerate(sentence_errors):
             span_key = (error['span'][0], error['span'][1])
-            if span_key in [(e['span'][0], e['span'][1]) for e in remaining_errors]:
-                # Find existing group
-                for existing_error in remaining_errors:
-                    if (existing_error['span'][0], existing_error['span'][1]) == span_key:
-                        if span_key not in errors_by_exact_span:
-                            errors_by_exact_span[span_key] = [existing_error]
-                            remaining_errors.remove(existing_error)
-                        errors_by_exact_span[span_key].append(error)
-                        break
-            else:
-                # Check if this should be grouped with existing errors by semantic relationship
-                grouped = False
-                for span_key, group in errors_by_exact_span.items():
-                    if self._should_group_semantically(error, group[0]):
-                        group.append(error)
-                        grouped = True
-                        break
-                
-                if not grouped:
-                    # Check against remaining errors for semantic grouping
-                    for i, existing_error in enumerate(remaining_errors):
-                        if self._should_group_semantically(error, existing_error):
-                            # Create new semantic group
-                            new_span_key = (min(error['span'][0], existing_error['span'][0]), 
-                                          max(error['span'][1], existing_error['span'][1]))
-                            errors_by_exact_span[new_span_key] = [existing_error, error]
-                            remaining_errors.pop(i)
-                            grouped = True
-                            break
-                    
-                    if not grouped:
-                        remaining_errors.append(error)
+            
+            # Group by exact span first (original behavior); at most one remaining error has a given span
+            if span_key in remaining_by_span:
+                if span_key not in errors_by_exact_span:
+                    set_group(span_key, [take_remaining(remaining_by_span[span_key])])
+                errors_by_exact_span[span_key].append(error)
+                continue
+            
+            # Check if this should be grouped with existing errors by semantic relationship
+            group_id = self._first_related(error, group_leads,
+                                           lambda candidate: errors_by_exact_span[group_keys[candidate]][0])
+            if group_id is not None:
+                errors_by_exact_span[group_keys[group_id]].append(error)
+                continue
+            
+            # Check against remaining errors for semantic grouping
+            existing_id = self._first_related(error, remaining_index, remaining.__getitem__)
+            if existing_id is not None:
+                existing_error = take_remaining(existing_id)
+                # Create new semantic group
+                new_span_key = (min(error['span'][0], existing_error['span'][0]), 
+                              max(error['span'][1], existing_error['span'][1]))
+                set_group(new_span_key, [existing_error, error])
+                continue
+            
+            remaining[error_id] = error
+            remaining_by_span[span_key] = error_id
+            remaining_index.add(error_id, span_key[0], span_key[1], error.get('type', ''))
         
         # Merge each group
         consolidated = []
@@ -368,10 +413,90 @@ class ErrorConsolidator:
                 consolidated.append(self._merge_error_group(group))
         
         # Add remaining ungrouped errors
-        consolidated.extend(remaining_errors)
+        consolidated.extend(remaining.values())
         
         return consolidated
     
+    def _first_related(self, error: Dict[str, Any], index: SpanIndex, lookup) -> Optional[int]:
+        """
+        Id of the earliest indexed error that error should be grouped with, or None.
+        
+        Only errors whose type could relate at any distance, or that lie within
+        the largest proximity threshold for their type pair, are checked with
+        _should_group_semantically.
+        """
+        if not len(index):
+            return None
+        
+        error_type = error.get('type', '')
+        candidates = set()
+        max_reach = None
+        for other_type in list(index.labels()):
+            reach = self._pair_reach(error_type, other_type)
+            if reach is None:
+                continue
+            if reach == float('inf'):
+                candidates |= index.with_label(other_type)
+            elif max_reach is None or reach > max_reach:
+                max_reach = reach
+        
+        if max_reach is not None:
+            start, end = error['span'][0], error['span'][1]
+            try:
+                candidates |= index.intersecting(start - max_reach, end + max_reach) if start <= end else set(index)
+            except TypeError:
+                candidates |= set(index)
+        
+        for candidate in sorted(candidates):
+            if self._should_group_semantically(error, lookup(candidate)):
+                return candidate
+        return None
+    
+    def _pair_reach(self, type1: str, type2: str) -> Optional[float]:
+        """
+        Upper bound on how far apart errors of two types can be and still group.
+        
+        Returns None if the types never group, ``inf`` if they group at any
+        distance, and otherwise the largest proximity threshold that applies.
+        Overlapping spans always fall within the bound.
+        """
+        key = (type1, type2)
+        if key in self._pair_reach_cache:
+            return self._pair_reach_cache[key]
+        
+        reach = None
+        
+        def widen(threshold):
+            nonlocal reach
+            threshold = max(0, threshold)
+            reach = threshold if reach is None else max(reach, threshold)
+        
+        # Special rule conditions depend only on the two types and whether the spans overlap
+        apart = ({'type': type1, 'span': (0, 1)}, {'type': type2, 'span': (2, 3)})
+        overlapping = ({'type': type1, 'span': (0, 2)}, {'type': type2, 'span': (1, 3)})
+        for rule_config in self.special_rules.values():
+            condition = rule_config.get('condition', '')
+            action = rule_config.get('action', '')
+            any_distance = self._evaluate_condition(condition, *apart)
+            if not any_distance and not self._evaluate_condition(condition, *overlapping):
+                continue
+            if action == 'always_consolidate':
+                widen(float('inf') if any_distance else 0)
+            elif action == 'consolidate_if_close':
+                widen(rule_config.get('proximity_threshold', self.default_proximity_threshold))
+        
+        for group_types, group_config in self._groups_by_type.get(type1, ()):
+            if type2 not in group_types:
+                continue
+            always_pairs = group_config.get('always_consolidate_pairs', [])
+            if any(type1 in pair and type2 in pair for pair in always_pairs):
+                widen(float('inf'))
+            else:
+                widen(group_config.get('proximity_threshold', self.default_proximity_threshold))
+        
+        self._pair_reach_cache[key] = reach
+        return reach
+    
     def _should_group_semantically(self, error1: Dict[str, Any], error2: Dict[str, Any]) -> bool:
         """
         Determine if two errors should be grouped based on semantic relationship.
@@ -385,11 +510,9 @@ class ErrorConsolidator:
         if self._check_special_rules(error1, error2):
             return True
         
-        # Check configured semantic groups
-        for group_name, group_config in self.semantic_groups.items():
-            group_types = set(group_config.get('types', []))
-            
-            if type1 in group_types and type2 in group_types:
+        # Check the configured semantic groups containing type1, in configuration order
+        for group_types, group_config in self._groups_by_type.get(type1, ()):
+            if type2 in group_types:
                 # Check if this group preserves specific messages
                 preserve_specific = group_config.get('preserve_specific_messages', False)
                 
@@ -5,8 +5,9 @@ Analyzes text spans in errors to detect overlaps, nested spans, and related text
 that should be consolidated into single error messages.
 """
 
+import math
 import re
-from typing import List, Dict, Any, Tuple, Set
+from typing import List, Dict, Any, Hashable, Iterable, Optional, Tuple, Set
 from dataclasses import dataclass
 from collections import defaultdict
 
@@ -271,4 +272,91 @@ class TextSpanAnalyzer:
             index = int(error_id.split('_')[1])
             return errors[index]
         except (IndexError, ValueError):
-            return {} 
\ No newline at end of file
+            return {} 
+
+
+class SpanIndex:
+    """
+    Interval index over character spans for overlap and proximity queries.
+    
+    Spans are registered in fixed-width position buckets, so the spans
+    intersecting a range are found by visiting only the buckets that range
+    covers instead of comparing against every span. Each span also carries a
+    label (the error type) so callers can fetch all spans of a given type.
+    Spans that are not well-formed (start after end, non-numeric) or very
+    long are returned by every query.
+    """
+    
+    # Spans covering more buckets than this are kept with the irregular spans
+    MAX_BUCKETS_PER_SPAN = 1024
+    
+    def __init__(self, bucket_size: int = 16):
+        self.bucket_size = max(1, bucket_size)
+        self._spans: Dict[Hashable, Tuple[Any, Any, Hashable]] = {}
+        self._buckets: Dict[int, Set[Hashable]] = defaultdict(set)
+        self._by_label: Dict[Hashable, Set[Hashable]] = defaultdict(set)
+        self._irregular: Set[Hashable] = set()
+    
+    def add(self, item_id: Hashable, start: Any, end: Any, label: Hashable = None):
+        """Register the span ``(start, end)`` of ``item_id``."""
+        if item_id in self._spans:
+            self.remove(item_id)
+        self._spans[item_id] = (start, end, label)
+        self._by_label[label].add(item_id)
+        buckets = self._bucket_range(start, end)
+        if buckets is None:
+            self._irregular.add(item_id)
+            return
+        for bucket in buckets:
+            self._buckets[bucket].add(item_id)
+    
+    def remove(self, item_id: Hashable):
+        start, end, label = self._spans.pop(item_id)
+        self._by_label[label].discard(item_id)
+        if not self._by_label[label]:
+            del self._by_label[label]
+        buckets = self._bucket_range(start, end)
+        if buckets is None:
+            self._irregular.discard(item_id)
+            return
+        for bucket in buckets:
+            self._buckets[bucket].discard(item_id)
+    
+    def intersecting(self, low: Any, high: Any) -> Set[Hashable]:
+        """Ids of spans sharing at least one position with the closed range ``[low, high]``."""
+        buckets = self._bucket_range(low, high)
+        if buckets is None:
+            return set(self._spans)
+        
+        found = set(self._irregular)
+        for bucket in buckets:
+            for item_id in self._buckets.get(bucket, ()):
+                start, end, _ = self._spans[item_id]
+                if start <= high and end >= low:
+                    found.add(item_id)
+        return found
+    
+    def labels(self) -> Iterable[Hashable]:
+        return self._by_label.keys()
+    
+    def with_label(self, label: Hashable) -> Set[Hashable]:
+        return set(self._by_label.get(label, ()))
+    
+    def __iter__(self):
+        return iter(self._spans)
+    
+    def __contains__(self, item_id: Hashable) -> bool:
+        return item_id in self._spans
+    
+    def __len__(self) -> int:
+        return len(self._spans)
+    
+    def _bucket_range(self, start: Any, end: Any) -> Optional[range]:
+        try:
+            first = math.floor(start / self.bucket_size)
+            last = math.floor(end / self.bucket_size)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if first > last or last - first >= self.MAX_BUCKETS_PER_SPAN:
+            return None
+        return range(first, last + 1)
@@ -0,0 +1,41 @@
+"""
+NLP Processing Package
+
+Shared spaCy plumbing used by the style analyzer, the rules registry and the
+validation system so that the same text is never parsed more often than needed.
+
+- DocCache: parse-once cache of spaCy Docs handed to every rule for a block
+- SpacyModelRegistry: loads each spaCy model once per process and shares it
+- sentence_index_of, token_at_char and friends: token and sentence lookups
+  backed by a per-Doc index extension
+"""
+
+from .doc_cache import DocCache, cached_nlp
+from .sentence_index import (
+    get_sentence_index, sentence_index_of, token_at_char, token_index_at_char,
+    closest_token_index, sentence_index_at_char, sentence_count, sentence_spans
+)
+from .model_registry import (
+    SpacyModelRegistry, PipelineView, PIPELINE_PROFILES,
+    get_model_registry, get_spacy_model
+)
+
+__version__ = "1.0.0"
+
+__all__ = [
+    'DocCache',
+    'cached_nlp',
+    'get_sentence_index',
+    'sentence_index_of',
+    'token_at_char',
+    'token_index_at_char',
+    'closest_token_index',
+    'sentence_index_at_char',
+    'sentence_count',
+    'sentence_spans',
+    'SpacyModelRegistry',
+    'PipelineView',
+    'PIPELINE_PROFILES',
+    'get_model_registry',
+    'get_spacy_model'
+]
@@ -0,0 +1,158 @@
+"""
+Doc Cache Module
+Parse-once layer for spaCy. Wraps an nlp pipeline so that repeated calls with the
+same text return the same Doc instead of re-running the whole pipeline.
+
+Rules keep calling ``nlp(text)`` exactly as before; when the registry hands them a
+DocCache instead of the raw pipeline, the first call parses and every later call
+for the same block (or sentence) is a dictionary lookup.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DocCache:
+    """
+    Callable wrapper around a spaCy pipeline that memoises Docs by text.
+
+    The cache is intended to be short-lived (one block or one document). Docs are
+    shared between callers, so consumers must treat them as read-only.
+    """
+
+    def __init__(self, nlp, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            nlp: The spaCy nlp object to delegate parsing to
+            max_entries: Maximum number of Docs to keep (least recently used are dropped)
+        """
+        # Never stack caches on top of each other
+        if isinstance(nlp, DocCache):
+            nlp = nlp.nlp
+        self._nlp = nlp
+        self._max_entries = max(1, max_entries)
+        self._docs: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nlp(self):
+        """The underlying spaCy pipeline."""
+        return self._nlp
+
+    def __call__(self, text: str, *args, **kwargs):
+        """Return the Doc for ``text``, parsing it only on the first request."""
+        # Non-default pipeline arguments bypass the cache
+        if args or kwargs or not isinstance(text, str):
+            return self._nlp(text, *args, **kwargs)
+
+        with self._lock:
+            doc = self._docs.get(text)
+            if doc is not None:
+                self._docs.move_to_end(text)
+                self.hits += 1
+                return doc
+
+        doc = self._nlp(text)
+
+        with self._lock:
+            self.misses += 1
+            self._docs[text] = doc
+            if len(self._docs) > self._max_entries:
+                self._docs.popitem(last=False)
+        return doc
+
+    def add(self, text: str, doc) -> None:
+        """Register an already parsed Doc for ``text`` (e.g. from ``nlp.pipe``)."""
+        if doc is None or not isinstance(text, str):
+            return
+        with self._lock:
+            self._docs[text] = doc
+            self._docs.move_to_end(text)
+            if len(self._docs) > self._max_entries:
+                self._docs.popitem(last=False)
+
+    def prime(self, texts: Iterable[str], batch_size: int = 64, n_process: int = 1) -> List[Any]:
+        """
+        Parse many texts with one batched ``nlp.pipe`` call and cache the Docs.
+
+        Texts that are already cached (or repeated) are parsed only once.
+
+        Args:
+            texts: Texts to parse
+            batch_size: Number of texts spaCy buffers per batch
+            n_process: Number of processes spaCy uses for the batch
+
+        Returns:
+            The Doc for every input text, in input order
+        """
+        texts = [text for text in texts if isinstance(text, str)]
+        with self._lock:
+            pending = list(dict.fromkeys(text for text in texts if text not in self._docs))
+
+        if pending:
+            pipe_kwargs = {'batch_size': max(1, batch_size)}
+            if n_process and n_process > 1:
+                pipe_kwargs['n_process'] = n_process
+            for text, doc in zip(pending, self._nlp.pipe(pending, **pipe_kwargs)):
+                self.add(text, doc)
+            self.misses += len(pending)
+
+        with self._lock:
+            return [self._docs.get(text) for text in texts]
+
+    def get(self, text: str):
+        """Return the cached Doc for ``text`` without parsing, or None."""
+        with self._lock:
+            return self._docs.get(text)
+
+    def clear(self) -> None:
+        """Drop all cached Docs."""
+        with self._lock:
+            self._docs.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._docs),
+            'max_entries': self._max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __bool__(self) -> bool:
+        # Rules guard with ``if not nlp``; keep that check meaningful
+        return self._nlp is not None
+
+    def __getattr__(self, name: str):
+        # Everything else (vocab, pipe, pipe_names, ...) comes from the pipeline
+        nlp = self.__dict__.get('_nlp')
+        if nlp is None:
+            raise AttributeError(name)
+        return getattr(nlp, name)
+
+
+def cached_nlp(nlp, max_entries: int = 256) -> Optional[DocCache]:
+    """
+    Return a DocCache for ``nlp``.
+
+    Passing an existing DocCache returns it unchanged so callers further down the
+    stack share the parses made by their caller. Returns None when ``nlp`` is None.
+    """
+    if nlp is None:
+        return None
+    if isinstance(nlp, DocCache):
+        return nlp
+    return DocCache(nlp, max_entries=max_entries)
@@ -0,0 +1,182 @@
+"""
+Model Registry Module
+Process-wide registry of spaCy pipelines. Each model is loaded once and the same
+instance is returned to every subsystem (style analyzer, validators, confidence
+analyzers, rewriter), so a worker holds a single copy of the weights.
+
+Subsystems that only need part of the pipeline ask for a profile (e.g. 'parser'
+for sentence segmentation). Profiles are lightweight views over the shared model
+that skip the unneeded components at call time; they never load another copy.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except ImportError:
+    spacy = None
+    SPACY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+# Components each profile does NOT need. Only components present in the loaded
+# pipeline are disabled, so the same profile works across model sizes.
+PIPELINE_PROFILES: Dict[str, Tuple[str, ...]] = {
+    'full': (),
+    'parser': ('tagger', 'attribute_ruler', 'lemmatizer', 'ner'),
+    'tagger': ('parser', 'ner'),
+    'ner': ('parser',),
+}
+
+
+class PipelineView:
+    """
+    A restricted view of a shared spaCy pipeline.
+
+    Calls are forwarded to the shared model with the profile's components
+    disabled for that call only, so concurrent callers never interfere.
+    """
+
+    def __init__(self, nlp, disabled: Iterable[str], profile: Optional[str] = None):
+        self._nlp = nlp
+        self.profile = profile
+        self.disabled: List[str] = [name for name in disabled if name in nlp.pipe_names]
+
+    @property
+    def nlp(self):
+        """The shared, full pipeline."""
+        return self._nlp
+
+    @property
+    def pipe_names(self) -> List[str]:
+        """Names of the components this view runs."""
+        return [name for name in self._nlp.pipe_names if name not in self.disabled]
+
+    def __call__(self, text: str, **kwargs):
+        disable = list(self.disabled) + list(kwargs.pop('disable', []))
+        return self._nlp(text, disable=disable, **kwargs)
+
+    def pipe(self, texts, **kwargs):
+        disable = list(self.disabled) + list(kwargs.pop('disable', []))
+        return self._nlp.pipe(texts, disable=disable, **kwargs)
+
+    def __getattr__(self, name: str):
+        nlp = self.__dict__.get('_nlp')
+        if nlp is None:
+            raise AttributeError(name)
+        return getattr(nlp, name)
+
+
+class SpacyModelRegistry:
+    """Loads each spaCy model once per process and hands out the shared instance."""
+
+    def __init__(self):
+        self._models: Dict[str, Any] = {}
+        self._views: Dict[Tuple[str, str], PipelineView] = {}
+        self._lock = threading.RLock()
+        self._load_times: Dict[str, float] = {}
+
+    def get_model(self, model_name: str = DEFAULT_MODEL, profile: Optional[str] = None):
+        """
+        Get a loaded spaCy pipeline.
+
+        Args:
+            model_name: Name of the spaCy model package
+            profile: Optional pipeline profile (see PIPELINE_PROFILES); None or 'full'
+                returns the shared pipeline itself
+
+        Returns:
+            The shared Language object, or a PipelineView over it
+
+        Raises:
+            OSError: If the model cannot be loaded (same as spacy.load)
+            ValueError: If the profile is unknown
+        """
+        nlp = self._load(model_name)
+
+        if not profile or profile == 'full':
+            return nlp
+
+        if profile not in PIPELINE_PROFILES:
+            raise ValueError(f"Unknown pipeline profile '{profile}'. Available: {', '.join(PIPELINE_PROFILES)}")
+
+        key = (model_name, profile)
+        with self._lock:
+            view = self._views.get(key)
+            if view is None:
+                view = PipelineView(nlp, PIPELINE_PROFILES[profile], profile=profile)
+                self._views[key] = view
+            return view
+
+    def _load(self, model_name: str):
+        """Load a model on first use; later calls return the cached instance."""
+        nlp = self._models.get(model_name)
+        if nlp is not None:
+            return nlp
+
+        if not SPACY_AVAILABLE:
+            raise OSError(f"spaCy is not installed; cannot load model '{model_name}'")
+
+        with self._lock:
+            # Another thread may have finished loading while we waited
+            nlp = self._models.get(model_name)
+            if nlp is not None:
+                return nlp
+
+            start_time = time.time()
+            nlp = spacy.load(model_name)
+            self._load_times[model_name] = time.time() - start_time
+            self._models[model_name] = nlp
+            logger.info(f"Loaded spaCy model '{model_name}' in {self._load_times[model_name]:.2f}s")
+            return nlp
+
+    def register_model(self, model_name: str, nlp) -> None:
+        """Register an already constructed pipeline under ``model_name``."""
+        with self._lock:
+            self._models[model_name] = nlp
+            self._views = {key: view for key, view in self._views.items() if key[0] != model_name}
+
+    def is_loaded(self, model_name: str = DEFAULT_MODEL) -> bool:
+        """Check whether a model has already been loaded."""
+        return model_name in self._models
+
+    def clear(self) -> None:
+        """Drop all loaded models (mainly for tests)."""
+        with self._lock:
+            self._models.clear()
+            self._views.clear()
+            self._load_times.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics."""
+        return {
+            'loaded_models': list(self._models.keys()),
+            'profiles_in_use': [f"{name}:{profile}" for name, profile in self._views.keys()],
+            'load_times': dict(self._load_times)
+        }
+
+
+# Global registry instance
+_model_registry = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> SpacyModelRegistry:
+    """Get the process-wide model registry, creating it if needed."""
+    global _model_registry
+    if _model_registry is None:
+        with _model_registry_lock:
+            if _model_registry is None:
+                _model_registry = SpacyModelRegistry()
+    return _model_registry
+
+
+def get_spacy_model(model_name: str = DEFAULT_MODEL, profile: Optional[str] = None):
+    """Get a shared spaCy pipeline from the process-wide registry."""
+    return get_model_registry().get_model(model_name, profile=profile)
@@ -0,0 +1,157 @@
+"""
+Sentence Index Module
+Constant-time lookup of the sentence a token, span or character offset belongs to.
+
+Rules report a ``sentence_index`` with every error, and validators locate the
+token and sentence at an error position for every error they check. Scanning
+``doc.sents`` or the tokens for each lookup is quadratic in a block with many
+errors. Instead, the sentence number of every token and the character bounds of
+every token and sentence are computed in one pass the first time they are
+needed and stored on the Doc as the ``doc._.sentence_index`` extension, where
+every later rule and validator finds them. Character offsets are then resolved
+by binary search.
+"""
+
+import bisect
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from spacy.tokens import Doc
+
+SENTENCE_INDEX_EXTENSION = 'sentence_index'
+
+# Plain tuples of ints, so Docs carrying it still serialize
+if not Doc.has_extension(SENTENCE_INDEX_EXTENSION):
+    Doc.set_extension(SENTENCE_INDEX_EXTENSION, default=None)
+
+
+class DocIndex(NamedTuple):
+    """Token and sentence boundaries of a Doc."""
+    sentence_of_token: Tuple[int, ...]
+    token_starts: Tuple[int, ...]
+    token_ends: Tuple[int, ...]
+    sentence_bounds: Tuple[Tuple[int, int], ...]
+    sentence_starts: Tuple[int, ...]
+    sentence_ends: Tuple[int, ...]
+
+
+def build_doc_index(doc) -> DocIndex:
+    """
+    Index the tokens and sentences of ``doc``.
+
+    Without sentence boundaries (no parser or sentencizer) every token is in
+    sentence 0 and the index holds no sentences.
+    """
+    sentence_of_token = [0] * len(doc)
+    sentences = []
+    try:
+        for sentence_number, sent in enumerate(doc.sents):
+            for position in range(sent.start, sent.end):
+                sentence_of_token[position] = sentence_number
+            sentences.append(sent)
+    except ValueError:
+        # Sentence boundaries were never set
+        sentences = []
+
+    return DocIndex(
+        sentence_of_token=tuple(sentence_of_token),
+        token_starts=tuple(token.idx for token in doc),
+        token_ends=tuple(token.idx + len(token.text) for token in doc),
+        sentence_bounds=tuple((sent.start, sent.end) for sent in sentences),
+        sentence_starts=tuple(sent.start_char for sent in sentences),
+        sentence_ends=tuple(sent.end_char for sent in sentences)
+    )
+
+
+def get_doc_index(doc) -> DocIndex:
+    """Return the index of ``doc``, building it on first use."""
+    index = doc._.get(SENTENCE_INDEX_EXTENSION)
+    if not isinstance(index, DocIndex) or len(index.sentence_of_token) != len(doc):
+        index = build_doc_index(doc)
+        doc._.set(SENTENCE_INDEX_EXTENSION, index)
+    return index
+
+
+def get_sentence_index(doc) -> Tuple[int, ...]:
+    """Return the per-token sentence numbers for ``doc``."""
+    return get_doc_index(doc).sentence_of_token
+
+
+def sentence_index_of(item: Any) -> int:
+    """
+    Index within ``doc.sents`` of the sentence containing a Token or Span.
+
+    A Span is placed by its first token, matching ``span.sent``.
+    """
+    doc = item.doc
+    position = item.i if hasattr(item, 'i') else item.start
+    if not 0 <= position < len(doc):
+        return 0
+    return get_sentence_index(doc)[position]
+
+
+def token_index_at_char(doc, char: int, include_end: bool = False) -> Optional[int]:
+    """
+    Index of the token whose text contains character offset ``char``, or None.
+
+    With ``include_end`` the offset just past a token's text also counts as
+    inside it; where that touches the next token, the earlier token wins.
+    """
+    index = get_doc_index(doc)
+    if include_end:
+        i = bisect.bisect_left(index.token_ends, char)
+    else:
+        i = bisect.bisect_right(index.token_ends, char)
+    if i < len(index.token_starts) and index.token_starts[i] <= char:
+        return i
+    return None
+
+
+def token_at_char(doc, char: int, include_end: bool = False) -> Optional[Any]:
+    """The token whose text contains character offset ``char``, or None."""
+    i = token_index_at_char(doc, char, include_end)
+    return doc[i] if i is not None else None
+
+
+def closest_token_index(doc, char: int) -> Optional[int]:
+    """
+    Index of the token containing ``char`` (end inclusive), else of the first
+    token whose start or end is nearest to it. None for an empty document.
+    """
+    index = get_doc_index(doc)
+    if not index.token_starts:
+        return None
+
+    containing = token_index_at_char(doc, char, include_end=True)
+    if containing is not None:
+        return containing
+
+    # No token contains the offset: the nearest tokens are the last one
+    # ending before it and the first one starting after it
+    after = bisect.bisect_left(index.token_ends, char)
+    candidates = [i for i in (after - 1, after) if 0 <= i < len(index.token_starts)]
+
+    best, best_distance = None, float('inf')
+    for i in candidates:
+        distance = min(abs(index.token_starts[i] - char), abs(index.token_ends[i] - char))
+        if distance < best_distance:
+            best, best_distance = i, distance
+    return best
+
+
+def sentence_index_at_char(doc, char: int) -> Optional[int]:
+    """Index of the first sentence with ``start_char <= char <= end_char``, or None."""
+    index = get_doc_index(doc)
+    i = bisect.bisect_left(index.sentence_ends, char)
+    if i < len(index.sentence_starts) and index.sentence_starts[i] <= char:
+        return i
+    return None
+
+
+def sentence_count(doc) -> int:
+    """Number of sentences in ``doc`` (0 without sentence boundaries)."""
+    return len(get_doc_index(doc).sentence_bounds)
+
+
+def sentence_spans(doc, start: int = 0, end: Optional[int] = None) -> List[Any]:
+    """Sentence spans ``start:end`` of ``doc``."""
+    return [doc[token_start:token_end] for token_start, token_end in get_doc_index(doc).sentence_bounds[start:end]]
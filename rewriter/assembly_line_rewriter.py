@@ -359,9 +359,9 @@ class AssemblyLineRewriter:
     def _split_into_sentences(self, content: str) -> List[str]:
         """Split content into sentences using robust spaCy sentence segmentation."""
         try:
-            import spacy
-            # Try to load the existing spaCy model used elsewhere in the system
-            nlp = spacy.load("en_core_web_sm")
+            from nlp_processing import get_spacy_model
+            # Reuse the shared model; sentence boundaries only need the parser
+            nlp = get_spacy_model("en_core_web_sm", profile='parser')
             doc = nlp(content.strip())
             
             # Extract sentences using spaCy's robust sentence boundary detection
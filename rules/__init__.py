@@ -29,22 +29,46 @@ except ImportError:
     ENHANCED_VALIDATION_AVAILABLE = False
     print("Warning: Enhanced validation pipeline not available. Confidence filtering will be disabled.")
 
+# Import parse-once Doc cache (with fallback if not available)
+try:
+    from nlp_processing import cached_nlp
+    DOC_CACHE_AVAILABLE = True
+except ImportError:
+    DOC_CACHE_AVAILABLE = False
+
 # Import base rule with proper path handling
 try:
     from .base_rule import BaseRule
+    from .rule_manifest import (
+        DEFAULT_MANIFEST_PATH, MANIFEST_CACHE_PATH, LazyRule, LazyRuleDict,
+        compute_sources_fingerprint, iter_rule_files, load_manifest, write_manifest
+    )
 except ImportError:
     # Fallback for when running from different contexts
     import sys
     current_dir = os.path.dirname(os.path.abspath(__file__))
     sys.path.insert(0, current_dir)
     from base_rule import BaseRule
+    from rule_manifest import (
+        DEFAULT_MANIFEST_PATH, MANIFEST_CACHE_PATH, LazyRule, LazyRuleDict,
+        compute_sources_fingerprint, iter_rule_files, load_manifest, write_manifest
+    )
 
 class RulesRegistry:
     """Registry that automatically discovers and manages all writing rules from all subdirectories up to 4 levels deep."""
     
-    def __init__(self, enable_consolidation: bool = True, enable_enhanced_validation: bool = True, confidence_threshold: float = None):
-        self.rules = {}
+    def __init__(self, enable_consolidation: bool = True, enable_enhanced_validation: bool = True, confidence_threshold: float = None,
+                 use_manifest: bool = True, manifest_path: Optional[str] = None,
+                 manifest_cache_path: Optional[str] = None):
+        self.rules = LazyRuleDict()
         self.rule_locations = {}  # Track where each rule was found
+        self.rule_categories = {}  # Track the top-level rules subdirectory of each rule
+        self.rule_manifest = {}  # rule_type -> manifest entry
+        
+        # Rule manifest configuration (see rules/rule_manifest.py)
+        self.use_manifest = use_manifest
+        self.manifest_path = manifest_path or DEFAULT_MANIFEST_PATH
+        self.manifest_cache_path = manifest_cache_path or MANIFEST_CACHE_PATH
         
         # Error consolidation configuration
         self.enable_consolidation = enable_consolidation and CONSOLIDATION_AVAILABLE
@@ -59,10 +83,10 @@ class RulesRegistry:
         # Initialize validation components
         self._initialize_validation_system(confidence_threshold)
         
-        self._load_all_rules()
-        
         # Load rule-to-block type mappings from configuration file
         self._load_rule_mappings()
+        
+        self._load_all_rules()
     
     def _initialize_validation_system(self, confidence_threshold: float = None):
         """Initialize enhanced validation pipeline components with universal threshold."""
@@ -93,82 +117,113 @@ class RulesRegistry:
             self.confidence_calculator = None
     
     def _load_all_rules(self):
+        """
+        Load rules from the prebuilt rule manifest, importing each rule only when it is first used.
+        
+        Falls back to the manifest cache, then to a full discovery of all rule
+        modules, when the shipped manifest is missing or out of date. Discovery
+        results are only written to the manifest cache, never to the package.
+        """
+        fingerprint = None
+        if self.use_manifest:
+            paths = [self.manifest_path] + ([self.manifest_cache_path] if self.manifest_cache_path else [])
+            manifest = None
+            try:
+                fingerprint = compute_sources_fingerprint()
+                for path in paths:
+                    manifest = load_manifest(path, fingerprint)
+                    if manifest:
+                        break
+                else:
+                    print("⚠️ Rule manifest is out of date, discovering rules "
+                          "(regenerate it with: python -m rules.rule_manifest)")
+            except Exception as e:
+                print(f"⚠️ Could not read rule manifest, discovering rules instead: {e}")
+                manifest = None
+            
+            if manifest:
+                self._load_rules_from_manifest(manifest)
+                return
+        
+        self._discover_all_rules()
+        
+        if self.use_manifest and fingerprint and self.rule_manifest and self.manifest_cache_path:
+            if write_manifest(self.manifest_cache_path, fingerprint, self.rule_manifest):
+                print(f"📋 Wrote rule manifest cache: {self.manifest_cache_path}")
+    
+    def _load_rules_from_manifest(self, manifest: Dict[str, Any]):
+        """Register a LazyRule placeholder for every rule listed in the manifest."""
+        self.rule_manifest = manifest['rules']
+        self.rules = LazyRuleDict(
+            (rule_type, LazyRule(rule_type, entry))
+            for rule_type, entry in self.rule_manifest.items()
+        )
+        self.rule_locations = {rule_type: entry['location'] for rule_type, entry in self.rule_manifest.items()}
+        self.rule_categories = {rule_type: entry['category'] for rule_type, entry in self.rule_manifest.items()}
+        
+        print(f"📋 Loaded rule manifest: {len(self.rules)} rules from {len(set(self.rule_locations.values()))} locations (imported on first use)")
+    
+    def _discover_all_rules(self):
         """Automatically discover and load all rule modules from main directory and nested subdirectories (up to 4 levels deep)."""
+        self.rules = LazyRuleDict()
+        
         try:
             # Get the current directory (rules directory)
             rules_dir = os.path.dirname(os.path.abspath(__file__))
             print(f"🔍 Scanning for rules in: {rules_dir}")
             
-            # Recursively walk through all subdirectories
-            for root, dirs, files in os.walk(rules_dir):
-                # Calculate relative path from rules directory
-                rel_path = os.path.relpath(root, rules_dir)
-                
-                # Skip __pycache__ directories and hidden directories
-                if '__pycache__' in root or (rel_path != '.' and any(part.startswith('.') for part in rel_path.split(os.sep))):
-                    continue
+            for root, filename, path_parts in iter_rule_files(rules_dir):
+                depth = len(path_parts)
+                module_name = filename[:-3]  # Remove .py extension
                 
-                # Calculate nesting depth
-                if rel_path == '.':
-                    depth = 0
-                    path_parts = []
+                # Determine import path and display location based on directory structure
+                if not path_parts:
+                    # Main rules directory
+                    import_path = module_name
+                    display_location = "main"
                 else:
-                    path_parts = rel_path.split(os.sep)
-                    depth = len(path_parts)
-                
-                # Limit depth to 4 levels as requested
-                if depth > 4:
-                    print(f"⚠️ Skipping directory too deep (>{4} levels): {rel_path}")
-                    continue
+                    # Nested subdirectory - convert path separators to dots
+                    import_path = f"{'.'.join(path_parts)}.{module_name}"
+                    display_location = ' > '.join(path_parts)
                 
-                # Process all Python files ending with '_rule.py' or '.py' (to be more flexible)
-                for filename in files:
-                    if (filename.endswith('_rule.py') and 
-                        filename != 'base_rule.py' and 
-                        not filename.startswith('base_')):  # Skip all base rule files
-                        module_name = filename[:-3]  # Remove .py extension
+                try:
+                    print(f"🔍 Attempting to load: {import_path} (depth: {depth})")
+                    
+                    # Import the module using enhanced import mechanism
+                    module = self._import_rule_module_enhanced(import_path, root, filename, depth)
+                    
+                    if module:
+                        # Find and instantiate the rule class
+                        rule_instance = self._find_and_instantiate_rule_class(module, module_name)
                         
-                        try:
-                            # Determine import path and display location based on directory structure
-                            if rel_path == '.':
-                                # Main rules directory
-                                import_path = module_name
-                                display_location = "main"
-                            else:
-                                # Nested subdirectory - convert path separators to dots
-                                subdir_path = rel_path.replace(os.sep, '.')
-                                import_path = f"{subdir_path}.{module_name}"
-                                display_location = ' > '.join(path_parts)
-                            
-                            print(f"🔍 Attempting to load: {import_path} (depth: {depth})")
+                        if rule_instance:
+                            rule_type = rule_instance.rule_type
                             
-                            # Import the module using enhanced import mechanism
-                            module = self._import_rule_module_enhanced(import_path, root, filename, depth)
-                            
-                            if module:
-                                # Find and instantiate the rule class
-                                rule_instance = self._find_and_instantiate_rule_class(module, module_name)
-                                
-                                if rule_instance:
-                                    rule_type = rule_instance.rule_type
-                                    
-                                    # Check for rule type conflicts
-                                    if rule_type in self.rules:
-                                        print(f"⚠️ Rule type conflict: {rule_type} already exists from {self.rule_locations[rule_type]}")
-                                        print(f"   Keeping existing rule, skipping: {display_location}")
-                                    else:
-                                        self.rules[rule_type] = rule_instance
-                                        self.rule_locations[rule_type] = display_location
-                                    print(f"✅ Loaded rule: {rule_type} (from {display_location})")
-                                else:
-                                    print(f"⚠️ No valid rule class found in {import_path}")
+                            # Check for rule type conflicts
+                            if rule_type in self.rules:
+                                print(f"⚠️ Rule type conflict: {rule_type} already exists from {self.rule_locations[rule_type]}")
+                                print(f"   Keeping existing rule, skipping: {display_location}")
                             else:
-                                print(f"❌ Failed to import module: {import_path}")
-                                
-                        except Exception as e:
-                            print(f"❌ Error loading rule {import_path}: {e}")
-                            # Continue with next rule instead of stopping
-                            
+                                self.rules[rule_type] = rule_instance
+                                self.rule_locations[rule_type] = display_location
+                                self.rule_categories[rule_type] = path_parts[0] if path_parts else 'main'
+                                self.rule_manifest[rule_type] = {
+                                    'module': module.__name__,
+                                    'class_name': rule_instance.__class__.__name__,
+                                    'file': os.path.relpath(os.path.join(root, filename), rules_dir).replace(os.sep, '/'),
+                                    'location': display_location,
+                                    'category': self.rule_categories[rule_type]
+                                }
+                            print(f"✅ Loaded rule: {rule_type} (from {display_location})")
+                        else:
+                            print(f"⚠️ No valid rule class found in {import_path}")
+                    else:
+                        print(f"❌ Failed to import module: {import_path}")
+                        
+                except Exception as e:
+                    print(f"❌ Error loading rule {import_path}: {e}")
+                    # Continue with next rule instead of stopping
+                    
         except Exception as e:
             print(f"❌ Critical error in rules registry initialization: {e}")
             
@@ -428,11 +483,12 @@ class RulesRegistry:
         if category is None:
             return self.get_all_rules()
         
-        # Filter rules based on category (could be extended to track rule origins)
+        # Filter rules based on the top-level subdirectory each rule came from
         filtered_rules = {}
-        for rule_type, rule in self.rules.items():
-            # This could be extended to track which subdirectory each rule came from
-            filtered_rules[rule_type] = rule
+        for rule_type, rule_category in self.rule_categories.items():
+            rule = self.rules.get(rule_type) if rule_category == category else None
+            if rule is not None:
+                filtered_rules[rule_type] = rule
         
         return filtered_rules
     
@@ -450,11 +506,25 @@ class RulesRegistry:
             'total_rules': len(self.rules),
             'rules_by_location': rules_by_location,
             'all_rule_types': list(self.rules.keys()),
+            'imported_rule_types': [rule_type for rule_type in self.rules if self._is_rule_imported(rule_type)],
             'locations': list(set(self.rule_locations.values()))
         }
     
-    def analyze_with_context_aware_rules(self, text: str, sentences: List[str], nlp=None, context=None) -> List[Dict[str, Any]]:
-        """Run analysis with context-aware rule selection based on block type."""
+    def _is_rule_imported(self, rule_type: str) -> bool:
+        """Whether a rule has been imported yet (rules from the manifest load on first use)."""
+        if isinstance(self.rules, LazyRuleDict):
+            return self.rules.is_loaded(rule_type)
+        return rule_type in self.rules
+    
+    def analyze_with_context_aware_rules(self, text: str, sentences: List[str], nlp=None, context=None,
+                                         options=None) -> List[Dict[str, Any]]:
+        """
+        Run analysis with context-aware rule selection based on block type.
+        
+        ``options`` carries per-request settings (an AnalysisOptions); a
+        confidence_threshold set there overrides the registry's own for this
+        call only.
+        """
         all_errors = []
         
         # Get block type from context
@@ -467,38 +537,67 @@ class RulesRegistry:
         # Get applicable rules for this block type
         applicable_rules = self._get_applicable_rules(block_type)
         
-        # Apply only the relevant rules
-        for rule_type in applicable_rules:
-            rule = self.rules.get(rule_type)
-            if rule:
-                try:
-                    rule_errors = rule.analyze(text, sentences, nlp, context)
-                    
-                    # Ensure all errors are JSON serializable
-                    serializable_errors = []
-                    for error in rule_errors:
-                        # Use base rule's serialization method
-                        serializable_error = rule._make_serializable(error)
-                        serializable_errors.append(serializable_error)
-                    
-                    all_errors.extend(serializable_errors)
-                    
-                except Exception as e:
-                    print(f"❌ Error in rule {rule.__class__.__name__}: {e}")
-                    # Add a system error that is guaranteed to be serializable
-                    all_errors.append({
-                        'type': 'system_error',
-                        'message': f'Rule {rule.__class__.__name__} failed: {str(e)}',
-                        'suggestions': ['Check rule implementation'],
-                        'sentence': '',
-                        'sentence_index': -1,
-                        'severity': 'low'
-                    })
+        # Parse the block once and hand the same Doc to every rule
+        nlp = self._prepare_shared_nlp(nlp, text) if applicable_rules else nlp
+        
+        # Apply only the relevant rules; errors are scored once, in a batch, afterwards
+        pending_scoring = []
+        with BaseRule.deferred_scoring():
+            for rule_type in applicable_rules:
+                rule = self.rules.get(rule_type)
+                if rule:
+                    self._run_rule(rule, text, sentences, nlp, context, all_errors, pending_scoring)
+        
+        return self._score_filter_and_consolidate(all_errors, pending_scoring, text, context, options)
+    
+    def _run_rule(self, rule, text: str, sentences: List[str], nlp, context,
+                  all_errors: List[Dict[str, Any]], pending_scoring: List[tuple]):
+        """Run one rule, collecting its serializable errors and their deferred scoring requests."""
+        try:
+            rule_errors = rule.analyze(text, sentences, nlp, context)
+            
+            # Ensure all errors are JSON serializable
+            serializable_errors = []
+            for error in rule_errors:
+                scoring_request = BaseRule.pop_scoring_request(error)
+                # Use base rule's serialization method
+                serializable_error = rule._make_serializable(error)
+                serializable_errors.append(serializable_error)
+                if scoring_request is not None:
+                    pending_scoring.append((serializable_error, scoring_request))
+            
+            all_errors.extend(serializable_errors)
+            
+        except Exception as e:
+            print(f"❌ Error in rule {rule.__class__.__name__}: {e}")
+            # Add a system error that is guaranteed to be serializable
+            all_errors.append({
+                'type': 'system_error',
+                'message': f'Rule {rule.__class__.__name__} failed: {str(e)}',
+                'suggestions': ['Check rule implementation'],
+                'sentence': '',
+                'sentence_index': -1,
+                'severity': 'low'
+            })
+    
+    def _score_filter_and_consolidate(self, all_errors: List[Dict[str, Any]], pending_scoring: List[tuple],
+                                      text: str, context: Optional[Dict[str, Any]],
+                                      options=None) -> List[Dict[str, Any]]:
+        """
+        Score the rule errors in one batch, filter them, then consolidate the survivors.
+        
+        Consolidation picks a merged error's primary by confidence, so every
+        candidate is scored before merging and the validation-decision and
+        threshold filters judge each member on its own score. A low-confidence
+        false positive therefore cannot pull an overlapping valid error below
+        the threshold with it.
+        """
+        self._score_deferred_errors(pending_scoring)
         
         # Apply enhanced filtering (validation pipeline + confidence filtering)
         if self.enable_enhanced_validation:
             try:
-                all_errors = self._apply_enhanced_filtering(all_errors, text, context)
+                all_errors = self._apply_enhanced_filtering(all_errors, text, context, options)
             except Exception as e:
                 print(f"⚠️ Enhanced filtering failed, continuing with unfiltered errors: {e}")
                 # Continue with unfiltered errors rather than crashing
@@ -513,6 +612,33 @@ class RulesRegistry:
         
         return all_errors
     
+    def _score_deferred_errors(self, pending_scoring: List[tuple]):
+        """Run the batched confidence scoring stage over the errors the rules produced."""
+        if not pending_scoring:
+            return
+        try:
+            BaseRule.score_deferred_errors(pending_scoring)
+        except Exception as e:
+            print(f"⚠️ Batched confidence scoring failed, continuing with unscored errors: {e}")
+    
+    def _prepare_shared_nlp(self, nlp, text: str):
+        """
+        Wrap the nlp pipeline in a parse-once Doc cache and pre-parse the block text.
+        
+        Rules keep calling ``nlp(text)`` / ``nlp(sentence)``; every call after the
+        first one for the same string returns the cached Doc.
+        """
+        if not nlp or not DOC_CACHE_AVAILABLE:
+            return nlp
+        
+        shared_nlp = cached_nlp(nlp)
+        if text and text.strip():
+            try:
+                shared_nlp(text)
+            except Exception as e:
+                print(f"⚠️ Shared parse failed, rules will parse on demand: {e}")
+        return shared_nlp
+    
     def _get_block_type_from_context(self, context: Optional[dict]) -> str:
         """Extract block type from context information."""
         if not context:
@@ -550,15 +676,23 @@ class RulesRegistry:
         exclusions = self.rule_exclusions.get(block_type, [])
         applicable_rules = [rule for rule in applicable_rules if rule not in exclusions]
         
-        # Filter to only include rules that are actually loaded
-        return [rule for rule in applicable_rules if rule in self.rules]
+        # Filter to only include rules that are actually loaded; rules listed in
+        # the manifest are imported here the first time a block selects them
+        return [rule for rule in applicable_rules if rule in self.rules and self.rules.get(rule) is not None]
     
-    def _apply_confidence_filtering(self, errors: List[Dict[str, Any]], context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    def _effective_confidence_threshold(self, options=None) -> Optional[float]:
+        """The request's confidence threshold if it sets one, otherwise the registry's."""
+        threshold = getattr(options, 'confidence_threshold', None)
+        return self.confidence_threshold if threshold is None else threshold
+    
+    def _apply_confidence_filtering(self, errors: List[Dict[str, Any]], context: Optional[Dict[str, Any]] = None,
+                                    options=None) -> List[Dict[str, Any]]:
         """Apply confidence-based filtering to errors."""
         if not self.enable_enhanced_validation or not errors:
             return errors
         
-        if self.confidence_threshold is None:
+        confidence_threshold = self._effective_confidence_threshold(options)
+        if confidence_threshold is None:
             return errors
         
         filtered_errors = []
@@ -573,13 +707,13 @@ class RulesRegistry:
                 continue
             
             # Apply confidence threshold
-            if confidence_score >= self.confidence_threshold:
+            if confidence_score >= confidence_threshold:
                 filtered_errors.append(error)
             else:
                 filtered_count += 1
         
         if filtered_count > 0:
-            print(f"🔍 Confidence filtering: Removed {filtered_count}/{len(errors)} low-confidence errors (threshold: {self.confidence_threshold:.3f})")
+            print(f"🔍 Confidence filtering: Removed {filtered_count}/{len(errors)} low-confidence errors (threshold: {confidence_threshold:.3f})")
         
         return filtered_errors
     
@@ -616,13 +750,14 @@ class RulesRegistry:
         
         return validated_errors
     
-    def _apply_enhanced_filtering(self, errors: List[Dict[str, Any]], text: str, context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    def _apply_enhanced_filtering(self, errors: List[Dict[str, Any]], text: str, context: Optional[Dict[str, Any]] = None,
+                                  options=None) -> List[Dict[str, Any]]:
         """Apply both confidence and validation filtering to errors."""
         # First apply validation pipeline filtering
         errors = self._apply_validation_pipeline(errors, text, context)
         
         # Then apply confidence filtering
-        errors = self._apply_confidence_filtering(errors, context)
+        errors = self._apply_confidence_filtering(errors, context, options)
         
         return errors
     
@@ -639,52 +774,21 @@ class RulesRegistry:
             'validation_thresholds_loaded': self.validation_thresholds is not None
         }
 
-    def analyze_with_all_rules(self, text: str, sentences: List[str], nlp=None, context=None) -> List[Dict[str, Any]]:
-        """Run analysis with all discovered rules from all directories."""
+    def analyze_with_all_rules(self, text: str, sentences: List[str], nlp=None, context=None,
+                               options=None) -> List[Dict[str, Any]]:
+        """Run analysis with all discovered rules from all directories (``options`` as for context-aware analysis)."""
         all_errors = []
         
-        for rule in self.rules.values():
-            try:
-                rule_errors = rule.analyze(text, sentences, nlp, context)
-                
-                # Ensure all errors are JSON serializable
-                serializable_errors = []
-                for error in rule_errors:
-                    # Use base rule's serialization method
-                    serializable_error = rule._make_serializable(error)
-                    serializable_errors.append(serializable_error)
-                
-                all_errors.extend(serializable_errors)
-                
-            except Exception as e:
-                print(f"❌ Error in rule {rule.__class__.__name__}: {e}")
-                # Add a system error that is guaranteed to be serializable
-                all_errors.append({
-                    'type': 'system_error',
-                    'message': f'Rule {rule.__class__.__name__} failed: {str(e)}',
-                    'suggestions': ['Check rule implementation'],
-                    'sentence': '',
-                    'sentence_index': -1,
-                    'severity': 'low'
-                })
+        # Parse the text once and hand the same Doc to every rule
+        nlp = self._prepare_shared_nlp(nlp, text)
         
-        # Apply enhanced filtering (validation pipeline + confidence filtering)
-        if self.enable_enhanced_validation:
-            try:
-                all_errors = self._apply_enhanced_filtering(all_errors, text, context)
-            except Exception as e:
-                print(f"⚠️ Enhanced filtering failed, continuing with unfiltered errors: {e}")
-                # Continue with unfiltered errors rather than crashing
+        # Errors are scored once, in a batch, after all rules have run
+        pending_scoring = []
+        with BaseRule.deferred_scoring():
+            for rule in self.rules.values():
+                self._run_rule(rule, text, sentences, nlp, context, all_errors, pending_scoring)
         
-        # Apply error consolidation if enabled
-        if self.enable_consolidation and all_errors:
-            try:
-                all_errors = consolidate_errors(all_errors)
-            except Exception as e:
-                print(f"Warning: Error consolidation failed: {e}")
-                # Continue with unconsolidated errors
-        
-        return all_errors
+        return self._score_filter_and_consolidate(all_errors, pending_scoring, text, context, options)
 
 # Global registry instance (lazy-loaded to avoid circular imports)
 _registry = None
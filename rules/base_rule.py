@@ -5,8 +5,13 @@ Provides comprehensive linguistic analysis utilities without hardcoded patterns.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Set, Tuple, Union
+import copy
 import re
+import threading
+import time
 from collections import defaultdict
 import yaml
 import os
@@ -32,12 +37,61 @@ except ImportError:
     get_rule_reliability_coefficient = None
     ENHANCED_VALIDATION_AVAILABLE = False
 
+from nlp_processing.sentence_index import sentence_index_of, token_at_char
+
+try:
+    from .exception_index import ExceptionIndex
+except ImportError:
+    # Fallback for when rules are imported with the rules directory on sys.path
+    from exception_index import ExceptionIndex
+
 try:
     from spacy.matcher import Matcher, PhraseMatcher
 except ImportError:
     Matcher = None
     PhraseMatcher = None
 
+# Fields every error starts with; enhanced fields follow them
+BASE_ERROR_FIELDS = ('type', 'message', 'suggestions', 'sentence', 'sentence_index', 'severity')
+
+# Key under which a deferred error carries its scoring request until it is scored
+SCORING_REQUEST_KEY = '_scoring_request'
+
+# Per-thread flag set by BaseRule.deferred_scoring()
+_scoring_state = threading.local()
+
+EXCEPTIONS_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'exceptions.yaml')
+
+# Minimum seconds between checks of exceptions.yaml for changes (hot reload)
+EXCEPTIONS_RELOAD_INTERVAL = float(os.getenv('RULES_EXCEPTIONS_RELOAD_INTERVAL', '2.0'))
+
+
+@dataclass
+class ErrorScoringRequest:
+    """Inputs for scoring one error candidate, captured when the rule creates it."""
+    rule: Any
+    sentence: str
+    message: str
+    text: Optional[str]
+    context: Optional[Dict[str, Any]]
+    analysis_text: str
+    error_position: int
+    error_text: str
+    content_type: Optional[str]
+    domain: Optional[str]
+    severity: str
+    suggestions: List[str]
+    evidence_score: Optional[float]
+    
+    def scoring_key(self) -> tuple:
+        """Identity of the scoring inputs; candidates with equal keys score identically."""
+        return (
+            id(self.rule), self.analysis_text, self.error_position, self.error_text,
+            self.content_type, self.domain, self.severity, self.evidence_score,
+            self.sentence, self.message, repr(self.suggestions), repr(self.text), repr(self.context)
+        )
+
+
 class BaseRule(ABC):
     """
     Abstract base class for all writing rules using pure SpaCy morphological analysis.
@@ -46,6 +100,10 @@ class BaseRule(ABC):
     
     # Class-level cache for exceptions to avoid reading the file for every rule instance.
     _exceptions = None
+    _exception_index: Optional[ExceptionIndex] = None
+    _exceptions_mtime: Optional[float] = None
+    _exceptions_checked_at = 0.0
+    _exceptions_lock = threading.Lock()
     
     # Class-level shared validation system components for enhanced error creation
     _confidence_calculator = None
@@ -63,8 +121,8 @@ class BaseRule(ABC):
         self._patterns_initialized = False
         
         # Load exceptions once and cache them at the class level.
-        if BaseRule._exceptions is None:
-            self._load_exceptions()
+        if BaseRule._exception_index is None:
+            BaseRule._get_exception_index()
         
         # Initialize validation system components once at class level
         if ENHANCED_VALIDATION_AVAILABLE and BaseRule._confidence_calculator is None:
@@ -73,25 +131,56 @@ class BaseRule(ABC):
     @classmethod
     def _load_exceptions(cls):
         """
-        Loads the exceptions.yaml file and caches it.
-        This method is called only once to optimize performance.
+        Loads the exceptions.yaml file, caches it and compiles its exception index.
+        Called once on first use and again whenever the file changes.
         """
         # The path is constructed relative to this file's location.
         # It goes up one level (to the 'rules' dir) and then into a 'config' dir.
         # Assumed structure: project_root/rules/base_rule.py and project_root/config/exceptions.yaml
-        path = os.path.join(os.path.dirname(__file__), '..', 'config', 'exceptions.yaml')
+        path = EXCEPTIONS_PATH
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                cls._exceptions = yaml.safe_load(f)
-                if not isinstance(cls._exceptions, dict):
+                exceptions = yaml.safe_load(f)
+                if not isinstance(exceptions, dict):
                     print(f"Warning: exceptions.yaml at {path} is not a valid dictionary. Disabling exceptions.")
-                    cls._exceptions = {}
+                    exceptions = {}
         except FileNotFoundError:
             print(f"Warning: exceptions.yaml not found at {path}. No exceptions will be applied.")
-            cls._exceptions = {}
+            exceptions = {}
         except Exception as e:
             print(f"Error loading or parsing exceptions.yaml: {e}")
-            cls._exceptions = {}
+            exceptions = {}
+
+        # Rules read the index without locking, so it is replaced in one assignment
+        cls._exception_index = ExceptionIndex.from_config(exceptions)
+        cls._exceptions = exceptions
+        cls._exceptions_mtime = mtime
+        cls._exceptions_checked_at = time.monotonic()
+
+    @classmethod
+    def _get_exception_index(cls) -> ExceptionIndex:
+        """Return the compiled exception index, reloading it if exceptions.yaml has changed."""
+        now = time.monotonic()
+        if BaseRule._exception_index is not None and now - BaseRule._exceptions_checked_at < EXCEPTIONS_RELOAD_INTERVAL:
+            return BaseRule._exception_index
+
+        with BaseRule._exceptions_lock:
+            if BaseRule._exception_index is None:
+                BaseRule._load_exceptions()
+            elif now - BaseRule._exceptions_checked_at >= EXCEPTIONS_RELOAD_INTERVAL:
+                try:
+                    mtime = os.path.getmtime(EXCEPTIONS_PATH)
+                except OSError:
+                    mtime = None
+                if mtime != BaseRule._exceptions_mtime:
+                    BaseRule._load_exceptions()
+                else:
+                    BaseRule._exceptions_checked_at = now
+        return BaseRule._exception_index
 
     @classmethod
     def _initialize_validation_system(cls):
@@ -144,7 +233,7 @@ class BaseRule(ABC):
             cls._validation_pipeline = None
             cls._validation_pipeline_config = None
 
-    def _is_excepted(self, text_span: str) -> bool:
+    def _is_excepted(self, text_span: str, rule_type: Optional[str] = None) -> bool:
         """
         Checks if a given text span is in the global or rule-specific exception list.
         This is the core method for preventing false positives.
@@ -152,30 +241,36 @@ class BaseRule(ABC):
 
         Args:
             text_span: The word or phrase to check (e.g., "user interface").
+            rule_type: Rule-specific exception list to check (defaults to this rule's type).
 
         Returns:
             True if the text_span is an exception, False otherwise.
         """
-        if not self._exceptions or not text_span:
+        if not text_span:
             return False
+        return self._get_exception_index().is_excepted(text_span, rule_type or self.rule_type)
 
-        text_span_lower = text_span.lower().strip()
+    def _excepted_token_indices(self, doc, rule_type: Optional[str] = None) -> Set[int]:
+        """
+        Get the indices of tokens covered by a global or rule-specific exception.
 
-        # 1. Check global exceptions
-        global_exceptions = self._exceptions.get('global_exceptions', [])
-        if isinstance(global_exceptions, list):
-            if text_span_lower in [str(exc).lower() for exc in global_exceptions]:
-                return True
+        Multi-word exceptions (e.g., "user interface") are matched directly against
+        the tokens of the Doc or Span.
 
-        # 2. Check rule-specific exceptions
-        rule_specifics = self._exceptions.get('rule_specific_exceptions', {})
-        if isinstance(rule_specifics, dict):
-            rule_exceptions = rule_specifics.get(self.rule_type, [])
-            if isinstance(rule_exceptions, list):
-                if text_span_lower in [str(exc).lower() for exc in rule_exceptions]:
-                    return True
+        Args:
+            doc: SpaCy Doc or Span to scan
+            rule_type: Rule-specific exception list to use (defaults to this rule's type).
 
-        return False
+        Returns:
+            Set of ``token.i`` values inside an excepted phrase.
+        """
+        if doc is None:
+            return set()
+        index = self._get_exception_index()
+        tokens = list(doc)
+        return {tokens[position].i
+                for start, end in index.match_tokens(tokens, rule_type or self.rule_type)
+                for position in range(start, end)}
 
     @abstractmethod
     def _get_rule_type(self) -> str:
@@ -265,6 +360,28 @@ class BaseRule(ABC):
                 
         return errors
     
+    def _get_sentence_index(self, item) -> int:
+        """
+        Get the index within ``doc.sents`` of the sentence containing a token or span.
+
+        Uses the per-Doc sentence index, so each lookup is O(1) instead of a scan
+        over every sentence.
+        """
+        return sentence_index_of(item)
+
+    def _locate_char(self, doc, char_start: int) -> Tuple[Any, Any, int]:
+        """
+        Find the token containing a character offset, its sentence and sentence index.
+
+        Returns:
+            (token, sentence span, sentence index), or (None, None, 0) when no
+            token contains ``char_start``.
+        """
+        token = token_at_char(doc, char_start)
+        if token is None:
+            return None, None, 0
+        return token, token.sent, sentence_index_of(token)
+
     def _process_match_span(self, span, word_map=None, error_type_prefix="word_usage"):
         """
         Convert a spaCy span match to error format.
@@ -279,13 +396,7 @@ class BaseRule(ABC):
         """
         matched_text = span.text.lower()
         sent = span.sent
-        
-        # Get sentence index
-        sentence_index = 0
-        for i, s in enumerate(span.doc.sents):
-            if s == sent:
-                sentence_index = i
-                break
+        sentence_index = self._get_sentence_index(span)
         
         # Default error details
         error_details = {
@@ -1181,6 +1292,11 @@ class BaseRule(ABC):
         """
         Create standardized error dictionary with enhanced validation system integration.
         
+        Inside a ``BaseRule.deferred_scoring()`` block (as used by the rules
+        registry) the error is returned as a lightweight candidate: confidence
+        and validation fields are added later, in one batch, by
+        ``BaseRule.score_deferred_errors``.
+        
         Args:
             sentence: The sentence containing the error
             sentence_index: Index of the sentence
@@ -1206,26 +1322,23 @@ class BaseRule(ABC):
             'sentence_index': int(sentence_index),
             'severity': severity
         }
+        scoring_request = None
         
         # Enhanced validation integration (if available)
         if ENHANCED_VALIDATION_AVAILABLE and self._confidence_calculator and self._validation_pipeline:
-            try:
-                enhanced_fields = self._calculate_enhanced_error_fields(
-                    sentence, message, text, context, extra_data
-                )
-                error.update(enhanced_fields)
-            except Exception as e:
-                # Log warning but don't fail - maintain backward compatibility
-                print(f"Warning: Enhanced validation failed for rule {self.rule_type}: {e}")
-                # Add basic enhanced fields as fallback
-                error.update({
-                    'confidence_score': 0.5,  # Default confidence
-                    'confidence': 0.5,  # Backward compatibility
-                    'confidence_breakdown': None,
-                    'validation_result': None,
-                    'enhanced_validation_available': False,
-                    'validation_error': str(e)
-                })
+            if BaseRule.is_scoring_deferred():
+                scoring_request = self._build_scoring_request(sentence, message, text, context, extra_data)
+            else:
+                try:
+                    enhanced_fields = self._calculate_enhanced_error_fields(
+                        sentence, message, text, context, extra_data
+                    )
+                    error.update(enhanced_fields)
+                except Exception as e:
+                    # Log warning but don't fail - maintain backward compatibility
+                    print(f"Warning: Enhanced validation failed for rule {self.rule_type}: {e}")
+                    # Add basic enhanced fields as fallback
+                    error.update(self._fallback_enhanced_fields(e))
         else:
             # Mark that enhanced validation is not available
             error['enhanced_validation_available'] = False
@@ -1239,8 +1352,151 @@ class BaseRule(ABC):
             except Exception as e:
                 error[str(key)] = f"<serialization_error: {str(e)}>"
         
+        if scoring_request is not None:
+            error[SCORING_REQUEST_KEY] = scoring_request
+        
         return error
     
+    @staticmethod
+    def _fallback_enhanced_fields(error: Exception) -> Dict[str, Any]:
+        """Enhanced fields used when confidence scoring fails altogether."""
+        return {
+            'confidence_score': 0.5,  # Default confidence
+            'confidence': 0.5,  # Backward compatibility
+            'confidence_breakdown': None,
+            'validation_result': None,
+            'enhanced_validation_available': False,
+            'validation_error': str(error)
+        }
+    
+    @staticmethod
+    @contextmanager
+    def deferred_scoring():
+        """
+        Defer confidence scoring of errors created in this thread until the block exits.
+        
+        Errors created by ``_create_error`` inside the block carry a scoring
+        request instead of confidence fields; the caller must pop it with
+        ``pop_scoring_request`` and pass the errors to ``score_deferred_errors``.
+        """
+        previous = getattr(_scoring_state, 'deferred', False)
+        _scoring_state.deferred = True
+        try:
+            yield
+        finally:
+            _scoring_state.deferred = previous
+    
+    @staticmethod
+    def is_scoring_deferred() -> bool:
+        return getattr(_scoring_state, 'deferred', False)
+    
+    @staticmethod
+    def pop_scoring_request(error: Any) -> Optional['ErrorScoringRequest']:
+        """Remove and return the deferred scoring request attached to an error, if any."""
+        if isinstance(error, dict):
+            return error.pop(SCORING_REQUEST_KEY, None)
+        return None
+    
+    @classmethod
+    def score_deferred_errors(cls, pending: List[Tuple[Dict[str, Any], 'ErrorScoringRequest']]) -> None:
+        """
+        Score deferred error candidates in one batch, adding the same fields
+        ``_create_error`` adds when scoring immediately.
+        
+        Candidates with identical scoring inputs (e.g. the same issue reported
+        twice) are scored once. Confidence is calculated per distinct candidate;
+        the validation pipeline runs once for the whole batch, sharing analysis
+        between errors found in the same text.
+        
+        Args:
+            pending: (error, scoring_request) pairs; errors are updated in place
+        """
+        if not pending:
+            return
+        
+        # Deduplicate identical candidates before paying for any scoring
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        requests: Dict[tuple, ErrorScoringRequest] = {}
+        for error, request in pending:
+            key = request.scoring_key()
+            groups.setdefault(key, []).append(error)
+            requests.setdefault(key, request)
+        
+        scored = []
+        for key, request in requests.items():
+            try:
+                scored.append((key, request, request.rule._calculate_confidence_fields(request)))
+            except Exception as e:
+                print(f"Warning: Enhanced validation failed for rule {request.rule.rule_type}: {e}")
+                for error in groups[key]:
+                    cls._merge_enhanced_fields(error, request.rule._fallback_enhanced_fields(e))
+        
+        pipeline_results = [None] * len(scored)
+        pipeline_error = None
+        if cls._validation_pipeline is not None and scored:
+            try:
+                contexts = [request.rule._build_validation_context(request, fields) for _, request, fields in scored]
+                pipeline_results = cls._validation_pipeline.validate_errors(contexts)
+            except Exception as e:
+                print(f"Warning: Validation pipeline failed: {e}")
+                pipeline_error = e
+        
+        for (key, request, fields), pipeline_result in zip(scored, pipeline_results):
+            rule = request.rule
+            if pipeline_error is not None:
+                fields['validation_pipeline_error'] = str(pipeline_error)
+            else:
+                rule._apply_pipeline_result(fields, pipeline_result)
+            enhanced_fields = rule._make_serializable(rule._finish_enhanced_fields(request, fields))
+            
+            for index, error in enumerate(groups[key]):
+                cls._merge_enhanced_fields(error, enhanced_fields if index == 0 else copy.deepcopy(enhanced_fields))
+    
+    @staticmethod
+    def _merge_enhanced_fields(error: Dict[str, Any], enhanced_fields: Dict[str, Any]) -> None:
+        """
+        Insert enhanced fields after the base error fields of a scored candidate.
+        
+        Fields the rule set itself (through extra data or afterwards) take
+        precedence, as they do when scoring immediately.
+        """
+        rest = {key: error.pop(key) for key in list(error) if key not in BASE_ERROR_FIELDS}
+        for key, value in enhanced_fields.items():
+            if key not in rest:
+                error[key] = value
+        error.update(rest)
+    
+    def _build_scoring_request(self, sentence: str, message: str, text: Optional[str],
+                               context: Optional[Dict[str, Any]], extra_data: Dict[str, Any]) -> 'ErrorScoringRequest':
+        """Capture everything confidence scoring needs about an error."""
+        # Extract error position and text from extra data if available
+        error_position = extra_data.get('span', [0, 0])[0] if extra_data.get('span') else 0
+        error_text = extra_data.get('flagged_text', '') or extra_data.get('error_text', '')
+        
+        # Get content metadata
+        content_type = None
+        domain = None
+        if context:
+            content_type = context.get('content_type') or context.get('block_type')
+            domain = context.get('domain')
+        
+        return ErrorScoringRequest(
+            rule=self,
+            sentence=sentence,
+            message=message,
+            text=text,
+            context=context,
+            # Use full text if available, otherwise fall back to sentence
+            analysis_text=text or sentence,
+            error_position=error_position,
+            error_text=error_text,
+            content_type=content_type,
+            domain=domain,
+            severity=extra_data.get('severity', 'medium'),
+            suggestions=extra_data.get('suggestions', []),
+            evidence_score=extra_data.get('evidence_score')
+        )
+    
     def _calculate_enhanced_error_fields(self, sentence: str, message: str, 
                                        text: Optional[str], context: Optional[Dict[str, Any]],
                                        extra_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1257,6 +1513,24 @@ class BaseRule(ABC):
         Returns:
             Dictionary with enhanced error fields
         """
+        request = self._build_scoring_request(sentence, message, text, context, extra_data)
+        
+        # 1. Calculate normalized confidence score
+        enhanced_fields = self._calculate_confidence_fields(request)
+        
+        # 2. Run validation pipeline
+        try:
+            validation_context = self._build_validation_context(request, enhanced_fields)
+            pipeline_result = self._validation_pipeline.validate_error(validation_context)
+            self._apply_pipeline_result(enhanced_fields, pipeline_result)
+        except Exception as e:
+            print(f"Warning: Validation pipeline failed: {e}")
+            enhanced_fields['validation_pipeline_error'] = str(e)
+        
+        return self._finish_enhanced_fields(request, enhanced_fields)
+    
+    def _calculate_confidence_fields(self, request: 'ErrorScoringRequest') -> Dict[str, Any]:
+        """Calculate the normalized confidence score (with provenance) for an error."""
         enhanced_fields = {
             'enhanced_validation_available': True,
             'confidence_score': 0.5,  # Default fallback
@@ -1264,31 +1538,16 @@ class BaseRule(ABC):
             'validation_result': None
         }
         
-        # Use full text if available, otherwise fall back to sentence
-        analysis_text = text or sentence
-        
-        # Extract error position and text from extra data if available
-        error_position = extra_data.get('span', [0, 0])[0] if extra_data.get('span') else 0
-        error_text = extra_data.get('flagged_text', '') or extra_data.get('error_text', '')
-        
-        # Get content metadata
-        content_type = None
-        domain = None
-        if context:
-            content_type = context.get('content_type') or context.get('block_type')
-            domain = context.get('domain')
-        
-        # 1. Calculate normalized confidence score (replaces legacy confidence calculation)
         try:
             # Use the new normalized confidence calculation with provenance
             normalized_confidence, confidence_breakdown = self._confidence_calculator.calculate_normalized_confidence(
-                text=analysis_text,
-                error_position=error_position,
+                text=request.analysis_text,
+                error_position=request.error_position,
                 rule_type=self.rule_type,
-                content_type=content_type,
+                content_type=request.content_type,
                 rule_reliability=self._get_rule_reliability_coefficient(),
                 base_confidence=0.5,
-                evidence_score=extra_data.get('evidence_score'),
+                evidence_score=request.evidence_score,
                 return_breakdown=True
             )
             
@@ -1305,49 +1564,51 @@ class BaseRule(ABC):
             print(f"Warning: Confidence calculation failed: {e}")
             enhanced_fields['confidence_calculation_error'] = str(e)
         
-        # 2. Run validation pipeline
-        try:
-            validation_context = ValidationContext(
-                text=analysis_text,
-                error_position=error_position,
-                error_text=error_text,
-                rule_type=self.rule_type,
-                rule_name=self.__class__.__name__,
-                rule_severity=extra_data.get('severity', 'medium'),
-                content_type=content_type,
-                domain=domain,
-                confidence_breakdown=enhanced_fields.get('confidence_breakdown'),
-                additional_context={
-                    'sentence': sentence,
-                    'message': message,
-                    'suggestions': extra_data.get('suggestions', []),
-                    'original_context': context or {}
-                }
-            )
-            
-            pipeline_result = self._validation_pipeline.validate_error(validation_context)
-            enhanced_fields['validation_result'] = self._make_serializable(pipeline_result)
-            
-            # Extract key validation insights
-            if pipeline_result and hasattr(pipeline_result, 'final_result'):
-                final_result = pipeline_result.final_result
-                enhanced_fields['validation_decision'] = final_result.decision.value if hasattr(final_result.decision, 'value') else str(final_result.decision)
-                enhanced_fields['validation_confidence'] = final_result.confidence_score
-                enhanced_fields['validation_reasoning'] = final_result.reasoning
-                
-                # Update overall confidence if validation provides better estimate
-                if final_result.confidence_score > enhanced_fields['confidence_score']:
-                    enhanced_fields['confidence_score'] = final_result.confidence_score
-            
-        except Exception as e:
-            print(f"Warning: Validation pipeline failed: {e}")
-            enhanced_fields['validation_pipeline_error'] = str(e)
-        
+        return enhanced_fields
+    
+    def _build_validation_context(self, request: 'ErrorScoringRequest',
+                                  enhanced_fields: Dict[str, Any]) -> 'ValidationContext':
+        """Build the validation pipeline context for an error."""
+        return ValidationContext(
+            text=request.analysis_text,
+            error_position=request.error_position,
+            error_text=request.error_text,
+            rule_type=self.rule_type,
+            rule_name=self.__class__.__name__,
+            rule_severity=request.severity,
+            content_type=request.content_type,
+            domain=request.domain,
+            confidence_breakdown=enhanced_fields.get('confidence_breakdown'),
+            additional_context={
+                'sentence': request.sentence,
+                'message': request.message,
+                'suggestions': request.suggestions,
+                'original_context': request.context or {}
+            }
+        )
+    
+    def _apply_pipeline_result(self, enhanced_fields: Dict[str, Any], pipeline_result: Any) -> None:
+        """Record the validation pipeline's verdict in the enhanced fields."""
+        enhanced_fields['validation_result'] = self._make_serializable(pipeline_result)
+        
+        # Extract key validation insights
+        if pipeline_result and hasattr(pipeline_result, 'final_result'):
+            final_result = pipeline_result.final_result
+            enhanced_fields['validation_decision'] = final_result.decision.value if hasattr(final_result.decision, 'value') else str(final_result.decision)
+            enhanced_fields['validation_confidence'] = final_result.confidence_score
+            enhanced_fields['validation_reasoning'] = final_result.reasoning
+            
+            # Update overall confidence if validation provides better estimate
+            if final_result.confidence_score > enhanced_fields['confidence_score']:
+                enhanced_fields['confidence_score'] = final_result.confidence_score
+    
+    def _finish_enhanced_fields(self, request: 'ErrorScoringRequest', enhanced_fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the remaining context fields and the backward compatible confidence alias."""
         # Preserve Level 2 Enhanced Validation fields
-        if text is not None:
-            enhanced_fields['text'] = text
-        if context is not None:
-            enhanced_fields['context'] = context
+        if request.text is not None:
+            enhanced_fields['text'] = request.text
+        if request.context is not None:
+            enhanced_fields['context'] = request.context
         
         # Backward compatibility: Map confidence_score to confidence
         if 'confidence_score' in enhanced_fields:
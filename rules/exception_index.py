@@ -0,0 +1,123 @@
+"""
+Exception Index Module
+Precompiled lookup structure for config/exceptions.yaml.
+
+BaseRule._is_excepted is called for candidate tokens in many rules. Instead of
+lowercasing the exception lists on every call, the YAML is compiled once into
+frozensets (global and per rule) for O(1) membership checks, plus a character
+trie per rule so multi-word exceptions can be matched directly against the
+tokens of a Doc or Span.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+# Trie key marking the end of an exception phrase
+_TERMINAL = ''
+
+
+def _normalize(term: Any) -> str:
+    return str(term).lower().strip()
+
+
+def _terms(entries: Any) -> FrozenSet[str]:
+    if not isinstance(entries, list):
+        return _EMPTY
+    return frozenset(term for term in map(_normalize, entries) if term)
+
+
+def _build_trie(terms: Iterable[str]) -> Dict[str, dict]:
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        # Runs of whitespace match the single space between tokens
+        for char in ' '.join(term.split()):
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = {}
+    return trie
+
+
+class ExceptionIndex:
+    """
+    Immutable index of global and rule-specific exceptions.
+
+    Terms are compared lowercased with surrounding whitespace removed, exactly like
+    the list-based check it replaces.
+    """
+
+    def __init__(self, global_terms: FrozenSet[str], rule_terms: Mapping[str, FrozenSet[str]]):
+        self.global_terms = global_terms
+        self.rule_terms = MappingProxyType(dict(rule_terms))
+        self._global_trie = _build_trie(global_terms)
+        self._rule_tries = MappingProxyType({
+            rule_type: _build_trie(global_terms | terms) for rule_type, terms in self.rule_terms.items()
+        })
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'ExceptionIndex':
+        """Compile the parsed exceptions.yaml mapping."""
+        config = config if isinstance(config, dict) else {}
+        rule_specifics = config.get('rule_specific_exceptions', {})
+        if not isinstance(rule_specifics, dict):
+            rule_specifics = {}
+        return cls(
+            _terms(config.get('global_exceptions', [])),
+            {rule_type: _terms(entries) for rule_type, entries in rule_specifics.items()}
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.global_terms) or any(self.rule_terms.values())
+
+    def terms_for(self, rule_type: Optional[str]) -> FrozenSet[str]:
+        """Rule-specific exceptions for ``rule_type`` (global exceptions not included)."""
+        return self.rule_terms.get(rule_type, _EMPTY)
+
+    def is_excepted(self, text_span: str, rule_type: Optional[str] = None) -> bool:
+        """Check ``text_span`` against the global and ``rule_type`` exceptions."""
+        if not text_span:
+            return False
+        term = text_span.lower().strip()
+        return term in self.global_terms or term in self.terms_for(rule_type)
+
+    def match_tokens(self, tokens: Sequence[Any], rule_type: Optional[str] = None) -> List[Tuple[int, int]]:
+        """
+        Find exceptions in a token sequence (a spaCy Doc or Span).
+
+        Returns (start, end) positions into ``tokens``, end exclusive. The longest
+        exception starting at a token wins and matching resumes after it.
+        """
+        trie = self._rule_tries.get(rule_type, self._global_trie)
+        if not trie or not tokens:
+            return []
+
+        words = [(token.text.lower(), bool(token.whitespace_)) for token in tokens]
+        matches = []
+        start = 0
+        while start < len(words):
+            end = self._longest_match(trie, words, start)
+            if end:
+                matches.append((start, end))
+                start = end
+            else:
+                start += 1
+        return matches
+
+    @staticmethod
+    def _longest_match(trie: Dict[str, dict], words: List[Tuple[str, bool]], start: int) -> int:
+        node = trie
+        longest = 0
+        for position in range(start, len(words)):
+            # Tokens written without a space between them (e.g. "end-of-life") join directly
+            if position > start and words[position - 1][1]:
+                node = node.get(' ')
+                if node is None:
+                    return longest
+            for char in words[position][0]:
+                node = node.get(char)
+                if node is None:
+                    return longest
+            if _TERMINAL in node:
+                longest = position + 1
+        return longest
@@ -107,7 +107,7 @@ class AbbreviationsRule(BaseLanguageRule):
                     # Only create error if evidence suggests it's worth evaluating
                     if evidence_score > 0.1:  # Low threshold - let enhanced validation decide
                         sent = token.sent
-                        sent_index = list(doc.sents).index(sent)
+                        sent_index = self._get_sentence_index(sent)
                         errors.append(self._create_error(
                             sentence=sent.text,
                             sentence_index=sent_index,
@@ -132,7 +132,7 @@ class AbbreviationsRule(BaseLanguageRule):
                     # Only create error if evidence suggests it's worth evaluating
                     if evidence_score > 0.1:  # Low threshold - let enhanced validation decide
                         sent = token.sent
-                        sent_index = list(doc.sents).index(sent)
+                        sent_index = self._get_sentence_index(sent)
                         errors.append(self._create_error(
                             sentence=sent.text,
                             sentence_index=sent_index,
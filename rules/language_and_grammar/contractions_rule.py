@@ -149,7 +149,7 @@ class ContractionsRule(BaseLanguageRule):
         
         # METHOD 1: spaCy morphological analysis
         for sent in doc.sents:
-            sent_index = list(doc.sents).index(sent)
+            sent_index = self._get_sentence_index(sent)
             for token in sent:
                 # UNIVERSAL LINGUISTIC ANCHOR: Check if token has contraction characteristics
                 if self._is_contraction_by_morphology(token):
@@ -117,7 +117,7 @@ class PrefixesRule(BaseLanguageRule):
                             
                             errors.append(self._create_error(
                                 sentence=sent.text,
-                                sentence_index=list(doc.sents).index(sent),
+                                sentence_index=self._get_sentence_index(sent),
                                 message=self._get_contextual_prefix_message(prefix_part, full_match, evidence_score),
                                 suggestions=self._generate_smart_prefix_suggestions(prefix_part, full_match, evidence_score, context_analysis, context),
                                 severity='medium',
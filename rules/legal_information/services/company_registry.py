@@ -7,7 +7,7 @@ import os
 import yaml
 import re
 import logging
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, List, Set, Optional, Pattern, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -29,6 +29,32 @@ class Company:
         names.update(self.aliases)
         return names
 
+def _trie_pattern(names) -> str:
+    """
+    Build a regex alternation of ``names`` shaped as a prefix trie.
+    
+    Shared prefixes are matched once, so the cost of trying every name at a
+    position grows with name length rather than with the number of names.
+    Optional suffixes are greedy, which makes the longest name win.
+    """
+    trie: Dict[str, dict] = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if '' not in node and len(branches) == 1:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if '' in node else group
+    
+    return emit(trie)
+
 class CompanyRegistry:
     """
     Production-grade company registry with multiple data sources.
@@ -46,6 +72,7 @@ class CompanyRegistry:
         self.companies: Dict[str, Company] = {}
         self.legal_suffixes: Set[str] = set()
         self.config = {}
+        self._detector: Tuple[Optional[Pattern], Dict[str, Company], bool] = (None, {}, False)
         self._load_configuration()
         self._initialize_companies()
     
@@ -83,6 +110,7 @@ class CompanyRegistry:
         # self._load_api_companies()
         # self._load_database_companies()
         
+        self._build_detector()
         logger.info(f"Initialized company registry with {len(self.companies)} companies")
     
     def _load_static_companies(self, company_data: List[Dict]) -> None:
@@ -140,40 +168,48 @@ class CompanyRegistry:
         """
         Production-grade company detection in text.
         
+        All names and aliases are matched in a single scan with the pattern
+        compiled by ``_build_detector``. At each position the longest matching
+        name wins and scanning resumes after it, so detections are sorted,
+        non-overlapping intervals.
+        
         Returns:
             List of (matched_text, start_pos, end_pos, company_object) tuples
         """
         if not text:
             return []
         
+        pattern, name_index, case_sensitive = self._detector
+        if pattern is None:
+            return []
+        
         detections = []
+        for match in pattern.finditer(text):
+            matched_text = match.group()
+            company = name_index.get(matched_text if case_sensitive else matched_text.lower())
+            if company is not None:
+                detections.append((matched_text, match.start(), match.end(), company))
+        
+        return detections
+    
+    def _build_detector(self) -> None:
+        """Compile every known company name into one word-bounded pattern"""
         case_sensitive = self.config.get('detection_settings', {}).get('case_sensitive', False)
         
-        # Get unique companies (avoid duplicates from aliases)
-        unique_companies = {}
-        for company in self.companies.values():
-            unique_companies[company.name] = company
+        if case_sensitive:
+            name_index = {name: company for company in self.companies.values()
+                          for name in company.all_names() if name}
+        else:
+            # Same lowercased lookup as get_company()
+            name_index = {name: company for name, company in self.companies.items() if name}
         
-        for company in unique_companies.values():
-            for name in company.all_names():
-                # Create regex pattern for word boundaries
-                pattern = r'\b' + re.escape(name) + r'\b'
-                flags = 0 if case_sensitive else re.IGNORECASE
-                
-                for match in re.finditer(pattern, text, flags):
-                    # Avoid duplicates at same position
-                    start, end = match.start(), match.end()
-                    duplicate = any(
-                        abs(det[1] - start) < 3 and abs(det[2] - end) < 3 
-                        for det in detections
-                    )
-                    
-                    if not duplicate:
-                        detections.append((match.group(), start, end, company))
+        pattern = None
+        if name_index:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            pattern = re.compile(r'\b' + _trie_pattern(name_index) + r'\b', flags)
         
-        # Sort by position in text
-        detections.sort(key=lambda x: x[1])
-        return detections
+        # Swapped in one assignment so concurrent detections never see a partial rebuild
+        self._detector = (pattern, name_index, case_sensitive)
     
     def reload_configuration(self) -> None:
         """Reload configuration from file (for runtime updates)"""
@@ -0,0 +1,230 @@
+"""
+Rule Manifest - Prebuilt index of the rules in this package.
+
+Discovering rules means importing every ``*_rule.py`` module and instantiating
+every rule class, which dominates registry start-up (and therefore the cold start
+of every analysis worker process). The manifest records, per rule type, where
+the rule lives, which class implements it and its category. With a current
+manifest the registry only creates lightweight LazyRule placeholders and imports
+a rule the first time it is actually selected.
+
+The manifest is keyed by a content fingerprint of the rule modules, so a
+manifest that no longer matches them is ignored and the registry falls back to
+a full discovery. The registry never writes the shipped manifest; regenerate it
+after adding, removing or editing a rule with::
+
+    python -m rules.rule_manifest
+
+Set RULES_MANIFEST_CACHE_PATH to let the registry keep a manifest of its own
+discovery there, for installs whose rules differ from the shipped manifest.
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+MANIFEST_VERSION = 2
+RULES_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MANIFEST_PATH = os.path.join(RULES_DIR, 'rule_manifest.json')
+# Writable manifest for the registry's own discovery results; unset means none is written
+MANIFEST_CACHE_PATH = os.getenv('RULES_MANIFEST_CACHE_PATH') or None
+MAX_RULE_DEPTH = 4
+
+
+def is_rule_filename(filename: str) -> bool:
+    """Whether a file is a discoverable rule module (base rule modules are not)."""
+    return filename.endswith('_rule.py') and not filename.startswith('base_')
+
+
+def iter_rule_files(rules_dir: str = RULES_DIR) -> Iterator[Tuple[str, str, List[str]]]:
+    """
+    Yield (directory, filename, path_parts) for every rule module, in os.walk order.
+
+    ``path_parts`` are the subdirectories between ``rules_dir`` and the module.
+    Hidden directories, ``__pycache__`` and directories nested deeper than
+    MAX_RULE_DEPTH are skipped.
+    """
+    for root, dirs, files in os.walk(rules_dir):
+        rel_path = os.path.relpath(root, rules_dir)
+        path_parts = [] if rel_path == '.' else rel_path.split(os.sep)
+
+        if '__pycache__' in path_parts or any(part.startswith('.') for part in path_parts):
+            continue
+        if len(path_parts) > MAX_RULE_DEPTH:
+            continue
+
+        for filename in files:
+            if is_rule_filename(filename):
+                yield root, filename, path_parts
+
+
+def compute_sources_fingerprint(rules_dir: str = RULES_DIR) -> str:
+    """Content hash of every rule module."""
+    digest = hashlib.sha256()
+    sources = sorted(os.path.join(root, filename) for root, filename, _ in iter_rule_files(rules_dir))
+
+    for path in sources:
+        digest.update(os.path.relpath(path, rules_dir).encode('utf-8'))
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b'<missing>')
+    return digest.hexdigest()
+
+
+def load_manifest(path: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+    """Return the manifest at ``path`` if it exists and matches ``fingerprint``, else None."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION or manifest.get('fingerprint') != fingerprint:
+        return None
+    if not isinstance(manifest.get('rules'), dict):
+        return None
+    return manifest
+
+
+def write_manifest(path: str, fingerprint: str, rules: Dict[str, Dict[str, Any]]) -> bool:
+    """Atomically write a manifest. Returns False if the location is not writable."""
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'fingerprint': fingerprint,
+        'rules': {rule_type: rules[rule_type] for rule_type in sorted(rules)}
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+
+class LazyRule:
+    """Placeholder for a rule that has been discovered but not yet imported."""
+
+    def __init__(self, rule_type: str, entry: Dict[str, Any], rules_dir: str = RULES_DIR):
+        self.rule_type = rule_type
+        self.module = entry['module']
+        self.class_name = entry['class_name']
+        self.file = entry.get('file')
+        self.rules_dir = rules_dir
+
+    def load(self):
+        """Import the rule module and instantiate the rule class."""
+        try:
+            module = importlib.import_module(self.module)
+        except ImportError:
+            if not self.file:
+                raise
+            # Same fallback as discovery: load the module straight from its file
+            file_path = os.path.join(self.rules_dir, self.file)
+            spec = importlib.util.spec_from_file_location(self.module, file_path)
+            if not spec or not spec.loader:
+                raise
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+        rule = getattr(module, self.class_name)()
+        if rule.rule_type != self.rule_type:
+            raise ImportError(f"{self.module}.{self.class_name} now provides rule type "
+                              f"'{rule.rule_type}', expected '{self.rule_type}'")
+        return rule
+
+    def __repr__(self):
+        return f"LazyRule({self.rule_type!r}, {self.module}.{self.class_name})"
+
+
+class LazyRuleDict(dict):
+    """
+    Mapping of rule_type -> rule that imports LazyRule entries on first access.
+
+    Membership tests, ``len`` and key iteration never import anything. Item
+    access, ``get``, ``values`` and ``items`` return real rule instances; a rule
+    that fails to import is reported once and dropped from the mapping.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._load_lock = threading.RLock()
+
+    def _resolve(self, rule_type: str):
+        value = dict.get(self, rule_type)
+        if not isinstance(value, LazyRule):
+            return value
+
+        with self._load_lock:
+            value = dict.get(self, rule_type)
+            if not isinstance(value, LazyRule):
+                return value
+            try:
+                rule = value.load()
+            except Exception as e:
+                print(f"❌ Error loading rule {rule_type} from {value.module}: {e}")
+                dict.pop(self, rule_type, None)
+                return None
+            dict.__setitem__(self, rule_type, rule)
+            return rule
+
+    def __getitem__(self, rule_type: str):
+        rule = self._resolve(rule_type)
+        if rule is None:
+            raise KeyError(rule_type)
+        return rule
+
+    def get(self, rule_type: str, default=None):
+        if not dict.__contains__(self, rule_type):
+            return default
+        rule = self._resolve(rule_type)
+        return default if rule is None else rule
+
+    def is_loaded(self, rule_type: str) -> bool:
+        """Whether a rule has been imported (False for unknown rule types)."""
+        return dict.__contains__(self, rule_type) and not isinstance(dict.__getitem__(self, rule_type), LazyRule)
+
+    def loaded_rule_types(self) -> List[str]:
+        return [rule_type for rule_type, value in dict.items(self) if not isinstance(value, LazyRule)]
+
+    def load_all(self):
+        for rule_type in list(self.keys()):
+            self._resolve(rule_type)
+
+    def values(self):
+        self.load_all()
+        return list(dict.values(self))
+
+    def items(self):
+        self.load_all()
+        return list(dict.items(self))
+
+
+def main():
+    """Rebuild the manifest from a full rule discovery."""
+    from rules import RulesRegistry
+
+    registry = RulesRegistry(enable_enhanced_validation=False, use_manifest=False)
+    fingerprint = compute_sources_fingerprint()
+    if write_manifest(DEFAULT_MANIFEST_PATH, fingerprint, registry.rule_manifest):
+        print(f"📋 Wrote rule manifest with {len(registry.rule_manifest)} rules to {DEFAULT_MANIFEST_PATH}")
+    else:
+        print(f"❌ Could not write rule manifest to {DEFAULT_MANIFEST_PATH}")
+
+
+if __name__ == '__main__':
+    main()
@@ -230,17 +230,11 @@ class SecondPersonRule(BaseLanguageRule):
         if any(token.lemma_.lower() == 'you' for token in doc):
             return errors  # The sentence correctly uses second person
 
+        excepted_tokens = self._excepted_token_indices(doc)
         for token in doc:
             if token.lemma_.lower() in self.third_person_substitutes:
-                # Check for multi-word exceptions first
-                if token.i + 1 < len(doc):
-                    next_token = doc[token.i + 1]
-                    two_word_phrase = f"{token.text} {next_token.text}"
-                    if self._is_excepted(two_word_phrase):
-                        continue
-
-                # Check for single-word exceptions
-                if self._is_excepted(token.text):
+                # Check for single- and multi-word exceptions (e.g. "user interface", "end user")
+                if token.i in excepted_tokens:
                     continue
 
                 # Calculate evidence score for this third person substitute
@@ -475,25 +469,14 @@ class SecondPersonRule(BaseLanguageRule):
         if any(token.lemma_.lower() == 'you' for token in doc):
             return errors # The sentence correctly uses second person.
 
+        excepted_tokens = self._excepted_token_indices(doc)
         for token in doc:
             # Check if the token is a potential substitute (e.g., "user", "administrator")
             if token.lemma_.lower() in self.third_person_substitutes:
                 
-                # *** NEW EXCEPTION HANDLING LOGIC ***
-                # Check for multi-word exceptions first (e.g., "user interface")
-                if token.i + 1 < len(doc):
-                    next_token = doc[token.i + 1]
-                    two_word_phrase = f"{token.text} {next_token.text}"
-                    if self._is_excepted(two_word_phrase):
-                        # This is an allowed phrase like "user interface", so we skip the next token as well
-                        # to avoid it being processed individually.
-                        # We can simply continue here, as the loop will advance past the current token.
-                        continue
-
-                # Check for single-word exceptions (e.g., if you wanted to allow "admin" in some contexts)
-                if self._is_excepted(token.text):
+                # Check for single- and multi-word exceptions (e.g., "user interface", "end user")
+                if token.i in excepted_tokens:
                     continue
-                # *** END OF NEW LOGIC ***
 
                 # If not an exception, proceed with the original logic
                 if self._is_part_of_compound_noun(token):
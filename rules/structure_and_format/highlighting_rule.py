@@ -187,22 +187,15 @@ class HighlightingRule(BaseStructureRule):
                     sent_span = doc.char_span(start_token.idx, end_token.idx + len(end_token.text), alignment_mode="expand")
                     if sent_span:
                         sentence_text = sent_span.sent.text
-                        # Correctly find the sentence index within the doc
-                        sentence_index = -1
-                        for idx, sent in enumerate(doc.sents):
-                            if sent.start_char == sent_span.sent.start_char:
-                                sentence_index = idx
-                                break
-
-                        if sentence_index != -1:
-                            candidates.append({
-                                'text': phrase_text,
-                                'span': (start_token.idx, end_token.idx + len(end_token.text)),
-                                'sentence': sentence_text,
-                                'sentence_index': sentence_index,
-                                'ui_type': token.lemma_,
-                                'imperative_verb': token.head.lemma_
-                            })
+                        sentence_index = self._get_sentence_index(sent_span)
+                        candidates.append({
+                            'text': phrase_text,
+                            'span': (start_token.idx, end_token.idx + len(end_token.text)),
+                            'sentence': sentence_text,
+                            'sentence_index': sentence_index,
+                            'ui_type': token.lemma_,
+                            'imperative_verb': token.head.lemma_
+                        })
         return candidates
 
     def _is_generic_ui_reference(self, ui_text: str) -> bool:
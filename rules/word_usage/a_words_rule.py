@@ -50,18 +50,14 @@ class AWordsRule(BaseWordUsageRule):
 
         # PRESERVE EXISTING FUNCTIONALITY: Context-aware check for 'action' as a verb
         # This specialized grammar check uses evidence-based scoring with improved linguistic detection
-        for token in doc:
+        for token in self._lexicon_tokens(doc, ("action",)):
             if token.lemma_.lower() == "action" and self._is_action_used_as_verb(token, doc):
                 # Apply surgical guards first
                 if self._apply_surgical_zero_false_positive_guards_word_usage(token, context or {}):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 # Calculate evidence for verb misuse of 'action'
                 evidence_score = self._calculate_a_word_evidence(
@@ -83,7 +79,7 @@ class AWordsRule(BaseWordUsageRule):
                     ))
 
         # Evidence-based analysis for other A-words using lemma-based matching
-        for token in doc:
+        for token in self._lexicon_tokens(doc, a_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -112,11 +108,7 @@ class AWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_a_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -57,20 +57,7 @@ class BWordsRule(BaseWordUsageRule):
                 matched_text = match.group(0)
                 
                 # Find the token and sentence
-                token = None
-                sent = None
-                sentence_index = 0
-                
-                for i, s in enumerate(doc.sents):
-                    if s.start_char <= char_start < s.end_char:
-                        sent = s
-                        sentence_index = i
-                        # Find the specific token
-                        for t in s:
-                            if t.idx <= char_start < t.idx + len(t.text):
-                                token = t
-                                break
-                        break
+                token, sent, sentence_index = self._locate_char(doc, char_start)
                 
                 if sent and token:
                     # Apply surgical guards
@@ -106,7 +93,7 @@ class BWordsRule(BaseWordUsageRule):
         Enhanced morphological analysis for backup vs back up using evidence-based scoring.
         Uses comprehensive POS tagging, dependency parsing, and semantic analysis.
         """
-        for token in doc:
+        for token in self._lexicon_tokens(doc, ("backup", "back")):
             # LINGUISTIC ANCHOR 1: Single token "backup" analysis
             if self._is_backup_single_token(token):
                 # Apply surgical guards
@@ -120,7 +107,7 @@ class BWordsRule(BaseWordUsageRule):
                     
                     if evidence_score > 0.1:
                         sent = token.sent
-                        sentence_idx = list(doc.sents).index(sent)
+                        sentence_idx = self._get_sentence_index(sent)
                         errors.append(self._create_error(
                             sentence=sent.text,
                             sentence_index=sentence_idx,
@@ -149,7 +136,7 @@ class BWordsRule(BaseWordUsageRule):
                         
                         if evidence_score > 0.1:
                             sent = token.sent
-                            sentence_idx = list(doc.sents).index(sent)
+                            sentence_idx = self._get_sentence_index(sent)
                             errors.append(self._create_error(
                                 sentence=sent.text,
                                 sentence_index=sentence_idx,
@@ -14,6 +14,8 @@ except ImportError:
     Token = None
     PhraseMatcher = None
 
+from .lexicon_index import get_lexicon_index
+
 # A generic base rule to be inherited from a central location
 # in a real application. The # type: ignore comments prevent the
 # static type checker from getting confused by the fallback class.
@@ -101,11 +103,7 @@ class BaseWordUsageRule(BaseRule):
                 sent = span.sent
                 
                 # Get sentence index
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 # Get error details from word_details
                 if matched_text in self.word_details:
@@ -143,46 +141,24 @@ class BaseWordUsageRule(BaseRule):
         Returns:
             List of match dictionaries with keys: phrase, start_token, end_token, lemmatized_match
         """
-        matches = []
-        
-        for phrase in phrase_list:
-            phrase_tokens = phrase.strip().split()
-            if not phrase_tokens:
-                continue
-                
-            phrase_len = len(phrase_tokens)
-            
-            # Convert phrase to lemmas for comparison
-            phrase_lemmas = [token.lower() if not case_sensitive else token for token in phrase_tokens]
-            
-            # Scan through document tokens
-            for i in range(len(doc) - phrase_len + 1):
-                # Get consecutive tokens matching phrase length
-                token_sequence = doc[i:i + phrase_len]
-                
-                # Extract lemmas from token sequence
-                token_lemmas = [
-                    token.lemma_.lower() if not case_sensitive else token.lemma_ 
-                    for token in token_sequence
-                ]
-                
-                # Check if lemmas match the target phrase
-                if token_lemmas == phrase_lemmas:
-                    # Extract the actual text span
-                    start_token = token_sequence[0]
-                    end_token = token_sequence[-1]
-                    
-                    matches.append({
-                        'phrase': phrase,
-                        'start_token': start_token,
-                        'end_token': end_token,
-                        'lemmatized_match': ' '.join(token_lemmas),
-                        'actual_text': doc[start_token.i:end_token.i + 1].text,
-                        'start_char': start_token.idx,
-                        'end_char': end_token.idx + len(end_token.text)
-                    })
+        return get_lexicon_index(doc).find_phrases(phrase_list, case_sensitive=case_sensitive)
+
+    def _lexicon_tokens(self, doc, terms) -> List[Any]:
+        """
+        Tokens whose lowercase lemma or text is one of ``terms``, in document order.
         
-        return matches
+        Served from the lexicon index shared by all word usage rules for this Doc,
+        so rules only visit their candidate tokens instead of the whole Doc.
+        """
+        return get_lexicon_index(doc).tokens_for(term.lower() for term in terms)
+
+    def _lexicon_positions(self, doc, terms) -> List[int]:
+        """Token positions for ``terms``, as returned by _lexicon_tokens."""
+        return [token.i for token in self._lexicon_tokens(doc, terms)]
+
+    def _hyphen_positions(self, doc) -> List[int]:
+        """Start positions of "word - word" token sequences, for hyphenated-term checks."""
+        return get_lexicon_index(doc).hyphen_starts()
 
     def _detect_phrasal_verbs_with_unnecessary_prepositions(self, doc) -> List[Dict[str, Any]]:
         """
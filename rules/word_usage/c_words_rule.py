@@ -48,7 +48,7 @@ class CWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for C-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches
-        for token in doc:
+        for token in self._lexicon_tokens(doc, c_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -69,11 +69,7 @@ class CWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_c_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -108,11 +104,7 @@ class CWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_c_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
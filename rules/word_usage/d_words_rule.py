@@ -53,19 +53,7 @@ class DWordsRule(BaseWordUsageRule):
                 matched_text = match.group(0)
                 
                 # Find the token and sentence
-                token = None
-                sent = None
-                sentence_index = 0
-                
-                for i, s in enumerate(doc.sents):
-                    if s.start_char <= char_start < s.end_char:
-                        sent = s
-                        sentence_index = i
-                        for t in s:
-                            if t.idx <= char_start < t.idx + len(t.text):
-                                token = t
-                                break
-                        break
+                token, sent, sentence_index = self._locate_char(doc, char_start)
                 
                 if sent and token:
                     # Apply surgical guards
@@ -48,7 +48,7 @@ class EWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for E-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches
-        for token in doc:
+        for token in self._lexicon_tokens(doc, e_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -77,11 +77,7 @@ class EWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_e_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -114,7 +110,7 @@ class EWordsRule(BaseWordUsageRule):
                     first_part, second_part = pattern_parts
                     
                     # Scan through tokens looking for the pattern
-                    for i in range(len(doc) - 2):
+                    for i in self._hyphen_positions(doc):
                         if (doc[i].text.lower() == first_part and 
                             doc[i + 1].text == '-' and 
                             doc[i + 2].text.lower() == second_part):
@@ -128,11 +124,7 @@ class EWordsRule(BaseWordUsageRule):
                                 continue
                             
                             sent = start_token.sent
-                            sentence_index = 0
-                            for j, s in enumerate(doc.sents):
-                                if s == sent:
-                                    sentence_index = j
-                                    break
+                            sentence_index = self._get_sentence_index(sent)
                             
                             evidence_score = self._calculate_e_word_evidence(
                                 pattern, start_token, sent, text, context or {}, details["category"]
@@ -166,11 +158,7 @@ class EWordsRule(BaseWordUsageRule):
                         continue
                     
                     sent = match['start_token'].sent
-                    sentence_index = 0
-                    for i, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = i
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     evidence_score = self._calculate_e_word_evidence(
                         pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -55,7 +55,7 @@ class HWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for H-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches
-        for token in doc:
+        for token in self._lexicon_tokens(doc, h_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -76,11 +76,7 @@ class HWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_h_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -102,7 +98,7 @@ class HWordsRule(BaseWordUsageRule):
 
         # 2. Hyphenated word detection for H-words
         hyphenated_patterns = ['hard-coded', 'high-availability', 'high-level', 'how-to']
-        for i in range(len(doc) - 2):
+        for i in self._hyphen_positions(doc):
             if (i < len(doc) - 2 and 
                 doc[i + 1].text == "-" and
                 doc[i].text.lower() + "-" + doc[i + 2].text.lower() in hyphenated_patterns):
@@ -116,11 +112,7 @@ class HWordsRule(BaseWordUsageRule):
                         continue
                     
                     sent = doc[i].sent
-                    sentence_index = 0
-                    for j, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = j
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     evidence_score = self._calculate_h_word_evidence(
                         hyphenated_word, doc[i], sent, text, context or {}, details["category"]
@@ -159,11 +151,7 @@ class HWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_h_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
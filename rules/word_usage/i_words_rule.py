@@ -50,7 +50,7 @@ class IWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for I-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches (including abbreviations with periods)
-        for token in doc:
+        for token in self._lexicon_tokens(doc, i_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -90,11 +90,7 @@ class IWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_i_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -116,7 +112,7 @@ class IWordsRule(BaseWordUsageRule):
 
         # 2. Hyphenated word detection for I-words
         hyphenated_patterns = ['in-depth']
-        for i in range(len(doc) - 2):
+        for i in self._hyphen_positions(doc):
             if (i < len(doc) - 2 and 
                 doc[i + 1].text == "-" and
                 doc[i].text.lower() + "-" + doc[i + 2].text.lower() in hyphenated_patterns):
@@ -130,11 +126,7 @@ class IWordsRule(BaseWordUsageRule):
                         continue
                     
                     sent = doc[i].sent
-                    sentence_index = 0
-                    for j, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = j
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     evidence_score = self._calculate_i_word_evidence(
                         hyphenated_word, doc[i], sent, text, context or {}, details["category"]
@@ -173,11 +165,7 @@ class IWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_i_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -45,7 +45,7 @@ class JWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for J-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches using lemma-based approach
-        for token in doc:
+        for token in self._lexicon_tokens(doc, j_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -75,11 +75,7 @@ class JWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_j_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -114,11 +110,7 @@ class JWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_j_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
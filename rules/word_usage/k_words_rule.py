@@ -44,7 +44,7 @@ class KWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for K-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches with special POS handling for "key"
-        for token in doc:
+        for token in self._lexicon_tokens(doc, list(k_word_patterns) + ["key"]):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -75,11 +75,7 @@ class KWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_k_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -101,7 +97,7 @@ class KWordsRule(BaseWordUsageRule):
 
         # 2. Hyphenated word detection for K-words
         hyphenated_patterns = ['know-how']
-        for i in range(len(doc) - 2):
+        for i in self._hyphen_positions(doc):
             if (i < len(doc) - 2 and 
                 doc[i + 1].text == "-" and
                 doc[i].text.lower() + "-" + doc[i + 2].text.lower() in hyphenated_patterns):
@@ -115,11 +111,7 @@ class KWordsRule(BaseWordUsageRule):
                         continue
                     
                     sent = doc[i].sent
-                    sentence_index = 0
-                    for j, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = j
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     evidence_score = self._calculate_k_word_evidence(
                         hyphenated_word, doc[i], sent, text, context or {}, details["category"]
@@ -158,11 +150,7 @@ class KWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_k_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -0,0 +1,127 @@
+"""
+Word Usage Lexicon Index
+A per-Doc index of token lemmas and texts shared by all word usage rules.
+
+The index is built with a single pass over the Doc the first time any word usage
+rule asks for it. Because the rules registry hands every rule the same Doc for a
+block, the other rules reuse it: each rule then looks up only its own lexicon
+entries instead of scanning every token, and multi-word phrases are matched by
+jumping to the positions of their first word.
+"""
+
+import threading
+import weakref
+from typing import Any, Dict, Iterable, List
+
+
+class LexiconIndex:
+    """Token positions of a Doc keyed by lowercase lemma and lowercase text."""
+
+    def __init__(self, doc):
+        # The index is cached against the Doc, so it must not keep the Doc alive
+        try:
+            self._doc_ref = weakref.ref(doc)
+        except TypeError:
+            self._doc_ref = lambda: doc
+        self.lemma_positions: Dict[str, List[int]] = {}
+        self.text_positions: Dict[str, List[int]] = {}
+        self.exact_lemma_positions: Dict[str, List[int]] = {}
+
+        for token in doc:
+            lemma = token.lemma_
+            self.exact_lemma_positions.setdefault(lemma, []).append(token.i)
+            self.lemma_positions.setdefault(lemma.lower(), []).append(token.i)
+            self.text_positions.setdefault(token.text.lower(), []).append(token.i)
+
+    @property
+    def doc(self):
+        return self._doc_ref()
+
+    def tokens_for(self, terms: Iterable[str]) -> List[Any]:
+        """
+        Tokens whose lowercase lemma or text is one of ``terms``, in document order.
+
+        Word usage rules iterate over this instead of the whole Doc; their own
+        matching logic still decides which of these tokens to flag.
+        """
+        positions = set()
+        for term in terms:
+            positions.update(self.lemma_positions.get(term, ()))
+            positions.update(self.text_positions.get(term, ()))
+        return [self.doc[i] for i in sorted(positions)]
+
+    def tokens_with_lemma(self, lemma: str) -> List[Any]:
+        """Tokens with the given lowercase lemma, in document order."""
+        return [self.doc[i] for i in self.lemma_positions.get(lemma, ())]
+
+    def tokens_with_text(self, text: str) -> List[Any]:
+        """Tokens with the given lowercase text, in document order."""
+        return [self.doc[i] for i in self.text_positions.get(text, ())]
+
+    def hyphen_starts(self) -> List[int]:
+        """Positions i where doc[i + 1] is a "-" token and doc[i + 2] exists."""
+        return [i - 1 for i in self.text_positions.get('-', ()) if i >= 1 and i + 1 < len(self.doc)]
+
+    def find_phrases(self, phrase_list: List[str], case_sensitive: bool = False) -> List[Dict[str, Any]]:
+        """
+        Find multi-word phrases by lemma.
+
+        Produces exactly the matches (and order) of a full scan per phrase, but
+        only checks positions where the phrase's first word occurs.
+        """
+        doc = self.doc
+        first_positions = self.exact_lemma_positions if case_sensitive else self.lemma_positions
+        matches = []
+
+        for phrase in phrase_list:
+            phrase_tokens = phrase.strip().split()
+            if not phrase_tokens:
+                continue
+
+            phrase_len = len(phrase_tokens)
+            phrase_lemmas = [token.lower() if not case_sensitive else token for token in phrase_tokens]
+
+            for i in first_positions.get(phrase_lemmas[0], ()):
+                if i + phrase_len > len(doc):
+                    break
+                token_sequence = doc[i:i + phrase_len]
+                token_lemmas = [
+                    token.lemma_.lower() if not case_sensitive else token.lemma_
+                    for token in token_sequence
+                ]
+
+                if token_lemmas == phrase_lemmas:
+                    start_token = token_sequence[0]
+                    end_token = token_sequence[-1]
+
+                    matches.append({
+                        'phrase': phrase,
+                        'start_token': start_token,
+                        'end_token': end_token,
+                        'lemmatized_match': ' '.join(token_lemmas),
+                        'actual_text': doc[start_token.i:end_token.i + 1].text,
+                        'start_char': start_token.idx,
+                        'end_char': end_token.idx + len(end_token.text)
+                    })
+
+        return matches
+
+
+_indexes: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def get_lexicon_index(doc) -> LexiconIndex:
+    """Return the shared index for ``doc``, building it on first use."""
+    try:
+        with _indexes_lock:
+            index = _indexes.get(doc)
+    except TypeError:
+        # Objects that cannot be weakly referenced are indexed every time
+        return LexiconIndex(doc)
+
+    if index is None:
+        index = LexiconIndex(doc)
+        with _indexes_lock:
+            _indexes[doc] = index
+    return index
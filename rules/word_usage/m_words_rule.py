@@ -49,7 +49,7 @@ class MWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for M-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches with special handling for "master"
-        for token in doc:
+        for token in self._lexicon_tokens(doc, list(m_word_patterns) + ["master"]):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -77,11 +77,7 @@ class MWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_m_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -103,7 +99,7 @@ class MWordsRule(BaseWordUsageRule):
 
         # 2. Hyphenated word detection for M-words
         hyphenated_patterns = ['man-hour']
-        for i in range(len(doc) - 2):
+        for i in self._hyphen_positions(doc):
             if (i < len(doc) - 2 and 
                 doc[i + 1].text == "-" and
                 doc[i].text.lower() + "-" + doc[i + 2].text.lower() in hyphenated_patterns):
@@ -117,11 +113,7 @@ class MWordsRule(BaseWordUsageRule):
                         continue
                     
                     sent = doc[i].sent
-                    sentence_index = 0
-                    for j, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = j
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     evidence_score = self._calculate_m_word_evidence(
                         hyphenated_word, doc[i], sent, text, context or {}, details["category"]
@@ -160,11 +152,7 @@ class MWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_m_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -185,7 +173,7 @@ class MWordsRule(BaseWordUsageRule):
                     ))
 
         # 4. Special handling for "meta data" due to lemma issues ("data" -> "datum")
-        for i in range(len(doc) - 1):
+        for i in self._lexicon_positions(doc, ("meta",)):
             if (doc[i].text.lower() == "meta" and 
                 i + 1 < len(doc) and 
                 doc[i + 1].text.lower() == "data"):
@@ -198,11 +186,7 @@ class MWordsRule(BaseWordUsageRule):
                         continue
                     
                     sent = doc[i].sent
-                    sentence_index = 0
-                    for j, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = j
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     evidence_score = self._calculate_m_word_evidence(
                         "meta data", doc[i], sent, text, context or {}, details["category"]
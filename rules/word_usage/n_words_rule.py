@@ -48,7 +48,7 @@ class NWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for N-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches
-        for token in doc:
+        for token in self._lexicon_tokens(doc, n_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -72,11 +72,7 @@ class NWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_n_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -117,11 +113,7 @@ class NWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_n_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -142,7 +134,7 @@ class NWordsRule(BaseWordUsageRule):
                     ))
 
         # 3. Special handling for "no." abbreviation with period detection
-        for i in range(len(doc) - 1):
+        for i in self._lexicon_positions(doc, ("no",)):
             if (doc[i].text.lower() == "no" and 
                 i + 1 < len(doc) and 
                 doc[i + 1].text == "."):
@@ -155,11 +147,7 @@ class NWordsRule(BaseWordUsageRule):
                         continue
                     
                     sent = doc[i].sent
-                    sentence_index = 0
-                    for j, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = j
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     evidence_score = self._calculate_n_word_evidence(
                         "no.", doc[i], sent, text, context or {}, details["category"]
@@ -184,7 +172,7 @@ class NWordsRule(BaseWordUsageRule):
                         ))
 
         # 4. Special handling for "non-English" hyphenated pattern
-        for i in range(len(doc) - 2):
+        for i in self._lexicon_positions(doc, ("non",)):
             if (doc[i].text.lower() == "non" and 
                 i + 1 < len(doc) and 
                 doc[i + 1].text == "-" and 
@@ -199,11 +187,7 @@ class NWordsRule(BaseWordUsageRule):
                         continue
                     
                     sent = doc[i].sent
-                    sentence_index = 0
-                    for j, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = j
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     evidence_score = self._calculate_n_word_evidence(
                         "non-English", doc[i], sent, text, context or {}, details["category"]
@@ -50,7 +50,7 @@ class OWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for O-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches
-        for token in doc:
+        for token in self._lexicon_tokens(doc, o_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -77,11 +77,7 @@ class OWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_o_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -116,11 +112,7 @@ class OWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_o_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -148,7 +140,7 @@ class OWordsRule(BaseWordUsageRule):
                 details = o_word_patterns[pattern]
                 
                 # Find hyphenated versions in text
-                for i in range(len(doc)):
+                for i in self._hyphen_positions(doc):
                     tokens_found = []
                     current_pos = i
                     
@@ -181,11 +173,7 @@ class OWordsRule(BaseWordUsageRule):
                             continue
                         
                         sent = tokens_found[0].sent
-                        sentence_index = 0
-                        for j, s in enumerate(doc.sents):
-                            if s == sent:
-                                sentence_index = j
-                                break
+                        sentence_index = self._get_sentence_index(sent)
                         
                         evidence_score = self._calculate_o_word_evidence(
                             pattern, tokens_found[0], sent, text, context or {}, details["category"]
@@ -58,7 +58,7 @@ class QWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for Q-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches (including advanced POS analysis for 'quote')
-        for token in doc:
+        for token in self._lexicon_tokens(doc, list(q_word_patterns) + ["quote"]):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -89,11 +89,7 @@ class QWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_q_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -128,11 +124,7 @@ class QWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_q_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -62,7 +62,7 @@ class RWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for R-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches
-        for token in doc:
+        for token in self._lexicon_tokens(doc, r_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -89,11 +89,7 @@ class RWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_r_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -128,11 +124,7 @@ class RWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_r_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -162,7 +154,7 @@ class RWordsRule(BaseWordUsageRule):
             span = error.get('span', (0, 0))
             detected_spans.add((span[0], span[1]))
         
-        for token in doc:
+        for token in self._lexicon_tokens(doc, ("real",)):
             # Linguistic Anchor: Check for 'real time' used as an adjective through dependency analysis
             if token.lemma_ == "real" and token.i + 1 < len(doc) and doc[token.i + 1].lemma_ == "time":
                 if doc[token.i + 1].dep_ == "amod" or token.dep_ == "amod":
@@ -176,11 +168,7 @@ class RWordsRule(BaseWordUsageRule):
                         continue  # Skip if already detected
                     
                     # Get sentence index
-                    sentence_index = 0
-                    for i, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = i
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     # Apply surgical guards for dependency detection
                     if self._apply_surgical_zero_false_positive_guards_word_usage(token, context or {}):
@@ -207,15 +195,7 @@ class RWordsRule(BaseWordUsageRule):
             matched_text = match.group(0)
             
             # Find the corresponding token
-            token, sent, sentence_index = None, None, 0
-            for i, s in enumerate(doc.sents):
-                if s.start_char <= char_start < s.end_char:
-                    sent, sentence_index = s, i
-                    for t in s:
-                        if t.idx <= char_start < t.idx + len(t.text):
-                            token = t
-                            break
-                    break
+            token, sent, sentence_index = self._locate_char(doc, char_start)
             
             if sent and token:
                 # Apply surgical guards
@@ -69,7 +69,7 @@ class SWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for S-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches (including advanced POS analysis for verb forms)
-        for token in doc:
+        for token in self._lexicon_tokens(doc, list(s_word_patterns) + ["setup", "shutdown"]):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -99,11 +99,7 @@ class SWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_s_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -138,11 +134,7 @@ class SWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_s_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -169,7 +161,7 @@ class SWordsRule(BaseWordUsageRule):
             'stand-alone': {'alternatives': ['standalone'], 'category': 'hyphenation', 'severity': 'low'}
         }
         
-        for i in range(len(doc) - 2):
+        for i in self._hyphen_positions(doc):
             token1 = doc[i]
             hyphen = doc[i + 1]
             token2 = doc[i + 2]
@@ -186,11 +178,7 @@ class SWordsRule(BaseWordUsageRule):
                         continue
                     
                     sent = token1.sent
-                    sentence_index = 0
-                    for j, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = j
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     evidence_score = self._calculate_s_word_evidence(
                         combined_text, token1, sent, text, context or {}, details["category"]
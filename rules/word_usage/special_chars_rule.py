@@ -115,15 +115,7 @@ class SpecialCharsRule(BaseWordUsageRule):
                 if overlap:
                     continue
                 
-                token, sent, sentence_index = None, None, 0
-                for i, s in enumerate(doc.sents):
-                    if s.start_char <= char_start < s.end_char:
-                        sent, sentence_index = s, i
-                        for t in s:
-                            if t.idx <= char_start < t.idx + len(t.text):
-                                token = t
-                                break
-                        break
+                token, sent, sentence_index = self._locate_char(doc, char_start)
                 
                 if sent and token:
                     # Apply surgical guards but allow time format patterns to override file path filtering
@@ -162,11 +154,7 @@ class SpecialCharsRule(BaseWordUsageRule):
                     continue
                 
                 sent = span.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 # Apply surgical guards for hash detection
                 if self._should_filter_special_char("#", span[0], context or {}):
@@ -66,7 +66,7 @@ class TWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for T-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches
-        for token in doc:
+        for token in self._lexicon_tokens(doc, t_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -92,11 +92,7 @@ class TWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_t_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -131,11 +127,7 @@ class TWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_t_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -161,7 +153,7 @@ class TWordsRule(BaseWordUsageRule):
             'trade-off': {'alternatives': ['tradeoff'], 'category': 'hyphenation', 'severity': 'low'}
         }
         
-        for i in range(len(doc) - 2):
+        for i in self._hyphen_positions(doc):
             token1 = doc[i]
             hyphen = doc[i + 1]
             token2 = doc[i + 2]
@@ -178,11 +170,7 @@ class TWordsRule(BaseWordUsageRule):
                         continue
                     
                     sent = token1.sent
-                    sentence_index = 0
-                    for j, s in enumerate(doc.sents):
-                        if s == sent:
-                            sentence_index = j
-                            break
+                    sentence_index = self._get_sentence_index(sent)
                     
                     evidence_score = self._calculate_t_word_evidence(
                         combined_text, token1, sent, text, context or {}, details["category"]
@@ -59,7 +59,7 @@ class UWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for U-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches
-        for token in doc:
+        for token in self._lexicon_tokens(doc, u_word_patterns):
             # Check if token lemma matches any of our target words
             token_lemma = token.lemma_.lower()
             token_text = token.text.lower()
@@ -85,11 +85,7 @@ class UWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_u_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -124,11 +120,7 @@ class UWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_u_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -156,15 +148,7 @@ class UWordsRule(BaseWordUsageRule):
             matched_text = match.group(0)
 
             # Find the corresponding token
-            token, sent, sentence_index = None, None, 0
-            for i, s in enumerate(doc.sents):
-                if s.start_char <= char_start < s.end_char:
-                    sent, sentence_index = s, i
-                    for t in s:
-                        if t.idx <= char_start < t.idx + len(t.text):
-                            token = t
-                            break
-                    break
+            token, sent, sentence_index = self._locate_char(doc, char_start)
 
             if sent and token:
                 # Apply surgical guards
@@ -194,7 +178,7 @@ class UWordsRule(BaseWordUsageRule):
             'user-friendly': {'alternatives': ['(describe specific benefits)'], 'category': 'subjective_claim', 'severity': 'high'}
         }
         
-        for i in range(len(doc) - 2):
+        for i in self._hyphen_positions(doc):
             token1 = doc[i]
             hyphen = doc[i + 1]
             
@@ -216,11 +200,7 @@ class UWordsRule(BaseWordUsageRule):
                                 continue
                             
                             sent = token1.sent
-                            sentence_index = 0
-                            for j, s in enumerate(doc.sents):
-                                if s == sent:
-                                    sentence_index = j
-                                    break
+                            sentence_index = self._get_sentence_index(sent)
                             
                             evidence_score = self._calculate_u_word_evidence(
                                 combined_text, token1, sent, text, context or {}, details["category"]
@@ -253,11 +233,7 @@ class UWordsRule(BaseWordUsageRule):
                             continue
                         
                         sent = token1.sent
-                        sentence_index = 0
-                        for j, s in enumerate(doc.sents):
-                            if s == sent:
-                                sentence_index = j
-                                break
+                        sentence_index = self._get_sentence_index(sent)
                         
                         evidence_score = self._calculate_u_word_evidence(
                             combined_text, token1, sent, text, context or {}, details["category"]
@@ -65,7 +65,7 @@ class WWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for W-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches (excluding the advanced "while" analysis)
-        for token in doc:
+        for token in self._lexicon_tokens(doc, list(w_word_patterns) + ["w"]):
             # Skip "while" - it gets special advanced processing below
             if token.lemma_.lower() == "while":
                 continue
@@ -104,11 +104,7 @@ class WWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_w_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -143,11 +139,7 @@ class WWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_w_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
@@ -169,7 +161,8 @@ class WWordsRule(BaseWordUsageRule):
 
         # 2b. Special handling for hyphenated words like "world-wide"
         # SpaCy often tokenizes "world-wide" as ["world", "-", "wide"]
-        for i, token in enumerate(doc):
+        for token in self._lexicon_tokens(doc, ("world",)):
+            i = token.i
             if (token.text.lower() == "world" and 
                 i + 2 < len(doc) and 
                 doc[i + 1].text == "-" and 
@@ -184,11 +177,7 @@ class WWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for j, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = j
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_w_word_evidence(
                     pattern, token, sent, text, context or {}, details["category"]
@@ -217,17 +206,12 @@ class WWordsRule(BaseWordUsageRule):
 
         # 3. PRESERVE EXISTING ADVANCED FUNCTIONALITY: Enhanced context-aware morphological analysis for 'while'
         # This sophisticated linguistic analysis uses dependency parsing and morphology to determine semantic usage
-        for token in doc:
+        for token in self._lexicon_tokens(doc, ("while",)):
             if token.lemma_.lower() == "while":
                 sent = token.sent
                 sent_text = sent.text.lower()
                 
-                # Get the sentence index by finding the sentence in the doc.sents
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 # Apply surgical guards for dependency detection
                 if self._apply_surgical_zero_false_positive_guards_word_usage(token, context or {}):
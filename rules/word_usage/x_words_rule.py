@@ -73,7 +73,7 @@ class XWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for X-words using lemma-based matching and phrase detection
         
         # 1. Single-word matches (case-sensitive for technical terms)
-        for token in doc:
+        for token in self._lexicon_tokens(doc, x_word_patterns):
             # Check if token matches any of our target words
             token_text = token.text
             token_text_lower = token.text.lower()
@@ -108,11 +108,7 @@ class XWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_x_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
@@ -147,11 +143,7 @@ class XWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = match['start_token'].sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_x_word_evidence(
                     pattern, match['start_token'], sent, text, context or {}, details["category"]
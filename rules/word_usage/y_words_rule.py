@@ -71,7 +71,7 @@ class YWordsRule(BaseWordUsageRule):
         # Evidence-based analysis for Y-words using lemma-based matching
         
         # 1. Single-word matches with context awareness
-        for token in doc:
+        for token in self._lexicon_tokens(doc, y_word_patterns):
             token_text = token.text.lower()
             token_lemma = token.lemma_.lower()
             matched_pattern = None
@@ -94,11 +94,7 @@ class YWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 evidence_score = self._calculate_y_word_evidence(
                     matched_pattern, token, sent, text, context or {}, details["category"]
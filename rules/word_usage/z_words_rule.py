@@ -89,15 +89,7 @@ class ZWordsRule(BaseWordUsageRule):
                         continue
                     
                     # Find the sentence and first token
-                    token, sent, sentence_index = None, None, 0
-                    for i, s in enumerate(doc.sents):
-                        if s.start_char <= char_start < s.end_char:
-                            sent, sentence_index = s, i
-                            for t in s:
-                                if t.idx <= char_start < t.idx + len(t.text):
-                                    token = t
-                                    break
-                            break
+                    token, sent, sentence_index = self._locate_char(doc, char_start)
                     
                     if sent and token:
                         # Apply surgical guards on the first token
@@ -125,7 +117,7 @@ class ZWordsRule(BaseWordUsageRule):
                             matched_spans.append((char_start, char_end))
         
         # 2. Single-word matches
-        for token in doc:
+        for token in self._lexicon_tokens(doc, z_word_patterns):
             token_text = token.text.lower()
             token_lemma = token.lemma_.lower()
             matched_pattern = None
@@ -150,11 +142,7 @@ class ZWordsRule(BaseWordUsageRule):
                     continue
                 
                 sent = token.sent
-                sentence_index = 0
-                for i, s in enumerate(doc.sents):
-                    if s == sent:
-                        sentence_index = i
-                        break
+                sentence_index = self._get_sentence_index(sent)
                 
                 # Check for overlap with already matched spans
                 token_start, token_end = token.idx, token.idx + len(token.text)
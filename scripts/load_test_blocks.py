@@ -30,6 +30,8 @@ class LoadTestConfig:
     think_time_min: float = 1.0
     think_time_max: float = 3.0
     timeout_seconds: int = 30
+    use_jobs: bool = False  # Submit to /jobs/rewrite-block and poll for the result
+    poll_interval: float = 0.5
 
 
 @dataclass
@@ -152,33 +154,39 @@ class BlockProcessingLoadTester:
         start_time = time.time()
         
         try:
-            async with session.post(
-                f"{self.config.base_url}/rewrite-block",
-                json=block_data,
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds)
-            ) as response:
-                
-                response_time = time.time() - start_time
-                response_data = await response.json()
-                
-                result = {
-                    'user_id': user_id,
-                    'block_num': block_num,
-                    'test_case': test_case.name,
-                    'start_time': start_time,
-                    'response_time': response_time,
-                    'status_code': response.status,
-                    'success': response.status == 200,
-                    'block_id': block_data['block_id'],
-                    'expected_time': test_case.expected_processing_time,
-                    'performance_met': response_time <= test_case.expected_processing_time,
-                    'response_size': len(json.dumps(response_data)),
-                    'errors_fixed': response_data.get('errors_fixed', 0) if response.status == 200 else 0,
-                    'confidence': response_data.get('confidence', 0.0) if response.status == 200 else 0.0
-                }
-                
-                return result
-                
+            if self.config.use_jobs:
+                status_code, response_data = await asyncio.wait_for(
+                    self._run_block_job(session, block_data), timeout=self.config.timeout_seconds
+                )
+            else:
+                async with session.post(
+                    f"{self.config.base_url}/rewrite-block",
+                    json=block_data,
+                    timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds)
+                ) as response:
+                    status_code = response.status
+                    response_data = await response.json()
+            
+            response_time = time.time() - start_time
+            
+            result = {
+                'user_id': user_id,
+                'block_num': block_num,
+                'test_case': test_case.name,
+                'start_time': start_time,
+                'response_time': response_time,
+                'status_code': status_code,
+                'success': status_code == 200,
+                'block_id': block_data['block_id'],
+                'expected_time': test_case.expected_processing_time,
+                'performance_met': response_time <= test_case.expected_processing_time,
+                'response_size': len(json.dumps(response_data)),
+                'errors_fixed': response_data.get('errors_fixed', 0) if status_code == 200 else 0,
+                'confidence': response_data.get('confidence', 0.0) if status_code == 200 else 0.0
+            }
+            
+            return result
+            
         except asyncio.TimeoutError:
             response_time = time.time() - start_time
             self.logger.warning(f"Timeout for user {user_id}, block {block_num}")
@@ -219,6 +227,25 @@ class BlockProcessingLoadTester:
                 'error': str(e)
             }
     
+    async def _run_block_job(self, session: aiohttp.ClientSession, block_data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """Submit a rewrite job and poll until it finishes; returns (status_code, result)."""
+        async with session.post(f"{self.config.base_url}/jobs/rewrite-block", json=block_data) as response:
+            job = await response.json()
+            if response.status != 202:
+                # 429 when the server's job queue is full
+                return response.status, job
+        
+        while True:
+            await asyncio.sleep(self.config.poll_interval)
+            async with session.get(f"{self.config.base_url}/jobs/{job['job_id']}") as response:
+                job = await response.json()
+                if response.status != 200:
+                    return response.status, job
+            if job['status'] == 'completed':
+                return 200, job.get('result', {})
+            if job['status'] in ('failed', 'cancelled'):
+                return 500, job
+    
     async def _simulate_user(self, user_id: int) -> List[Dict[str, Any]]:
         """Simulate a single user processing multiple blocks."""
         
@@ -453,6 +480,7 @@ def main():
     parser.add_argument('--ramp-up', type=int, default=10, help='Ramp-up time in seconds')
     parser.add_argument('--timeout', type=int, default=30, help='Request timeout in seconds')
     parser.add_argument('--output', help='Output file for detailed results (JSON)')
+    parser.add_argument('--use-jobs', action='store_true', help='Use the asynchronous /jobs API instead of /rewrite-block')
     
     args = parser.parse_args()
     
@@ -463,7 +491,8 @@ def main():
         num_blocks_per_user=args.blocks,
         test_duration_seconds=args.duration,
         ramp_up_seconds=args.ramp_up,
-        timeout_seconds=args.timeout
+        timeout_seconds=args.timeout,
+        use_jobs=args.use_jobs
     )
     
     # Run load test
@@ -1,21 +1,277 @@
 """
 Simplified Ruby client for AsciiDoc parsing.
-Uses direct subprocess calls with temporary files for reliable communication.
+Keeps a pool of long-lived Ruby worker processes that speak length-prefixed JSON
+over stdin/stdout, so the Ruby interpreter and asciidoctor gem are loaded once per
+worker instead of once per parse. Falls back to a one-shot subprocess with
+temporary files if the pool cannot serve a request.
 """
 import json
 import tempfile
 import subprocess
 import os
+import queue
+import struct
+import threading
+import time
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 logger = logging.getLogger(__name__)
 
+# Pool configuration (overridable through the environment)
+DEFAULT_POOL_SIZE = int(os.environ.get('ASCIIDOC_RUBY_WORKERS', 2))
+DEFAULT_REQUEST_TIMEOUT = float(os.environ.get('ASCIIDOC_RUBY_TIMEOUT', 30))
+DEFAULT_HEALTH_CHECK_INTERVAL = float(os.environ.get('ASCIIDOC_RUBY_HEALTH_INTERVAL', 60))
+DEFAULT_MAX_REQUESTS_PER_WORKER = int(os.environ.get('ASCIIDOC_RUBY_MAX_REQUESTS', 1000))
+
+_FRAME_HEADER = struct.Struct('>I')
+
+
+class RubyWorkerError(Exception):
+    """Raised when a Ruby worker crashes, times out, or returns an invalid frame."""
+    pass
+
+
+class RubyWorker:
+    """A single long-lived `ruby asciidoc_parser.rb --server` process."""
+
+    def __init__(self, script_path: str, worker_id: int = 0):
+        self.script_path = script_path
+        self.worker_id = worker_id
+        self.process: Optional[subprocess.Popen] = None
+        self.requests_served = 0
+        self.last_used = 0.0
+        self._responses: 'queue.Queue' = queue.Queue()
+        self._reader: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the Ruby process and its response reader thread."""
+        self.process = subprocess.Popen(
+            ['ruby', self.script_path, '--server'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+        self.requests_served = 0
+        self.last_used = time.time()
+        self._responses = queue.Queue()
+        self._reader = threading.Thread(
+            target=self._read_responses,
+            args=(self.process, self._responses),
+            name=f"ruby-worker-{self.worker_id}-reader",
+            daemon=True
+        )
+        self._reader.start()
+        logger.debug(f"Started Ruby worker {self.worker_id} (pid {self.process.pid})")
+
+    @staticmethod
+    def _read_exact(stream, size: int) -> Optional[bytes]:
+        data = b''
+        while len(data) < size:
+            chunk = stream.read(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    @classmethod
+    def _read_responses(cls, process: subprocess.Popen, responses: 'queue.Queue'):
+        """Reader thread: turn frames from the worker's stdout into queue items."""
+        try:
+            while True:
+                header = cls._read_exact(process.stdout, _FRAME_HEADER.size)
+                if header is None:
+                    break
+                (size,) = _FRAME_HEADER.unpack(header)
+                payload = cls._read_exact(process.stdout, size)
+                if payload is None:
+                    break
+                responses.put(payload)
+        except Exception as e:
+            logger.debug(f"Ruby worker reader stopped: {e}")
+        # None signals that the worker's output stream is gone
+        responses.put(None)
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def request(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one request frame and wait for its response frame."""
+        if not self.is_alive():
+            raise RubyWorkerError(f"Ruby worker {self.worker_id} is not running")
+
+        data = json.dumps(payload).encode('utf-8')
+        try:
+            self.process.stdin.write(_FRAME_HEADER.pack(len(data)) + data)
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise RubyWorkerError(f"Ruby worker {self.worker_id} pipe closed: {e}")
+
+        try:
+            response = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            raise RubyWorkerError(f"Ruby worker {self.worker_id} timed out after {timeout}s")
+
+        if response is None:
+            raise RubyWorkerError(f"Ruby worker {self.worker_id} exited unexpectedly")
+
+        self.requests_served += 1
+        self.last_used = time.time()
+        try:
+            return json.loads(response.decode('utf-8'))
+        except ValueError as e:
+            raise RubyWorkerError(f"Ruby worker {self.worker_id} returned invalid JSON: {e}")
+
+    def ping(self, timeout: float = 5.0) -> bool:
+        try:
+            return bool(self.request({'command': 'ping'}, timeout).get('pong'))
+        except RubyWorkerError:
+            return False
+
+    def stop(self):
+        """Stop the Ruby process (closing stdin lets it exit cleanly)."""
+        process, self.process = self.process, None
+        if process is None:
+            return
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.wait(timeout=2)
+        except Exception:
+            process.kill()
+            try:
+                process.wait(timeout=2)
+            except Exception:
+                pass
+        finally:
+            if process.stdout:
+                process.stdout.close()
+
+
+class RubyWorkerPool:
+    """
+    Bounded pool of Ruby workers with health checks and restart-on-crash.
+    Workers are started lazily, up to `size`, the first time they are needed.
+    """
+
+    def __init__(self, script_path: str, size: int = DEFAULT_POOL_SIZE,
+                 request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+                 health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+                 max_requests_per_worker: int = DEFAULT_MAX_REQUESTS_PER_WORKER):
+        self.script_path = script_path
+        self.size = max(1, size)
+        self.request_timeout = request_timeout
+        self.health_check_interval = health_check_interval
+        self.max_requests_per_worker = max_requests_per_worker
+
+        self._idle: 'queue.Queue[RubyWorker]' = queue.Queue()
+        self._workers: List[RubyWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {'requests': 0, 'failures': 0, 'restarts': 0}
+
+    def _acquire(self, timeout: float) -> RubyWorker:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._workers) < self.size:
+                worker = RubyWorker(self.script_path, worker_id=len(self._workers))
+                worker.start()
+                self._workers.append(worker)
+                return worker
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise RubyWorkerError(f"No Ruby worker became available within {timeout}s")
+
+    def _release(self, worker: RubyWorker):
+        if self._closed:
+            worker.stop()
+        else:
+            self._idle.put(worker)
+
+    def _restart(self, worker: RubyWorker):
+        worker.stop()
+        self.stats['restarts'] += 1
+        if not self._closed:
+            worker.start()
+
+    def _ensure_healthy(self, worker: RubyWorker):
+        """Restart dead, worn-out, or unresponsive workers before use."""
+        if not worker.is_alive():
+            logger.warning(f"Ruby worker {worker.worker_id} died; restarting")
+            self._restart(worker)
+        elif worker.requests_served >= self.max_requests_per_worker:
+            self._restart(worker)
+        elif time.time() - worker.last_used > self.health_check_interval and not worker.ping():
+            logger.warning(f"Ruby worker {worker.worker_id} failed health check; restarting")
+            self._restart(worker)
+
+    def run(self, content: str, filename: str = "") -> Dict[str, Any]:
+        """Parse content on a pooled worker. Raises RubyWorkerError on failure."""
+        if self._closed:
+            raise RubyWorkerError("Ruby worker pool is shut down")
+
+        worker = self._acquire(self.request_timeout)
+        try:
+            self._ensure_healthy(worker)
+            self.stats['requests'] += 1
+            return worker.request({'content': content, 'filename': filename}, self.request_timeout)
+        except RubyWorkerError:
+            self.stats['failures'] += 1
+            # The response stream may be out of sync; always start a fresh process
+            self._restart(worker)
+            raise
+        finally:
+            self._release(worker)
+
+    def health_check(self) -> Dict[str, Any]:
+        """Ping every idle worker and restart the ones that do not answer."""
+        checked, restarted = 0, 0
+        idle_workers = []
+        while True:
+            try:
+                idle_workers.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        for worker in idle_workers:
+            checked += 1
+            if not worker.is_alive() or not worker.ping():
+                self._restart(worker)
+                restarted += 1
+            self._release(worker)
+        return {'checked': checked, 'restarted': restarted, 'workers': len(self._workers)}
+
+    def shutdown(self):
+        self._closed = True
+        with self._lock:
+            for worker in self._workers:
+                worker.stop()
+            self._workers = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats.update({
+            'size': self.size,
+            'started_workers': len(self._workers),
+            'alive_workers': sum(1 for w in self._workers if w.is_alive())
+        })
+        return stats
+
+
 class SimpleRubyClient:
-    def __init__(self):
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, use_worker_pool: bool = True):
         self.ruby_script_path = self._get_ruby_script_path()
         self.asciidoctor_available = self._check_asciidoctor_availability()
+        self.pool: Optional[RubyWorkerPool] = None
+        if self.asciidoctor_available and use_worker_pool:
+            self.pool = RubyWorkerPool(self.ruby_script_path, size=pool_size)
 
     def _get_ruby_script_path(self) -> str:
         current_dir = Path(__file__).parent
@@ -33,11 +289,25 @@ class SimpleRubyClient:
     # This method is now correctly named 'run' and accepts 'filename'
     def run(self, content: str, filename: str = "") -> Dict[str, Any]:
         """
-        Parse AsciiDoc content by running the Ruby script.
+        Parse AsciiDoc content on a pooled Ruby worker.
         """
         if not self.asciidoctor_available:
             return {'success': False, 'error': 'Ruby or asciidoctor is not available'}
 
+        if self.pool is not None:
+            try:
+                return self.pool.run(content, filename)
+            except RubyWorkerError as e:
+                logger.warning(f"Ruby worker pool failed, falling back to one-shot parse: {e}")
+            except Exception as e:
+                logger.warning(f"Unexpected Ruby worker pool error, falling back to one-shot parse: {e}")
+
+        return self._run_subprocess(content, filename)
+
+    def _run_subprocess(self, content: str, filename: str = "") -> Dict[str, Any]:
+        """
+        Parse AsciiDoc content by running the Ruby script once with temporary files.
+        """
         input_path, output_path = None, None
         try:
             with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', suffix='.adoc', delete=False) as input_file:
@@ -68,11 +338,33 @@ class SimpleRubyClient:
     def ping(self) -> bool:
         return self.asciidoctor_available
 
+    def health_check(self) -> Dict[str, Any]:
+        if self.pool is None:
+            return {'checked': 0, 'restarted': 0, 'workers': 0}
+        return self.pool.health_check()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return self.pool.get_stats() if self.pool is not None else {}
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+
 # Global client instance
 _client_instance: Optional[SimpleRubyClient] = None
+_client_lock = threading.Lock()
 
 def get_client() -> SimpleRubyClient:
     global _client_instance
     if _client_instance is None:
-        _client_instance = SimpleRubyClient()
-    return _client_instance
\ No newline at end of file
+        with _client_lock:
+            if _client_instance is None:
+                _client_instance = SimpleRubyClient()
+    return _client_instance
+
+def shutdown_client():
+    """Stop all pooled Ruby workers (registered as an app cleanup handler)."""
+    global _client_instance
+    if _client_instance is not None:
+        _client_instance.shutdown()
+        _client_instance = None
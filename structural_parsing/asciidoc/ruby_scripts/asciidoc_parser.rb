@@ -124,10 +124,59 @@ def parse_asciidoc(content, filename = "")
 end
 
 
+# Reads one length-prefixed frame (4-byte big-endian size + UTF-8 JSON) from io.
+# Returns nil when the stream is closed.
+def read_frame(io)
+  header = io.read(4)
+  return nil if header.nil? || header.bytesize < 4
+  size = header.unpack1('N')
+  payload = io.read(size)
+  return nil if payload.nil? || payload.bytesize < size
+  JSON.parse(payload.force_encoding('UTF-8'))
+end
+
+
+# Writes one length-prefixed JSON frame to io.
+def write_frame(io, obj)
+  payload = obj.to_json.b
+  io.write([payload.bytesize].pack('N'))
+  io.write(payload)
+  io.flush
+end
+
+
+# Long-lived worker mode: serve parse requests over stdin/stdout until stdin closes.
+# Requests are {"content": "...", "filename": "..."} or {"command": "ping"}.
+def serve(input = STDIN, output = STDOUT)
+  input.binmode
+  output.binmode
+  output.sync = true
+
+  while (request = read_frame(input))
+    response =
+      begin
+        if request['command'] == 'ping'
+          { 'success' => true, 'pong' => true, 'pid' => Process.pid }
+        else
+          parse_asciidoc(request['content'] || '', request['filename'] || '')
+        end
+      rescue => e
+        { 'success' => false, 'error' => e.message }
+      end
+    write_frame(output, response)
+  end
+end
+
+
 # Main execution logic
 if __FILE__ == $0
+  if ARGV == ['--server']
+    serve
+    exit 0
+  end
   if ARGV.length != 2
     STDERR.puts "Usage: ruby asciidoc_parser.rb <input_file> <output_file>"
+    STDERR.puts "       ruby asciidoc_parser.rb --server"
     exit 1
   end
   input_file = ARGV[0]
@@ -1,11 +1,26 @@
 """
 Document Processor Module
 Handles text extraction from various document formats.
+
+Documents are read as a stream of page or paragraph chunks (``iter_text``),
+so large manuals do not have to be built up in memory one concatenation at
+a time. Sources may be file paths or binary file objects such as an upload
+stream. Long PDFs are split into page ranges that a process pool extracts
+in parallel, with pages still yielded in document order.
 """
 
+import atexit
+import io
+import multiprocessing
 import os
 import logging
-from typing import Optional, Dict, Any
+import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator, List, Union, BinaryIO
 import fitz  # PyMuPDF
 from docx import Document
 import markdown
@@ -14,200 +29,315 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Parallel PDF extraction (0 or 1 workers keeps extraction in-process)
+PDF_EXTRACTION_WORKERS = int(os.getenv('DOCUMENT_PDF_WORKERS', str(min(4, os.cpu_count() or 1))))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv('DOCUMENT_PDF_PARALLEL_MIN_PAGES', '32'))
+PDF_PAGES_PER_TASK = int(os.getenv('DOCUMENT_PDF_PAGES_PER_TASK', '16'))
+
+DocumentSource = Union[str, os.PathLike, BinaryIO]
+
+
+def _page_text(page) -> str:
+    try:
+        # Try newer PyMuPDF API first
+        return page.get_text()
+    except AttributeError:
+        # Fallback to older API
+        return page.getText()
+
+
+def _extract_pdf_pages(filepath: str, start: int, stop: int) -> List[str]:
+    """Text of pages ``start``..``stop - 1``; runs in a pool worker."""
+    doc = fitz.open(filepath)
+    try:
+        return [_page_text(doc[page_num]) for page_num in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def _is_path(source: DocumentSource) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+@contextmanager
+def _local_path(source: DocumentSource, suffix: str) -> Iterator[str]:
+    """
+    A file path for ``source``.
+
+    Streams are copied to a uniquely named temporary file, which page workers
+    can open and which is removed afterwards.
+    """
+    if _is_path(source):
+        yield os.fspath(source)
+        return
+
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as spool:
+        shutil.copyfileobj(source, spool)
+    try:
+        yield spool.name
+    finally:
+        try:
+            os.remove(spool.name)
+        except OSError:
+            pass
+
+
+def _iter_paragraphs(lines) -> Iterator[str]:
+    """Group lines into paragraphs, each ending with the blank line after it."""
+    paragraph = []
+    for line in lines:
+        paragraph.append(line)
+        if not line.strip():
+            yield ''.join(paragraph)
+            paragraph = []
+    if paragraph:
+        yield ''.join(paragraph)
+
+
 class DocumentProcessor:
     """Handles document processing for multiple file formats."""
     
     ALLOWED_EXTENSIONS = {'adoc', 'md', 'dita', 'docx', 'pdf', 'txt'}
     
-    def __init__(self):
-        """Initialize the document processor."""
+    def __init__(self, pdf_workers: Optional[int] = None, pdf_parallel_min_pages: Optional[int] = None):
+        """
+        Initialize the document processor.
+        
+        Args:
+            pdf_workers: Processes extracting PDF pages (defaults to DOCUMENT_PDF_WORKERS)
+            pdf_parallel_min_pages: Smallest PDF extracted in parallel
+        """
         self.supported_formats = {
-            '.pdf': self._extract_from_pdf,
-            '.docx': self._extract_from_docx,
-            '.md': self._extract_from_markdown,
-            '.adoc': self._extract_from_asciidoc,
-            '.dita': self._extract_from_dita,
-            '.txt': self._extract_from_text
+            '.pdf': self._iter_pdf,
+            '.docx': self._iter_docx,
+            '.md': self._iter_markdown,
+            '.adoc': self._iter_asciidoc,
+            '.dita': self._iter_dita,
+            '.txt': self._iter_text
         }
+        self.pdf_workers = PDF_EXTRACTION_WORKERS if pdf_workers is None else pdf_workers
+        self.pdf_parallel_min_pages = (PDF_PARALLEL_MIN_PAGES if pdf_parallel_min_pages is None
+                                       else pdf_parallel_min_pages)
+        self._pdf_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
     
     def allowed_file(self, filename: str) -> bool:
         """Check if file extension is allowed."""
         return '.' in filename and \
                filename.rsplit('.', 1)[1].lower() in self.ALLOWED_EXTENSIONS
     
-    def extract_text(self, filepath: str) -> Optional[str]:
+    def extract_text(self, source: DocumentSource, filename: Optional[str] = None) -> Optional[str]:
         """
         Extract text from a document file.
         
         Args:
-            filepath: Path to the document file
+            source: Path to the document file, or a binary file object
+            filename: Name giving the format of a file object
             
         Returns:
             Extracted text or None if extraction fails
         """
+        name = filename or (os.fspath(source) if _is_path(source) else '<stream>')
         try:
-            if not os.path.exists(filepath):
-                logger.error(f"File not found: {filepath}")
+            if _is_path(source) and not os.path.exists(source):
+                logger.error(f"File not found: {name}")
                 return None
             
-            file_ext = os.path.splitext(filepath)[1].lower()
+            file_ext = os.path.splitext(name)[1].lower()
             
             if file_ext not in self.supported_formats:
                 logger.error(f"Unsupported file format: {file_ext}")
                 return None
             
-            # Extract text using appropriate method
-            text = self.supported_formats[file_ext](filepath)
-            
-            if text is not None:
-                # Clean and normalize the text
-                text = self._clean_text(text)
-                logger.info(f"Successfully extracted {len(text)} characters from {filepath}")
-                return text
-            else:
-                logger.error(f"Failed to extract text from {filepath}")
-                return None
+            # Clean and normalize the text
+            text = self._clean_text(''.join(self.iter_text(source, filename)))
+            logger.info(f"Successfully extracted {len(text)} characters from {name}")
+            return text
                 
         except Exception as e:
-            logger.error(f"Error extracting text from {filepath}: {str(e)}")
+            logger.error(f"Error extracting text from {name}: {str(e)}")
             return None
     
-    def _extract_from_pdf(self, filepath: str) -> Optional[str]:
-        """Extract text from PDF file."""
-        try:
-            doc = fitz.open(filepath)
-            text = ""
-            
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                try:
-                    # Try newer PyMuPDF API first
-                    text += page.get_text()
-                except AttributeError:
-                    # Fallback to older API
-                    text += page.getText()
-                text += "\n\n"  # Add page break
-            
-            doc.close()
-            return text.strip()
+    def iter_text(self, source: DocumentSource, filename: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the raw text of a document in page or paragraph chunks.
+        
+        Chunks keep their separators, so joining them gives the whole text.
+        PDFs yield one chunk per page, DOCX and plain text one per paragraph
+        (and per table row); formats that must be converted as a whole yield
+        a single chunk.
+        
+        Args:
+            source: Path to the document file, or a binary file object
+            filename: Name giving the format of a file object
             
-        except Exception as e:
-            logger.error(f"Error extracting from PDF: {str(e)}")
-            return None
+        Raises:
+            ValueError: If the format is not supported
+        """
+        name = filename or (os.fspath(source) if _is_path(source) else '')
+        file_ext = os.path.splitext(name)[1].lower()
+        if file_ext not in self.supported_formats:
+            raise ValueError(f"Unsupported file format: {file_ext}")
+        return self.supported_formats[file_ext](source)
+    
+    def _iter_pdf(self, source: DocumentSource) -> Iterator[str]:
+        """Yield the text of each PDF page."""
+        with _local_path(source, '.pdf') as filepath:
+            doc = fitz.open(filepath)
+            try:
+                page_count = doc.page_count
+                if self.pdf_workers <= 1 or page_count < self.pdf_parallel_min_pages:
+                    for page_num in range(page_count):
+                        yield _page_text(doc[page_num]) + "\n\n"  # Add page break
+                    return
+            finally:
+                doc.close()
+            
+            for text in self._iter_pdf_parallel(filepath, page_count):
+                yield text + "\n\n"
     
-    def _extract_from_docx(self, filepath: str) -> Optional[str]:
-        """Extract text from DOCX file."""
+    def _iter_pdf_parallel(self, filepath: str, page_count: int) -> Iterator[str]:
+        """Extract page ranges in the pool, yielding pages in order as ranges complete."""
+        ranges = iter([(start, min(start + PDF_PAGES_PER_TASK, page_count))
+                       for start in range(0, page_count, max(1, PDF_PAGES_PER_TASK))])
+        pool = self._get_pdf_pool()
+        pending = deque()
+        
+        def submit_next():
+            page_range = next(ranges, None)
+            if page_range is not None:
+                pending.append(pool.submit(_extract_pdf_pages, filepath, *page_range))
+        
         try:
-            doc = Document(filepath)
-            text = ""
-            
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
-            
-            return text.strip()
-            
-        except Exception as e:
-            logger.error(f"Error extracting from DOCX: {str(e)}")
-            return None
+            # Keep a bounded number of ranges in flight so a slow consumer
+            # does not pile up the text of the whole document
+            for _ in range(self.pdf_workers * 2):
+                submit_next()
+            while pending:
+                pages = pending.popleft().result()
+                submit_next()
+                yield from pages
+        except Exception:
+            # A broken pool cannot be reused; start a fresh one next time
+            self.shutdown()
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    def _get_pdf_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pdf_pool is None:
+                # 'spawn' avoids forking a process that already runs server threads
+                self._pdf_pool = ProcessPoolExecutor(
+                    max_workers=self.pdf_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                atexit.register(self.shutdown)
+                logger.info(f"Started PDF extraction pool with {self.pdf_workers} workers")
+            return self._pdf_pool
     
-    def _extract_from_markdown(self, filepath: str) -> Optional[str]:
+    def shutdown(self):
+        """Stop the PDF extraction pool, if one was started."""
+        with self._pool_lock:
+            pool, self._pdf_pool = self._pdf_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _iter_docx(self, source: DocumentSource) -> Iterator[str]:
+        """Yield DOCX paragraphs, then table rows."""
+        doc = Document(source)
+        
+        for paragraph in doc.paragraphs:
+            yield paragraph.text + "\n"
+        
+        # Extract text from tables
+        for table in doc.tables:
+            for row in table.rows:
+                yield "".join(cell.text + " " for cell in row.cells) + "\n"
+    
+    def _read_text(self, source: DocumentSource) -> str:
+        """Read a whole text document."""
+        if _is_path(source):
+            with open(source, 'r', encoding='utf-8') as file:
+                return file.read()
+        return source.read().decode('utf-8')
+    
+    def _iter_markdown(self, source: DocumentSource) -> Iterator[str]:
         """Extract text from Markdown file."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                md_content = file.read()
-            
-            # Convert markdown to HTML, then extract text
-            html = markdown.markdown(md_content)
-            soup = BeautifulSoup(html, 'html.parser')
-            text = soup.get_text()
-            
-            return text.strip()
-            
-        except Exception as e:
-            logger.error(f"Error extracting from Markdown: {str(e)}")
-            return None
+        md_content = self._read_text(source)
+        
+        # Convert markdown to HTML, then extract text
+        html = markdown.markdown(md_content)
+        soup = BeautifulSoup(html, 'html.parser')
+        text = soup.get_text()
+        
+        yield text
     
-    def _extract_from_asciidoc(self, filepath: str) -> Optional[str]:
+    def _iter_asciidoc(self, source: DocumentSource) -> Iterator[str]:
         """Extract text from AsciiDoc file."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            # Remove AsciiDoc formatting (basic implementation)
-            # Convert headers to text (preserve content, remove =+ markers)
-            content = re.sub(r'^=+\s+(.*?)$', r'\1', content, flags=re.MULTILINE)
-            
-            # Remove attribute entries (lines starting with :attribute:)
-            content = re.sub(r'^:[\w-]+:\s*.*?$', '', content, flags=re.MULTILINE)
-            
-            # Remove block delimiters but preserve content inside
-            content = re.sub(r'^----+$', '', content, flags=re.MULTILINE)
-            content = re.sub(r'^\*\*\*\*+$', '', content, flags=re.MULTILINE)
-            content = re.sub(r'^====+$', '', content, flags=re.MULTILINE)
-            content = re.sub(r'^\+\+\+\++$', '', content, flags=re.MULTILINE)
-            
-            # Remove admonition markers but preserve content
-            content = re.sub(r'^\[(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]$', '', content, flags=re.MULTILINE)
-            
-            # Remove inline formatting
-            content = re.sub(r'\*([^*]+)\*', r'\1', content)  # bold
-            content = re.sub(r'_([^_]+)_', r'\1', content)    # italic
-            content = re.sub(r'`([^`]+)`', r'\1', content)    # monospace
-            
-            # Remove links but keep text
-            content = re.sub(r'link:([^[]+)\[([^\]]*)\]', r'\2', content)
-            content = re.sub(r'http[s]?://[^\s\[\]]+', '', content)
-            
-            # Clean up extra whitespace
-            content = re.sub(r'\n\s*\n', '\n\n', content)
-            content = re.sub(r'\n{3,}', '\n\n', content)
-            
-            return content.strip()
-            
-        except Exception as e:
-            logger.error(f"Error extracting from AsciiDoc: {str(e)}")
-            return None
+        content = self._read_text(source)
+        
+        # Remove AsciiDoc formatting (basic implementation)
+        # Convert headers to text (preserve content, remove =+ markers)
+        content = re.sub(r'^=+\s+(.*?)$', r'\1', content, flags=re.MULTILINE)
+        
+        # Remove attribute entries (lines starting with :attribute:)
+        content = re.sub(r'^:[\w-]+:\s*.*?$', '', content, flags=re.MULTILINE)
+        
+        # Remove block delimiters but preserve content inside
+        content = re.sub(r'^----+$', '', content, flags=re.MULTILINE)
+        content = re.sub(r'^\*\*\*\*+$', '', content, flags=re.MULTILINE)
+        content = re.sub(r'^====+$', '', content, flags=re.MULTILINE)
+        content = re.sub(r'^\+\+\+\++$', '', content, flags=re.MULTILINE)
+        
+        # Remove admonition markers but preserve content
+        content = re.sub(r'^\[(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]$', '', content, flags=re.MULTILINE)
+        
+        # Remove inline formatting
+        content = re.sub(r'\*([^*]+)\*', r'\1', content)  # bold
+        content = re.sub(r'_([^_]+)_', r'\1', content)    # italic
+        content = re.sub(r'`([^`]+)`', r'\1', content)    # monospace
+        
+        # Remove links but keep text
+        content = re.sub(r'link:([^[]+)\[([^\]]*)\]', r'\2', content)
+        content = re.sub(r'http[s]?://[^\s\[\]]+', '', content)
+        
+        # Clean up extra whitespace
+        content = re.sub(r'\n\s*\n', '\n\n', content)
+        content = re.sub(r'\n{3,}', '\n\n', content)
+        
+        yield content
     
-    def _extract_from_dita(self, filepath: str) -> Optional[str]:
+    def _iter_dita(self, source: DocumentSource) -> Iterator[str]:
         """Extract text from DITA file."""
+        content = self._read_text(source)
+        
+        # Parse DITA XML and extract text
+        soup = BeautifulSoup(content, 'xml')
+        
+        # Remove unwanted metadata but preserve titles
+        for element in soup(['prolog', 'metadata']):
+            element.decompose()
+        
+        # Extract text content
+        text = soup.get_text(separator='\n')
+        
+        yield text
+        
+    def _iter_text(self, source: DocumentSource) -> Iterator[str]:
+        """Yield the paragraphs of a plain text file."""
+        if _is_path(source):
+            with open(source, 'r', encoding='utf-8') as file:
+                yield from _iter_paragraphs(file)
+            return
+        
+        stream = io.TextIOWrapper(source, encoding='utf-8')
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            # Parse DITA XML and extract text
-            soup = BeautifulSoup(content, 'xml')
-            
-            # Remove unwanted metadata but preserve titles
-            for element in soup(['prolog', 'metadata']):
-                element.decompose()
-            
-            # Extract text content
-            text = soup.get_text(separator='\n')
-            
-            return text.strip()
-            
-        except Exception as e:
-            logger.error(f"Error extracting from DITA: {str(e)}")
-            return None
-    
-    def _extract_from_text(self, filepath: str) -> Optional[str]:
-        """Extract text from plain text file."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            return content.strip()
-            
-        except Exception as e:
-            logger.error(f"Error extracting from text file: {str(e)}")
-            return None
+            yield from _iter_paragraphs(stream)
+        finally:
+            # Leave the caller's stream open
+            stream.detach()
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text."""
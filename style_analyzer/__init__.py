@@ -4,6 +4,7 @@ Provides comprehensive style analysis with zero false positives design.
 """
 
 from .core_analyzer import StyleAnalyzer
+from .base_types import AnalysisOptions
 
-__all__ = ['StyleAnalyzer']
+__all__ = ['StyleAnalyzer', 'AnalysisOptions']
 __version__ = '2.0.0' 
\ No newline at end of file
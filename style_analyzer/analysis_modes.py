@@ -4,6 +4,7 @@ Different analysis strategies based on available capabilities.
 """
 
 import logging
+import threading
 from typing import List, Dict, Any, Optional
 
 try:
@@ -13,7 +14,13 @@ try:
 except ImportError:
     STRUCTURAL_PARSING_AVAILABLE = False
 
-from .base_types import ErrorDict, AnalysisMode, create_error
+try:
+    from nlp_processing import cached_nlp
+    DOC_CACHE_AVAILABLE = True
+except ImportError:
+    DOC_CACHE_AVAILABLE = False
+
+from .base_types import ErrorDict, AnalysisMode, AnalysisOptions, create_error
 from .error_converters import ErrorConverter
 
 logger = logging.getLogger(__name__)
@@ -29,9 +36,11 @@ class AnalysisModeExecutor:
         self.rules_registry = rules_registry
         self.nlp = nlp
         self.error_converter = ErrorConverter()
+        # Docs pre-parsed for, and request options of, the block currently analyzed on this thread
+        self._local = threading.local()
     
     def analyze_spacy_with_modular_rules(self, text: str, sentences: List[str], 
-                                       block_context: Optional[dict] = None) -> List[ErrorDict]:
+                                       block_context: Optional[dict] = None, nlp=None) -> List[ErrorDict]:
         """Analyze using ONLY modular rules with SpaCy (highest accuracy)."""
         errors = []
         
@@ -41,7 +50,7 @@ class AnalysisModeExecutor:
                 try:
                     # Use context-aware rule analysis to prevent false positives
                     rules_errors = self.rules_registry.analyze_with_context_aware_rules(
-                        text, sentences, self.nlp, block_context
+                        text, sentences, nlp or self.nlp, block_context, options=self._current_options()
                     )
                     
                     # Convert rules errors to our error format
@@ -56,12 +65,12 @@ class AnalysisModeExecutor:
         except Exception as e:
             logger.error(f"Modular rules analysis failed: {e}")
             # Ultimate fallback - try minimal safe mode
-            return self.analyze_minimal_safe_mode(text, sentences, block_context)
+            return self.analyze_minimal_safe_mode(text, sentences, block_context, nlp)
         
         return errors
     
     def analyze_modular_rules_with_fallbacks(self, text: str, sentences: List[str], 
-                                           block_context: Optional[dict] = None) -> List[ErrorDict]:
+                                           block_context: Optional[dict] = None, nlp=None) -> List[ErrorDict]:
         """Analyze using ONLY modular rules with conservative fallbacks."""
         errors = []
         
@@ -71,7 +80,7 @@ class AnalysisModeExecutor:
                 try:
                     # Use context-aware rule analysis to prevent false positives
                     rules_errors = self.rules_registry.analyze_with_context_aware_rules(
-                        text, sentences, self.nlp, block_context
+                        text, sentences, nlp or self.nlp, block_context, options=self._current_options()
                     )
                     # Convert rules errors to our error format
                     for error in rules_errors:
@@ -84,19 +93,19 @@ class AnalysisModeExecutor:
         except Exception as e:
             logger.error(f"Modular rules analysis failed: {e}")
             # Ultimate fallback - try minimal safe mode
-            return self.analyze_minimal_safe_mode(text, sentences, block_context)
+            return self.analyze_minimal_safe_mode(text, sentences, block_context, nlp)
         
         return errors
     
     def analyze_spacy_legacy_only(self, text: str, sentences: List[str], 
-                                 block_context: Optional[dict] = None) -> List[ErrorDict]:
+                                 block_context: Optional[dict] = None, nlp=None) -> List[ErrorDict]:
         """DEPRECATED: Legacy analysis mode removed for simplification."""
         # This mode has been eliminated to reduce complexity
         # Fall back to modular rules analysis
-        return self.analyze_modular_rules_with_fallbacks(text, sentences, block_context)
+        return self.analyze_modular_rules_with_fallbacks(text, sentences, block_context, nlp)
     
     def analyze_minimal_safe_mode(self, text: str, sentences: List[str], 
-                                 block_context: Optional[dict] = None) -> List[ErrorDict]:
+                                 block_context: Optional[dict] = None, nlp=None) -> List[ErrorDict]:
         """Analyze using minimal safe methods (most conservative)."""
         errors = []
         
@@ -105,7 +114,7 @@ class AnalysisModeExecutor:
             if self.rules_registry:
                 try:
                     rules_errors = self.rules_registry.analyze_with_context_aware_rules(
-                        text, sentences, self.nlp, block_context
+                        text, sentences, nlp or self.nlp, block_context, options=self._current_options()
                     )
                     # Convert rules errors to our error format  
                     for error in rules_errors:
@@ -123,9 +132,12 @@ class AnalysisModeExecutor:
         return errors
     
     def analyze_block_content(self, block, content: str, analysis_mode: AnalysisMode, 
-                            block_context: Optional[dict] = None) -> List[ErrorDict]:
-        """Analyze content within a specific block context."""
+                            block_context: Optional[dict] = None,
+                            options: Optional[AnalysisOptions] = None) -> List[ErrorDict]:
+        """Analyze content within a specific block context, applying the request's ``options``."""
         errors = []
+        self._local.block_docs = self._collect_block_docs(block)
+        self._local.options = options
         
         try:
             # Get block-specific context
@@ -142,9 +154,28 @@ class AnalysisModeExecutor:
                 
         except Exception as e:
             logger.error(f"Error analyzing block content: {e}")
+        finally:
+            self._local.block_docs = None
+            self._local.options = None
             
         return errors
     
+    def _current_options(self) -> Optional[AnalysisOptions]:
+        """Options of the request whose block is being analyzed on this thread."""
+        return getattr(self._local, 'options', None)
+    
+    def _collect_block_docs(self, block) -> List[Any]:
+        """Gather Docs attached by the batched pre-pass to a block and its descendants."""
+        docs = []
+        pending = [block]
+        while pending:
+            current = pending.pop()
+            doc = getattr(current, '_spacy_doc', None)
+            if doc is not None:
+                docs.append(doc)
+            pending.extend(getattr(current, 'children', None) or [])
+        return docs
+    
     def _is_asciidoc_block(self, block_type) -> bool:
         """Check if block is an AsciiDoc block type."""
         if not STRUCTURAL_PARSING_AVAILABLE:
@@ -254,7 +285,7 @@ class AnalysisModeExecutor:
                         # Use context-aware rule analysis to apply all mapped rules for admonition blocks
                         sentences = self.sentence_analyzer.split_sentences_safe(content) if self.sentence_analyzer else [content]
                         rules_errors = self.rules_registry.analyze_with_context_aware_rules(
-                            content, sentences, self.nlp, enhanced_context
+                            content, sentences, self.nlp, enhanced_context, options=self._current_options()
                         )
                         # Convert rules errors to our error format
                         for error in rules_errors:
@@ -858,28 +889,41 @@ class AnalysisModeExecutor:
         errors = []
         
         try:
-            sentences = self._split_sentences(content)
+            # Share one parse between sentence splitting and every rule
+            block_nlp = self._get_block_nlp()
+            sentences = self._split_sentences(content, block_nlp)
             
             if analysis_mode == AnalysisMode.SPACY_WITH_MODULAR_RULES:
-                errors = self.analyze_spacy_with_modular_rules(content, sentences, block_context)
+                errors = self.analyze_spacy_with_modular_rules(content, sentences, block_context, block_nlp)
             elif analysis_mode == AnalysisMode.MODULAR_RULES_WITH_FALLBACKS:
-                errors = self.analyze_modular_rules_with_fallbacks(content, sentences, block_context)
+                errors = self.analyze_modular_rules_with_fallbacks(content, sentences, block_context, block_nlp)
             elif analysis_mode == AnalysisMode.MINIMAL_SAFE_MODE:
-                errors = self.analyze_minimal_safe_mode(content, sentences, block_context)
+                errors = self.analyze_minimal_safe_mode(content, sentences, block_context, block_nlp)
             else:
                 # Default fallback to modular rules
-                errors = self.analyze_modular_rules_with_fallbacks(content, sentences, block_context)
+                errors = self.analyze_modular_rules_with_fallbacks(content, sentences, block_context, block_nlp)
                 
         except Exception as e:
             logger.error(f"Error in generic content analysis: {e}")
             
         return errors
     
-    def _split_sentences(self, text: str) -> List[str]:
+    def _get_block_nlp(self):
+        """Return a parse-once Doc cache scoped to a single block."""
+        if self.nlp and DOC_CACHE_AVAILABLE:
+            block_nlp = cached_nlp(self.nlp)
+            # Reuse Docs already parsed by the batched pre-pass
+            for doc in getattr(self._local, 'block_docs', None) or []:
+                block_nlp.add(doc.text, doc)
+            return block_nlp
+        return self.nlp
+    
+    def _split_sentences(self, text: str, nlp=None) -> List[str]:
         """Split text into sentences safely."""
+        nlp = nlp or self.nlp
         try:
-            if self.nlp:
-                return self.sentence_analyzer.split_sentences_safe(text, self.nlp)
+            if nlp:
+                return self.sentence_analyzer.split_sentences_safe(text, nlp)
             else:
                 return self.sentence_analyzer.split_sentences_safe(text)
         except Exception as e:
@@ -4,11 +4,11 @@ Main StyleAnalyzer class that coordinates all analysis components.
 """
 
 import logging
+import os
 from typing import Dict, List, Any, Optional
 
 try:
-    import spacy
-    SPACY_AVAILABLE = True
+    from nlp_processing.model_registry import SPACY_AVAILABLE, get_spacy_model
 except ImportError:
     SPACY_AVAILABLE = False
 
@@ -21,7 +21,7 @@ except ImportError:
     get_registry = None
 
 from .base_types import (
-    AnalysisResult, AnalysisMode, ErrorDict,
+    AnalysisResult, AnalysisMode, AnalysisOptions, ErrorDict,
     create_analysis_result, create_error
 )
 from .readability_analyzer import ReadabilityAnalyzer
@@ -30,9 +30,16 @@ from .statistics_calculator import StatisticsCalculator
 from .suggestion_generator import SuggestionGenerator
 from .structural_analyzer import StructuralAnalyzer
 from .analysis_modes import AnalysisModeExecutor
+from .readability_engine import prepare_readability_engine
+from .incremental import AnalysisResultStore, diff_errors, diff_line_regions, line_hashes
 
 logger = logging.getLogger(__name__)
 
+# Import every manifest rule and load the readability backends when the
+# analyzer is built ('0' leaves them to first use, which puts that one-time
+# cost on the first document analysed)
+WARM_UP_ON_INIT = os.getenv('STYLE_ANALYZER_WARM_UP', '1') != '0'
+
 
 class StyleAnalyzer:
     """Main style analyzer with zero false positives design and structural parsing support."""
@@ -53,10 +60,15 @@ class StyleAnalyzer:
             try:
                 self.rules_registry = get_registry(enable_consolidation=True)
                 logger.info("Rules registry loaded successfully with error consolidation enabled")
+                if WARM_UP_ON_INIT and hasattr(self.rules_registry.rules, 'load_all'):
+                    self.rules_registry.rules.load_all()
             except Exception as e:
                 logger.warning(f"Failed to load rules registry: {e}")
                 self.rules_registry = None
         
+        if WARM_UP_ON_INIT:
+            prepare_readability_engine()
+        
         # Initialize NLP model if available
         self.nlp = None
         if SPACY_AVAILABLE:
@@ -81,11 +93,14 @@ class StyleAnalyzer:
             self.rules_registry,
             self.nlp
         )
+        
+        # Baselines of results produced for clients in incremental mode
+        self.result_store = AnalysisResultStore()
     
     def _initialize_spacy(self):
         """Initialize SpaCy model safely."""
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = get_spacy_model("en_core_web_sm")
             logger.info("SpaCy model loaded successfully")
         except OSError:
             logger.warning("SpaCy model not found, using fallback methods")
@@ -117,17 +132,22 @@ class StyleAnalyzer:
             # Extract errors from the analysis result
             errors = result.get('analysis', {}).get('errors', [])
             
-            # Calculate statistics and metrics
-            sentences = self._split_sentences(text)
-            paragraphs = self.statistics_calculator.split_paragraphs_safe(text)
-            
-            statistics = self.statistics_calculator.calculate_comprehensive_statistics(
-                text, sentences, paragraphs
-            )
+            # Statistics were already summed from the analysed blocks
+            statistics = result.get('analysis', {}).get('statistics') or {}
+            technical_metrics = result.get('analysis', {}).get('technical_writing_metrics') or {}
             
-            technical_metrics = self.statistics_calculator.calculate_comprehensive_technical_metrics(
-                text, sentences, errors
-            )
+            if not statistics or not technical_metrics:
+                # Document structure could not be parsed; calculate from the raw text
+                sentences = self._split_sentences(text)
+                paragraphs = self.statistics_calculator.split_paragraphs_safe(text)
+                
+                statistics = self.statistics_calculator.calculate_comprehensive_statistics(
+                    text, sentences, paragraphs
+                )
+                
+                technical_metrics = self.statistics_calculator.calculate_comprehensive_technical_metrics(
+                    text, sentences, errors
+                )
             
             # Generate suggestions
             suggestions = self.suggestion_generator.generate_suggestions(
@@ -167,16 +187,28 @@ class StyleAnalyzer:
                 modular_rules_available=RULES_AVAILABLE
             )
     
-    def analyze_with_blocks(self, text: str, format_hint: str = 'auto') -> Dict[str, Any]:
-        """Perform block-aware analysis returning structured results with errors per block."""
+    def analyze_with_blocks(self, text: str, format_hint: str = 'auto',
+                            options: Optional[AnalysisOptions] = None,
+                            incremental: bool = False) -> Dict[str, Any]:
+        """
+        Perform block-aware analysis returning structured results with errors per block.
+        
+        Per-request settings such as the confidence threshold are passed as
+        ``options`` rather than set on the shared analyzer. With ``incremental``
+        a baseline of the result is stored and its id returned as ``result_id``
+        for later ``analyze_incremental`` calls.
+        """
         try:
             # Determine analysis mode
             analysis_mode = self._determine_analysis_mode()
             
             # Use structural analyzer for block-aware analysis
-            return self.structural_analyzer.analyze_with_blocks(
-                text, format_hint, analysis_mode
+            result = self.structural_analyzer.analyze_with_blocks(
+                text, format_hint, analysis_mode, options
             )
+            if incremental:
+                result['result_id'] = self.result_store.add(text, format_hint, result, options or AnalysisOptions())
+            return result
             
         except Exception as e:
             logger.error(f"Block-aware analysis failed: {e}")
@@ -199,6 +231,43 @@ class StyleAnalyzer:
                 'has_structure': False
             }
     
+    def analyze_incremental(self, previous_result_id: Optional[str], new_text: str,
+                            format_hint: Optional[str] = None,
+                            options: Optional[AnalysisOptions] = None) -> Dict[str, Any]:
+        """
+        Re-analyze an edited document against the baseline of a previous result.
+        
+        Only blocks whose text or inter-block context changed are run through the
+        rules again; the rest come from the block result cache. The returned result
+        is a full block-aware result plus the changed line regions and the errors
+        added and removed since the previous result. Removed errors are reported
+        by their identity fields, which is all a baseline keeps of them.
+        
+        ``format_hint`` and ``options`` default to the ones the previous result
+        was produced with.
+        """
+        previous = self.result_store.get(previous_result_id) if previous_result_id else None
+        if format_hint is None:
+            format_hint = previous['format_hint'] if previous else 'auto'
+        if options is None:
+            options = (previous['options'] if previous else None) or AnalysisOptions()
+        
+        result = dict(self.analyze_with_blocks(new_text, format_hint, options, incremental=True))
+        
+        old_errors = previous['errors'] if previous else []
+        new_errors = result.get('analysis', {}).get('errors', [])
+        added_errors, removed_errors = diff_errors(old_errors, new_errors)
+        
+        result.update({
+            'previous_result_id': previous_result_id,
+            'previous_result_found': previous is not None,
+            'changed_regions': diff_line_regions(previous['line_hashes'] if previous else (), line_hashes(new_text)),
+            'added_errors': added_errors,
+            'removed_errors': removed_errors,
+            'unchanged_error_count': len(new_errors) - len(added_errors)
+        })
+        return result
+    
     def _determine_analysis_mode(self) -> AnalysisMode:
         """Determine the analysis mode - simplified to eliminate complexity."""
         # Use the most capable mode available, with a simple fallback
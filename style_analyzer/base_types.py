@@ -3,6 +3,7 @@ Base Types and Constants for Style Analyzer
 Defines common types, enums, and constants used across all analyzer modules.
 """
 
+from dataclasses import dataclass, replace
 from typing import Dict, List, Any, Optional, Union
 from enum import Enum
 import logging
@@ -30,6 +31,31 @@ class AnalysisMethod(Enum):
     SPACY_LEGACY = "spacy_legacy"
     MINIMAL_SAFE = "minimal_safe"
 
+@dataclass(frozen=True)
+class AnalysisOptions:
+    """
+    Per-request analysis settings.
+    
+    Passed down from StyleAnalyzer.analyze_with_blocks to the rules registry
+    instead of being set on the shared analyzer, so concurrent requests with
+    different settings can share one warm analyzer. Fields left as None fall
+    back to the analyzer's configured defaults.
+    """
+    confidence_threshold: Optional[float] = None
+    
+    def __post_init__(self):
+        if self.confidence_threshold is not None:
+            threshold = float(self.confidence_threshold)
+            if not 0.0 <= threshold <= 1.0:
+                raise ValueError(f"confidence_threshold must be between 0.0 and 1.0, got {threshold}")
+            object.__setattr__(self, 'confidence_threshold', threshold)
+    
+    def with_defaults(self, confidence_threshold: Optional[float] = None) -> 'AnalysisOptions':
+        """Return these options with unset fields filled from the given defaults."""
+        if self.confidence_threshold is None and confidence_threshold is not None:
+            return replace(self, confidence_threshold=confidence_threshold)
+        return self
+
 # Type aliases for better code readability
 ErrorDict = Dict[str, Any]
 SuggestionDict = Dict[str, Any]
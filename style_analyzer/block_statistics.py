@@ -0,0 +1,57 @@
+"""
+Block Statistics Module
+Per-block sentence and readability counts collected during block analysis.
+
+Document statistics used to start from a fresh parse of the whole raw
+document once every block had been analysed. Each block's text has already
+been parsed for the rules by then, so its sentences and readability counts
+are taken from that Doc while the block is analysed, cached with the block's
+result, and summed into document statistics afterwards.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+from .readability_engine import ReadabilityCounts, count_readability
+
+
+@dataclass(frozen=True)
+class BlockStatistics:
+    """Sentences and readability counts of one analysed block."""
+    sentences: Tuple[str, ...] = ()
+    readability: ReadabilityCounts = field(default_factory=ReadabilityCounts)
+
+
+def collect_block_statistics(text: str, doc=None) -> BlockStatistics:
+    """
+    Count a block's sentences and readability figures.
+
+    Args:
+        text: The block text that was analysed
+        doc: The spaCy Doc the rules parsed from ``text``, if any
+    """
+    if not isinstance(text, str) or not text.strip():
+        return BlockStatistics()
+
+    sentences = None
+    if doc is not None:
+        try:
+            sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+        except Exception:
+            # No sentence boundaries on this Doc
+            doc = None
+    if sentences is None:
+        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+
+    return BlockStatistics(tuple(sentences), count_readability(text, doc))
+
+
+def combine_block_statistics(parts: Iterable[BlockStatistics]) -> Tuple[List[str], ReadabilityCounts]:
+    """Document sentences, in block order, and the readability counts of all blocks together."""
+    sentences: List[str] = []
+    readability: List[ReadabilityCounts] = []
+    for part in parts:
+        sentences.extend(part.sentences)
+        readability.append(part.readability)
+    return sentences, ReadabilityCounts.combine(readability)
@@ -0,0 +1,140 @@
+"""
+Incremental Analysis Module
+Support for re-analyzing an edited document against a previous result.
+
+Keeps a bounded store of analysis baselines for clients that opt into
+incremental mode, finds the line regions that changed between two versions of a
+document and computes the delta of added and removed errors. Rule execution
+itself is limited to changed blocks by the block result cache in the structural
+analyzer.
+"""
+
+import difflib
+import hashlib
+import json
+import uuid
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from validation.confidence.bounded_cache import BoundedCache
+
+# Error fields that identify an issue independently of the run that found it and
+# of its position: the sentence text anchors an error, its index and span do not,
+# so inserting a sentence above an error leaves the error unchanged
+ERROR_IDENTITY_FIELDS = ('type', 'message', 'sentence', 'flagged_text', 'text_segment')
+
+# Baselines are compact (line hashes and error identities), but one is kept per
+# opted-in analysis, so the store is bounded by count, estimated bytes and age
+BASELINE_STORE_MAX_ENTRIES = 1024
+BASELINE_STORE_MAX_BYTES = 32 * 1024 * 1024
+BASELINE_STORE_TTL_SECONDS = 3600
+
+
+def line_hashes(text: str) -> Tuple[bytes, ...]:
+    """Short digests of the lines of ``text``, enough to diff it against a later version."""
+    return tuple(hashlib.blake2b(line.encode('utf-8'), digest_size=8).digest() for line in text.splitlines())
+
+
+def diff_line_regions(old_lines: Sequence[Any], new_lines: Sequence[Any]) -> List[Dict[str, int]]:
+    """
+    Find the line ranges that differ between two sequences of lines (or line hashes).
+
+    Returns:
+        One dict per changed region with 0-based, end-exclusive line ranges
+        ('old_start', 'old_end', 'new_start', 'new_end')
+    """
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+
+    regions = []
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag == 'equal':
+            continue
+        regions.append({
+            'old_start': old_start,
+            'old_end': old_end,
+            'new_start': new_start,
+            'new_end': new_end
+        })
+    return regions
+
+
+def diff_text_regions(old_text: str, new_text: str) -> List[Dict[str, int]]:
+    """Find the line ranges that differ between two versions of a document."""
+    return diff_line_regions(old_text.splitlines(), new_text.splitlines())
+
+
+def error_identity(error: Dict[str, Any]) -> Dict[str, Any]:
+    """The identity fields of an error; all a baseline keeps of it."""
+    return {field: error.get(field) for field in ERROR_IDENTITY_FIELDS if error.get(field) is not None}
+
+
+def error_signature(error: Dict[str, Any]) -> str:
+    """Stable identity for an error, used to match errors across analyses."""
+    return json.dumps(error_identity(error), sort_keys=True, default=str)
+
+
+def _unmatched_errors(errors: List[Dict[str, Any]], others: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Errors in ``errors`` that have no counterpart in ``others`` (matched one-for-one)."""
+    remaining = Counter(error_signature(error) for error in others)
+    unmatched = []
+    for error in errors:
+        signature = error_signature(error)
+        if remaining[signature] > 0:
+            remaining[signature] -= 1
+        else:
+            unmatched.append(error)
+    return unmatched
+
+
+def diff_errors(old_errors: List[Dict[str, Any]],
+                new_errors: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Compare two error lists.
+
+    Repeated identical errors are matched one-for-one, so a duplicated sentence
+    that gains a second occurrence of an issue reports one added error.
+
+    Returns:
+        (added_errors, removed_errors)
+    """
+    return _unmatched_errors(new_errors, old_errors), _unmatched_errors(old_errors, new_errors)
+
+
+class AnalysisResultStore:
+    """
+    Bounded, thread-safe store of analysis baselines keyed by result id.
+
+    A baseline holds what a later incremental request needs to compute its delta:
+    the format hint and options of the analysis, hashes of the analysed lines and
+    the identity fields of the errors found. The text and full result are not
+    kept; unchanged blocks are re-served by the block result cache instead.
+    """
+
+    def __init__(self, max_results: int = BASELINE_STORE_MAX_ENTRIES,
+                 max_bytes: Optional[int] = BASELINE_STORE_MAX_BYTES,
+                 ttl_seconds: Optional[float] = BASELINE_STORE_TTL_SECONDS):
+        self._baselines = BoundedCache(max_entries=max_results, max_bytes=max_bytes,
+                                       ttl_seconds=ttl_seconds, name='incremental_baselines')
+
+    def add(self, text: str, format_hint: str, result: Dict[str, Any], options: Any = None) -> str:
+        """Store the baseline of ``result``, produced for ``text`` with ``options``; return its id."""
+        result_id = str(uuid.uuid4())
+        errors = result.get('analysis', {}).get('errors', [])
+        self._baselines.put(result_id, {
+            'format_hint': format_hint,
+            'options': options,
+            'line_hashes': line_hashes(text),
+            'errors': [error_identity(error) for error in errors]
+        })
+        return result_id
+
+    def get(self, result_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored baseline, or None if it is unknown, evicted or expired."""
+        return self._baselines.get(result_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        return self._baselines.get_stats()
+
+    def __len__(self) -> int:
+        return len(self._baselines)
@@ -0,0 +1,240 @@
+"""
+Parallel Block Executor Module
+Fans block analysis out to a pool of worker processes. Each worker keeps a warm
+spaCy model and RulesRegistry for its whole lifetime, so only the blocks and
+their results cross the process boundary.
+
+Results are returned in submission (document) order. Side effects that block
+analysis has on a block's descendants (e.g. errors stored on list items and
+table cells) are shipped back and replayed on the original tree, so the final
+output is identical to sequential analysis.
+"""
+
+import atexit
+import contextlib
+import copy
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base_types import AnalysisMode
+from .block_statistics import collect_block_statistics
+
+logger = logging.getLogger(__name__)
+
+# Per-process state populated by _initialize_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def _initialize_worker(rules: Optional[dict], enable_enhanced_validation: bool,
+                       confidence_threshold: Optional[float], spacy_model: str):
+    """Load the spaCy model, rules registry and mode executor once per worker."""
+    from .readability_analyzer import ReadabilityAnalyzer
+    from .sentence_analyzer import SentenceAnalyzer
+    from .analysis_modes import AnalysisModeExecutor
+
+    nlp = None
+    try:
+        from nlp_processing import get_spacy_model
+        nlp = get_spacy_model(spacy_model)
+    except Exception as e:
+        logger.warning(f"Block worker {os.getpid()} could not load spaCy model: {e}")
+
+    rules_registry = None
+    try:
+        from rules import get_registry, get_enhanced_registry
+        if enable_enhanced_validation:
+            rules_registry = get_enhanced_registry(confidence_threshold=confidence_threshold)
+        else:
+            rules_registry = get_registry(enable_consolidation=True)
+    except Exception as e:
+        logger.warning(f"Block worker {os.getpid()} could not load rules registry: {e}")
+
+    _worker_state['rules_registry'] = rules_registry
+    _worker_state['mode_executor'] = AnalysisModeExecutor(
+        ReadabilityAnalyzer(rules),
+        SentenceAnalyzer(rules),
+        rules_registry,
+        nlp
+    )
+
+
+def _iter_descendants(block, path: Tuple[int, ...] = ()):
+    """Yield (path, descendant) pairs for every descendant of a block."""
+    for index, child in enumerate(getattr(block, 'children', None) or []):
+        child_path = path + (index,)
+        yield child_path, child
+        yield from _iter_descendants(child, child_path)
+
+
+def snapshot_descendants(block) -> Dict[Tuple[int, ...], int]:
+    """Record how many errors each descendant holds before a block is analyzed."""
+    return {path: len(getattr(child, '_analysis_errors', None) or [])
+            for path, child in _iter_descendants(block)}
+
+
+def collect_descendant_updates(block, before: Dict[Tuple[int, ...], int]) -> List[tuple]:
+    """
+    Describe what analyzing a block did to its descendants since ``before``.
+
+    Returns:
+        (child_path, added_errors, already_analyzed) tuples
+    """
+    updates = []
+    for path, child in _iter_descendants(block):
+        child_errors = getattr(child, '_analysis_errors', None) or []
+        added = child_errors[before.get(path, 0):]
+        already_analyzed = getattr(child, '_already_analyzed', False)
+        if added or already_analyzed:
+            updates.append((path, list(added), already_analyzed))
+    return updates
+
+
+def apply_descendant_updates(block, updates: List[tuple]):
+    """Replay descendant updates produced by collect_descendant_updates on ``block``."""
+    for path, added_errors, already_analyzed in updates:
+        child = block
+        for index in path:
+            child = child.children[index]
+        if added_errors:
+            if not hasattr(child, '_analysis_errors'):
+                child._analysis_errors = []
+            child._analysis_errors.extend(added_errors)
+        if already_analyzed:
+            child._already_analyzed = True
+
+
+def _text_profile_scope():
+    """Scope validator text profiles to one block task in this worker."""
+    try:
+        from validation.multi_pass.text_profile import text_profile_scope
+    except ImportError:
+        return contextlib.nullcontext()
+    return text_profile_scope()
+
+
+def _parse_block_text(nlp, content: str, analysis_mode):
+    """Parse a block's text once so its rules and its statistics share the Doc."""
+    if not nlp or not isinstance(content, str) or not content.strip():
+        return None
+    if analysis_mode not in (AnalysisMode.SPACY_WITH_MODULAR_RULES, AnalysisMode.MODULAR_RULES_WITH_FALLBACKS):
+        return None
+    try:
+        return nlp(content)
+    except Exception as e:
+        logger.warning(f"Block worker {os.getpid()} could not parse block text: {e}")
+        return None
+
+
+def _analyze_block_in_worker(task: Tuple[Any, str, Any, dict, Any]):
+    """
+    Analyze one detached block and report its errors, descendant side effects
+    and sentence/readability statistics.
+    """
+    block, content, analysis_mode, context, options = task
+    mode_executor = _worker_state['mode_executor']
+
+    before = snapshot_descendants(block)
+
+    start_time = time.time()
+    # Same pre-parse the in-process path does; the rules pick the Doc up from the block
+    doc = _parse_block_text(getattr(mode_executor, 'nlp', None), content, analysis_mode)
+    if doc is not None:
+        block._spacy_doc = doc
+    with _text_profile_scope():
+        errors = mode_executor.analyze_block_content(block, content, analysis_mode, context, options)
+    elapsed = time.time() - start_time
+
+    return errors, collect_descendant_updates(block, before), elapsed, collect_block_statistics(content, doc)
+
+
+def _detached_copy(block):
+    """
+    Copy a block subtree without its parent links so pickling it does not drag
+    the rest of the document along.
+    """
+    clone = copy.copy(block)
+    if hasattr(clone, 'parent'):
+        clone.parent = None
+    if isinstance(getattr(block, '_analysis_errors', None), list):
+        clone._analysis_errors = list(block._analysis_errors)
+    if hasattr(block, 'children'):
+        clone.children = [_detached_copy(child) for child in block.children]
+    return clone
+
+
+class ParallelBlockExecutor:
+    """Process-pool runner for block analysis with warm per-worker state."""
+
+    def __init__(self, max_workers: Optional[int] = None, rules: Optional[dict] = None,
+                 enable_enhanced_validation: bool = True,
+                 confidence_threshold: Optional[float] = None,
+                 spacy_model: str = "en_core_web_sm",
+                 chunksize: int = 4):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.rules = rules
+        self.enable_enhanced_validation = enable_enhanced_validation
+        self.confidence_threshold = confidence_threshold
+        self.spacy_model = spacy_model
+        self.chunksize = max(1, chunksize)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # 'spawn' avoids forking a process that already runs server threads
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_initialize_worker,
+                    initargs=(self.rules, self.enable_enhanced_validation,
+                              self.confidence_threshold, self.spacy_model)
+                )
+                atexit.register(self.shutdown)
+                logger.info(f"Started parallel block analysis pool with {self.max_workers} workers")
+            return self._pool
+
+    def analyze_blocks(self, work_items: List[Tuple[Any, str, dict]], analysis_mode,
+                       options=None) -> List[Tuple[List[Dict[str, Any]], float, List[tuple], Any]]:
+        """
+        Analyze blocks in parallel.
+
+        Args:
+            work_items: (block, content, context) tuples in document order
+            analysis_mode: AnalysisMode to run
+            options: The request's AnalysisOptions, applied by the workers per task
+
+        Returns:
+            (errors, elapsed_seconds, descendant_updates, statistics) per work
+            item, in the same order. Descendant updates have already been
+            applied to the original blocks; statistics are BlockStatistics.
+        """
+        tasks = [
+            (_detached_copy(block), content, analysis_mode, context, options)
+            for block, content, context in work_items
+        ]
+
+        try:
+            results = list(self._get_pool().map(_analyze_block_in_worker, tasks, chunksize=self.chunksize))
+        except Exception:
+            # A broken pool cannot be reused; start a fresh one next time
+            self.shutdown()
+            raise
+
+        ordered_results = []
+        for (block, _, _), (errors, descendant_updates, elapsed, statistics) in zip(work_items, results):
+            apply_descendant_updates(block, descendant_updates)
+            ordered_results.append((errors, elapsed, descendant_updates, statistics))
+
+        return ordered_results
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
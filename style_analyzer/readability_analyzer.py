@@ -6,7 +6,6 @@ Designed for zero false positives with conservative thresholds.
 
 import logging
 from typing import List, Optional, Any
-import textstat
 
 try:
     import spacy
@@ -16,8 +15,9 @@ except ImportError:
 
 from .base_types import (
     ErrorDict, AnalysisMethod, ErrorSeverity, CONSERVATIVE_THRESHOLDS,
-    DEFAULT_RULES, create_error, safe_textstat_call
+    DEFAULT_RULES, create_error
 )
+from .readability_engine import get_readability_counts
 
 # Fallback confidence scores when enhanced system not available
 FALLBACK_CONFIDENCE_SCORES = {
@@ -51,7 +51,7 @@ class ReadabilityAnalyzer:
             
             # Only flag readability if we have sufficient text and clear issues
             if len(text) > 100 and sentence_count > 2:
-                flesch_score = safe_textstat_call(getattr(textstat, 'flesch_reading_ease', lambda x: 0), text)
+                flesch_score = get_readability_counts(text, doc).flesch_reading_ease()
                 
                 if flesch_score < self.rules['min_readability_score']:
                     error = create_error(
@@ -91,7 +91,7 @@ class ReadabilityAnalyzer:
             # Only flag very clear readability issues
             min_length = CONSERVATIVE_THRESHOLDS['readability_min_text_length']
             if len(text) > min_length:
-                flesch_score = safe_textstat_call(getattr(textstat, 'flesch_reading_ease', lambda x: 0), text)
+                flesch_score = get_readability_counts(text).flesch_reading_ease()
                 
                 if flesch_score < conservative_min_score:
                     error = create_error(
@@ -124,7 +124,7 @@ class ReadabilityAnalyzer:
         min_length = CONSERVATIVE_THRESHOLDS['minimal_safe_text_length']
         if len(text) > min_length:
             try:
-                flesch_score = safe_textstat_call(getattr(textstat, 'flesch_reading_ease', lambda x: 0), text)
+                flesch_score = get_readability_counts(text).flesch_reading_ease()
                 threshold = CONSERVATIVE_THRESHOLDS['minimal_safe_readability_threshold']
                 
                 if flesch_score < threshold:
@@ -144,8 +144,8 @@ class ReadabilityAnalyzer:
                 
         return errors
     
-    def calculate_readability_metrics(self, text: str) -> dict:
-        """Calculate comprehensive readability metrics safely."""
+    def calculate_readability_metrics(self, text: str, doc=None) -> dict:
+        """Calculate comprehensive readability metrics safely, reusing ``doc`` if already parsed."""
         metrics = {
             'flesch_reading_ease': 0.0,
             'flesch_kincaid_grade': 0.0,
@@ -161,39 +161,9 @@ class ReadabilityAnalyzer:
             return metrics
             
         try:
-            # Use safe textstat calls for all metrics
-            metrics['flesch_reading_ease'] = safe_textstat_call(
-                getattr(textstat, 'flesch_reading_ease', lambda x: 0), text
-            )
-            metrics['flesch_kincaid_grade'] = safe_textstat_call(
-                getattr(textstat, 'flesch_kincaid_grade', lambda x: 0), text
-            )
-            metrics['gunning_fog_index'] = safe_textstat_call(
-                getattr(textstat, 'gunning_fog', lambda x: 0), text
-            )
-            metrics['smog_index'] = safe_textstat_call(
-                getattr(textstat, 'smog_index', lambda x: 0), text
-            )
-            metrics['coleman_liau_index'] = safe_textstat_call(
-                getattr(textstat, 'coleman_liau_index', lambda x: 0), text
-            )
-            metrics['automated_readability_index'] = safe_textstat_call(
-                getattr(textstat, 'automated_readability_index', lambda x: 0), text
-            )
-            metrics['dale_chall_readability'] = safe_textstat_call(
-                getattr(textstat, 'dale_chall_readability_score', lambda x: 0), text
-            )
+            # Every index is derived from one pass over the text
+            metrics.update(get_readability_counts(text, doc).to_metrics())
             
-            # Handle text_standard separately as it may return non-numeric
-            try:
-                text_standard_result = getattr(textstat, 'text_standard', lambda x, float_output=True: 0)(text, float_output=True)
-                if isinstance(text_standard_result, (int, float)):
-                    metrics['text_standard'] = float(text_standard_result)
-                else:
-                    metrics['text_standard'] = 0.0
-            except Exception:
-                metrics['text_standard'] = 0.0
-                
         except Exception as e:
             logger.error(f"Error calculating readability metrics: {e}")
             
@@ -0,0 +1,535 @@
+"""
+Readability Engine Module
+Single-pass counts from which every readability index is derived.
+
+textstat re-tokenises the full text inside each index function, so computing
+the eight indices reported per analysis (and Flesch/Flesch-Kincaid again for
+the technical metrics) walked the text some fifteen times. This module walks
+it once, collects word, sentence, syllable, polysyllable and difficult-word
+counts into a ReadabilityCounts record and derives every index from that
+record arithmetically, using textstat's formulas.
+
+Words are whitespace-delimited chunks with punctuation removed, exactly as
+textstat counts them. When a parsed spaCy Doc is available its tokens are
+walked instead of the raw text and its sentence boundaries replace textstat's
+punctuation regex. Per-word results (syllables, Dale-Chall familiarity) are
+memoised per word type, and counts are memoised per text so the readability
+analyzer and the statistics calculator share one pass over the same document.
+"""
+
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import textstat
+    TEXTSTAT_AVAILABLE = True
+except ImportError:
+    TEXTSTAT_AVAILABLE = False
+
+try:
+    import pyphen
+    PYPHEN_AVAILABLE = True
+except ImportError:
+    PYPHEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Distinct word types whose syllable count and familiarity are kept
+READABILITY_WORD_CACHE_SIZE = int(os.getenv('READABILITY_WORD_CACHE_SIZE', '65536'))
+# Distinct texts whose counts are kept (one per analysed document)
+READABILITY_COUNTS_CACHE_SIZE = int(os.getenv('READABILITY_COUNTS_CACHE_SIZE', '64'))
+
+# Linsear Write only looks at the first 100 words
+LINSEAR_WORD_LIMIT = 100
+
+# Mirrors textstat: sentences of two words or fewer are ignored
+_SENTENCE_PATTERN = re.compile(r"\b[^.!?]+[.!?]*", re.UNICODE)
+# Apostrophes outside common contractions are punctuation
+_NONCONTRACTION_APOSTROPHE = re.compile(r"\'(?![tsd]|ve|ll|re)")
+_PUNCTUATION_KEEP_APOSTROPHE = re.compile(r"[^\w\s\']")
+_NON_LETTER = re.compile(r"[^\w]")
+
+# Cleared when textstat's syllable backend (cmudict) cannot be loaded
+_textstat_words_usable = TEXTSTAT_AVAILABLE
+
+
+@dataclass(frozen=True)
+class ReadabilityCounts:
+    """
+    Counts of a text that every readability index is derived from.
+
+    ``difficult_words`` are words outside the Dale-Chall familiar list with
+    three or more syllables (Gunning Fog); ``unfamiliar_words`` are all words
+    outside the list (Dale-Chall). ``tokens`` counts whitespace-delimited
+    chunks including punctuation-only ones, the word count used by ARI.
+    """
+    words: int = 0
+    sentences: int = 0
+    syllables: int = 0
+    polysyllables: int = 0
+    difficult_words: int = 0
+    unfamiliar_words: int = 0
+    letters: int = 0
+    characters: int = 0
+    tokens: int = 0
+    linsear_easy_words: int = 0
+    linsear_hard_words: int = 0
+    linsear_sentences: int = 0
+
+    @classmethod
+    def combine(cls, parts: Iterable['ReadabilityCounts']) -> 'ReadabilityCounts':
+        """
+        Counts of consecutive texts (e.g. the blocks of a document) taken together.
+
+        Linsear Write keeps the figures of the leading texts until its 100-word
+        window is filled, so the last text taken may overrun it slightly.
+        """
+        totals = dict.fromkeys((f.name for f in fields(cls)), 0)
+        for part in parts:
+            linsear_words = totals['linsear_easy_words'] + totals['linsear_hard_words']
+            for name, value in vars(part).items():
+                if name.startswith('linsear_') and linsear_words >= LINSEAR_WORD_LIMIT:
+                    continue
+                totals[name] += value
+        return cls(**totals)
+
+    @property
+    def words_per_sentence(self) -> float:
+        return self.words / self.sentences if self.sentences else 0.0
+
+    @property
+    def syllables_per_word(self) -> float:
+        return self.syllables / self.words if self.words else 0.0
+
+    def flesch_reading_ease(self) -> float:
+        if not self.words_per_sentence or not self.syllables_per_word:
+            return 0.0
+        return 206.835 - 1.015 * self.words_per_sentence - 84.6 * self.syllables_per_word
+
+    def flesch_kincaid_grade(self) -> float:
+        if not self.words_per_sentence or not self.syllables_per_word:
+            return 0.0
+        return 0.39 * self.words_per_sentence + 11.8 * self.syllables_per_word - 15.59
+
+    def gunning_fog(self) -> float:
+        if not self.words:
+            return 0.0
+        return 0.4 * (self.words_per_sentence + 100 * self.difficult_words / self.words)
+
+    def smog_index(self) -> float:
+        if not self.sentences:
+            return 0.0
+        return 1.043 * math.sqrt(30 * self.polysyllables / self.sentences) + 3.1291
+
+    def coleman_liau_index(self) -> float:
+        if not self.words:
+            return 0.0
+        letters = 100 * self.letters / self.words
+        sentences = 100 * self.sentences / self.words
+        if letters == 0 or sentences == 0:
+            return 0.0
+        return 0.058 * letters - 0.296 * sentences - 15.8
+
+    def automated_readability_index(self) -> float:
+        chars_per_word = self.characters / self.tokens if self.tokens else 0.0
+        if chars_per_word == 0 or self.words_per_sentence == 0:
+            return 0.0
+        return 4.71 * chars_per_word + 0.5 * self.words_per_sentence - 21.43
+
+    def dale_chall_readability_score(self) -> float:
+        if not self.words:
+            return 0.0
+        unfamiliar_percentage = 100 * self.unfamiliar_words / self.words
+        score = 0.1579 * unfamiliar_percentage + 0.0496 * self.words_per_sentence
+        if unfamiliar_percentage > 5:
+            score += 3.6365
+        return score
+
+    def linsear_write_formula(self) -> float:
+        if not self.linsear_sentences:
+            return 0.0
+        number = (self.linsear_easy_words + 3 * self.linsear_hard_words) / self.linsear_sentences
+        if number <= 20:
+            number -= 2
+        return number / 2
+
+    def text_standard(self) -> float:
+        """Consensus grade of the individual indices (textstat's text_standard)."""
+        # Order matters: ties go to the grade seen first
+        grades = _rounded_grades(self.flesch_kincaid_grade())
+        grades.extend(_flesch_band_grades(self.flesch_reading_ease()))
+        for score in (self.smog_index(), self.coleman_liau_index(), self.automated_readability_index(),
+                      self.dale_chall_readability_score(), self.linsear_write_formula(), self.gunning_fog()):
+            grades.extend(_rounded_grades(score))
+        consensus = Counter(grades).most_common(1)[0][0]
+        # Clamped to kindergarten through graduate school
+        return float(max(1, min(consensus, 18)))
+
+    def to_metrics(self) -> Dict[str, float]:
+        """All indices under the keys used in analysis results."""
+        return {
+            'flesch_reading_ease': self.flesch_reading_ease(),
+            'flesch_kincaid_grade': self.flesch_kincaid_grade(),
+            'gunning_fog_index': self.gunning_fog(),
+            'smog_index': self.smog_index(),
+            'coleman_liau_index': self.coleman_liau_index(),
+            'automated_readability_index': self.automated_readability_index(),
+            'dale_chall_readability': self.dale_chall_readability_score(),
+            'text_standard': self.text_standard(),
+        }
+
+
+def _rounded_grades(score: float):
+    return [math.floor(score), math.ceil(score), round(score)]
+
+
+def _flesch_band_grades(score: float):
+    if 90 <= score < 100:
+        return [5]
+    if 80 <= score < 90:
+        return [6]
+    if 70 <= score < 80:
+        return [7]
+    if 60 <= score < 70:
+        return [8, 9]
+    if 50 <= score < 60:
+        return [10]
+    if 40 <= score < 50:
+        return [11]
+    if 30 <= score < 40:
+        return [12]
+    return [13]
+
+
+class _CountsBuilder:
+    """Accumulates counts chunk by chunk."""
+
+    def __init__(self):
+        self.words = 0
+        self.sentences = 0
+        self.syllables = 0
+        self.polysyllables = 0
+        self.difficult_words = 0
+        self.unfamiliar_words = 0
+        self.letters = 0
+        self.characters = 0
+        self.tokens = 0
+        self.linsear_easy_words = 0
+        self.linsear_hard_words = 0
+        self.linsear_sentences = 0
+        # Chunks up to and including the last word Linsear Write looks at
+        self.linsear_tokens = 0
+        self._sentence_words = 0
+        self._sentence_linsear_words = 0
+
+    def add(self, chunk: str) -> bool:
+        """Count one whitespace-delimited chunk; returns whether it is a word."""
+        self.tokens += 1
+        self.characters += len(chunk)
+        profile = _chunk_profile(chunk)
+        if profile is None:
+            return False
+
+        letters, syllables, unfamiliar = profile
+        self.words += 1
+        self.letters += letters
+        self.syllables += syllables
+        if syllables >= 3:
+            self.polysyllables += 1
+        if unfamiliar:
+            self.unfamiliar_words += 1
+            if syllables >= 3:
+                self.difficult_words += 1
+
+        self._sentence_words += 1
+        if self.words <= LINSEAR_WORD_LIMIT:
+            self.linsear_tokens = self.tokens
+            self._sentence_linsear_words += 1
+            if syllables >= 3:
+                self.linsear_hard_words += 1
+            elif syllables > 0:
+                self.linsear_easy_words += 1
+        return True
+
+    def end_sentence(self):
+        if self._sentence_words > 2:
+            self.sentences += 1
+        if self._sentence_linsear_words > 2:
+            self.linsear_sentences += 1
+        self._sentence_words = 0
+        self._sentence_linsear_words = 0
+
+    def build(self) -> ReadabilityCounts:
+        return ReadabilityCounts(
+            words=self.words,
+            sentences=self.sentences,
+            syllables=self.syllables,
+            polysyllables=self.polysyllables,
+            difficult_words=self.difficult_words,
+            unfamiliar_words=self.unfamiliar_words,
+            letters=self.letters,
+            characters=self.characters,
+            tokens=self.tokens,
+            linsear_easy_words=self.linsear_easy_words,
+            linsear_hard_words=self.linsear_hard_words,
+            linsear_sentences=self.linsear_sentences,
+        )
+
+
+def count_readability(text: str, doc=None) -> ReadabilityCounts:
+    """
+    Collect readability counts for ``text`` in a single pass.
+
+    Args:
+        text: The text to measure
+        doc: Optional spaCy Doc already parsed from ``text``; its tokens and
+            sentence boundaries are used instead of re-tokenising the text
+    """
+    if not text or not text.strip():
+        return ReadabilityCounts()
+
+    if doc is not None and _has_sentences(doc):
+        return _count_doc(doc)
+    return _count_text(text)
+
+
+def _count_doc(doc) -> ReadabilityCounts:
+    builder = _CountsBuilder()
+    for chunk, opens_sentence in _iter_chunks(doc):
+        if opens_sentence:
+            builder.end_sentence()
+        builder.add(chunk)
+    builder.end_sentence()
+
+    # A non-empty text always has at least one sentence
+    builder.sentences = max(1, builder.sentences)
+    builder.linsear_sentences = max(1, builder.linsear_sentences)
+    return builder.build()
+
+
+def _count_text(text: str) -> ReadabilityCounts:
+    builder = _CountsBuilder()
+    chunks = text.split()
+    for chunk in chunks:
+        builder.add(chunk)
+
+    builder.sentences = _count_sentences(text)
+    if builder.linsear_tokens < len(chunks) and len(chunks) > LINSEAR_WORD_LIMIT:
+        builder.linsear_sentences = _count_sentences(' '.join(chunks[:builder.linsear_tokens]))
+    else:
+        builder.linsear_sentences = builder.sentences
+    return builder.build()
+
+
+def _has_sentences(doc) -> bool:
+    try:
+        return doc.has_annotation('SENT_START')
+    except Exception:
+        return False
+
+
+def _iter_chunks(doc) -> Iterator[Tuple[str, bool]]:
+    """
+    Rebuild whitespace-delimited chunks from spaCy tokens.
+
+    Yields (chunk, opens_sentence). A sentence boundary inside a chunk (as in
+    "end.(Next") takes effect at the following chunk.
+    """
+    parts = []
+    opens_sentence = False
+    pending_break = False
+    for token in doc:
+        if token.is_sent_start and token.i > 0:
+            pending_break = True
+        if token.is_space:
+            if parts:
+                yield ''.join(parts), opens_sentence
+                parts = []
+            continue
+        if not parts:
+            opens_sentence, pending_break = pending_break, False
+        parts.append(token.text)
+        if token.whitespace_:
+            yield ''.join(parts), opens_sentence
+            parts = []
+    if parts:
+        yield ''.join(parts), opens_sentence
+
+
+def _count_sentences(text: str) -> int:
+    if not text:
+        return 0
+    ignored = 0
+    sentences = _SENTENCE_PATTERN.findall(text)
+    for sentence in sentences:
+        if sum(1 for chunk in sentence.split() if _chunk_profile(chunk) is not None) <= 2:
+            ignored += 1
+    return max(1, len(sentences) - ignored)
+
+
+@lru_cache(maxsize=READABILITY_WORD_CACHE_SIZE)
+def _chunk_profile(chunk: str) -> Optional[Tuple[int, int, bool]]:
+    """(letters, syllables, unfamiliar) of a chunk, or None if it holds no word."""
+    word = _PUNCTUATION_KEEP_APOSTROPHE.sub('', _NONCONTRACTION_APOSTROPHE.sub('', chunk))
+    if not word:
+        return None
+    letters = len(_NON_LETTER.sub('', chunk))
+    syllables = syllable_count(word)
+    return letters, syllables, not _is_familiar_word(word, syllables)
+
+
+@lru_cache(maxsize=READABILITY_WORD_CACHE_SIZE)
+def syllable_count(word: str) -> int:
+    """Syllables in ``word``, counted the way textstat counts them."""
+    word = word.lower()
+    if _textstat_words_usable:
+        try:
+            return textstat.syllable_count(word)
+        except Exception as e:
+            _disable_textstat_words(e)
+    if PYPHEN_AVAILABLE:
+        return len(_get_pyphen().positions(word)) + 1
+    return _estimate_syllables(word)
+
+
+def _is_familiar_word(word: str, syllables: int) -> bool:
+    if _textstat_words_usable:
+        try:
+            return not textstat.is_difficult_word(word, 0)
+        except Exception as e:
+            _disable_textstat_words(e)
+    familiar_words = _get_familiar_words()
+    if familiar_words is not None:
+        return word.lower() in familiar_words
+    # Without the Dale-Chall list, only long words count as unfamiliar
+    return syllables < 3
+
+
+def prepare_readability_engine():
+    """
+    Resolve the syllable and word-list backends now rather than while the
+    first text is counted (textstat's cmudict probe, pyphen's dictionary).
+    """
+    if _textstat_words_usable:
+        try:
+            textstat.syllable_count('readability')
+            textstat.is_difficult_word('readability', 0)
+        except Exception as e:
+            _disable_textstat_words(e)
+    if not _textstat_words_usable:
+        if PYPHEN_AVAILABLE:
+            _get_pyphen()
+        _get_familiar_words()
+
+
+def _disable_textstat_words(error: Exception):
+    global _textstat_words_usable
+    if _textstat_words_usable:
+        _textstat_words_usable = False
+        logger.warning(f"textstat word lookups unavailable, using fallback syllable counts: {error}")
+
+
+@lru_cache(maxsize=1)
+def _get_pyphen():
+    return pyphen.Pyphen(lang='en_US')
+
+
+@lru_cache(maxsize=1)
+def _get_familiar_words():
+    """The Dale-Chall familiar word list shipped with textstat, if reachable."""
+    try:
+        from textstat.backend.utils import get_lang_easy_words
+        return frozenset(get_lang_easy_words('en_US'))
+    except Exception:
+        return None
+
+
+def _estimate_syllables(word: str) -> int:
+    """Vowel-group estimate used when neither textstat nor pyphen is installed."""
+    vowels = "aeiouy"
+    count = 1 if word[0] in vowels else 0
+    for index in range(1, len(word)):
+        if word[index] in vowels and word[index - 1] not in vowels:
+            count += 1
+    if word.endswith("e") and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+class _CountsCache:
+    """
+    Bounded LRU of ReadabilityCounts keyed by text and sentence method.
+
+    Sentences come from the Doc's boundaries when a parsed Doc is given and
+    from textstat's regex otherwise, so the two are cached separately.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(1, max_entries)
+        self._counts: 'OrderedDict[Tuple[str, bool], ReadabilityCounts]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str, doc=None) -> ReadabilityCounts:
+        key = (text, doc is not None and _has_sentences(doc))
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is not None:
+                self._counts.move_to_end(key)
+                self.hits += 1
+                return counts
+            self.misses += 1
+
+        counts = count_readability(text, doc)
+
+        with self._lock:
+            self._counts[key] = counts
+            while len(self._counts) > self.max_entries:
+                self._counts.popitem(last=False)
+        return counts
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_counts_cache = _CountsCache(READABILITY_COUNTS_CACHE_SIZE)
+
+
+def get_readability_counts(text: str, doc=None) -> ReadabilityCounts:
+    """
+    Readability counts for ``text``, computed once and shared by every caller.
+
+    Pass the Doc parsed from ``text`` when one is at hand. Counts taken with
+    the Doc's sentence boundaries are cached apart from regex-split ones, so
+    the result does not depend on which caller counted the text first.
+    """
+    return _counts_cache.get(text, doc)
+
+
+def get_readability_cache_stats() -> Dict[str, int]:
+    words = _chunk_profile.cache_info()
+    return {
+        'texts': len(_counts_cache._counts),
+        'text_hits': _counts_cache.hits,
+        'text_misses': _counts_cache.misses,
+        'word_types': words.currsize,
+        'word_hits': words.hits,
+        'word_misses': words.misses,
+    }
+
+
+def clear_readability_caches():
+    _counts_cache.clear()
+    _chunk_profile.cache_clear()
+    syllable_count.cache_clear()
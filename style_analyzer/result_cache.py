@@ -0,0 +1,331 @@
+"""
+Block Result Cache Module
+Content-addressed cache of post-validation block analysis results.
+
+Entries are keyed by a hash of everything that determines a block's errors: the
+block text (including nested items), block type, context info, the active rule
+set, the confidence threshold, the versions of the configuration files and a hash
+of the analysis code (rule modules, validation and consolidation). An
+unchanged block in a re-analyzed document is served from the cache instead of
+running every rule again.
+
+The in-memory tier is a bounded LRU. An optional SQLite tier keeps results across
+restarts; it is consulted on memory misses and written through on every store.
+Values are stored as JSON, so a tampered cache file can at worst yield wrong
+results, never run code. Tuples and the block statistics dataclasses are tagged
+and restored on load; values of any other type are not cached.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .block_statistics import BlockStatistics
+from .readability_engine import ReadabilityCounts
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached payload or key layout changes
+CACHE_FORMAT_VERSION = 3
+
+# Dataclasses cached block results contain, restored by name on load
+CACHEABLE_DATACLASSES = {cls.__name__: cls for cls in (BlockStatistics, ReadabilityCounts)}
+
+_TYPE_TAG = '__cache_type__'
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Configuration files whose edits change analysis results
+DEFAULT_CONFIG_FILES = (
+    os.path.join(_PROJECT_ROOT, 'rules', 'rule_mappings.yaml'),
+    os.path.join(_PROJECT_ROOT, 'config', 'exceptions.yaml'),
+    os.path.join(_PROJECT_ROOT, 'validation', 'config', 'confidence_weights.yaml'),
+    os.path.join(_PROJECT_ROOT, 'validation', 'config', 'linguistic_anchors.yaml'),
+    os.path.join(_PROJECT_ROOT, 'validation', 'config', 'reliability_overrides.yaml'),
+    os.path.join(_PROJECT_ROOT, 'validation', 'config', 'validation_thresholds.yaml'),
+)
+
+# Packages besides the rule modules whose code shapes block results
+DEFAULT_CODE_PACKAGES = ('rules', 'validation', 'error_consolidation', 'ambiguity',
+                         'nlp_processing', 'style_analyzer')
+
+
+def config_fingerprint(paths: Iterable[str] = DEFAULT_CONFIG_FILES) -> str:
+    """Version stamp for a set of config files, based on their size and mtime."""
+    parts = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{path}:missing")
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def code_fingerprint(packages: Tuple[str, ...] = DEFAULT_CODE_PACKAGES) -> str:
+    """
+    Content hash of the rule modules and the Python sources of ``packages``.
+
+    Unlike configuration, code only changes with a deploy, so the hash is
+    computed once per process. Results cached on disk by an older deploy then
+    stop matching instead of being served after the rules changed.
+    """
+    digest = hashlib.sha256()
+    try:
+        from rules.rule_manifest import compute_sources_fingerprint, is_rule_filename
+        digest.update(compute_sources_fingerprint().encode('utf-8'))
+    except ImportError:
+        is_rule_filename = None
+
+    for package in packages:
+        package_dir = os.path.join(_PROJECT_ROOT, package)
+        for root, dirs, files in os.walk(package_dir):
+            dirs[:] = sorted(d for d in dirs if d not in ('__pycache__', 'tests'))
+            for filename in sorted(files):
+                # Rule modules are already covered by the rule source fingerprint
+                if not filename.endswith('.py') or (is_rule_filename and is_rule_filename(filename)):
+                    continue
+                path = os.path.join(root, filename)
+                digest.update(os.path.relpath(path, _PROJECT_ROOT).encode('utf-8'))
+                try:
+                    with open(path, 'rb') as f:
+                        digest.update(f.read())
+                except OSError:
+                    digest.update(b'<missing>')
+    return digest.hexdigest()
+
+
+def make_cache_key(text: str, block_type: Any, context: Optional[dict], fingerprint: str) -> str:
+    """
+    Build the content address for one block.
+
+    Args:
+        text: The block text, including the text of nested items
+        block_type: Block type (enum or string)
+        context: The block's context_info
+        fingerprint: Rule set / threshold / config / code / mode fingerprint
+
+    Returns:
+        Hex digest identifying the block's analysis result
+    """
+    payload = json.dumps({
+        'format': CACHE_FORMAT_VERSION,
+        'text': text,
+        'block_type': str(getattr(block_type, 'value', block_type)),
+        'context': context or {},
+        'fingerprint': fingerprint,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Convert a cached value to plain JSON data.
+
+    Raises:
+        TypeError: If the value holds anything but JSON scalars, lists, tuples,
+            string-keyed dicts and the dataclasses in ``CACHEABLE_DATACLASSES``
+    """
+    if value is None or (isinstance(value, (bool, int, float, str)) and not isinstance(value, Enum)):
+        return value
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {_TYPE_TAG: 'tuple', 'items': [encode_value(item) for item in value]}
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError('only dicts with string keys can be cached')
+        return {key: encode_value(item) for key, item in value.items()}
+    name = type(value).__name__
+    if CACHEABLE_DATACLASSES.get(name) is type(value):
+        return {_TYPE_TAG: name,
+                'fields': {f.name: encode_value(getattr(value, f.name)) for f in dataclasses.fields(value)}}
+    raise TypeError(f"{name} values cannot be cached")
+
+
+def decode_value(data: Any) -> Any:
+    """Rebuild a value converted by ``encode_value``."""
+    if isinstance(data, list):
+        return [decode_value(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    tag = data.get(_TYPE_TAG)
+    if tag is None:
+        return {key: decode_value(item) for key, item in data.items()}
+    if tag == 'tuple':
+        return tuple(decode_value(item) for item in data['items'])
+    if tag not in CACHEABLE_DATACLASSES:
+        raise ValueError(f"unknown cached type {tag!r}")
+    return CACHEABLE_DATACLASSES[tag](**{key: decode_value(item) for key, item in data['fields'].items()})
+
+
+class BlockResultCache:
+    """Bounded LRU cache of block results with an optional SQLite tier."""
+
+    def __init__(self, max_entries: int = 2048, db_path: Optional[str] = None,
+                 max_disk_entries: int = 50000):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept in memory
+            db_path: SQLite file for the persistent tier (None keeps the cache in memory only)
+            max_disk_entries: Maximum number of results kept in the SQLite tier
+        """
+        self.max_entries = max(1, max_entries)
+        self.max_disk_entries = max(1, max_disk_entries)
+        self._memory: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.db_path = db_path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str):
+        try:
+            directory = os.path.dirname(os.path.abspath(db_path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS block_results ('
+                'key TEXT PRIMARY KEY, payload BLOB NOT NULL, accessed REAL NOT NULL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS idx_block_results_accessed ON block_results(accessed)')
+            self._db.commit()
+            logger.info(f"Block result cache persisting to {db_path}")
+        except sqlite3.Error as e:
+            logger.warning(f"Block result cache disk tier unavailable ({db_path}): {e}")
+            self._db = None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh copy of the cached value for ``key``, or None."""
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+            elif self._db is not None:
+                payload = self._get_from_disk(key)
+                if payload is not None:
+                    self.disk_hits += 1
+                    self._store_in_memory(key, payload)
+            if payload is None:
+                self.misses += 1
+                return None
+
+        try:
+            return decode_value(json.loads(payload))
+        except Exception as e:
+            logger.warning(f"Dropping unreadable block result cache entry: {e}")
+            self.invalidate(key)
+            return None
+
+    def put(self, key: str, value: Any) -> bool:
+        """Store ``value`` under ``key``. Returns False if it cannot be serialized."""
+        try:
+            payload = json.dumps(encode_value(value), separators=(',', ':')).encode('utf-8')
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Block result not cacheable: {e}")
+            return False
+
+        with self._lock:
+            self._store_in_memory(key, payload)
+            if self._db is not None:
+                self._put_on_disk(key, payload)
+        return True
+
+    def invalidate(self, key: str):
+        """Remove one entry from both tiers."""
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._db is not None:
+                try:
+                    self._db.execute('DELETE FROM block_results WHERE key = ?', (key,))
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Block result cache delete failed: {e}")
+
+    def clear(self):
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute('DELETE FROM block_results')
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Block result cache clear failed: {e}")
+
+    def close(self):
+        """Close the SQLite tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'entries': len(self._memory),
+            'max_entries': self.max_entries,
+            'memory_hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            'disk_enabled': self._db is not None,
+        }
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _store_in_memory(self, key: str, payload: bytes):
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _get_from_disk(self, key: str) -> Optional[bytes]:
+        try:
+            row = self._db.execute('SELECT payload FROM block_results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute('UPDATE block_results SET accessed = ? WHERE key = ?', (time.time(), key))
+            self._db.commit()
+            return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Block result cache read failed: {e}")
+            return None
+
+    def _put_on_disk(self, key: str, payload: bytes):
+        try:
+            self._db.execute(
+                'INSERT OR REPLACE INTO block_results (key, payload, accessed) VALUES (?, ?, ?)',
+                (key, payload, time.time())
+            )
+            # Trim the least recently used rows once the table outgrows its bound
+            count = self._db.execute('SELECT COUNT(*) FROM block_results').fetchone()[0]
+            if count > self.max_disk_entries:
+                self._db.execute(
+                    'DELETE FROM block_results WHERE key IN '
+                    '(SELECT key FROM block_results ORDER BY accessed ASC LIMIT ?)',
+                    (count - self.max_disk_entries,)
+                )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Block result cache write failed: {e}")
@@ -9,16 +9,11 @@ import re
 from typing import List, Dict, Any, Optional
 from collections import Counter
 
-try:
-    import textstat
-    TEXTSTAT_AVAILABLE = True
-except ImportError:
-    TEXTSTAT_AVAILABLE = False
-
 from .base_types import (
     StatisticsDict, TechnicalMetricsDict, DEFAULT_RULES,
-    safe_textstat_call, safe_float_conversion
+    safe_float_conversion
 )
+from .readability_engine import ReadabilityCounts, get_readability_counts
 
 logger = logging.getLogger(__name__)
 
@@ -80,8 +75,13 @@ class StatisticsCalculator:
         
         return stats
     
-    def calculate_comprehensive_statistics(self, text: str, sentences: List[str], paragraphs: List[str]) -> StatisticsDict:
-        """Calculate comprehensive statistics including readability metrics."""
+    def calculate_comprehensive_statistics(self, text: str, sentences: List[str], paragraphs: List[str],
+                                           readability: Optional[ReadabilityCounts] = None) -> StatisticsDict:
+        """Calculate comprehensive statistics including readability metrics.
+
+        ``readability`` holds counts already collected for ``text`` (for example
+        summed from its blocks); without it the text is counted once and cached.
+        """
         # Start with safe statistics
         stats = self.calculate_safe_statistics(text, sentences, paragraphs)
         
@@ -97,10 +97,9 @@ class StatisticsCalculator:
             word_stats = self._calculate_word_statistics(text)
             stats.update(word_stats)
             
-            # Add readability metrics if textstat is available
-            if TEXTSTAT_AVAILABLE:
-                readability_stats = self._calculate_readability_statistics(text)
-                stats.update(readability_stats)
+            # Add readability metrics
+            readability_stats = self._calculate_readability_statistics(text, readability)
+            stats.update(readability_stats)
                 
             # Add language patterns
             pattern_stats = self._calculate_pattern_statistics(text)
@@ -111,7 +110,8 @@ class StatisticsCalculator:
             
         return stats
     
-    def calculate_safe_technical_metrics(self, text: str, sentences: List[str], error_count: int) -> TechnicalMetricsDict:
+    def calculate_safe_technical_metrics(self, text: str, sentences: List[str], error_count: int,
+                                         readability: Optional[ReadabilityCounts] = None) -> TechnicalMetricsDict:
         """Calculate technical writing metrics safely."""
         metrics = {
             'readability_score': 0.0,
@@ -125,15 +125,12 @@ class StatisticsCalculator:
             
         try:
             # Only calculate for substantial text
-            if len(text) > 50 and TEXTSTAT_AVAILABLE:
-                metrics['readability_score'] = safe_textstat_call(
-                    getattr(textstat, 'flesch_reading_ease', lambda x: 0), text
-                )
+            if len(text) > 50:
+                counts = self._readability_counts(text, readability)
+                metrics['readability_score'] = counts.flesch_reading_ease()
                 
                 # Use flesch_kincaid_grade for numeric grade level instead of text_standard
-                metrics['grade_level'] = safe_textstat_call(
-                    getattr(textstat, 'flesch_kincaid_grade', lambda x: 0), text
-                )
+                metrics['grade_level'] = counts.flesch_kincaid_grade()
                 
             # Safe error density calculation
             valid_sentences = [s for s in sentences if s.strip()]
@@ -148,22 +145,22 @@ class StatisticsCalculator:
         
         return metrics
     
-    def calculate_comprehensive_technical_metrics(self, text: str, sentences: List[str], errors: List[Dict[str, Any]]) -> TechnicalMetricsDict:
+    def calculate_comprehensive_technical_metrics(self, text: str, sentences: List[str], errors: List[Dict[str, Any]],
+                                                  readability: Optional[ReadabilityCounts] = None) -> TechnicalMetricsDict:
         """Calculate comprehensive technical writing metrics."""
         # Start with safe metrics
-        metrics = self.calculate_safe_technical_metrics(text, sentences, len(errors))
+        metrics = self.calculate_safe_technical_metrics(text, sentences, len(errors), readability)
         
         if not text.strip() or len(text) < 50:
             return metrics
             
         try:
             # Add detailed readability metrics
-            if TEXTSTAT_AVAILABLE:
-                readability_metrics = self._calculate_detailed_readability_metrics(text)
-                metrics.update(readability_metrics)
+            readability_metrics = self._calculate_detailed_readability_metrics(text, readability)
+            metrics.update(readability_metrics)
                 
             # Add grade level analysis
-            grade_analysis = self._calculate_grade_level_analysis(text)
+            grade_analysis = self._calculate_grade_level_analysis(text, readability)
             metrics.update(grade_analysis)
             
             # Add complexity analysis
@@ -179,6 +176,9 @@ class StatisticsCalculator:
             
         return metrics
     
+    def _readability_counts(self, text: str, readability: Optional[ReadabilityCounts]) -> ReadabilityCounts:
+        return readability if readability is not None else get_readability_counts(text)
+    
     def _calculate_sentence_statistics(self, sentences: List[str]) -> Dict[str, Any]:
         """Calculate detailed sentence statistics."""
         stats = {
@@ -257,8 +257,8 @@ class StatisticsCalculator:
             
         return stats
     
-    def _calculate_readability_statistics(self, text: str) -> Dict[str, Any]:
-        """Calculate readability statistics using textstat."""
+    def _calculate_readability_statistics(self, text: str, readability: Optional[ReadabilityCounts] = None) -> Dict[str, Any]:
+        """Calculate readability statistics from a single pass over the text."""
         stats = {
             'flesch_reading_ease': 0.0,
             'flesch_kincaid_grade': 0.0,
@@ -269,17 +269,13 @@ class StatisticsCalculator:
             'dale_chall_readability': 0.0
         }
         
-        if not TEXTSTAT_AVAILABLE or not text.strip():
+        if not text.strip():
             return stats
             
         try:
-            stats['flesch_reading_ease'] = safe_textstat_call(getattr(textstat, 'flesch_reading_ease', lambda x: 0), text)
-            stats['flesch_kincaid_grade'] = safe_textstat_call(getattr(textstat, 'flesch_kincaid_grade', lambda x: 0), text)
-            stats['gunning_fog_index'] = safe_textstat_call(getattr(textstat, 'gunning_fog', lambda x: 0), text)
-            stats['smog_index'] = safe_textstat_call(getattr(textstat, 'smog_index', lambda x: 0), text)
-            stats['coleman_liau_index'] = safe_textstat_call(getattr(textstat, 'coleman_liau_index', lambda x: 0), text)
-            stats['automated_readability_index'] = safe_textstat_call(getattr(textstat, 'automated_readability_index', lambda x: 0), text)
-            stats['dale_chall_readability'] = safe_textstat_call(getattr(textstat, 'dale_chall_readability_score', lambda x: 0), text)
+            metrics = self._readability_counts(text, readability).to_metrics()
+            for key in stats:
+                stats[key] = metrics[key]
             
         except Exception as e:
             logger.error(f"Error calculating readability statistics: {e}")
@@ -312,7 +308,7 @@ class StatisticsCalculator:
             
         return stats
     
-    def _calculate_detailed_readability_metrics(self, text: str) -> Dict[str, Any]:
+    def _calculate_detailed_readability_metrics(self, text: str, readability: Optional[ReadabilityCounts] = None) -> Dict[str, Any]:
         """Calculate detailed readability metrics."""
         metrics = {
             'readability_category': 'unknown',
@@ -321,7 +317,7 @@ class StatisticsCalculator:
         }
         
         try:
-            flesch_score = safe_textstat_call(getattr(textstat, 'flesch_reading_ease', lambda x: 0), text)
+            flesch_score = self._readability_counts(text, readability).flesch_reading_ease()
             
             # Categorize readability
             if flesch_score >= 90:
@@ -344,7 +340,7 @@ class StatisticsCalculator:
             
         return metrics
     
-    def _calculate_grade_level_analysis(self, text: str) -> Dict[str, Any]:
+    def _calculate_grade_level_analysis(self, text: str, readability: Optional[ReadabilityCounts] = None) -> Dict[str, Any]:
         """Calculate grade level analysis."""
         analysis = {
             'estimated_grade_level': 0.0,
@@ -354,9 +350,7 @@ class StatisticsCalculator:
         
         try:
             # Use flesch_kincaid_grade for numeric grade level instead of text_standard
-            grade_level = safe_textstat_call(
-                getattr(textstat, 'flesch_kincaid_grade', lambda x: 0), text
-            )
+            grade_level = self._readability_counts(text, readability).flesch_kincaid_grade()
             
             analysis['estimated_grade_level'] = grade_level
             
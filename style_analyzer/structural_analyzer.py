@@ -6,13 +6,21 @@ This is the central component for structure-aware analysis.
 **ENHANCED** with Phase 4 Step 19: Validation pipeline integration for enhanced error quality.
 """
 import logging
+import os
 import time
+from contextlib import nullcontext
 from typing import List, Dict, Any, Optional
 
 from structural_parsing.parser_factory import StructuralParserFactory
+from structural_parsing.asciidoc.types import AsciiDocBlockType
 from .block_processors import BlockProcessor
 from .analysis_modes import AnalysisModeExecutor
-from .base_types import AnalysisMode, create_analysis_result, create_error
+from .base_types import AnalysisMode, AnalysisOptions, create_analysis_result, create_error
+from .parallel_executor import (
+    ParallelBlockExecutor, snapshot_descendants, collect_descendant_updates, apply_descendant_updates
+)
+from .result_cache import BlockResultCache, code_fingerprint, config_fingerprint, make_cache_key
+from .block_statistics import collect_block_statistics, combine_block_statistics
 
 # Import enhanced validation capabilities
 try:
@@ -21,8 +29,38 @@ try:
 except ImportError:
     ENHANCED_VALIDATION_AVAILABLE = False
 
+try:
+    from nlp_processing import cached_nlp
+    DOC_CACHE_AVAILABLE = True
+except ImportError:
+    DOC_CACHE_AVAILABLE = False
+
+try:
+    from validation.multi_pass.text_profile import text_profile_scope
+    TEXT_PROFILES_AVAILABLE = True
+except ImportError:
+    TEXT_PROFILES_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Parallel block analysis (0 workers keeps analysis in-process)
+PARALLEL_BLOCK_WORKERS = int(os.getenv('STYLE_ANALYZER_BLOCK_WORKERS', '0'))
+PARALLEL_MIN_BLOCKS = int(os.getenv('STYLE_ANALYZER_PARALLEL_MIN_BLOCKS', '8'))
+
+# Batched spaCy pre-pass over all block texts
+PIPE_BATCH_SIZE = int(os.getenv('STYLE_ANALYZER_PIPE_BATCH_SIZE', '64'))
+PIPE_PROCESSES = int(os.getenv('STYLE_ANALYZER_PIPE_PROCESSES', '1'))
+
+# Content-addressed block result cache (0 entries disables it; a path enables the SQLite tier)
+RESULT_CACHE_SIZE = int(os.getenv('STYLE_ANALYZER_RESULT_CACHE_SIZE', '2048'))
+RESULT_CACHE_PATH = os.getenv('STYLE_ANALYZER_RESULT_CACHE_PATH') or None
+
+# Block types (AsciiDoc and Markdown values) whose content is only their own
+# text; their children's text is not part of it
+OWN_TEXT_BLOCK_TYPES = frozenset({'document', 'section', 'heading', 'paragraph',
+                                  'dlist', 'description_list_item'})
+
+
 class StructuralAnalyzer:
     """
     Analyzes document content with full awareness of its structure,
@@ -32,7 +70,10 @@ class StructuralAnalyzer:
     def __init__(self, readability_analyzer, sentence_analyzer, 
                  statistics_calculator, suggestion_generator, 
                  rules_registry, nlp, enable_enhanced_validation: bool = True,
-                 confidence_threshold: float = None):
+                 confidence_threshold: float = None,
+                 parallel_workers: Optional[int] = None,
+                 parallel_min_blocks: Optional[int] = None,
+                 result_cache: Optional[BlockResultCache] = None):
         """Initializes the analyzer with all necessary components."""
         self.parser_factory = StructuralParserFactory()
         self.nlp = nlp
@@ -70,12 +111,38 @@ class StructuralAnalyzer:
             self.rules_registry,
             nlp
         )
+        
+        # Parallel block analysis: workers hold their own warm model and registry
+        self.parallel_workers = PARALLEL_BLOCK_WORKERS if parallel_workers is None else parallel_workers
+        self.parallel_min_blocks = PARALLEL_MIN_BLOCKS if parallel_min_blocks is None else parallel_min_blocks
+        self.parallel_executor = None
+        if self.parallel_workers > 0:
+            self.parallel_executor = ParallelBlockExecutor(
+                max_workers=self.parallel_workers,
+                rules=getattr(readability_analyzer, 'rules', None),
+                enable_enhanced_validation=self.enable_enhanced_validation,
+                confidence_threshold=confidence_threshold
+            )
+        
+        # Results of unchanged blocks are reused across analyses
+        self.result_cache = result_cache
+        if self.result_cache is None and RESULT_CACHE_SIZE > 0:
+            self.result_cache = BlockResultCache(max_entries=RESULT_CACHE_SIZE, db_path=RESULT_CACHE_PATH)
 
-    def analyze_with_blocks(self, text: str, format_hint: str, analysis_mode: AnalysisMode) -> Dict[str, Any]:
+    def analyze_with_blocks(self, text: str, format_hint: str, analysis_mode: AnalysisMode,
+                            options: Optional[AnalysisOptions] = None) -> Dict[str, Any]:
         """
         Parses a document, enriches blocks with structural context, runs analysis,
         and returns a structured result for the UI.
+        
+        ``options`` holds this request's settings; the analyzer's own configuration
+        is never modified, so concurrent calls with different options are safe.
         """
+        requested_threshold = options.confidence_threshold if options else None
+        options = (options or AnalysisOptions()).with_defaults(
+            confidence_threshold=getattr(self.rules_registry, 'confidence_threshold', None)
+        )
+        
         parse_result = self.parser_factory.parse(text, format_hint=format_hint)
 
         if not parse_result.success or not parse_result.document:
@@ -101,51 +168,34 @@ class StructuralAnalyzer:
         all_errors = []
         validation_start_time = time.time()
         
-        for block in flat_blocks:
-            context = getattr(block, 'context_info', block.get_context_info())
-            
-            if not block.should_skip_analysis():
-                content = block.get_text_content()
+        work_items = self._collect_analysis_work(flat_blocks)
+        # Validators share per-text features for the duration of this request
+        with text_profile_scope() if TEXT_PROFILES_AVAILABLE else nullcontext():
+            for (block, _, _), (errors, block_validation_time) in zip(
+                    work_items, self._run_block_analysis(work_items, analysis_mode, options)):
+                # Enhanced: Update validation performance metrics
+                self._update_validation_performance(errors, block_validation_time)
                 
-                # DLIST blocks have special handling - bypass content check
-                is_dlist = hasattr(block, 'block_type') and str(block.block_type).endswith('DLIST')
-                if is_dlist or (isinstance(content, str) and content.strip()):
-                    # CRITICAL FIX: Ensure table cell context includes proper position information
-                    if hasattr(block, 'block_type') and str(block.block_type).endswith('TABLE_CELL'):
-                        # Add table cell specific context information
-                        if hasattr(block, 'attributes') and hasattr(block.attributes, 'named_attributes'):
-                            cell_attrs = block.attributes.named_attributes
-                            context['table_row_index'] = cell_attrs.get('row_index', 999)  # Default to high number for non-headers
-                            context['cell_index'] = cell_attrs.get('cell_index', 0)
-                            context['is_table_cell'] = True
-                    
-                    # Enhanced: Track validation performance
-                    block_start_time = time.time()
-                    errors = self.mode_executor.analyze_block_content(block, content, analysis_mode, context)
-                    block_validation_time = time.time() - block_start_time
-                    
-                    # Enhanced: Update validation performance metrics
-                    self._update_validation_performance(errors, block_validation_time)
-                    
-                    block._analysis_errors = errors
-                    all_errors.extend(errors)
+                block._analysis_errors = errors
+                all_errors.extend(errors)
         
         # Track total validation time
         total_validation_time = time.time() - validation_start_time
         self.validation_performance['validation_time'] += total_validation_time
 
         # **Step 4: Calculate statistics and technical metrics from the original text**
-        # This is what was missing - we need to calculate actual statistics!
-        sentences = self._split_sentences(text)
+        # Sentences and readability counts are summed from the block parses made
+        # during analysis rather than parsing the whole document again
+        sentences, readability = self._aggregate_block_statistics(work_items)
         paragraphs = self.statistics_calculator.split_paragraphs_safe(text)
         
         # Use comprehensive calculation methods to get all the detailed metrics
         statistics = self.statistics_calculator.calculate_comprehensive_statistics(
-            text, sentences, paragraphs
+            text, sentences, paragraphs, readability=readability
         )
         
         technical_metrics = self.statistics_calculator.calculate_comprehensive_technical_metrics(
-            text, sentences, all_errors
+            text, sentences, all_errors, readability=readability
         )
         
         # Generate suggestions
@@ -176,7 +226,9 @@ class StructuralAnalyzer:
         if self.enable_enhanced_validation:
             analysis_result['validation_performance'] = self._get_validation_performance_summary()
             analysis_result['enhanced_validation_enabled'] = True
-            analysis_result['confidence_threshold'] = self.confidence_threshold
+            analysis_result['confidence_threshold'] = (
+                self.confidence_threshold if requested_threshold is None else requested_threshold
+            )
             
             # Add enhanced error statistics
             enhanced_errors = [e for e in all_errors if self._is_enhanced_error(e)]
@@ -194,6 +246,203 @@ class StructuralAnalyzer:
             'has_structure': True
         }
 
+    def _collect_analysis_work(self, flat_blocks: List[Any]) -> List[tuple]:
+        """Returns (block, content, context) for every block that needs analysis, in document order."""
+        work_items = []
+        for block in flat_blocks:
+            context = getattr(block, 'context_info', block.get_context_info())
+            
+            if block.should_skip_analysis():
+                continue
+            
+            content = block.get_text_content()
+            
+            # DLIST blocks have special handling - bypass content check
+            is_dlist = hasattr(block, 'block_type') and str(block.block_type).endswith('DLIST')
+            if is_dlist or (isinstance(content, str) and content.strip()):
+                # CRITICAL FIX: Ensure table cell context includes proper position information
+                if hasattr(block, 'block_type') and str(block.block_type).endswith('TABLE_CELL'):
+                    # Add table cell specific context information
+                    if hasattr(block, 'attributes') and hasattr(block.attributes, 'named_attributes'):
+                        cell_attrs = block.attributes.named_attributes
+                        context['table_row_index'] = cell_attrs.get('row_index', 999)  # Default to high number for non-headers
+                        context['cell_index'] = cell_attrs.get('cell_index', 0)
+                        context['is_table_cell'] = True
+                
+                work_items.append((block, content, context))
+        return work_items
+
+    def _run_block_analysis(self, work_items: List[tuple], analysis_mode: AnalysisMode,
+                            options: Optional[AnalysisOptions] = None) -> List[tuple]:
+        """
+        Analyzes each work item and returns (errors, elapsed_seconds) in the same order.
+        Unchanged blocks are served from the result cache; the rest go to the process
+        pool for large documents or are analyzed in-process. Each block's sentence and
+        readability counts are left on it as ``_block_statistics``.
+        """
+        results = [None] * len(work_items)
+        cache_keys = [None] * len(work_items)
+        pending = list(range(len(work_items)))
+        
+        if self.result_cache is not None:
+            fingerprint = self._result_cache_fingerprint(analysis_mode, options)
+            pending = []
+            for index, (block, content, context) in enumerate(work_items):
+                key = make_cache_key(self._block_cache_text(block, content),
+                                     getattr(block, 'block_type', None), context, fingerprint)
+                cached = self.result_cache.get(key)
+                if cached is None:
+                    cache_keys[index] = key
+                    pending.append(index)
+                    continue
+                errors, descendant_updates, block._block_statistics = cached
+                apply_descendant_updates(block, descendant_updates)
+                results[index] = (errors, 0.0)
+        
+        analyzed = self._analyze_uncached_blocks([work_items[i] for i in pending], analysis_mode, options)
+        for index, (errors, elapsed, descendant_updates, statistics) in zip(pending, analyzed):
+            results[index] = (errors, elapsed)
+            work_items[index][0]._block_statistics = statistics
+            if cache_keys[index] is not None:
+                self.result_cache.put(cache_keys[index], (errors, descendant_updates, statistics))
+        return results
+
+    def _analyze_uncached_blocks(self, work_items: List[tuple], analysis_mode: AnalysisMode,
+                                 options: Optional[AnalysisOptions] = None) -> List[tuple]:
+        """Returns (errors, elapsed_seconds, descendant_updates, statistics) per work item, in order."""
+        if not work_items:
+            return []
+        
+        if self.parallel_executor and len(work_items) >= max(2, self.parallel_min_blocks):
+            try:
+                return self.parallel_executor.analyze_blocks(work_items, analysis_mode, options=options)
+            except Exception as e:
+                logger.warning(f"Parallel block analysis failed, analyzing sequentially: {e}")
+        
+        self._attach_block_docs(work_items, analysis_mode)
+        
+        results = []
+        for block, content, context in work_items:
+            before = snapshot_descendants(block)
+            # Enhanced: Track validation performance
+            block_start_time = time.time()
+            errors = self.mode_executor.analyze_block_content(block, content, analysis_mode, context, options)
+            elapsed = time.time() - block_start_time
+            # Counted from the Doc the batched pre-pass parsed for the rules
+            statistics = collect_block_statistics(content, getattr(block, '_spacy_doc', None))
+            results.append((errors, elapsed, collect_descendant_updates(block, before), statistics))
+        return results
+
+    def _result_cache_fingerprint(self, analysis_mode: AnalysisMode,
+                                  options: Optional[AnalysisOptions] = None) -> str:
+        """Identifies the rule set and code, threshold, configuration and mode a result was produced under."""
+        rules = getattr(self.rules_registry, 'rules', None) or {}
+        confidence_threshold = options.confidence_threshold if options else None
+        if confidence_threshold is None:
+            confidence_threshold = getattr(self.rules_registry, 'confidence_threshold', None)
+        return '|'.join([
+            str(getattr(analysis_mode, 'value', analysis_mode)),
+            ','.join(sorted(rules)),
+            str(confidence_threshold),
+            str(self.enable_enhanced_validation),
+            config_fingerprint(),
+            code_fingerprint()
+        ])
+
+    def _block_cache_text(self, block, content: str) -> str:
+        """Block text plus the text of nested items, which list and table analysis also read."""
+        parts = [content if isinstance(content, str) else str(content)]
+        for child in self._iter_descendants(block):
+            parts.append(str(getattr(child, 'block_type', '')))
+            parts.append(getattr(child, 'content', None) or '')
+            parts.append(getattr(child, 'raw_content', None) or '')
+        return '\x1f'.join(parts)
+
+    def _attach_block_docs(self, work_items: List[tuple], analysis_mode: AnalysisMode):
+        """
+        Parses every block (and nested list item / table cell) text in one batched
+        nlp.pipe call and attaches the Doc to its block as ``_spacy_doc``, so rule
+        execution starts from already parsed text.
+        """
+        if not self.nlp or not DOC_CACHE_AVAILABLE:
+            return
+        if analysis_mode not in (AnalysisMode.SPACY_WITH_MODULAR_RULES, AnalysisMode.MODULAR_RULES_WITH_FALLBACKS):
+            return
+        
+        targets = []
+        for block, content, _ in work_items:
+            if isinstance(content, str) and content.strip():
+                targets.append((block, content))
+            for child in self._iter_descendants(block):
+                try:
+                    child_content = child.get_text_content().strip()
+                except Exception:
+                    continue
+                if child_content:
+                    targets.append((child, child_content))
+        
+        if not targets:
+            return
+        
+        try:
+            doc_cache = cached_nlp(self.nlp, max_entries=len(targets) + 1)
+            docs = doc_cache.prime([text for _, text in targets],
+                                   batch_size=PIPE_BATCH_SIZE, n_process=PIPE_PROCESSES)
+        except Exception as e:
+            logger.warning(f"Batched block parsing failed, blocks will be parsed individually: {e}")
+            return
+        
+        for (block, _), doc in zip(targets, docs):
+            block._spacy_doc = doc
+
+    def _aggregate_block_statistics(self, work_items: List[tuple]):
+        """
+        Document sentences and readability counts summed over the analysed blocks.
+
+        A nested block is skipped only when the parser folded its text into an
+        analysed ancestor's content (see _descendants_in_content), so every
+        sentence is counted once however similar two blocks' texts are.
+        """
+        nested = set()
+        for block, _, _ in work_items:
+            nested.update(id(child) for child in self._descendants_in_content(block))
+        
+        parts = []
+        for block, content, _ in work_items:
+            if id(block) in nested:
+                continue
+            statistics = getattr(block, '_block_statistics', None)
+            if statistics is None:
+                statistics = collect_block_statistics(content)
+            parts.append(statistics)
+        return combine_block_statistics(parts)
+
+    def _descendants_in_content(self, block) -> List[Any]:
+        """
+        Descendants whose text the parser folded into ``block``'s own content.
+
+        Headings, paragraphs and description lists hold only their own text. An
+        AsciiDoc list joins the text of its direct items, and an AsciiDoc item
+        holds only its own text, so a nested list is separate. Every other
+        container (tables, quotes, admonitions, Markdown lists) is built from
+        the source of all its children.
+        """
+        block_type = getattr(block, 'block_type', None)
+        if str(getattr(block_type, 'value', block_type)) in OWN_TEXT_BLOCK_TYPES:
+            return []
+        if block_type == AsciiDocBlockType.LIST_ITEM:
+            return []
+        if block_type in (AsciiDocBlockType.ORDERED_LIST, AsciiDocBlockType.UNORDERED_LIST):
+            return [child for child in getattr(block, 'children', None) or []
+                    if getattr(child, 'block_type', None) == AsciiDocBlockType.LIST_ITEM]
+        return list(self._iter_descendants(block))
+
+    def _iter_descendants(self, block):
+        """Yields every descendant of a block."""
+        for child in getattr(block, 'children', None) or []:
+            yield child
+            yield from self._iter_descendants(child)
+
     def _flatten_tree_only(self, processor, root_node):
         """Uses the BlockProcessor's flattening logic without running analysis."""
         processor.flat_blocks = []
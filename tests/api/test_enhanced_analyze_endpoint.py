@@ -56,9 +56,8 @@ class MockStyleAnalyzer:
         self.structural_analyzer = Mock()
         self.structural_analyzer.confidence_threshold = 0.43
         self.structural_analyzer.rules_registry = Mock()
-        self.structural_analyzer.rules_registry.set_confidence_threshold = Mock()
         
-    def analyze_with_blocks(self, content, format_hint):
+    def analyze_with_blocks(self, content, format_hint, options=None, incremental=False):
         """Mock analysis with confidence data"""
         # Simulate different responses based on content
         errors = []
@@ -98,7 +97,9 @@ class MockStyleAnalyzer:
             'errors': errors,
             'total_errors': len(errors),
             'enhanced_validation_enabled': True,
-            'confidence_threshold': self.structural_analyzer.confidence_threshold,
+            'confidence_threshold': (self.structural_analyzer.confidence_threshold
+                                     if options is None or options.confidence_threshold is None
+                                     else options.confidence_threshold),
             'enhanced_error_stats': enhanced_error_stats,
             'validation_performance': validation_performance,
             'statistics': {
@@ -0,0 +1,140 @@
+"""
+Test Suite for the asynchronous /jobs endpoints
+Tests job submission, result retrieval, cancellation and backpressure
+"""
+
+import json
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from flask import Flask
+
+from app_modules.job_queue import JobQueue
+
+
+class BlockingStyleAnalyzer:
+    """Style analyzer whose analysis can be held until the test releases it"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+
+    def analyze_with_blocks(self, content, format_hint, options=None, incremental=False):
+        self.started.set()
+        self.release.wait(5)
+        return {
+            'analysis': {'errors': [], 'confidence_threshold': 0.43},
+            'structural_blocks': [],
+            'has_structure': True
+        }
+
+
+def create_test_app(style_analyzer, job_queue):
+    """Create Flask test application with mocked dependencies and the given job queue"""
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+
+    ai_rewriter = Mock(spec=['rewrite'])
+    ai_rewriter.rewrite.return_value = {'rewritten_text': 'Rewritten.', 'errors_fixed': 1}
+
+    from app_modules.api_routes import setup_routes
+    setup_routes(app, Mock(), style_analyzer, ai_rewriter, job_queue=job_queue)
+    return app
+
+
+def wait_for_status(client, job_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        data = client.get(f'/jobs/{job_id}').get_json()
+        if data['status'] in ('completed', 'failed', 'cancelled'):
+            return data
+        time.sleep(0.01)
+    return data
+
+
+class TestJobEndpoints:
+    """Test suite for the /jobs endpoints"""
+
+    @pytest.fixture(autouse=True)
+    def patch_websocket(self):
+        with patch('app_modules.api_routes.emit_progress') as emit_progress, \
+             patch('app_modules.api_routes.emit_completion') as emit_completion:
+            self.emit_progress = emit_progress
+            self.emit_completion = emit_completion
+            yield
+
+    @pytest.fixture
+    def app(self):
+        self.style_analyzer = BlockingStyleAnalyzer()
+        job_queue = JobQueue(max_workers=1, max_pending=1)
+        yield create_test_app(self.style_analyzer, job_queue)
+        self.style_analyzer.release.set()
+        job_queue.shutdown(wait=True)
+
+    @pytest.fixture
+    def client(self, app):
+        return app.test_client()
+
+    def _submit_analysis(self, client, **extra):
+        body = {'content': 'Some text.', 'session_id': 'job-session', **extra}
+        return client.post('/jobs/analyze', data=json.dumps(body), content_type='application/json')
+
+    def test_analysis_job_lifecycle(self, client):
+        """A submitted analysis is accepted, runs on a worker and its result can be fetched"""
+        response = self._submit_analysis(client, confidence_threshold=0.6)
+
+        assert response.status_code == 202
+        job = response.get_json()
+        assert job['status_url'] == f"/jobs/{job['job_id']}"
+        assert response.headers['Location'] == job['status_url']
+
+        data = wait_for_status(client, job['job_id'])
+        assert data['status'] == 'completed'
+        assert data['result']['confidence_metadata']['confidence_threshold_used'] == 0.6
+
+        # Completion goes out over the existing WebSocket event
+        deadline = time.time() + 5
+        while not self.emit_completion.called and time.time() < deadline:
+            time.sleep(0.01)
+        self.emit_completion.assert_called_with('job-session', True, data['result'])
+
+    def test_rewrite_job(self, client):
+        body = {'block_content': 'Text.', 'block_id': 'b1', 'session_id': 's1', 'priority': 'high'}
+        response = client.post('/jobs/rewrite-block', data=json.dumps(body), content_type='application/json')
+
+        assert response.status_code == 202
+        data = wait_for_status(client, response.get_json()['job_id'])
+        assert data['priority'] == 'high'
+        assert data['result']['rewritten_text'] == 'Rewritten.'
+        assert data['result']['block_id'] == 'b1'
+
+    def test_invalid_requests(self, client):
+        assert self._submit_analysis(client, content='').status_code == 400
+        assert self._submit_analysis(client, confidence_threshold=2).status_code == 400
+        assert self._submit_analysis(client, priority='urgent').status_code == 400
+        assert client.get('/jobs/unknown').status_code == 404
+        assert client.delete('/jobs/unknown').status_code == 404
+
+    def test_backpressure_and_cancellation(self, client):
+        """A full queue answers 429; queued jobs can be cancelled before they run"""
+        self.style_analyzer.release.clear()
+        running = self._submit_analysis(client).get_json()
+        assert self.style_analyzer.started.wait(5)
+        queued = self._submit_analysis(client).get_json()
+        rejected = self._submit_analysis(client)
+
+        assert rejected.status_code == 429
+        assert int(rejected.headers['Retry-After']) >= 1
+
+        response = client.delete(f"/jobs/{queued['job_id']}")
+        assert response.status_code == 200
+        assert response.get_json()['status'] == 'cancelled'
+        self.emit_completion.assert_called_once()
+        assert self.emit_completion.call_args[0][2]['status'] == 'cancelled'
+
+        self.style_analyzer.release.set()
+        assert wait_for_status(client, running['job_id'])['status'] == 'completed'
+        assert client.delete(f"/jobs/{running['job_id']}").status_code == 409
+        assert client.get('/health').get_json()['job_queue']['rejected'] == 1
@@ -0,0 +1,51 @@
+"""
+Test Suite for the /upload endpoint
+Tests that uploads are extracted from the request stream
+"""
+
+import io
+import pytest
+from unittest.mock import Mock
+from flask import Flask
+
+from structural_parsing.extractors.document_processor import DocumentProcessor
+
+
+@pytest.fixture
+def upload_folder(tmp_path):
+    return tmp_path / "uploads"
+
+
+@pytest.fixture
+def client(upload_folder):
+    """Create Flask test application with the real document processor"""
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['UPLOAD_FOLDER'] = str(upload_folder)
+
+    from app_modules.api_routes import setup_routes
+    setup_routes(app, DocumentProcessor(pdf_workers=0), Mock(), Mock(), job_queue=Mock())
+    return app.test_client()
+
+
+class TestUploadEndpoint:
+    """Test suite for the /upload endpoint"""
+
+    def test_extracts_from_request_stream(self, client, upload_folder):
+        """Text comes back without the file being written to the upload folder"""
+        response = client.post('/upload', data={
+            'file': (io.BytesIO(b"Install the server.\n\nRestart it."), 'notes.txt')
+        }, content_type='multipart/form-data')
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['content'] == "Install the server. Restart it."
+        assert data['filename'] == 'notes.txt'
+        assert not upload_folder.exists()
+
+    def test_rejects_unsupported_type(self, client):
+        response = client.post('/upload', data={
+            'file': (io.BytesIO(b"data"), 'tool.exe')
+        }, content_type='multipart/form-data')
+
+        assert response.status_code == 400
@@ -0,0 +1,103 @@
+"""
+Tests for shared-parse, sentence-parallel detection in BaseAmbiguityRule.
+"""
+
+import sys
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import spacy
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ambiguity.base_ambiguity_rule as base_ambiguity_rule
+from ambiguity.base_ambiguity_rule import BaseAmbiguityRule, AmbiguityDetector
+
+
+class CountingNLP:
+    """spaCy pipeline wrapper that counts how often each text is parsed."""
+
+    def __init__(self):
+        self._nlp = spacy.blank("en")
+        self.parsed = []
+        self._lock = threading.Lock()
+
+    def __call__(self, text):
+        with self._lock:
+            self.parsed.append(text)
+        return self._nlp(text)
+
+    def pipe(self, texts, **kwargs):
+        texts = list(texts)
+        with self._lock:
+            self.parsed.extend(texts)
+        return self._nlp.pipe(texts)
+
+
+class RecordingDetector(AmbiguityDetector):
+    """Detector that reports one error per sentence and parses its neighbours."""
+
+    def __init__(self, parent_rule, name):
+        super().__init__(parent_rule.config, parent_rule)
+        self.name = name
+        self.docs = []
+
+    def detect(self, context, nlp):
+        doc = self._parse_sentence(context, nlp)
+        self.docs.append(doc)
+        for sentence in context.preceding_sentences:
+            nlp(sentence)
+        error = {'type': self.name, 'sentence_index': context.sentence_index, 'tokens': len(doc)}
+        return [SimpleNamespace(to_error_dict=lambda error=error: error)]
+
+
+class TestAmbiguitySentenceEngine:
+    """Test BaseAmbiguityRule.analyze."""
+
+    def setup_method(self):
+        self.rule = BaseAmbiguityRule()
+        self.rule.detectors = {}
+        self.first = RecordingDetector(self.rule, 'first')
+        self.second = RecordingDetector(self.rule, 'second')
+        self.rule.add_detector('first', self.first)
+        self.rule.add_detector('second', self.second)
+        self.sentences = [f"Sentence number {i} is here." for i in range(12)]
+        self.text = " ".join(self.sentences)
+
+    def test_each_sentence_parsed_once(self):
+        """All detectors share one parse per sentence, including neighbour lookups."""
+        nlp = CountingNLP()
+        errors = self.rule.analyze(self.text, self.sentences + ["  "], nlp)
+
+        assert sorted(nlp.parsed) == sorted(self.sentences)
+        assert len(errors) == 2 * len(self.sentences)
+        assert all(a is b for a, b in zip(self.first.docs, self.second.docs))
+
+    def test_errors_in_sentence_order(self):
+        """Errors are grouped by sentence, detectors in registration order."""
+        errors = self.rule.analyze(self.text, self.sentences, CountingNLP())
+        assert [(e['sentence_index'], e['type']) for e in errors] == [
+            (i, name) for i in range(len(self.sentences)) for name in ('first', 'second')]
+
+    def test_parallel_matches_sequential(self):
+        """The sentence worker pool returns the same errors in the same order."""
+        sequential = self.rule.analyze(self.text, self.sentences, CountingNLP())
+        with patch.object(base_ambiguity_rule, 'SENTENCE_WORKERS', 4), \
+             patch.object(base_ambiguity_rule, 'PARALLEL_MIN_SENTENCES', 2), \
+             patch.object(BaseAmbiguityRule, '_sentence_executor', None):
+            parallel = self.rule.analyze(self.text, self.sentences, CountingNLP())
+            executor = BaseAmbiguityRule._sentence_executor
+        executor.shutdown(wait=True)
+
+        assert executor is not None
+        assert parallel == sequential
+
+    def test_detector_exception_check_leaves_rule_type(self):
+        """Checking the claims exception list no longer swaps the parent's rule type."""
+        with patch.object(self.rule, '_is_excepted', return_value=False) as is_excepted:
+            assert not self.first._is_excepted("best in class")
+        assert self.rule.rule_type == 'ambiguity'
+        assert is_excepted.call_args_list[0].kwargs == {'rule_type': 'claims'}
@@ -0,0 +1,100 @@
+"""
+Tests for request-scoped analysis options.
+"""
+
+import dataclasses
+import pytest
+import sys
+import os
+import threading
+from unittest.mock import Mock
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rules import RulesRegistry
+from style_analyzer import AnalysisOptions
+from style_analyzer.analysis_modes import AnalysisModeExecutor
+from style_analyzer.base_types import AnalysisMode
+
+ERRORS = [
+    {'type': 'low', 'confidence_score': 0.4},
+    {'type': 'medium', 'confidence_score': 0.6},
+    {'type': 'high', 'confidence_score': 0.9},
+    {'type': 'legacy'},
+]
+
+
+class TestAnalysisOptions:
+    """Test the AnalysisOptions value object."""
+
+    def test_options_are_immutable(self):
+        options = AnalysisOptions(confidence_threshold=0.5)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            options.confidence_threshold = 0.9
+
+    def test_threshold_is_validated(self):
+        assert AnalysisOptions(confidence_threshold=1).confidence_threshold == 1.0
+        assert AnalysisOptions().confidence_threshold is None
+        with pytest.raises(ValueError):
+            AnalysisOptions(confidence_threshold=1.5)
+        with pytest.raises(ValueError):
+            AnalysisOptions(confidence_threshold="high")
+
+    def test_with_defaults_only_fills_unset_fields(self):
+        assert AnalysisOptions().with_defaults(confidence_threshold=0.43).confidence_threshold == 0.43
+        assert AnalysisOptions(confidence_threshold=0.0).with_defaults(confidence_threshold=0.43).confidence_threshold == 0.0
+
+
+class TestRegistryConfidenceFiltering:
+    """Test that per-request thresholds leave the shared registry untouched."""
+
+    def setup_method(self):
+        self.registry = RulesRegistry.__new__(RulesRegistry)
+        self.registry.enable_enhanced_validation = True
+        self.registry.confidence_threshold = 0.35
+
+    def _kept(self, options=None):
+        return [e['type'] for e in self.registry._apply_confidence_filtering(list(ERRORS), options=options)]
+
+    def test_request_threshold_overrides_registry(self):
+        assert self._kept() == ['low', 'medium', 'high', 'legacy']
+        assert self._kept(AnalysisOptions(confidence_threshold=0.7)) == ['high', 'legacy']
+        assert self._kept(AnalysisOptions()) == ['low', 'medium', 'high', 'legacy']
+        assert self.registry.confidence_threshold == 0.35
+
+    def test_concurrent_requests_use_their_own_threshold(self):
+        """Threads filtering with different thresholds never see each other's setting."""
+        expected = {0.5: ['medium', 'high', 'legacy'], 0.8: ['high', 'legacy']}
+        mismatches = []
+
+        def run(threshold):
+            options = AnalysisOptions(confidence_threshold=threshold)
+            for _ in range(200):
+                if self._kept(options) != expected[threshold]:
+                    mismatches.append(threshold)
+
+        threads = [threading.Thread(target=run, args=(threshold,)) for threshold in (0.5, 0.8) * 4]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mismatches == []
+        assert self.registry.confidence_threshold == 0.35
+
+
+class TestModeExecutorOptions:
+    """Test that the mode executor hands the block's options to the registry."""
+
+    def test_options_reach_registry_and_are_cleared(self):
+        registry = Mock()
+        registry.analyze_with_context_aware_rules.return_value = []
+        executor = AnalysisModeExecutor(None, None, registry, None)
+        options = AnalysisOptions(confidence_threshold=0.7)
+
+        executor.analyze_block_content(Mock(block_type=None, children=[]), "Some text.",
+                                       AnalysisMode.SPACY_WITH_MODULAR_RULES, {}, options)
+
+        assert registry.analyze_with_context_aware_rules.call_args.kwargs['options'] is options
+        assert executor._current_options() is None
@@ -0,0 +1,191 @@
+"""
+Tests for the content-addressed block result cache.
+
+Covers key construction, the in-memory LRU and SQLite tiers, and cache hits
+in StructuralAnalyzer's block analysis loop.
+"""
+
+import pickle
+import sys
+import os
+from unittest.mock import Mock, patch
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from structural_parsing.asciidoc.types import AsciiDocBlock, AsciiDocBlockType
+from style_analyzer.result_cache import BlockResultCache, make_cache_key
+from style_analyzer.block_statistics import BlockStatistics
+from style_analyzer.readability_engine import ReadabilityCounts
+from style_analyzer.structural_analyzer import StructuralAnalyzer
+from style_analyzer.base_types import AnalysisMode, AnalysisOptions
+
+
+class TestCacheKey:
+    """Test the content address of a block."""
+    
+    def test_key_is_stable(self):
+        """The same inputs always produce the same key, regardless of dict order."""
+        first = make_cache_key("Text.", AsciiDocBlockType.PARAGRAPH, {'a': 1, 'b': 2}, 'fp')
+        second = make_cache_key("Text.", 'paragraph', {'b': 2, 'a': 1}, 'fp')
+        assert first == second
+    
+    def test_key_changes_with_inputs(self):
+        """Text, context and fingerprint all take part in the key."""
+        base = make_cache_key("Text.", 'paragraph', {}, 'fp')
+        assert make_cache_key("Text!", 'paragraph', {}, 'fp') != base
+        assert make_cache_key("Text.", 'paragraph', {'is_table_cell': True}, 'fp') != base
+        assert make_cache_key("Text.", 'paragraph', {}, 'fp2') != base
+        assert make_cache_key("Text.", 'heading', {}, 'fp') != base
+
+
+class TestBlockResultCache:
+    """Test the memory and disk tiers."""
+    
+    def test_returns_independent_copies(self):
+        """Callers may mutate returned errors without corrupting the cache."""
+        cache = BlockResultCache()
+        cache.put('k', [{'type': 'passive_voice'}])
+        
+        first = cache.get('k')
+        first[0]['type'] = 'changed'
+        
+        assert cache.get('k') == [{'type': 'passive_voice'}]
+        assert cache.get('missing') is None
+        assert cache.get_stats()['memory_hits'] == 2
+        assert cache.get_stats()['misses'] == 1
+    
+    def test_lru_bound(self):
+        """The memory tier drops the least recently used entry."""
+        cache = BlockResultCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert len(cache) == 2
+    
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Results written to SQLite are served by a new cache instance."""
+        db_path = str(tmp_path / 'results.db')
+        cache = BlockResultCache(db_path=db_path)
+        cache.put('k', {'errors': [1, 2]})
+        cache.close()
+        
+        reopened = BlockResultCache(db_path=db_path)
+        assert reopened.get('k') == {'errors': [1, 2]}
+        assert reopened.get_stats()['disk_hits'] == 1
+        reopened.close()
+    
+    def test_block_payload_round_trips(self, tmp_path):
+        """Tuples and block statistics come back with their types from either tier."""
+        value = ([{'type': 'passive_voice', 'span': (0, 4)}],
+                 [((0, 1), [{'type': 'item'}], True)],
+                 BlockStatistics(('One.', 'Two.'), ReadabilityCounts(words=2, sentences=2)))
+        db_path = str(tmp_path / 'results.db')
+        cache = BlockResultCache(db_path=db_path)
+        assert cache.put('k', value) is True
+        assert cache.get('k') == value
+        cache.close()
+        
+        reopened = BlockResultCache(db_path=db_path)
+        assert reopened.get('k') == value
+        reopened.close()
+    
+    def test_unsupported_values_are_not_cached(self):
+        """Values JSON cannot represent faithfully are skipped rather than altered."""
+        cache = BlockResultCache()
+        assert cache.put('k', {'ids': {1, 2}}) is False
+        assert cache.put('k', {1: 'int key'}) is False
+        assert cache.get('k') is None
+    
+    def test_disk_entries_are_never_unpickled(self, tmp_path):
+        """A pickle planted in the SQLite file is dropped instead of being loaded."""
+        db_path = str(tmp_path / 'results.db')
+        cache = BlockResultCache(db_path=db_path)
+        cache._db.execute('INSERT INTO block_results (key, payload, accessed) VALUES (?, ?, 0)',
+                          ('k', pickle.dumps(Mock)))
+        cache._db.commit()
+        
+        assert cache.get('k') is None
+        assert cache._db.execute('SELECT COUNT(*) FROM block_results').fetchone()[0] == 0
+        cache.close()
+    
+    def test_disk_tier_bound(self, tmp_path):
+        """The SQLite tier is trimmed to its maximum size."""
+        cache = BlockResultCache(max_entries=1, db_path=str(tmp_path / 'results.db'), max_disk_entries=2)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, key)
+        
+        count = cache._db.execute('SELECT COUNT(*) FROM block_results').fetchone()[0]
+        assert count == 2
+        cache.close()
+
+
+class TestStructuralAnalyzerCaching:
+    """Test that unchanged blocks are not re-analyzed."""
+    
+    def setup_method(self):
+        """Create an analyzer with a counting executor and a fresh cache."""
+        self.analyzer = StructuralAnalyzer.__new__(StructuralAnalyzer)
+        self.analyzer.nlp = None
+        self.analyzer.rules_registry = Mock(confidence_threshold=0.43, rules={'passive_voice': Mock()})
+        self.analyzer.enable_enhanced_validation = True
+        self.analyzer.parallel_executor = None
+        self.analyzer.parallel_min_blocks = 8
+        self.analyzer.result_cache = BlockResultCache()
+        self.calls = []
+        
+        def analyze(block, content, mode, context, options=None):
+            self.calls.append(content)
+            for child in block.children:
+                child._analysis_errors.append({'type': 'item', 'message': child.content})
+            return [{'type': 'block', 'message': content}]
+        
+        self.analyzer.mode_executor = Mock()
+        self.analyzer.mode_executor.analyze_block_content.side_effect = analyze
+    
+    def _make_list(self, item_text='Item'):
+        ulist = AsciiDocBlock(block_type=AsciiDocBlockType.UNORDERED_LIST, content='', raw_content='', start_line=1)
+        ulist.children.append(AsciiDocBlock(block_type=AsciiDocBlockType.LIST_ITEM, content=item_text,
+                                            raw_content=f'* {item_text}', start_line=1, parent=ulist))
+        return ulist
+    
+    def test_unchanged_block_served_from_cache(self):
+        """A second analysis of the same block replays errors, including nested ones."""
+        mode = AnalysisMode.SPACY_WITH_MODULAR_RULES
+        self.analyzer._run_block_analysis([(self._make_list(), 'list', {})], mode)
+        
+        second_list = self._make_list()
+        results = self.analyzer._run_block_analysis([(second_list, 'list', {})], mode)
+        
+        assert self.calls == ['list']
+        assert results[0][0] == [{'type': 'block', 'message': 'list'}]
+        assert second_list.children[0]._analysis_errors == [{'type': 'item', 'message': 'Item'}]
+    
+    def test_changed_child_or_threshold_misses(self):
+        """Edits to nested items and threshold changes invalidate the result."""
+        mode = AnalysisMode.SPACY_WITH_MODULAR_RULES
+        self.analyzer._run_block_analysis([(self._make_list(), 'list', {})], mode)
+        self.analyzer._run_block_analysis([(self._make_list('Edited item'), 'list', {})], mode)
+        
+        self.analyzer.rules_registry.confidence_threshold = 0.6
+        self.analyzer._run_block_analysis([(self._make_list(), 'list', {})], mode)
+        
+        # A per-request threshold is part of the key as well
+        self.analyzer._run_block_analysis([(self._make_list(), 'list', {})], mode,
+                                          AnalysisOptions(confidence_threshold=0.8))
+        
+        assert self.calls == ['list', 'list', 'list', 'list']
+    
+    def test_code_change_misses(self):
+        """Results cached by a different version of the analysis code are not served."""
+        mode = AnalysisMode.SPACY_WITH_MODULAR_RULES
+        with patch('style_analyzer.structural_analyzer.code_fingerprint', return_value='old-deploy'):
+            self.analyzer._run_block_analysis([(self._make_list(), 'list', {})], mode)
+        with patch('style_analyzer.structural_analyzer.code_fingerprint', return_value='new-deploy'):
+            self.analyzer._run_block_analysis([(self._make_list(), 'list', {})], mode)
+        
+        assert self.calls == ['list', 'list']
@@ -0,0 +1,166 @@
+"""
+Tests for per-block statistics and their aggregation into document statistics.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from structural_parsing.asciidoc.types import AsciiDocBlock, AsciiDocBlockType
+from style_analyzer.block_statistics import BlockStatistics, collect_block_statistics, combine_block_statistics
+from style_analyzer.readability_engine import ReadabilityCounts, count_readability
+from style_analyzer.result_cache import BlockResultCache
+from style_analyzer.structural_analyzer import StructuralAnalyzer
+from style_analyzer.base_types import AnalysisMode
+
+FIRST_BLOCK = "Configure the deployment server before you install the application. It restarts automatically."
+SECOND_BLOCK = "The configuration file is validated whenever it changes. See the documentation for details."
+
+
+class TestBlockStatistics:
+    """Test collecting and combining the statistics of single blocks."""
+
+    def test_sentences_from_doc(self):
+        spacy = pytest.importorskip("spacy")
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+
+        statistics = collect_block_statistics(FIRST_BLOCK, nlp(FIRST_BLOCK))
+
+        assert statistics.sentences == (
+            "Configure the deployment server before you install the application.",
+            "It restarts automatically.",
+        )
+        assert statistics.readability == count_readability(FIRST_BLOCK)
+
+    def test_sentences_without_doc(self):
+        statistics = collect_block_statistics(FIRST_BLOCK)
+
+        assert statistics.sentences == (
+            "Configure the deployment server before you install the application",
+            "It restarts automatically",
+        )
+        assert collect_block_statistics("   ") == BlockStatistics()
+
+    def test_combined_counts_are_summed(self):
+        first = count_readability(FIRST_BLOCK)
+        second = count_readability(SECOND_BLOCK)
+
+        sentences, combined = combine_block_statistics(
+            [collect_block_statistics(FIRST_BLOCK), collect_block_statistics(SECOND_BLOCK)]
+        )
+
+        assert len(sentences) == 4
+        assert combined.words == first.words + second.words
+        assert combined.syllables == first.syllables + second.syllables
+        assert combined.sentences == first.sentences + second.sentences
+        assert ReadabilityCounts.combine([]) == ReadabilityCounts()
+
+    def test_linsear_sample_stops_at_word_limit(self):
+        first = ReadabilityCounts(words=90, linsear_easy_words=80, linsear_hard_words=20, linsear_sentences=5)
+        second = ReadabilityCounts(words=10, linsear_easy_words=10, linsear_sentences=1)
+
+        combined = ReadabilityCounts.combine([first, second])
+
+        assert combined.words == 100
+        assert combined.linsear_easy_words == 80
+        assert combined.linsear_sentences == 5
+
+
+class TestStructuralAnalyzerStatistics:
+    """Test that document statistics come from the analysed blocks."""
+
+    def setup_method(self):
+        self.analyzer = StructuralAnalyzer.__new__(StructuralAnalyzer)
+        self.analyzer.nlp = None
+        self.analyzer.rules_registry = Mock(confidence_threshold=0.43, rules={})
+        self.analyzer.enable_enhanced_validation = True
+        self.analyzer.parallel_executor = None
+        self.analyzer.parallel_min_blocks = 8
+        self.analyzer.result_cache = BlockResultCache()
+        self.analyzer.mode_executor = Mock()
+        self.analyzer.mode_executor.analyze_block_content.return_value = []
+
+    def _paragraph(self, text, parent=None):
+        return AsciiDocBlock(block_type=AsciiDocBlockType.PARAGRAPH, content=text, raw_content=text,
+                             start_line=1, parent=parent)
+
+    def _block(self, block_type, text, parent=None):
+        block = AsciiDocBlock(block_type=block_type, content=text, raw_content=text, start_line=1, parent=parent)
+        if parent is not None:
+            parent.children.append(block)
+        return block
+
+    def _aggregate(self, blocks):
+        work_items = [(block, block.content, {}) for block in blocks]
+        self.analyzer._run_block_analysis(work_items, AnalysisMode.SPACY_WITH_MODULAR_RULES)
+        return self.analyzer._aggregate_block_statistics(work_items)
+
+    def test_statistics_kept_with_cached_results(self):
+        mode = AnalysisMode.SPACY_WITH_MODULAR_RULES
+        self.analyzer._run_block_analysis([(self._paragraph(FIRST_BLOCK), FIRST_BLOCK, {})], mode)
+
+        cached_block = self._paragraph(FIRST_BLOCK)
+        self.analyzer._run_block_analysis([(cached_block, FIRST_BLOCK, {})], mode)
+
+        assert self.analyzer.mode_executor.analyze_block_content.call_count == 1
+        assert cached_block._block_statistics == collect_block_statistics(FIRST_BLOCK)
+
+    def test_nested_blocks_counted_once(self):
+        table = AsciiDocBlock(block_type=AsciiDocBlockType.TABLE, content=FIRST_BLOCK,
+                              raw_content=FIRST_BLOCK, start_line=1)
+        cell = AsciiDocBlock(block_type=AsciiDocBlockType.TABLE_CELL, content=FIRST_BLOCK,
+                             raw_content=FIRST_BLOCK, start_line=1, parent=table)
+        table.children.append(cell)
+        paragraph = self._paragraph(SECOND_BLOCK)
+        work_items = [(table, FIRST_BLOCK, {}), (cell, FIRST_BLOCK, {}), (paragraph, SECOND_BLOCK, {})]
+
+        self.analyzer._run_block_analysis(work_items, AnalysisMode.SPACY_WITH_MODULAR_RULES)
+        sentences, readability = self.analyzer._aggregate_block_statistics(work_items)
+
+        assert len(sentences) == 4
+        assert readability.words == count_readability(FIRST_BLOCK).words + count_readability(SECOND_BLOCK).words
+
+    def test_section_body_is_counted(self):
+        heading = self._block(AsciiDocBlockType.HEADING, "Installing the server")
+        first = self._block(AsciiDocBlockType.PARAGRAPH, FIRST_BLOCK, parent=heading)
+        second = self._block(AsciiDocBlockType.PARAGRAPH, SECOND_BLOCK, parent=heading)
+
+        sentences, readability = self._aggregate([heading, first, second])
+
+        assert sentences == ["Installing the server"] + list(collect_block_statistics(FIRST_BLOCK).sentences) \
+            + list(collect_block_statistics(SECOND_BLOCK).sentences)
+        assert readability.words == 3 + count_readability(FIRST_BLOCK).words + count_readability(SECOND_BLOCK).words
+
+    def test_paragraph_repeating_title_is_counted(self):
+        heading = self._block(AsciiDocBlockType.HEADING, "Installing the server")
+        paragraph = self._block(AsciiDocBlockType.PARAGRAPH, "Installing the server", parent=heading)
+
+        sentences, readability = self._aggregate([heading, paragraph])
+
+        assert sentences == ["Installing the server", "Installing the server"]
+        assert readability.words == 6
+
+    def test_container_children_counted_once(self):
+        admonition = self._block(AsciiDocBlockType.ADMONITION, FIRST_BLOCK + "\n" + SECOND_BLOCK)
+        self._block(AsciiDocBlockType.PARAGRAPH, FIRST_BLOCK, parent=admonition)
+        self._block(AsciiDocBlockType.PARAGRAPH, SECOND_BLOCK, parent=admonition)
+
+        _, readability = self._aggregate([admonition, *admonition.children])
+
+        assert readability.words == count_readability(FIRST_BLOCK + "\n" + SECOND_BLOCK).words
+
+    def test_nested_list_is_counted(self):
+        ulist = self._block(AsciiDocBlockType.UNORDERED_LIST, "Open the console.\nSelect the project.")
+        item = self._block(AsciiDocBlockType.LIST_ITEM, "Open the console.", parent=ulist)
+        self._block(AsciiDocBlockType.LIST_ITEM, "Select the project.", parent=ulist)
+        sublist = self._block(AsciiDocBlockType.UNORDERED_LIST, "Click the settings icon.", parent=item)
+        subitem = self._block(AsciiDocBlockType.LIST_ITEM, "Click the settings icon.", parent=sublist)
+
+        sentences, _ = self._aggregate([ulist, *ulist.children, sublist, subitem])
+
+        assert sentences == ["Open the console", "Select the project", "Click the settings icon"]
@@ -0,0 +1,107 @@
+"""
+Tests for compiled company detection in the legal-information company registry.
+"""
+
+import sys
+import os
+import re
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rules.legal_information.services.company_registry import CompanyRegistry, _trie_pattern
+
+CONFIG_PATH = Path(__file__).parent.parent / "rules" / "legal_information" / "config" / "companies.yaml"
+
+
+def _write_config(path, companies, case_sensitive=False):
+    lines = ["company_sources:", "  static:", "    enabled: true", "    companies:"]
+    for name, aliases in companies:
+        lines.append(f'      - name: "{name}"')
+        lines.append(f"        aliases: {aliases!r}")
+    lines.append("detection_settings:")
+    lines.append(f"  case_sensitive: {str(case_sensitive).lower()}")
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+
+class TestCompanyDetection:
+    """Test CompanyRegistry.detect_companies_in_text."""
+
+    def setup_method(self):
+        self.registry = CompanyRegistry(str(CONFIG_PATH))
+
+    def test_detects_names_and_aliases(self):
+        """Names and aliases are detected with positions and their company."""
+        text = "Microsoft and Google compete with AAPL."
+        detections = self.registry.detect_companies_in_text(text)
+
+        assert [(d[0], d[3].name) for d in detections] == [
+            ("Microsoft", "Microsoft"), ("Google", "Google"), ("AAPL", "Apple")]
+        for matched, start, end, _ in detections:
+            assert text[start:end] == matched
+
+    def test_longest_name_wins_without_overlaps(self):
+        """A legal name is reported once instead of also reporting its prefix."""
+        text = "Contact Microsoft Corporation or microsoft corp today."
+        detections = self.registry.detect_companies_in_text(text)
+
+        assert [d[0] for d in detections] == ["Microsoft Corporation", "microsoft corp"]
+        assert all(a[2] <= b[1] for a, b in zip(detections, detections[1:]))
+
+    def test_word_boundaries(self):
+        """Names inside longer words and prefixes of longer names do not match."""
+        detections = self.registry.detect_companies_in_text("Microsofts and Microsoft Corps.")
+        assert [d[0] for d in detections] == ["Microsoft"]
+
+    def test_matches_per_name_scan(self):
+        """The compiled detector finds the same spans as scanning each name separately."""
+        text = ("Oracle, Meta Platforms, Inc. and Facebook met Amazon Inc at Alphabet. "
+                "GOOGL and MSFT rose; oracle fell.")
+        expected = set()
+        for name in self.registry.get_all_company_names():
+            for match in re.finditer(r'\b' + re.escape(name) + r'\b', text, re.IGNORECASE):
+                expected.add((match.start(), match.end()))
+        spans = [(d[1], d[2]) for d in self.registry.detect_companies_in_text(text)]
+
+        assert set(spans) <= expected
+        # Every per-name match is covered by a reported detection
+        assert all(any(s <= start and end <= e for s, e in spans) for start, end in expected)
+
+    def test_empty_text_and_registry(self, tmp_path):
+        """Empty input or an empty registry yields no detections."""
+        assert self.registry.detect_companies_in_text("") == []
+        empty = CompanyRegistry(str(tmp_path / "missing.yaml"))
+        assert empty.detect_companies_in_text("Microsoft") == []
+
+    def test_case_sensitive_setting(self, tmp_path):
+        """With case_sensitive enabled only the configured spelling matches."""
+        config = tmp_path / "companies.yaml"
+        _write_config(config, [("Acme", ["ACME Labs"])], case_sensitive=True)
+        registry = CompanyRegistry(str(config))
+
+        detections = registry.detect_companies_in_text("acme, Acme and ACME Labs")
+        assert [d[0] for d in detections] == ["Acme", "ACME Labs"]
+
+    def test_reload_rebuilds_detector(self, tmp_path):
+        """reload_configuration recompiles the detector from the updated file."""
+        config = tmp_path / "companies.yaml"
+        _write_config(config, [("Acme", [])])
+        registry = CompanyRegistry(str(config))
+        assert [d[0] for d in registry.detect_companies_in_text("Acme and Globex")] == ["Acme"]
+
+        _write_config(config, [("Globex", ["Globex Corp"])])
+        registry.reload_configuration()
+        assert [d[0] for d in registry.detect_companies_in_text("Acme and Globex Corp")] == ["Globex Corp"]
+
+
+class TestTriePattern:
+    """Test the prefix-trie alternation builder."""
+
+    def test_pattern_matches_exactly_the_names(self):
+        names = ["IBM", "IBM Research", "Intel", "AT&T", "a.b"]
+        pattern = re.compile(_trie_pattern(names))
+        for name in names:
+            assert pattern.fullmatch(name)
+        for other in ["IB", "IBM Res", "Inte", "AT", "axb"]:
+            assert not pattern.fullmatch(other)
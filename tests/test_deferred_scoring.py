@@ -0,0 +1,160 @@
+"""
+Tests for deferred, batched confidence scoring of rule errors.
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rules import RulesRegistry
+from rules.base_rule import BaseRule, ErrorScoringRequest, SCORING_REQUEST_KEY
+
+
+class ScoringTestRule(BaseRule):
+    """Minimal rule that reports the given sentence as one error."""
+
+    def _get_rule_type(self) -> str:
+        return 'scoring_test'
+
+    def analyze(self, text, sentences, nlp=None, context=None):
+        return [self._create_error(sentence=text, sentence_index=0, message="Issue",
+                                   suggestions=["Fix it"], text=text, context=context,
+                                   flagged_text="Issue", span=(0, 5))]
+
+
+class OverlappingTestRule(ScoringTestRule):
+    """Rule that reports the same span as ScoringTestRule with another message."""
+
+    def _get_rule_type(self) -> str:
+        return 'overlapping_test'
+
+    def analyze(self, text, sentences, nlp=None, context=None):
+        return [self._create_error(sentence=text, sentence_index=0, message="Other issue",
+                                   suggestions=["Fix it differently"], text=text, context=context,
+                                   flagged_text="Issue", span=(0, 5))]
+
+
+def _pipeline_result(confidence):
+    final_result = SimpleNamespace(decision=SimpleNamespace(value='accept'),
+                                   confidence_score=confidence, reasoning='ok')
+    return SimpleNamespace(final_result=final_result)
+
+
+class TestDeferredScoring:
+    """Test BaseRule.deferred_scoring and score_deferred_errors."""
+
+    def setup_method(self):
+        """Install a recording confidence calculator and validation pipeline."""
+        self.calculator = Mock()
+        self.calculator.calculate_normalized_confidence.return_value = (0.4, None)
+        self.pipeline = Mock()
+        self.pipeline.validate_errors.side_effect = lambda contexts: [_pipeline_result(0.7) for _ in contexts]
+
+        self.patches = [
+            patch('rules.base_rule.ENHANCED_VALIDATION_AVAILABLE', True),
+            patch.object(BaseRule, '_confidence_calculator', self.calculator),
+            patch.object(BaseRule, '_validation_pipeline', self.pipeline),
+        ]
+        for p in self.patches:
+            p.start()
+        self.rule = ScoringTestRule()
+
+    def teardown_method(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+    def test_errors_carry_request_while_deferred(self):
+        """Inside deferred_scoring errors are created unscored with a scoring request."""
+        with BaseRule.deferred_scoring():
+            assert BaseRule.is_scoring_deferred()
+            error = self.rule.analyze("First text.", ["First text."])[0]
+        assert not BaseRule.is_scoring_deferred()
+
+        request = BaseRule.pop_scoring_request(error)
+        assert isinstance(request, ErrorScoringRequest)
+        assert SCORING_REQUEST_KEY not in error
+        assert 'confidence_score' not in error
+        assert request.error_position == 0 and request.error_text == "Issue"
+        self.calculator.calculate_normalized_confidence.assert_not_called()
+
+    def test_batch_scoring_matches_fields_and_dedupes(self):
+        """Identical candidates are scored once and get the same fields as eager scoring."""
+        with BaseRule.deferred_scoring():
+            errors = (self.rule.analyze("Same text.", ["Same text."]) +
+                      self.rule.analyze("Same text.", ["Same text."]) +
+                      self.rule.analyze("Other text.", ["Other text."]))
+        pending = [(error, BaseRule.pop_scoring_request(error)) for error in errors]
+
+        BaseRule.score_deferred_errors(pending)
+
+        assert self.calculator.calculate_normalized_confidence.call_count == 2
+        self.pipeline.validate_errors.assert_called_once()
+        assert len(self.pipeline.validate_errors.call_args[0][0]) == 2
+        for error in errors:
+            assert error['confidence_score'] == 0.7
+            assert error['confidence'] == 0.7
+            assert error['validation_decision'] == 'accept'
+            assert error['flagged_text'] == "Issue"
+        assert errors[0] == errors[1]
+
+    def test_eager_scoring_unchanged(self):
+        """Outside deferred_scoring errors are still scored as they are created."""
+        self.pipeline.validate_error.return_value = _pipeline_result(0.7)
+
+        error = self.rule.analyze("Eager text.", ["Eager text."])[0]
+
+        assert SCORING_REQUEST_KEY not in error
+        assert error['confidence_score'] == 0.7
+        assert list(error)[:6] == ['type', 'message', 'suggestions', 'sentence', 'sentence_index', 'severity']
+
+    def test_pipeline_failure_keeps_confidence(self):
+        """A failing pipeline is recorded on every candidate without losing confidence."""
+        self.pipeline.validate_errors.side_effect = RuntimeError("boom")
+        with BaseRule.deferred_scoring():
+            error = self.rule.analyze("Text.", ["Text."])[0]
+
+        BaseRule.score_deferred_errors([(error, BaseRule.pop_scoring_request(error))])
+
+        assert error['confidence_score'] == 0.4
+        assert error['validation_pipeline_error'] == "boom"
+
+    def _registry(self):
+        registry = RulesRegistry.__new__(RulesRegistry)
+        registry.enable_consolidation = True
+        registry.enable_enhanced_validation = True
+        registry.validation_pipeline = self.pipeline
+        registry.confidence_threshold = 0.35
+        return registry
+
+    def _run_overlapping_pair(self, registry):
+        all_errors, pending = [], []
+        with BaseRule.deferred_scoring():
+            for rule in (self.rule, OverlappingTestRule()):
+                registry._run_rule(rule, "Issue text.", ["Issue text."], None, None, all_errors, pending)
+        return registry._score_filter_and_consolidate(all_errors, pending, "Issue text.", None)
+
+    def test_registry_scores_every_candidate_in_one_batch(self):
+        """Overlapping candidates are scored together, then merged into one error."""
+        errors = self._run_overlapping_pair(self._registry())
+
+        self.pipeline.validate_errors.assert_called_once()
+        assert len(self.pipeline.validate_errors.call_args[0][0]) == 2
+        assert len(errors) == 1
+        assert errors[0]['consolidation_count'] == 2
+
+    def test_low_confidence_overlap_does_not_hide_valid_error(self):
+        """A low-confidence false positive is filtered before it can become the merged primary."""
+        confidences = {'scoring_test': 0.1, 'overlapping_test': 0.9}
+        self.calculator.calculate_normalized_confidence.return_value = (0.1, None)
+        self.pipeline.validate_errors.side_effect = lambda contexts: [
+            _pipeline_result(confidences[context.rule_type]) for context in contexts]
+
+        errors = self._run_overlapping_pair(self._registry())
+
+        assert len(errors) == 1
+        assert errors[0]['type'] == 'overlapping_test'
+        assert errors[0]['confidence_score'] == 0.9
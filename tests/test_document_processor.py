@@ -0,0 +1,84 @@
+"""
+Tests for chunked, streaming and page-parallel document extraction.
+"""
+
+import pytest
+import sys
+import os
+import io
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+fitz = pytest.importorskip("fitz")
+docx = pytest.importorskip("docx")
+
+from structural_parsing.extractors.document_processor import DocumentProcessor
+
+
+def _write_pdf(path, pages):
+    doc = fitz.open()
+    for page_num in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {page_num} explains the configuration.")
+    doc.save(path)
+    doc.close()
+
+
+class TestDocumentProcessor:
+    """Test the chunk generator, stream sources and the PDF page pool."""
+
+    def setup_method(self):
+        self.processor = DocumentProcessor(pdf_workers=0)
+
+    def test_pdf_yields_one_chunk_per_page(self, tmp_path):
+        pdf = str(tmp_path / "manual.pdf")
+        _write_pdf(pdf, 3)
+
+        chunks = list(self.processor.iter_text(pdf))
+
+        assert len(chunks) == 3
+        assert chunks[1].startswith("Page 1 explains")
+        assert self.processor.extract_text(pdf) == " ".join(
+            f"Page {page_num} explains the configuration." for page_num in range(3)
+        )
+
+    def test_parallel_pdf_keeps_page_order(self, tmp_path):
+        pdf = str(tmp_path / "manual.pdf")
+        _write_pdf(pdf, 40)
+        parallel = DocumentProcessor(pdf_workers=2, pdf_parallel_min_pages=4)
+
+        try:
+            assert parallel.extract_text(pdf) == self.processor.extract_text(pdf)
+        finally:
+            parallel.shutdown()
+
+    def test_streams_match_paths(self, tmp_path):
+        pdf = str(tmp_path / "manual.pdf")
+        _write_pdf(pdf, 2)
+        document = docx.Document()
+        document.add_paragraph("Install the server.")
+        table = document.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "Name"
+        table.cell(0, 1).text = "Value"
+        docx_path = str(tmp_path / "guide.docx")
+        document.save(docx_path)
+
+        for path, filename in ((pdf, "upload.pdf"), (docx_path, "upload.docx")):
+            with open(path, 'rb') as stream:
+                assert self.processor.extract_text(stream, filename) == self.processor.extract_text(path)
+        assert list(self.processor.iter_text(docx_path)) == ["Install the server.\n", "Name Value \n"]
+
+    def test_text_stream_yields_paragraphs(self):
+        stream = io.BytesIO(b"First line\nsecond line\n\nNext paragraph\n")
+
+        chunks = list(self.processor.iter_text(stream, "notes.txt"))
+
+        assert chunks == ["First line\nsecond line\n\n", "Next paragraph\n"]
+        # The caller's stream is left open
+        assert not stream.closed
+
+    def test_unsupported_format(self):
+        with pytest.raises(ValueError):
+            self.processor.iter_text(io.BytesIO(b"data"), "tool.exe")
+        assert self.processor.extract_text(io.BytesIO(b"data"), "tool.exe") is None
@@ -0,0 +1,106 @@
+"""
+Tests for the precompiled exception index used by BaseRule._is_excepted.
+"""
+
+import sys
+import os
+import time
+from unittest.mock import patch
+
+import spacy
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rules.base_rule as base_rule
+from rules.base_rule import BaseRule
+from rules.exception_index import ExceptionIndex
+
+CONFIG = {
+    'global_exceptions': ["DevOps", "end-of-life", "General Availability"],
+    'rule_specific_exceptions': {
+        'second_person': ["user interface", "end user", "  User  "],
+        'claims': ["best practice"],
+    }
+}
+
+
+class ExceptionTestRule(BaseRule):
+    """Minimal concrete rule for exception checks."""
+
+    def _get_rule_type(self) -> str:
+        return 'second_person'
+
+    def analyze(self, text, sentences, nlp=None, context=None):
+        return []
+
+
+class TestExceptionIndex:
+    """Test ExceptionIndex lookups and phrase matching."""
+
+    def setup_method(self):
+        self.index = ExceptionIndex.from_config(CONFIG)
+        self.nlp = spacy.blank("en")
+
+    def test_membership_is_case_insensitive(self):
+        assert self.index.is_excepted("devops")
+        assert self.index.is_excepted("  General availability ", 'second_person')
+        assert self.index.is_excepted("USER", 'second_person')
+        assert self.index.is_excepted("User Interface", 'second_person')
+
+    def test_rule_specific_terms_are_isolated(self):
+        assert not self.index.is_excepted("user interface")
+        assert not self.index.is_excepted("user interface", 'claims')
+        assert self.index.is_excepted("best practice", 'claims')
+        assert self.index.terms_for('unknown') == frozenset()
+
+    def test_invalid_config_gives_empty_index(self):
+        assert not ExceptionIndex.from_config(None)
+        assert not ExceptionIndex.from_config({'global_exceptions': "DevOps", 'rule_specific_exceptions': []})
+
+    def test_match_tokens_finds_phrases(self):
+        """Multi-word and hyphenated exceptions are matched against Doc tokens."""
+        doc = self.nlp("The end user opens the User Interface before end-of-life.")
+        spans = [doc[start:end].text for start, end in self.index.match_tokens(doc, 'second_person')]
+        assert spans == ["end user", "User Interface", "end-of-life"]
+
+    def test_match_tokens_without_rule_uses_global_terms(self):
+        doc = self.nlp("The user interface uses DevOps.")
+        assert [doc[s:e].text for s, e in self.index.match_tokens(doc)] == ["DevOps"]
+
+
+class TestBaseRuleExceptions:
+    """Test the exception index as used through BaseRule."""
+
+    def setup_method(self):
+        self.rule = ExceptionTestRule()
+        self.nlp = spacy.blank("en")
+
+    def teardown_method(self):
+        # Restore the index for the real exceptions.yaml
+        BaseRule._load_exceptions()
+
+    def test_excepted_token_indices(self):
+        """Tokens inside an excepted phrase are reported by their Doc index."""
+        doc = self.nlp("Ask the end user about the user interface.")
+        with patch.object(BaseRule, '_exception_index', ExceptionIndex.from_config(CONFIG)), \
+             patch.object(BaseRule, '_exceptions_checked_at', time.monotonic()):
+            indices = self.rule._excepted_token_indices(doc[2:])
+        assert indices == {2, 3, 6, 7}
+
+    def test_hot_reload_on_file_change(self, tmp_path):
+        """Edits to exceptions.yaml are picked up without restarting."""
+        path = tmp_path / "exceptions.yaml"
+        path.write_text("global_exceptions:\n  - Foo\n", encoding='utf-8')
+        with patch.object(base_rule, 'EXCEPTIONS_PATH', str(path)), \
+             patch.object(base_rule, 'EXCEPTIONS_RELOAD_INTERVAL', 0.0):
+            BaseRule._load_exceptions()
+            assert self.rule._is_excepted("foo")
+            assert not self.rule._is_excepted("bar")
+
+            path.write_text("global_exceptions:\n  - Bar\n", encoding='utf-8')
+            os.utime(path, (time.time() + 5, time.time() + 5))
+
+            assert self.rule._is_excepted("bar")
+            assert not self.rule._is_excepted("foo")
+            assert BaseRule._exceptions == {'global_exceptions': ['Bar']}
@@ -0,0 +1,234 @@
+"""
+Tests for incremental re-analysis.
+
+Covers text and error diffing, the baseline store, StyleAnalyzer.analyze_incremental
+and the /analyze/incremental endpoint.
+"""
+
+import json
+import pytest
+import sys
+import os
+from unittest.mock import Mock, patch
+from flask import Flask
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from style_analyzer.incremental import AnalysisResultStore, diff_errors, diff_text_regions
+from style_analyzer.base_analyzer import StyleAnalyzer
+from style_analyzer.base_types import AnalysisOptions
+
+
+def _error(message, sentence='A sentence.'):
+    return {'type': 'word_usage', 'message': message, 'sentence': sentence, 'confidence_score': 0.5}
+
+
+class TestDiffHelpers:
+    """Test text region and error diffing."""
+
+    def test_changed_regions(self):
+        """Only edited lines are reported, with ranges in both versions."""
+        old = "Title\n\nFirst paragraph.\n\nSecond paragraph."
+        new = "Title\n\nFirst paragraph, edited.\n\nSecond paragraph."
+
+        assert diff_text_regions(old, new) == [{'old_start': 2, 'old_end': 3, 'new_start': 2, 'new_end': 3}]
+        assert diff_text_regions(old, old) == []
+
+    def test_error_delta(self):
+        """Errors are matched by identity, ignoring run-specific fields like confidence."""
+        kept = _error('Keep')
+        old_errors = [kept, _error('Fixed')]
+        new_errors = [dict(kept, confidence_score=0.9), _error('New')]
+
+        added, removed = diff_errors(old_errors, new_errors)
+
+        assert [e['message'] for e in added] == ['New']
+        assert [e['message'] for e in removed] == ['Fixed']
+
+    def test_duplicate_errors_matched_one_for_one(self):
+        """A second occurrence of an existing error is reported as added."""
+        added, removed = diff_errors([_error('Same')], [_error('Same'), _error('Same')])
+        assert len(added) == 1
+        assert removed == []
+
+    def test_inserted_sentence_keeps_later_errors(self):
+        """Errors are matched by sentence text, not by sentence index or span."""
+        old_errors = [dict(_error('Issue', 'Second.'), sentence_index=0, span=[0, 7], flagged_text='Second')]
+        new_errors = [dict(_error('Issue', 'Inserted.'), sentence_index=0, span=[0, 9], flagged_text='Inserted'),
+                      dict(_error('Issue', 'Second.'), sentence_index=1, span=[10, 17], flagged_text='Second')]
+
+        added, removed = diff_errors(old_errors, new_errors)
+
+        assert [e['sentence'] for e in added] == ['Inserted.']
+        assert removed == []
+
+    def test_store_is_bounded(self):
+        """The oldest baselines are dropped once the store is full."""
+        store = AnalysisResultStore(max_results=2)
+        first = store.add('a', 'auto', {})
+        store.add('b', 'auto', {})
+        store.add('c', 'auto', {})
+
+        assert store.get(first) is None
+        assert len(store) == 2
+
+    def test_store_keeps_compact_baselines(self):
+        """A baseline keeps line hashes and error identities, not the text or the full result."""
+        store = AnalysisResultStore()
+        result = {'analysis': {'errors': [dict(_error('Issue'), suggestions=['Rewrite'], sentence_index=3)]}}
+
+        baseline = store.get(store.add('A sentence.\nAnother.', 'auto', result))
+
+        assert 'text' not in baseline and 'result' not in baseline
+        assert len(baseline['line_hashes']) == 2
+        assert baseline['errors'] == [{'type': 'word_usage', 'message': 'Issue', 'sentence': 'A sentence.'}]
+
+    def test_store_expires_baselines(self):
+        """Baselines older than the TTL are treated as unknown."""
+        store = AnalysisResultStore(ttl_seconds=0)
+        assert store.get(store.add('a', 'auto', {})) is None
+
+
+class TestAnalyzeIncremental:
+    """Test StyleAnalyzer.analyze_incremental."""
+
+    def setup_method(self):
+        """Create an analyzer whose block analysis reports one error per paragraph."""
+        self.analyzer = StyleAnalyzer.__new__(StyleAnalyzer)
+        self.analyzer.nlp = None
+        self.analyzer.result_store = AnalysisResultStore()
+
+        def analyze_with_blocks(text, format_hint, analysis_mode, options=None):
+            paragraphs = [paragraph for paragraph in text.split('\n\n') if paragraph]
+            errors = [dict(_error('Issue', paragraph), sentence_index=index)
+                      for index, paragraph in enumerate(paragraphs)]
+            return {'analysis': {'errors': errors}, 'structural_blocks': [], 'has_structure': True}
+
+        self.analyzer.structural_analyzer = Mock()
+        self.analyzer.structural_analyzer.analyze_with_blocks.side_effect = analyze_with_blocks
+
+    def test_delta_against_previous_result(self):
+        """Editing one paragraph removes its old error and adds the new one."""
+        first = self.analyzer.analyze_with_blocks("One.\n\nTwo.", 'markdown', incremental=True)
+
+        result = self.analyzer.analyze_incremental(first['result_id'], "One.\n\nTwo, edited.")
+
+        assert result['previous_result_found'] is True
+        assert [e['sentence'] for e in result['added_errors']] == ['Two, edited.']
+        assert [e['sentence'] for e in result['removed_errors']] == ['Two.']
+        assert result['unchanged_error_count'] == 1
+        assert result['changed_regions'] == [{'old_start': 2, 'old_end': 3, 'new_start': 2, 'new_end': 3}]
+        assert result['result_id'] != first['result_id']
+        # The previous result's format hint is reused
+        assert self.analyzer.structural_analyzer.analyze_with_blocks.call_args[0][1] == 'markdown'
+
+    def test_unchanged_text_has_empty_delta(self):
+        """Re-sending identical text reports no changes and stores a new baseline."""
+        first = self.analyzer.analyze_with_blocks("One.", 'auto', incremental=True)
+
+        result = self.analyzer.analyze_incremental(first['result_id'], "One.")
+
+        assert result['changed_regions'] == []
+        assert result['added_errors'] == [] and result['removed_errors'] == []
+        assert self.analyzer.result_store.get(result['result_id']) is not None
+
+    def test_inserted_sentence_above_error(self):
+        """Inserting a paragraph above an error reports only the new paragraph's error."""
+        first = self.analyzer.analyze_with_blocks("Two.", 'auto', incremental=True)
+
+        result = self.analyzer.analyze_incremental(first['result_id'], "One.\n\nTwo.")
+
+        assert [e['sentence'] for e in result['added_errors']] == ['One.']
+        assert result['removed_errors'] == []
+        assert result['unchanged_error_count'] == 1
+
+    def test_plain_analysis_keeps_no_baseline(self):
+        """Without incremental mode nothing is stored and no result id is returned."""
+        result = self.analyzer.analyze_with_blocks("One.", 'auto')
+
+        assert 'result_id' not in result
+        assert len(self.analyzer.result_store) == 0
+
+    def test_previous_options_are_reused(self):
+        """Re-analysis runs with the options of the previous result unless new ones are given."""
+        options = AnalysisOptions(confidence_threshold=0.7)
+        first = self.analyzer.analyze_with_blocks("One.", 'auto', options=options, incremental=True)
+
+        second = self.analyzer.analyze_incremental(first['result_id'], "One.\n\nTwo.")
+        assert self.analyzer.structural_analyzer.analyze_with_blocks.call_args[0][3] == options
+
+        # Identical text under different options is analysed again
+        stricter = AnalysisOptions(confidence_threshold=0.9)
+        third = self.analyzer.analyze_incremental(second['result_id'], "One.\n\nTwo.", options=stricter)
+        assert self.analyzer.structural_analyzer.analyze_with_blocks.call_count == 3
+        assert self.analyzer.structural_analyzer.analyze_with_blocks.call_args[0][3] == stricter
+        assert self.analyzer.result_store.get(third['result_id'])['options'] == stricter
+
+    def test_unknown_previous_result(self):
+        """Without a baseline every error is reported as added."""
+        result = self.analyzer.analyze_incremental('missing', "One.\n\nTwo.")
+
+        assert result['previous_result_found'] is False
+        assert len(result['added_errors']) == 2
+
+
+class TestIncrementalEndpoint:
+    """Test the /analyze/incremental route."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client with a mocked style analyzer."""
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        self.style_analyzer = Mock()
+        self.style_analyzer.analyze_incremental.return_value = {
+            'result_id': 'new-id',
+            'previous_result_found': True,
+            'changed_regions': [{'old_start': 0, 'old_end': 1, 'new_start': 0, 'new_end': 1}],
+            'added_errors': [_error('New')],
+            'removed_errors': [],
+            'unchanged_error_count': 3,
+            'analysis': {'errors': []},
+            'structural_blocks': []
+        }
+
+        from app_modules.api_routes import setup_routes
+        with patch('app_modules.api_routes.emit_progress'), patch('app_modules.api_routes.emit_completion'):
+            setup_routes(app, Mock(), self.style_analyzer, Mock())
+        return app.test_client()
+
+    def test_returns_error_delta(self, client):
+        """The endpoint forwards the request and returns the delta."""
+        response = client.post('/analyze/incremental',
+                               data=json.dumps({'content': 'Edited.', 'previous_result_id': 'old-id'}),
+                               content_type='application/json')
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['success'] is True
+        assert data['result_id'] == 'new-id'
+        assert [e['message'] for e in data['added_errors']] == ['New']
+        self.style_analyzer.analyze_incremental.assert_called_once_with('old-id', 'Edited.', None, None)
+
+    def test_forwards_confidence_threshold(self, client):
+        """A confidence threshold in the request overrides the previous result's options."""
+        response = client.post('/analyze/incremental',
+                               data=json.dumps({'content': 'Edited.', 'previous_result_id': 'old-id',
+                                                'confidence_threshold': 0.6}),
+                               content_type='application/json')
+
+        assert response.status_code == 200
+        self.style_analyzer.analyze_incremental.assert_called_once_with(
+            'old-id', 'Edited.', None, AnalysisOptions(confidence_threshold=0.6))
+
+        response = client.post('/analyze/incremental',
+                               data=json.dumps({'content': 'Edited.', 'confidence_threshold': 2}),
+                               content_type='application/json')
+        assert response.status_code == 400
+
+    def test_requires_content(self, client):
+        """Empty content is rejected."""
+        response = client.post('/analyze/incremental', data=json.dumps({'previous_result_id': 'x'}),
+                               content_type='application/json')
+        assert response.status_code == 400
@@ -0,0 +1,149 @@
+"""
+Tests for the bounded job queue behind the asynchronous /jobs endpoints.
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app_modules.job_queue import JobQueue, JobQueueFullError, COMPLETED, FAILED, CANCELLED, QUEUED
+
+
+def wait_for(job, timeout=5.0):
+    deadline = time.time() + timeout
+    while not job.is_finished and time.time() < deadline:
+        time.sleep(0.01)
+    return job
+
+
+class TestJobQueue:
+    """Test JobQueue scheduling, admission control and cancellation."""
+
+    def setup_method(self):
+        self.queue = JobQueue(max_workers=1, max_pending=3, max_pending_per_session=0, result_ttl=60)
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def teardown_method(self):
+        self.release.set()
+        self.queue.shutdown(wait=True)
+
+    def _block_worker(self):
+        """Occupy the single worker until self.release is set."""
+        def hold(job):
+            self.started.set()
+            self.release.wait(5)
+            return 'held'
+        job = self.queue.submit('test', hold)
+        assert self.started.wait(5)
+        return job
+
+    def test_result_and_failure(self):
+        done = wait_for(self.queue.submit('test', lambda job: {'value': 42}))
+        failed = wait_for(self.queue.submit('test', lambda job: 1 / 0))
+
+        assert done.status == COMPLETED and done.to_dict()['result'] == {'value': 42}
+        assert failed.status == FAILED and 'division' in failed.error
+        assert 'result' not in failed.to_dict()
+
+    def test_priority_order(self):
+        """Higher priority jobs start first; equal priorities run in submission order."""
+        order = []
+        self._block_worker()
+        jobs = [self.queue.submit('test', lambda job, name=name: order.append(name), priority=priority)
+                for name, priority in [('low', 'low'), ('normal', 'normal'), ('high', 'high')]]
+
+        assert self.queue.position(jobs[0].job_id) == 2
+        self.release.set()
+        for job in jobs:
+            wait_for(job)
+        assert order == ['high', 'normal', 'low']
+
+    def test_full_queue_is_rejected(self):
+        self._block_worker()
+        for _ in range(3):
+            self.queue.submit('test', lambda job: None)
+
+        with pytest.raises(JobQueueFullError) as excinfo:
+            self.queue.submit('test', lambda job: None)
+        assert excinfo.value.retry_after >= 1
+        assert self.queue.get_stats()['rejected'] == 1
+
+    def test_per_session_limit(self):
+        self.queue.max_pending_per_session = 1
+        self._block_worker()
+        self.queue.submit('test', lambda job: None, session_id='a')
+
+        with pytest.raises(JobQueueFullError):
+            self.queue.submit('test', lambda job: None, session_id='a')
+        self.queue.submit('test', lambda job: None, session_id='b')
+
+    def test_unknown_priority(self):
+        with pytest.raises(ValueError):
+            self.queue.submit('test', lambda job: None, priority='urgent')
+
+    def test_cancel_queued_job_never_runs(self):
+        ran = []
+        finished = []
+        self._block_worker()
+        job = self.queue.submit('test', lambda job: ran.append(True),
+                                on_finish=lambda job: finished.append(job.status))
+
+        assert self.queue.cancel(job.job_id).status == CANCELLED
+        # The callback runs straight away, not when a worker reaches the job
+        assert finished == [CANCELLED]
+        follow_up = self.queue.submit('test', lambda job: 'ok')
+        self.release.set()
+
+        assert wait_for(follow_up).status == COMPLETED
+        assert ran == []
+
+    def test_cancel_running_job_discards_result(self):
+        finished = []
+        job = self.queue.submit('test', lambda job: self.release.wait(5),
+                                on_finish=lambda job: finished.append(job.status))
+        while job.status == QUEUED:
+            time.sleep(0.01)
+
+        self.queue.cancel(job.job_id)
+        self.release.set()
+
+        assert wait_for(job).status == CANCELLED
+        self.queue.shutdown(wait=True)
+        assert job.result is None
+        assert finished == [CANCELLED]
+
+    def test_running_job_can_poll_cancellation(self):
+        def poll(job):
+            self.started.set()
+            while not job.cancel_requested:
+                time.sleep(0.01)
+            return 'stopped early'
+        job = self.queue.submit('test', poll)
+        assert self.started.wait(5)
+
+        self.queue.cancel(job.job_id)
+
+        assert wait_for(job).status == CANCELLED
+
+    def test_shutdown_finishes_queued_jobs(self):
+        finished = []
+        self._block_worker()
+        jobs = [self.queue.submit('test', lambda job: None, on_finish=lambda job: finished.append(job.job_id))
+                for _ in range(2)]
+
+        self.queue.shutdown()
+
+        assert all(job.status == CANCELLED for job in jobs)
+        assert finished == [job.job_id for job in jobs]
+
+    def test_finished_jobs_expire(self):
+        self.queue.result_ttl = 0
+        job = wait_for(self.queue.submit('test', lambda job: None))
+        time.sleep(0.01)
+        assert self.queue.get(job.job_id) is None
@@ -0,0 +1,302 @@
+"""
+Tests for the shared spaCy processing layer.
+
+Covers the parse-once Doc cache used by the rules registry, the per-Doc
+sentence index and the process-wide spaCy model registry.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock, patch
+
+import spacy
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlp_processing import (
+    DocCache, cached_nlp, SpacyModelRegistry, PipelineView,
+    get_sentence_index, sentence_index_of, token_at_char, closest_token_index,
+    sentence_index_at_char, sentence_count, sentence_spans
+)
+
+
+def _scan_closest_token(doc, position):
+    """Reference: a linear scan for the token containing or nearest to ``position``."""
+    best_token, min_distance = None, float('inf')
+    for token in doc:
+        if token.idx <= position <= token.idx + len(token.text):
+            return token.i
+        distance = min(abs(token.idx - position), abs(token.idx + len(token.text) - position))
+        if distance < min_distance:
+            min_distance, best_token = distance, token.i
+    return best_token
+
+
+def _scan_sentence(doc, position):
+    """Reference: a linear scan for the sentence containing ``position``."""
+    for index, sent in enumerate(doc.sents):
+        if sent.start_char <= position <= sent.end_char:
+            return index
+    return None
+
+
+class TestDocCache:
+    """Test the parse-once Doc cache."""
+    
+    def setup_method(self):
+        """Set up a mock pipeline that returns a fresh object per call."""
+        self.nlp = Mock(side_effect=lambda text: Mock(text=text))
+        self.nlp.vocab = 'vocab'
+    
+    def test_same_text_parsed_once(self):
+        """Repeated calls for the same text return the same Doc."""
+        cache = DocCache(self.nlp)
+        
+        first = cache("The system is configured.")
+        second = cache("The system is configured.")
+        
+        assert first is second
+        assert self.nlp.call_count == 1
+        assert cache.get_stats()['hits'] == 1
+        assert cache.get_stats()['misses'] == 1
+    
+    def test_different_texts_parsed_separately(self):
+        """Each distinct string gets its own parse."""
+        cache = DocCache(self.nlp)
+        
+        cache("First sentence.")
+        cache("Second sentence.")
+        
+        assert self.nlp.call_count == 2
+        assert len(cache) == 2
+    
+    def test_lru_eviction(self):
+        """The least recently used Doc is dropped when the cache is full."""
+        cache = DocCache(self.nlp, max_entries=2)
+        
+        cache("a")
+        cache("b")
+        cache("a")
+        cache("c")
+        
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert len(cache) == 2
+    
+    def test_add_preparsed_doc(self):
+        """Docs parsed elsewhere can be registered and are served without parsing."""
+        cache = DocCache(self.nlp)
+        doc = Mock(text="Pre-parsed.")
+        
+        cache.add("Pre-parsed.", doc)
+        
+        assert cache("Pre-parsed.") is doc
+        assert self.nlp.call_count == 0
+    
+    def test_prime_parses_batch_once(self):
+        """prime() runs one nlp.pipe call for all uncached, distinct texts."""
+        self.nlp.pipe = Mock(side_effect=lambda texts, **kwargs: [Mock(text=t) for t in texts])
+        cache = DocCache(self.nlp)
+        cache("Already cached.")
+        
+        docs = cache.prime(["First.", "Already cached.", "First.", "Second."], batch_size=16)
+        
+        self.nlp.pipe.assert_called_once_with(["First.", "Second."], batch_size=16)
+        assert [doc.text for doc in docs] == ["First.", "Already cached.", "First.", "Second."]
+        assert docs[0] is docs[2]
+        assert cache("Second.") is docs[3]
+        assert self.nlp.call_count == 1
+    
+    def test_attribute_passthrough(self):
+        """Pipeline attributes such as vocab are forwarded to the wrapped nlp."""
+        cache = DocCache(self.nlp)
+        
+        assert cache.vocab == 'vocab'
+        assert bool(cache)
+    
+    def test_cached_nlp_does_not_stack(self):
+        """Wrapping a cache again returns the same cache instance."""
+        cache = cached_nlp(self.nlp)
+        
+        assert cached_nlp(cache) is cache
+        assert DocCache(cache).nlp is self.nlp
+        assert cached_nlp(None) is None
+
+
+class TestRegistrySharedParse:
+    """Test that the rules registry hands one parse to every rule."""
+    
+    def test_rules_share_block_doc(self):
+        """Rules calling nlp(text) reuse the registry's parse of the block."""
+        from rules import RulesRegistry
+        
+        registry = RulesRegistry.__new__(RulesRegistry)
+        registry.enable_enhanced_validation = False
+        registry.enable_consolidation = False
+        registry.block_type_rules = {'paragraph': ['rule_a', 'rule_b']}
+        registry.rule_exclusions = {}
+        
+        seen_docs = []
+        
+        def make_rule():
+            rule = Mock()
+            rule.analyze.side_effect = lambda text, sentences, nlp, context: seen_docs.append(nlp(text)) or []
+            return rule
+        
+        registry.rules = {'rule_a': make_rule(), 'rule_b': make_rule()}
+        
+        nlp = Mock(side_effect=lambda t: Mock(text=t))
+        text = "Click the button to continue."
+        registry.analyze_with_context_aware_rules(text, [text], nlp, {'block_type': 'paragraph'})
+        
+        assert len(seen_docs) == 2
+        assert seen_docs[0] is seen_docs[1]
+        assert nlp.call_count == 1
+
+
+class TestBatchedBlockParsing:
+    """Test the structural analyzer's batched pre-pass over block texts."""
+    
+    def test_block_docs_attached_and_reused(self):
+        """Blocks and their children get Docs from one pipe call, reused by the executor."""
+        from style_analyzer.structural_analyzer import StructuralAnalyzer
+        from style_analyzer.analysis_modes import AnalysisModeExecutor
+        from style_analyzer.base_types import AnalysisMode
+        
+        nlp = Mock(side_effect=lambda t: Mock(text=t))
+        nlp.pipe = Mock(side_effect=lambda texts, **kwargs: [Mock(text=t) for t in texts])
+        
+        child = Mock(children=[])
+        child.get_text_content.return_value = "A table cell."
+        block = Mock(children=[child])
+        
+        analyzer = StructuralAnalyzer.__new__(StructuralAnalyzer)
+        analyzer.nlp = nlp
+        analyzer._attach_block_docs([(block, "A paragraph.", {})], AnalysisMode.SPACY_WITH_MODULAR_RULES)
+        
+        nlp.pipe.assert_called_once()
+        assert block._spacy_doc.text == "A paragraph."
+        assert child._spacy_doc.text == "A table cell."
+        
+        executor = AnalysisModeExecutor(Mock(), Mock(), None, nlp)
+        executor._local.block_docs = executor._collect_block_docs(block)
+        block_nlp = executor._get_block_nlp()
+        
+        assert block_nlp("A paragraph.") is block._spacy_doc
+        assert block_nlp("A table cell.") is child._spacy_doc
+        assert nlp.call_count == 0
+
+
+class TestSentenceIndex:
+    """Test the per-Doc sentence index."""
+    
+    def setup_method(self):
+        """Set up a pipeline with sentence boundaries."""
+        self.nlp = spacy.blank("en")
+        self.nlp.add_pipe("sentencizer")
+        self.doc = self.nlp("First sentence here. Second one  follows. And a third!")
+    
+    def test_matches_sentence_enumeration(self):
+        """Every token and span gets the index of its sentence in doc.sents."""
+        sentences = list(self.doc.sents)
+        for token in self.doc:
+            assert sentence_index_of(token) == sentences.index(token.sent)
+            assert sentence_index_of(self.doc[token.i:token.i + 2]) == sentences.index(token.sent)
+        for i, sent in enumerate(sentences):
+            assert sentence_index_of(sent) == i
+    
+    def test_index_stored_on_doc(self):
+        """The index is built once and kept as a Doc extension."""
+        index = get_sentence_index(self.doc)
+        assert self.doc._.sentence_index.sentence_of_token is index
+        assert get_sentence_index(self.doc) is index
+        assert len(index) == len(self.doc)
+    
+    def test_without_sentence_boundaries(self):
+        """Docs without sentence boundaries place everything in sentence 0."""
+        doc = spacy.blank("en")("No boundaries were set here")
+        assert sentence_index_of(doc[3]) == 0
+    
+    def test_token_at_char(self):
+        """Character offsets map to the token whose text contains them."""
+        for char in range(len(self.doc.text)):
+            expected = next((t for t in self.doc if t.idx <= char < t.idx + len(t.text)), None)
+            assert token_at_char(self.doc, char) == expected
+        assert token_at_char(self.doc, len(self.doc.text)) is None
+    
+    def test_char_lookups_match_linear_scan(self):
+        """Every offset, including gaps and the text end, resolves like a scan."""
+        doc = self.nlp("Hello,world.  Run   it now!It's done... ok")
+        for position in range(-2, len(doc.text) + 3):
+            assert closest_token_index(doc, position) == _scan_closest_token(doc, position), position
+            assert sentence_index_at_char(doc, position) == _scan_sentence(doc, position), position
+            expected = next((t for t in doc if t.idx <= position <= t.idx + len(t.text)), None)
+            assert token_at_char(doc, position, include_end=True) == expected, position
+    
+    def test_sentence_spans(self):
+        """Sentence spans equal those produced by doc.sents."""
+        assert sentence_spans(self.doc) == list(self.doc.sents)
+        assert sentence_spans(self.doc, 1, 2) == list(self.doc.sents)[1:2]
+        assert sentence_count(self.doc) == 3
+    
+    def test_empty_document(self):
+        """An empty document has no tokens or sentences."""
+        doc = self.nlp("")
+        assert closest_token_index(doc, 0) is None
+        assert sentence_index_at_char(doc, 0) is None
+        assert sentence_count(doc) == 0
+
+
+class TestSpacyModelRegistry:
+    """Test the process-wide spaCy model registry."""
+    
+    def setup_method(self):
+        """Build a small blank pipeline so no trained model is required."""
+        spacy = pytest.importorskip("spacy")
+        self.nlp = spacy.blank("en")
+        self.nlp.add_pipe("sentencizer")
+        self.nlp.add_pipe("attribute_ruler")
+        self.registry = SpacyModelRegistry()
+    
+    def test_model_loaded_once(self):
+        """Every caller gets the same instance and spacy.load runs once."""
+        with patch('nlp_processing.model_registry.spacy.load', return_value=self.nlp) as mock_load:
+            first = self.registry.get_model("test_model")
+            second = self.registry.get_model("test_model")
+        
+        assert first is second
+        assert mock_load.call_count == 1
+        assert self.registry.is_loaded("test_model")
+    
+    def test_load_failure_not_cached(self):
+        """A failed load raises OSError and can be retried later."""
+        with patch('nlp_processing.model_registry.spacy.load', side_effect=OSError("missing")):
+            with pytest.raises(OSError):
+                self.registry.get_model("missing_model")
+        
+        assert not self.registry.is_loaded("missing_model")
+    
+    def test_profile_view_shares_model(self):
+        """Profiles are views over the shared model with components disabled per call."""
+        self.registry.register_model("test_model", self.nlp)
+        
+        view = self.registry.get_model("test_model", profile='parser')
+        
+        assert isinstance(view, PipelineView)
+        assert view.nlp is self.nlp
+        assert view.pipe_names == ['sentencizer']
+        assert self.registry.get_model("test_model", profile='parser') is view
+        
+        doc = view("First sentence. Second sentence.")
+        assert len(list(doc.sents)) == 2
+        # The shared pipeline itself is left untouched
+        assert self.nlp.pipe_names == ['sentencizer', 'attribute_ruler']
+    
+    def test_unknown_profile(self):
+        """Unknown profiles are rejected."""
+        self.registry.register_model("test_model", self.nlp)
+        
+        with pytest.raises(ValueError):
+            self.registry.get_model("test_model", profile='nonexistent')
@@ -0,0 +1,152 @@
+"""
+Tests for parallel block analysis.
+
+Covers the worker-side task runner, detached block copies and the
+StructuralAnalyzer dispatch that keeps results in document order.
+"""
+
+import pickle
+import sys
+import os
+from unittest.mock import Mock
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from structural_parsing.asciidoc.types import AsciiDocBlock, AsciiDocBlockType
+from style_analyzer import parallel_executor
+from style_analyzer.parallel_executor import ParallelBlockExecutor, _detached_copy, _analyze_block_in_worker
+from style_analyzer.structural_analyzer import StructuralAnalyzer
+from style_analyzer.base_types import AnalysisMode, AnalysisOptions
+
+
+def _make_list_block():
+    """Build an unordered list with two items hanging off a document root."""
+    root = AsciiDocBlock(block_type=AsciiDocBlockType.DOCUMENT, content='', raw_content='', start_line=0)
+    ulist = AsciiDocBlock(block_type=AsciiDocBlockType.UNORDERED_LIST, content='', raw_content='', start_line=1, parent=root)
+    for i in range(2):
+        item = AsciiDocBlock(block_type=AsciiDocBlockType.LIST_ITEM, content=f'Item {i}',
+                             raw_content=f'* Item {i}', start_line=i + 1, parent=ulist)
+        ulist.children.append(item)
+    root.children.append(ulist)
+    return ulist
+
+
+class FakeModeExecutor:
+    """Mimics list analysis, which stores errors on the list items."""
+
+    def __init__(self):
+        self.options = []
+
+    def analyze_block_content(self, block, content, analysis_mode, context, options=None):
+        self.options.append(options)
+        for child in block.children:
+            child._analysis_errors.append({'type': 'item', 'message': child.content})
+            child._already_analyzed = True
+        return [{'type': 'block', 'message': content}]
+
+
+class TestDetachedCopy:
+    """Test the block copies shipped to worker processes."""
+
+    def test_copy_drops_parent_and_keeps_children(self):
+        """The copy has no parent link but a full, independent subtree."""
+        ulist = _make_list_block()
+        clone = _detached_copy(ulist)
+
+        assert clone.parent is None
+        assert ulist.parent is not None
+        assert [c.content for c in clone.children] == ['Item 0', 'Item 1']
+        assert clone.children[0] is not ulist.children[0]
+        assert clone.children[0].parent is None
+
+    def test_copy_is_picklable(self):
+        """Detached copies pickle without the rest of the document."""
+        clone = pickle.loads(pickle.dumps(_detached_copy(_make_list_block())))
+        assert len(clone.children) == 2
+
+
+class TestWorkerTask:
+    """Test the function that runs inside each worker."""
+
+    def setup_method(self):
+        """Install a fake executor and registry as the worker state."""
+        self.registry = Mock(confidence_threshold=0.43)
+        parallel_executor._worker_state['mode_executor'] = FakeModeExecutor()
+        parallel_executor._worker_state['rules_registry'] = self.registry
+
+    def teardown_method(self):
+        parallel_executor._worker_state.clear()
+
+    def test_reports_descendant_side_effects(self):
+        """Errors added to list items come back with their child path."""
+        options = AnalysisOptions(confidence_threshold=0.6)
+        task = (_detached_copy(_make_list_block()), 'list text', AnalysisMode.SPACY_WITH_MODULAR_RULES, {}, options)
+        errors, updates, elapsed, statistics = _analyze_block_in_worker(task)
+
+        assert errors == [{'type': 'block', 'message': 'list text'}]
+        assert updates == [
+            ((0,), [{'type': 'item', 'message': 'Item 0'}], True),
+            ((1,), [{'type': 'item', 'message': 'Item 1'}], True),
+        ]
+        assert elapsed >= 0
+        assert statistics.sentences == ('list text',)
+        # The options travel with the task instead of being set on the worker's registry
+        assert parallel_executor._worker_state['mode_executor'].options == [options]
+        assert self.registry.confidence_threshold == 0.43
+
+
+class TestStructuralAnalyzerDispatch:
+    """Test sequential and parallel dispatch in StructuralAnalyzer."""
+
+    def setup_method(self):
+        """Create an analyzer without running the heavy constructor."""
+        self.analyzer = StructuralAnalyzer.__new__(StructuralAnalyzer)
+        self.analyzer.mode_executor = FakeModeExecutor()
+        self.analyzer.rules_registry = Mock(confidence_threshold=0.43)
+        self.analyzer.nlp = None
+        self.analyzer.parallel_min_blocks = 2
+        self.analyzer.parallel_executor = None
+        self.analyzer.result_cache = None
+
+    def _work_items(self, count):
+        return [(_make_list_block(), f'block {i}', {}) for i in range(count)]
+
+    def test_sequential_results_in_document_order(self):
+        """Without a pool every block is analyzed in-process, in order."""
+        results = self.analyzer._run_block_analysis(self._work_items(3), AnalysisMode.SPACY_WITH_MODULAR_RULES)
+        assert [errors[0]['message'] for errors, _ in results] == ['block 0', 'block 1', 'block 2']
+
+    def test_parallel_results_replayed_on_original_blocks(self):
+        """Worker results are applied to the caller's blocks in document order."""
+        parallel_executor._worker_state['mode_executor'] = FakeModeExecutor()
+        executor = ParallelBlockExecutor(max_workers=2)
+        pool = Mock()
+        pool.map.side_effect = lambda fn, tasks, chunksize=1: [fn(task) for task in tasks]
+        executor._pool = pool
+        self.analyzer.parallel_executor = executor
+
+        work_items = self._work_items(3)
+        try:
+            results = self.analyzer._run_block_analysis(work_items, AnalysisMode.SPACY_WITH_MODULAR_RULES)
+        finally:
+            parallel_executor._worker_state.clear()
+
+        assert [errors[0]['message'] for errors, _ in results] == ['block 0', 'block 1', 'block 2']
+        for block, _, _ in work_items:
+            assert [e['message'] for e in block.children[0]._analysis_errors] == ['Item 0']
+            assert block.children[1]._already_analyzed is True
+
+    def test_pool_failure_falls_back_to_sequential(self):
+        """A broken pool does not lose the analysis."""
+        executor = ParallelBlockExecutor(max_workers=2)
+        executor._pool = Mock()
+        executor._pool.map.side_effect = RuntimeError('pool broken')
+        self.analyzer.parallel_executor = executor
+
+        work_items = self._work_items(2)
+        results = self.analyzer._run_block_analysis(work_items, AnalysisMode.SPACY_WITH_MODULAR_RULES)
+
+        assert len(results) == 2
+        assert executor._pool is None
+        assert len(work_items[0][0].children[0]._analysis_errors) == 1
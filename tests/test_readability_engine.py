@@ -0,0 +1,123 @@
+"""
+Tests for the single-pass readability engine shared by the readability
+analyzer and the statistics calculator.
+"""
+
+import pytest
+import sys
+import os
+import math
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from style_analyzer.readability_engine import (
+    ReadabilityCounts, count_readability, get_readability_counts,
+    get_readability_cache_stats, clear_readability_caches
+)
+from style_analyzer.readability_analyzer import ReadabilityAnalyzer
+from style_analyzer.statistics_calculator import StatisticsCalculator
+
+SAMPLE_TEXT = (
+    "Configure the deployment server before you install the application. "
+    "Administrators don't need to restart the well-known services (they reload automatically). "
+    "The configuration file is validated whenever it changes! "
+    "See the documentation for details."
+)
+
+
+def textstat_works():
+    try:
+        import textstat
+        textstat.flesch_reading_ease(SAMPLE_TEXT)
+        return True
+    except Exception:
+        return False
+
+
+class TestReadabilityEngine:
+    """Test the counts record, the derived indices and the caches."""
+
+    def setup_method(self):
+        clear_readability_caches()
+
+    def test_indices_derived_from_counts(self):
+        counts = ReadabilityCounts(words=20, sentences=2, syllables=30, polysyllables=4,
+                                   difficult_words=3, unfamiliar_words=5, letters=100,
+                                   characters=110, tokens=22)
+
+        assert counts.flesch_reading_ease() == pytest.approx(206.835 - 1.015 * 10 - 84.6 * 1.5)
+        assert counts.flesch_kincaid_grade() == pytest.approx(0.39 * 10 + 11.8 * 1.5 - 15.59)
+        assert counts.gunning_fog() == pytest.approx(0.4 * (10 + 15))
+        assert counts.smog_index() == pytest.approx(1.043 * math.sqrt(60) + 3.1291)
+        assert counts.dale_chall_readability_score() == pytest.approx(0.1579 * 25 + 0.0496 * 10 + 3.6365)
+
+        empty = ReadabilityCounts().to_metrics()
+        assert empty.pop('text_standard') == 1.0
+        assert set(empty.values()) == {0.0}
+
+    @pytest.mark.skipif(not textstat_works(), reason="textstat syllable data not installed")
+    def test_matches_textstat(self):
+        import textstat
+        metrics = count_readability(SAMPLE_TEXT).to_metrics()
+
+        assert metrics['flesch_reading_ease'] == pytest.approx(textstat.flesch_reading_ease(SAMPLE_TEXT))
+        assert metrics['gunning_fog_index'] == pytest.approx(textstat.gunning_fog(SAMPLE_TEXT))
+        assert metrics['coleman_liau_index'] == pytest.approx(textstat.coleman_liau_index(SAMPLE_TEXT))
+        assert metrics['automated_readability_index'] == pytest.approx(textstat.automated_readability_index(SAMPLE_TEXT))
+        assert metrics['dale_chall_readability'] == pytest.approx(textstat.dale_chall_readability_score(SAMPLE_TEXT))
+        assert metrics['text_standard'] == textstat.text_standard(SAMPLE_TEXT, float_output=True)
+
+    def test_doc_tokens_give_the_same_word_counts(self):
+        spacy = pytest.importorskip("spacy")
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+
+        from_doc = count_readability(SAMPLE_TEXT, nlp(SAMPLE_TEXT))
+        from_text = count_readability(SAMPLE_TEXT)
+
+        for field in ('words', 'tokens', 'syllables', 'polysyllables', 'letters', 'characters'):
+            assert getattr(from_doc, field) == getattr(from_text, field)
+        assert from_doc.sentences == 4
+
+    def test_cached_counts_do_not_depend_on_caller_order(self):
+        spacy = pytest.importorskip("spacy")
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        text = "Use the default value, e.g. the port number of the service. Then restart the whole service now."
+        doc = nlp(text)
+        # spaCy keeps "e.g." in one sentence where the regex splits it
+        assert count_readability(text, doc).sentences != count_readability(text).sentences
+
+        doc_first = (get_readability_counts(text, doc), get_readability_counts(text))
+        clear_readability_caches()
+        text_first = (get_readability_counts(text), get_readability_counts(text, doc))
+
+        assert doc_first == text_first[::-1]
+        assert doc_first[0] == count_readability(text, doc)
+        assert doc_first[1] == count_readability(text)
+
+    def test_counts_computed_once_per_text(self):
+        calculator = StatisticsCalculator()
+        sentences = SAMPLE_TEXT.split('. ')
+
+        calculator.calculate_comprehensive_statistics(SAMPLE_TEXT, sentences, [SAMPLE_TEXT])
+        calculator.calculate_comprehensive_technical_metrics(SAMPLE_TEXT, sentences, [])
+        ReadabilityAnalyzer().calculate_readability_metrics(SAMPLE_TEXT)
+
+        stats = get_readability_cache_stats()
+        assert stats['text_misses'] == 1
+        assert stats['text_hits'] >= 4
+
+    def test_word_types_are_memoised(self):
+        get_readability_counts("the server " * 50)
+
+        stats = get_readability_cache_stats()
+        assert stats['word_types'] == 2
+        assert stats['word_misses'] == 2
+
+    def test_short_text_keeps_zero_metrics(self):
+        metrics = ReadabilityAnalyzer().calculate_readability_metrics("Too short.")
+
+        assert set(metrics.values()) == {0.0}
+        assert count_readability("   ") == ReadabilityCounts()
@@ -0,0 +1,104 @@
+"""
+Tests for the pooled Ruby AsciiDoc client.
+
+A minimal stand-in for the asciidoctor gem is put on RUBYLIB so the real
+asciidoc_parser.rb worker protocol can be exercised without the gem installed.
+"""
+
+import pytest
+import shutil
+import sys
+import os
+import time
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from structural_parsing.asciidoc.ruby_client import SimpleRubyClient, RubyWorkerPool, RubyWorkerError
+
+FAKE_ASCIIDOCTOR = '''
+module Asciidoctor
+  Node = Struct.new(:context, :source, :blocks, :attributes, :lineno, :level, :title, :style)
+  def self.load(content, **opts)
+    raise "boom" if content.include?("FAIL")
+    Node.new(:document, content, [], {}, 1, 0, nil, nil)
+  end
+end
+'''
+
+pytestmark = pytest.mark.skipif(shutil.which('ruby') is None, reason="Ruby is not installed")
+
+
+@pytest.fixture
+def fake_asciidoctor(tmp_path, monkeypatch):
+    """Expose a stub asciidoctor library to Ruby subprocesses."""
+    (tmp_path / 'asciidoctor.rb').write_text(FAKE_ASCIIDOCTOR)
+    monkeypatch.setenv('RUBYLIB', str(tmp_path))
+    return tmp_path
+
+
+class TestRubyWorkerPool:
+    """Test the long-lived Ruby worker pool."""
+    
+    def test_workers_are_reused(self, fake_asciidoctor):
+        """Consecutive parses are served by the same process."""
+        client = SimpleRubyClient(pool_size=1)
+        try:
+            first = client.run("= Title\n\nFirst", "doc.adoc")
+            pid = client.pool._workers[0].process.pid
+            second = client.run("Second ünïcode", "doc.adoc")
+            
+            assert first['success'] and second['success']
+            assert second['data']['content'] == "Second ünïcode"
+            assert client.pool._workers[0].process.pid == pid
+            assert client.get_stats()['requests'] == 2
+        finally:
+            client.shutdown()
+    
+    def test_parse_errors_are_returned(self, fake_asciidoctor):
+        """Parser failures come back as the usual error dictionary."""
+        client = SimpleRubyClient(pool_size=1)
+        try:
+            result = client.run("FAIL")
+            
+            assert result['success'] is False
+            assert 'boom' in result['error']
+        finally:
+            client.shutdown()
+    
+    def test_restart_on_crash(self, fake_asciidoctor):
+        """A dead worker is replaced before it serves the next request."""
+        client = SimpleRubyClient(pool_size=1)
+        try:
+            client.run("warm up")
+            client.pool._workers[0].process.kill()
+            time.sleep(0.1)
+            
+            result = client.run("after crash")
+            
+            assert result['success']
+            assert client.get_stats()['restarts'] == 1
+            assert client.get_stats()['alive_workers'] == 1
+        finally:
+            client.shutdown()
+    
+    def test_health_check(self, fake_asciidoctor):
+        """Health checks ping idle workers."""
+        client = SimpleRubyClient(pool_size=2)
+        try:
+            client.run("warm up")
+            
+            report = client.health_check()
+            
+            assert report['checked'] == 1
+            assert report['restarted'] == 0
+        finally:
+            client.shutdown()
+    
+    def test_shutdown_pool_rejects_requests(self, fake_asciidoctor):
+        """A shut down pool refuses new work."""
+        pool = RubyWorkerPool(SimpleRubyClient(use_worker_pool=False).ruby_script_path, size=1)
+        pool.shutdown()
+        
+        with pytest.raises(RubyWorkerError):
+            pool.run("text")
@@ -0,0 +1,144 @@
+"""
+Tests for the prebuilt rule manifest and lazy rule loading in the RulesRegistry.
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rules import RulesRegistry
+from rules import rule_manifest
+from rules.rule_manifest import (
+    DEFAULT_MANIFEST_PATH, LazyRule, LazyRuleDict,
+    compute_sources_fingerprint, load_manifest, write_manifest
+)
+
+
+def _manifest_entry(module='rules.word_usage.a_words_rule', class_name='AWordsRule'):
+    return {
+        'module': module,
+        'class_name': class_name,
+        'file': 'word_usage/a_words_rule.py',
+        'location': 'word_usage',
+        'category': 'word_usage'
+    }
+
+
+class TestRuleManifest:
+    """Test manifest helpers."""
+
+    def test_stale_manifest_is_ignored(self, tmp_path):
+        """A manifest only loads when its fingerprint matches the current sources."""
+        path = str(tmp_path / 'manifest.json')
+        assert write_manifest(path, 'abc', {'word_usage_a': _manifest_entry()})
+
+        assert load_manifest(path, 'abc')['rules']['word_usage_a']['class_name'] == 'AWordsRule'
+        assert load_manifest(path, 'other') is None
+        assert load_manifest(str(tmp_path / 'missing.json'), 'abc') is None
+
+    def test_committed_manifest_is_current(self):
+        """The shipped manifest matches the rule modules."""
+        assert load_manifest(DEFAULT_MANIFEST_PATH, compute_sources_fingerprint()) is not None
+
+    def test_cli_rebuilds_from_full_discovery(self, tmp_path, monkeypatch):
+        """python -m rules.rule_manifest ignores any existing manifest and writes a fresh one."""
+        path = str(tmp_path / 'manifest.json')
+        monkeypatch.setattr(rule_manifest, 'DEFAULT_MANIFEST_PATH', path)
+        discovered = []
+
+        def fake_discovery(registry):
+            discovered.append(registry.use_manifest)
+            registry.rule_manifest = {'word_usage_a': _manifest_entry()}
+
+        monkeypatch.setattr(RulesRegistry, '_discover_all_rules', fake_discovery)
+        rule_manifest.main()
+
+        assert discovered == [False]
+        assert list(load_manifest(path, compute_sources_fingerprint())['rules']) == ['word_usage_a']
+
+
+class TestLazyRuleDict:
+    """Test that rules are imported on first access only."""
+
+    def test_rules_import_on_first_access(self):
+        """Membership and len never import; get() imports once and keeps the instance."""
+        rules = LazyRuleDict(word_usage_a=LazyRule('word_usage_a', _manifest_entry()))
+
+        assert 'word_usage_a' in rules and len(rules) == 1
+        assert not rules.is_loaded('word_usage_a')
+
+        rule = rules.get('word_usage_a')
+        assert rule.__class__.__name__ == 'AWordsRule'
+        assert rules.is_loaded('word_usage_a')
+        assert rules['word_usage_a'] is rule
+
+    def test_failed_import_is_dropped(self):
+        """A rule whose module no longer imports is removed instead of raising."""
+        entry = _manifest_entry(module='rules.no_such_rule')
+        entry['file'] = None
+        rules = LazyRuleDict(broken=LazyRule('broken', entry))
+
+        assert rules.get('broken') is None
+        assert 'broken' not in rules
+        with pytest.raises(KeyError):
+            rules['broken']
+
+
+class TestRegistryLazyLoading:
+    """Test the RulesRegistry start-up paths."""
+
+    def test_registry_from_manifest_imports_selected_rules_only(self):
+        """With a current manifest only the rules a block selects are imported."""
+        registry = RulesRegistry(enable_consolidation=False, enable_enhanced_validation=False)
+
+        assert isinstance(registry.rules, LazyRuleDict)
+        assert registry.rules.loaded_rule_types() == []
+        assert len(registry.rules) == len(registry.rule_locations) > 0
+
+        selected = registry._get_applicable_rules('heading')
+
+        assert selected
+        assert set(registry.rules.loaded_rule_types()) == set(selected)
+        assert len(selected) < len(registry.rules)
+
+    def test_stale_manifest_is_never_rewritten(self, tmp_path, monkeypatch):
+        """An outdated manifest falls back to discovery without writing to the manifest path."""
+        path = str(tmp_path / 'manifest.json')
+        write_manifest(path, 'outdated', {'word_usage_a': _manifest_entry()})
+        with open(path, encoding='utf-8') as f:
+            shipped = f.read()
+        monkeypatch.setattr(RulesRegistry, '_discover_all_rules', lambda registry: None)
+
+        RulesRegistry(enable_consolidation=False, enable_enhanced_validation=False, manifest_path=path)
+
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == shipped
+        assert os.listdir(tmp_path) == ['manifest.json']
+
+    def test_stale_manifest_uses_cache(self, tmp_path, monkeypatch):
+        """Discovery results go to the manifest cache, which the next registry loads from."""
+        path = str(tmp_path / 'manifest.json')
+        cache_path = str(tmp_path / 'cache.json')
+        write_manifest(path, 'outdated', {'word_usage_a': _manifest_entry()})
+        discoveries = []
+
+        def fake_discovery(registry):
+            discoveries.append(registry)
+            registry.rule_manifest = {'word_usage_b': _manifest_entry(
+                'rules.word_usage.b_words_rule', 'BWordsRule')}
+
+        monkeypatch.setattr(RulesRegistry, '_discover_all_rules', fake_discovery)
+        for _ in range(2):
+            registry = RulesRegistry(enable_consolidation=False, enable_enhanced_validation=False,
+                                     manifest_path=path, manifest_cache_path=cache_path)
+
+        with open(cache_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        assert manifest['fingerprint'] == compute_sources_fingerprint()
+        assert list(manifest['rules']) == ['word_usage_b']
+        assert len(discoveries) == 1
+        assert list(registry.rules) == ['word_usage_b']
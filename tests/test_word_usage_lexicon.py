@@ -0,0 +1,93 @@
+"""
+Tests for the lexicon index shared by the word usage rules.
+"""
+
+import pytest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+spacy = pytest.importorskip("spacy")
+
+from rules.word_usage.lexicon_index import LexiconIndex, get_lexicon_index
+
+
+@pytest.fixture
+def nlp():
+    """A blank English pipeline whose lemmas are the lowercase token text."""
+    pipeline = spacy.blank("en")
+
+    @spacy.Language.component("test_lowercase_lemma")
+    def lowercase_lemma(doc):
+        for token in doc:
+            token.lemma_ = token.text.lower()
+        return doc
+
+    pipeline.add_pipe("test_lowercase_lemma")
+    return pipeline
+
+
+def _scan_phrases(doc, phrase_list):
+    """Reference implementation: scan every position for every phrase."""
+    matches = []
+    for phrase in phrase_list:
+        words = phrase.lower().split()
+        for i in range(len(doc) - len(words) + 1):
+            if [t.lemma_.lower() for t in doc[i:i + len(words)]] == words:
+                matches.append((phrase, i))
+    return matches
+
+
+class TestLexiconIndex:
+    """Test lookups against the per-Doc index."""
+
+    def test_tokens_for_in_document_order(self, nlp):
+        """Tokens matching any term come back once each, in document order."""
+        doc = nlp("Abort the job, then abort the Backup and abort again.")
+        index = LexiconIndex(doc)
+
+        tokens = index.tokens_for(["backup", "abort"])
+
+        assert [t.i for t in tokens] == sorted(t.i for t in tokens)
+        assert [t.text for t in tokens] == ["Abort", "abort", "Backup", "abort"]
+
+    def test_find_phrases_matches_full_scan(self, nlp):
+        """Phrase matches equal a full scan, including overlapping and end-of-doc matches."""
+        doc = nlp("Click on the tab. Tap on tap on it, then click on")
+        phrases = ["click on", "tap on", "on the", "on it then"]
+
+        found = [(m['phrase'], m['start_token'].i) for m in LexiconIndex(doc).find_phrases(phrases)]
+
+        assert found == _scan_phrases(doc, phrases)
+
+    def test_hyphen_starts(self, nlp):
+        """Hyphenated sequences are located without scanning every token."""
+        doc = nlp("a trade - off and a world - wide - thing -")
+        starts = LexiconIndex(doc).hyphen_starts()
+
+        assert [doc[i].text for i in starts] == ["trade", "world", "wide"]
+
+    def test_index_shared_per_doc(self, nlp):
+        """Every rule asking about the same Doc gets the same index."""
+        doc = nlp("One doc.")
+        other = nlp("One doc.")
+
+        assert get_lexicon_index(doc) is get_lexicon_index(doc)
+        assert get_lexicon_index(other) is not get_lexicon_index(doc)
+
+
+class TestWordUsageRulesUseIndex:
+    """Test that rules built on the index still flag the same words."""
+
+    def test_hyphenated_and_single_words_flagged(self, nlp):
+        """A rule finds single words, phrases and hyphenated forms via the index."""
+        from rules.word_usage.t_words_rule import TWordsRule
+
+        nlp.add_pipe("sentencizer")
+        text = "The tribe will try and tap on the trade-off screen."
+        errors = TWordsRule().analyze(text, [text], nlp, {})
+
+        flagged = {e['flagged_text'] for e in errors}
+        assert {"tribe", "try and", "tap on"} <= flagged
@@ -8,6 +8,7 @@ from .linguistic_anchors import LinguisticAnchors, AnchorMatch, AnchorAnalysis
 from .context_analyzer import ContextAnalyzer, CoreferenceMatch, SentenceStructure, SemanticCoherence, ContextAnalysis
 from .domain_classifier import DomainClassifier, ContentTypeScore, DomainIdentification, FormalityAssessment, DomainAnalysis
 from .confidence_calculator import ConfidenceCalculator, ConfidenceBreakdown, LayerContribution, ConfidenceWeights, ConfidenceLayer
+from .bounded_cache import BoundedCache
 # from .validation_pipeline import ValidationPipeline  # Future step
 
 __all__ = [
@@ -29,5 +30,6 @@ __all__ = [
     'LayerContribution',
     'ConfidenceWeights',
     'ConfidenceLayer',
+    'BoundedCache',
     # 'ValidationPipeline'
 ]
\ No newline at end of file
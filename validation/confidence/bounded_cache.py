@@ -0,0 +1,214 @@
+"""
+BoundedCache Class
+Thread-safe LRU cache with entry, byte and age limits for the confidence layers.
+
+The confidence layers and pass validators memoise spaCy Docs and analysis results
+per text. Long-running workers see an unbounded stream of distinct texts, so every
+cache evicts its least recently used entries once it holds ``max_entries`` items
+or its estimated footprint exceeds ``max_bytes``. Entries older than
+``ttl_seconds`` are treated as misses and dropped.
+
+Sizes are estimates: spaCy Docs are costed per token plus their tensor, other
+values by a bounded walk of their contents. They are meant for relative budgeting,
+not exact accounting.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Approximate per-token footprint of a parsed spaCy Doc (TokenC plus annotations)
+DOC_BYTES_PER_TOKEN = 512
+
+_MAX_SIZE_DEPTH = 6
+_MISSING = object()
+
+
+def _is_spacy_doc(value: Any) -> bool:
+    return hasattr(value, 'vocab') and hasattr(value, 'to_bytes') and hasattr(value, 'sents')
+
+
+def estimate_size(value: Any, _depth: int = 0, _seen: Optional[set] = None) -> int:
+    """Estimate the memory held by ``value`` in bytes."""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    if _is_spacy_doc(value):
+        size = sys.getsizeof(value.text) + len(value) * DOC_BYTES_PER_TOKEN
+        tensor = getattr(value, 'tensor', None)
+        return size + int(getattr(tensor, 'nbytes', 0) or 0)
+
+    if value is None or isinstance(value, (bool, int, float, Enum)):
+        return 0 if value is None or isinstance(value, Enum) else sys.getsizeof(value)
+
+    try:
+        size = sys.getsizeof(value)
+    except TypeError:
+        size = 64
+    if _depth >= _MAX_SIZE_DEPTH or isinstance(value, (str, bytes, bytearray)):
+        return size
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key, _depth + 1, _seen) + estimate_size(item, _depth + 1, _seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, _depth + 1, _seen)
+    elif hasattr(value, '__dict__'):
+        size += estimate_size(vars(value), _depth + 1, _seen)
+    return size
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    size: int
+    expires_at: Optional[float]
+
+
+class BoundedCache:
+    """
+    Least recently used cache bounded by entry count, estimated bytes and age.
+
+    Supports the subset of the dict interface the analyzers use (``in``, ``len``,
+    item access, ``get`` and ``clear``); all operations take an internal lock.
+    """
+
+    def __init__(self,
+                 max_entries: int = 1024,
+                 max_bytes: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None,
+                 size_of: Callable[[Any], int] = estimate_size,
+                 name: str = 'cache'):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum estimated footprint of all values (None for no byte limit)
+            ttl_seconds: Maximum age of an entry (None keeps entries until evicted)
+            size_of: Function estimating the size of a value in bytes
+            name: Name reported in statistics
+        """
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self._size_of = size_of
+        self._entries: 'OrderedDict[Hashable, _CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` (marking it recently used), or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key`` and evict entries beyond the limits."""
+        size = self._size_of(value) if self.max_bytes is not None else 0
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Larger than the whole budget: caching it would only flush everything else
+                self.evictions += 1
+                return
+            self._entries[key] = _CacheEntry(value, size, expires_at)
+            self._bytes += size
+            self._evict()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``key``, creating and storing it on a miss.
+
+        ``factory`` runs outside the lock, so concurrent misses for the same key
+        may both create a value; the last one stored wins.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= time.monotonic()
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.put(key, value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'name': self.name,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
@@ -13,6 +13,11 @@ from .linguistic_anchors import LinguisticAnchors, AnchorAnalysis
 from .context_analyzer import ContextAnalyzer, ContextAnalysis, ContentType, ContentTypeResult
 from .domain_classifier import DomainClassifier, DomainAnalysis
 from .rule_reliability import get_rule_reliability_coefficient
+from .bounded_cache import BoundedCache
+
+# Cache limits for final confidence breakdowns
+CALCULATION_CACHE_MAX_ENTRIES = 4096
+CALCULATION_CACHE_MAX_BYTES = 64 * 1024 * 1024
 
 
 class ConfidenceLayer(Enum):
@@ -121,7 +126,8 @@ class ConfidenceCalculator:
         self.domain_classifier = DomainClassifier(cache_classifications=enable_layer_caching)
         
         # Result cache
-        self._calculation_cache: Dict[str, ConfidenceBreakdown] = {}
+        self._calculation_cache = BoundedCache(max_entries=CALCULATION_CACHE_MAX_ENTRIES,
+                                               max_bytes=CALCULATION_CACHE_MAX_BYTES, name='confidence_calculation')
         
         # Performance tracking
         self._cache_hits = 0
@@ -152,9 +158,10 @@ class ConfidenceCalculator:
         
         # Check cache first
         cache_key = self._generate_cache_key(text, error_position, rule_type, content_type, base_confidence)
-        if self.cache_results and cache_key in self._calculation_cache:
+        cached = self._calculation_cache.get(cache_key) if self.cache_results else None
+        if cached is not None:
             self._cache_hits += 1
-            return self._calculation_cache[cache_key]
+            return cached
         
         self._cache_misses += 1
         
@@ -662,26 +669,38 @@ class ConfidenceCalculator:
         anchor_stats = self.linguistic_anchors.get_performance_stats()
         context_stats = self.context_analyzer.get_performance_stats()
         domain_stats = self.domain_classifier.get_performance_stats()
+        calculator_cache = self._calculation_cache.get_stats()
         
         return {
             'calculator_cache_hit_rate': self._cache_hits / max(1, self._cache_hits + self._cache_misses),
+            'calculator_cache_evictions': calculator_cache['evictions'],
+            'calculator_cached_bytes': calculator_cache['bytes'],
             'total_calculations': self._total_calculations,
             'layer_cache_performance': {
-                'linguistic_anchors': {
-                    'hit_rate': anchor_stats['cache_hit_rate'],
-                    'cached_results': anchor_stats['analysis_results_cached']
-                },
-                'context_analysis': {
-                    'hit_rate': context_stats['cache_hit_rate'],
-                    'cached_results': context_stats['analysis_results_cached']
-                },
-                'domain_classification': {
-                    'hit_rate': domain_stats['cache_hit_rate'],
-                    'cached_results': domain_stats['classifications_cached']
-                }
+                'linguistic_anchors': self._layer_cache_performance(
+                    anchor_stats, anchor_stats['analysis_results_cached'], [anchor_stats['analysis_cache']]
+                ),
+                'context_analysis': self._layer_cache_performance(
+                    context_stats, context_stats['analysis_results_cached'],
+                    [context_stats['nlp_cache'], context_stats['analysis_cache']]
+                ),
+                'domain_classification': self._layer_cache_performance(
+                    domain_stats, domain_stats['classifications_cached'], [domain_stats['classification_cache']]
+                )
             }
         }
     
+    @staticmethod
+    def _layer_cache_performance(layer_stats: Dict[str, Any], cached_results: int,
+                                 caches: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Summarize one layer's caches."""
+        return {
+            'hit_rate': layer_stats['cache_hit_rate'],
+            'cached_results': cached_results,
+            'evictions': sum(cache['evictions'] + cache['expirations'] for cache in caches),
+            'cached_bytes': sum(cache['bytes'] for cache in caches)
+        }
+    
     def _generate_cache_key(self, text: str, error_position: int, 
                           rule_type: Optional[str], content_type: Optional[str], 
                           base_confidence: float) -> str:
@@ -704,6 +723,7 @@ class ConfidenceCalculator:
             'cache_misses': self._cache_misses,
             'cache_hit_rate': self._cache_hits / max(1, self._cache_hits + self._cache_misses),
             'cached_calculations': len(self._calculation_cache),
+            'calculation_cache': self._calculation_cache.get_stats(),
             'current_weights': {
                 'linguistic_anchors': self.weights.linguistic_anchors,
                 'context_analysis': self.weights.context_analysis,
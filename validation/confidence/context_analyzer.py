@@ -6,7 +6,6 @@ Complements LinguisticAnchors with coreference, sentence structure, and coherenc
 
 import re
 import time
-import spacy
 from typing import Dict, List, Tuple, Optional, Any, Set
 from dataclasses import dataclass
 from pathlib import Path
@@ -14,6 +13,16 @@ from collections import defaultdict, Counter
 from enum import Enum
 from functools import lru_cache
 
+from nlp_processing import get_spacy_model
+
+from .bounded_cache import BoundedCache
+
+# Cache limits; parsed Docs dominate the footprint
+NLP_CACHE_MAX_ENTRIES = 256
+NLP_CACHE_MAX_BYTES = 128 * 1024 * 1024
+ANALYSIS_CACHE_MAX_ENTRIES = 4096
+ANALYSIS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 
 class ContentType(Enum):
     """Content type classifications for confidence normalization."""
@@ -143,14 +152,16 @@ class ContextAnalyzer:
         
         # Load spaCy model
         try:
-            self.nlp = spacy.load(spacy_model)
+            self.nlp = get_spacy_model(spacy_model)
             print(f"✓ Loaded spaCy model: {spacy_model}")
         except OSError:
             raise ValueError(f"SpaCy model '{spacy_model}' not found. Install with: python -m spacy download {spacy_model}")
         
         # Analysis caches
-        self._nlp_cache: Dict[str, Any] = {}
-        self._analysis_cache: Dict[str, ContextAnalysis] = {}
+        self._nlp_cache = BoundedCache(max_entries=NLP_CACHE_MAX_ENTRIES, max_bytes=NLP_CACHE_MAX_BYTES,
+                                       name='context_nlp')
+        self._analysis_cache = BoundedCache(max_entries=ANALYSIS_CACHE_MAX_ENTRIES,
+                                            max_bytes=ANALYSIS_CACHE_MAX_BYTES, name='context_analysis')
         
         # Discourse markers and patterns
         self._discourse_markers = self._load_discourse_markers()
@@ -239,9 +250,10 @@ class ContextAnalyzer:
         
         # Check cache first
         cache_key = f"{hash(text)}:{error_position}"
-        if cache_key in self._analysis_cache:
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
             self._cache_hits += 1
-            return self._analysis_cache[cache_key]
+            return cached
         
         self._cache_misses += 1
         
@@ -303,9 +315,10 @@ class ContextAnalyzer:
         """
         # Check cache first
         cache_key = f"content_type:{hash(text)}"
-        if cache_key in self._analysis_cache:
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
             self._cache_hits += 1
-            return self._analysis_cache[cache_key]
+            return cached
         
         self._cache_misses += 1
         
@@ -690,11 +703,7 @@ class ContextAnalyzer:
         if not self.cache_nlp_results:
             return self.nlp(text)
         
-        text_hash = hash(text)
-        if text_hash not in self._nlp_cache:
-            self._nlp_cache[text_hash] = self.nlp(text)
-        
-        return self._nlp_cache[text_hash]
+        return self._nlp_cache.get_or_create(hash(text), lambda: self.nlp(text))
     
     def _find_error_sentence(self, doc, error_position: int) -> int:
         """Find which sentence contains the error position."""
@@ -1378,7 +1387,9 @@ class ContextAnalyzer:
             'cache_misses': self._cache_misses,
             'cache_hit_rate': self._cache_hits / max(1, self._cache_hits + self._cache_misses),
             'nlp_results_cached': len(self._nlp_cache),
-            'analysis_results_cached': len(self._analysis_cache)
+            'analysis_results_cached': len(self._analysis_cache),
+            'nlp_cache': self._nlp_cache.get_stats(),
+            'analysis_cache': self._analysis_cache.get_stats()
         }
     
     def clear_caches(self) -> None:
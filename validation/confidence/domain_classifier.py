@@ -11,6 +11,12 @@ from typing import Dict, List, Tuple, Optional, Any, Set
 from dataclasses import dataclass
 from collections import Counter, defaultdict
 
+from .bounded_cache import BoundedCache
+
+# Cache limits for per-text classifications
+CLASSIFICATION_CACHE_MAX_ENTRIES = 2048
+CLASSIFICATION_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
 
 @dataclass
 class ContentTypeScore:
@@ -88,7 +94,9 @@ class DomainClassifier:
         self.cache_classifications = cache_classifications
         
         # Classification caches
-        self._classification_cache: Dict[str, DomainAnalysis] = {}
+        self._classification_cache = BoundedCache(max_entries=CLASSIFICATION_CACHE_MAX_ENTRIES,
+                                                  max_bytes=CLASSIFICATION_CACHE_MAX_BYTES,
+                                                  name='domain_classification')
         
         # Load classification patterns and indicators
         self._content_type_patterns = self._load_content_type_patterns()
@@ -292,9 +300,10 @@ class DomainClassifier:
         text_hash = hash(text)
         cache_key = str(text_hash)
         
-        if self.cache_classifications and cache_key in self._classification_cache:
+        cached = self._classification_cache.get(cache_key) if self.cache_classifications else None
+        if cached is not None:
             self._cache_hits += 1
-            return self._classification_cache[cache_key]
+            return cached
         
         self._cache_misses += 1
         
@@ -661,6 +670,7 @@ class DomainClassifier:
             'cache_misses': self._cache_misses,
             'cache_hit_rate': self._cache_hits / max(1, self._cache_hits + self._cache_misses),
             'classifications_cached': len(self._classification_cache),
+            'classification_cache': self._classification_cache.get_stats(),
             'content_types_supported': len(self._content_type_patterns),
             'domains_supported': len(self._domain_indicators)
         }
@@ -11,6 +11,11 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from ..config.linguistic_anchors_config import LinguisticAnchorsConfig
+from .bounded_cache import BoundedCache
+
+# Cache limits for per-error anchor analyses
+ANALYSIS_CACHE_MAX_ENTRIES = 4096
+ANALYSIS_CACHE_MAX_BYTES = 32 * 1024 * 1024
 
 
 @dataclass
@@ -75,7 +80,8 @@ class LinguisticAnchors:
         self.config = LinguisticAnchorsConfig(config_file)
         self.cache_compiled_patterns = cache_compiled_patterns
         self._pattern_cache: Dict[str, List[re.Pattern]] = {}
-        self._analysis_cache: Dict[str, AnchorAnalysis] = {}
+        self._analysis_cache = BoundedCache(max_entries=ANALYSIS_CACHE_MAX_ENTRIES,
+                                            max_bytes=ANALYSIS_CACHE_MAX_BYTES, name='linguistic_anchors')
         self._cache_hits = 0
         self._cache_misses = 0
         
@@ -138,9 +144,10 @@ class LinguisticAnchors:
         
         # Create cache key for repeated analyses
         cache_key = f"{hash(text)}:{error_position}:{rule_type}:{content_type}"
-        if cache_key in self._analysis_cache:
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
             self._cache_hits += 1
-            return self._analysis_cache[cache_key]
+            return cached
         
         self._cache_misses += 1
         
@@ -579,7 +586,8 @@ class LinguisticAnchors:
             'cache_misses': self._cache_misses,
             'cache_hit_rate': self._cache_hits / max(1, self._cache_hits + self._cache_misses),
             'compiled_patterns_cached': len(self._pattern_cache),
-            'analysis_results_cached': len(self._analysis_cache)
+            'analysis_results_cached': len(self._analysis_cache),
+            'analysis_cache': self._analysis_cache.get_stats()
         }
     
     def clear_caches(self) -> None:
@@ -4,6 +4,8 @@ Provides YAML configuration loading, validation, caching, and error handling.
 """
 
 import os
+import copy
+import threading
 import yaml
 import logging
 from pathlib import Path
@@ -15,6 +17,12 @@ import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Parsed YAML shared by every config instance, keyed by (path, content hash).
+# Each rule builds its own validation config objects, so without this the
+# same files were parsed once per rule when rules are first loaded.
+_parsed_yaml: Dict[tuple, Dict[str, Any]] = {}
+_parsed_yaml_lock = threading.Lock()
+
 
 class ConfigurationError(Exception):
     """Custom exception for configuration-related errors."""
@@ -153,30 +161,40 @@ class BaseConfig(ABC):
                 )
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                
-                # Handle empty files
-                if not content:
-                    logger.warning(f"Configuration file is empty: {self.config_file}")
-                    return {}
-                
-                config = yaml.safe_load(content)
-                
-                # Handle None result from yaml.safe_load
-                if config is None:
-                    logger.warning(f"Configuration file contains no data: {self.config_file}")
-                    return {}
-                
-                # Ensure we have a dictionary
-                if not isinstance(config, dict):
-                    raise ConfigurationLoadError(
-                        f"Configuration file must contain a YAML mapping/dictionary, "
-                        f"got {type(config).__name__}: {self.config_file}"
-                    )
-                
-                return config
-                
+            with open(self.config_file, 'rb') as f:
+                raw = f.read()
+            
+            key = (str(self.config_file.resolve()), hashlib.md5(raw).hexdigest())
+            with _parsed_yaml_lock:
+                cached = _parsed_yaml.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
+            content = raw.decode('utf-8').strip()
+            
+            # Handle empty files
+            if not content:
+                logger.warning(f"Configuration file is empty: {self.config_file}")
+                return {}
+            
+            config = yaml.safe_load(content)
+            
+            # Handle None result from yaml.safe_load
+            if config is None:
+                logger.warning(f"Configuration file contains no data: {self.config_file}")
+                return {}
+            
+            # Ensure we have a dictionary
+            if not isinstance(config, dict):
+                raise ConfigurationLoadError(
+                    f"Configuration file must contain a YAML mapping/dictionary, "
+                    f"got {type(config).__name__}: {self.config_file}"
+                )
+            
+            with _parsed_yaml_lock:
+                _parsed_yaml[key] = config
+            return copy.deepcopy(config)
+            
         except yaml.YAMLError as e:
             raise ConfigurationLoadError(
                 f"Failed to parse YAML configuration file {self.config_file}: {e}"
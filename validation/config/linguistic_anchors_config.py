@@ -401,7 +401,16 @@ class LinguisticAnchorsConfig(BaseConfig):
         if cache_key in self._compiled_patterns_cache:
             return self._compiled_patterns_cache[cache_key]
         
-        category = self.get_anchor_category(category_type, category_name)
+        # Read the patterns in place; get_anchor_category deep-copies every
+        # anchor, which is wasted work for each of the hundreds of lookups
+        if category_type == 'boosting':
+            anchors = self.load_config().get('confidence_boosting_anchors', {})
+        elif category_type == 'reducing':
+            anchors = self.load_config().get('confidence_reducing_anchors', {})
+        else:
+            raise ValueError(f"Invalid category_type: {category_type}")
+        
+        category = anchors.get(category_name, {})
         if anchor_name not in category:
             return []
         
@@ -18,6 +18,7 @@ from .metrics import (
     record_pipeline_execution,
     record_validation_duration
 )
+from .streaming_stats import QuantileSketch, StreamingStats
 
 __all__ = [
     'ValidationMetrics',
@@ -32,5 +33,7 @@ __all__ = [
     'record_consolidation_adjustment',
     'record_negative_evidence',
     'record_pipeline_execution',
-    'record_validation_duration'
+    'record_validation_duration',
+    'QuantileSketch',
+    'StreamingStats'
 ]
@@ -0,0 +1,131 @@
+"""
+Streaming Statistics for Validation System
+Constant-memory running aggregates (count, mean, min, max, percentiles) for
+timings and scores recorded on every validation.
+
+Percentiles come from a log-bucketed quantile sketch: each value is counted in a
+bucket whose width grows geometrically, so any percentile is reported within a
+fixed relative error (1% by default) regardless of how many values were seen.
+Sketches with the same accuracy merge by adding bucket counts, which lets
+per-validator statistics be combined into pipeline-wide ones.
+"""
+
+import math
+import threading
+from typing import Dict, Iterable, Optional
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Values at or below this are counted as zero (timings are never negative)
+MIN_TRACKED_VALUE = 1e-9
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error for non-negative values."""
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Record one value (negative values are clamped to zero)."""
+        self.count += 1
+        if value <= MIN_TRACKED_VALUE:
+            self._zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Add the values recorded by another sketch with the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0 <= q <= 1); 0.0 for an empty sketch."""
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(i-1), gamma^i] in relative terms
+                return 2 * self._gamma ** index / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+
+class StreamingStats:
+    """Thread-safe running count, mean, min, max and percentiles of a value stream."""
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self._lock = threading.Lock()
+        self._sketch = QuantileSketch(relative_accuracy)
+        self.count = 0
+        self.total = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """Record one value."""
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self.minimum = value if self.minimum is None else min(self.minimum, value)
+            self.maximum = value if self.maximum is None else max(self.maximum, value)
+            self._sketch.add(value)
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: 'StreamingStats') -> None:
+        """Add everything recorded by ``other``."""
+        with other._lock:
+            count, total = other.count, other.total
+            minimum, maximum = other.minimum, other.maximum
+            sketch = QuantileSketch(other._sketch.relative_accuracy)
+            sketch.merge(other._sketch)
+        with self._lock:
+            self.count += count
+            self.total += total
+            if minimum is not None:
+                self.minimum = minimum if self.minimum is None else min(self.minimum, minimum)
+                self.maximum = maximum if self.maximum is None else max(self.maximum, maximum)
+            self._sketch.merge(sketch)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a percentile (0-100), clamped to the observed range."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            value = self._sketch.quantile(percent / 100.0)
+            return min(max(value, self.minimum), self.maximum)
+
+    def summary(self, scale: float = 1.0) -> Dict[str, float]:
+        """Count, mean, min, max and P50/P95/P99, with values multiplied by ``scale``."""
+        return {
+            'count': self.count,
+            'mean': self.mean * scale,
+            'min': (self.minimum or 0.0) * scale,
+            'max': (self.maximum or 0.0) * scale,
+            'p50': self.percentile(50) * scale,
+            'p95': self.percentile(95) * scale,
+            'p99': self.percentile(99) * scale
+        }
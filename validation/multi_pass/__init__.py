@@ -7,7 +7,7 @@ Provides base classes and interfaces for multi-pass error validation.
 from .base_validator import (
     BasePassValidator, ValidationDecision, ValidationConfidence,
     ValidationEvidence, ValidationResult, ValidationContext,
-    ValidationPerformanceMetrics, ValidationError, ValidationConfigError
+    ValidationPerformanceMetrics, ValidationError, ValidationCancelledError, ValidationConfigError
 )
 
 # Import concrete validators
@@ -28,6 +28,7 @@ __all__ = [
     'ValidationContext',
     'ValidationPerformanceMetrics',
     'ValidationError',
+    'ValidationCancelledError',
     'ValidationConfigError',
     'MorphologicalValidator',
     'ContextValidator',
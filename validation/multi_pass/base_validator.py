@@ -4,13 +4,21 @@ Abstract base class for all multi-pass validation components.
 Defines the interface and common functionality for validation passes.
 """
 
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Optional, Any, Union
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
 from ..confidence.confidence_calculator import ConfidenceCalculator, ConfidenceBreakdown
+from ..monitoring.streaming_stats import StreamingStats
+from .text_profile import get_text_profile, new_namespace
+
+# Number of recent per-validation samples kept alongside the running aggregates
+MAX_RECENT_SAMPLES = 1000
 
 
 class ValidationDecision(Enum):
@@ -100,10 +108,15 @@ class ValidationContext:
 
 @dataclass
 class ValidationPerformanceMetrics:
-    """Performance metrics for validation operations."""
+    """
+    Performance metrics for validation operations.
+    
+    Averages and percentiles cover every validation; the raw times and scores
+    are kept only for the most recent MAX_RECENT_SAMPLES validations.
+    """
     
     total_validations: int = 0             # Total number of validations performed
-    validation_times: List[float] = field(default_factory=list)  # Individual validation times
+    validation_times: Deque[float] = field(default_factory=lambda: deque(maxlen=MAX_RECENT_SAMPLES))  # Recent validation times
     
     # Decision statistics
     decisions_made: Dict[ValidationDecision, int] = field(default_factory=lambda: {
@@ -113,7 +126,14 @@ class ValidationPerformanceMetrics:
     })
     
     # Confidence statistics
-    confidence_scores: List[float] = field(default_factory=list)
+    confidence_scores: Deque[float] = field(default_factory=lambda: deque(maxlen=MAX_RECENT_SAMPLES))
+    
+    # Running aggregates over all validations
+    validation_time_stats: StreamingStats = field(default_factory=StreamingStats)
+    confidence_stats: StreamingStats = field(default_factory=StreamingStats)
+    recent_decisions: Deque[Tuple[ValidationDecision, float]] = field(
+        default_factory=lambda: deque(maxlen=MAX_RECENT_SAMPLES)
+    )
     
     # Error tracking
     validation_errors: int = 0             # Number of validation errors encountered
@@ -124,18 +144,17 @@ class ValidationPerformanceMetrics:
         self.validation_times.append(result.validation_time)
         self.decisions_made[result.decision] += 1
         self.confidence_scores.append(result.confidence_score)
+        self.validation_time_stats.add(result.validation_time)
+        self.confidence_stats.add(result.confidence_score)
+        self.recent_decisions.append((result.decision, result.confidence_score))
     
     def get_average_validation_time(self) -> float:
         """Get average validation time in seconds."""
-        if not self.validation_times:
-            return 0.0
-        return sum(self.validation_times) / len(self.validation_times)
+        return self.validation_time_stats.mean
     
     def get_average_confidence(self) -> float:
         """Get average confidence score."""
-        if not self.confidence_scores:
-            return 0.0
-        return sum(self.confidence_scores) / len(self.confidence_scores)
+        return self.confidence_stats.mean
     
     def get_decision_rate(self, decision: ValidationDecision) -> float:
         """Get the rate of a specific decision type."""
@@ -144,20 +163,15 @@ class ValidationPerformanceMetrics:
         return self.decisions_made[decision] / self.total_validations
     
     def get_decisiveness_rate(self, min_confidence: float = 0.7) -> float:
-        """Get the rate of decisive decisions (not uncertain and high confidence)."""
-        if self.total_validations == 0:
+        """Get the rate of decisive decisions (not uncertain and high confidence) among recent validations."""
+        if not self.recent_decisions:
             return 0.0
         
-        decisive_count = 0
-        for i, decision in enumerate([ValidationDecision.ACCEPT, ValidationDecision.REJECT, ValidationDecision.UNCERTAIN]):
-            if decision != ValidationDecision.UNCERTAIN:
-                # Count decisions with sufficient confidence
-                start_idx = sum(self.decisions_made[d] for d in list(ValidationDecision)[:list(ValidationDecision).index(decision)])
-                end_idx = start_idx + self.decisions_made[decision]
-                decision_confidences = self.confidence_scores[start_idx:end_idx]
-                decisive_count += sum(1 for conf in decision_confidences if conf >= min_confidence)
-        
-        return decisive_count / self.total_validations
+        decisive_count = sum(
+            1 for decision, confidence in self.recent_decisions
+            if decision != ValidationDecision.UNCERTAIN and confidence >= min_confidence
+        )
+        return decisive_count / len(self.recent_decisions)
 
 
 class BasePassValidator(ABC):
@@ -197,8 +211,13 @@ class BasePassValidator(ABC):
         self.config: Dict[str, Any] = {}
         
         # Validation history for debugging
-        self.validation_history: List[ValidationResult] = []
-        self.max_history_size = 1000  # Prevent memory bloat
+        self.validation_history: Deque[ValidationResult] = deque(maxlen=1000)  # Prevent memory bloat
+        
+        # Per-thread state of the batch currently being validated
+        self._batch_local = threading.local()
+        
+        # Prefix for this validator's features in shared text profiles
+        self._profile_namespace = new_namespace()
     
     @abstractmethod
     def _validate_error(self, context: ValidationContext) -> ValidationResult:
@@ -216,16 +235,22 @@ class BasePassValidator(ABC):
         """
         pass
     
-    def validate_error(self, context: ValidationContext) -> ValidationResult:
+    def validate_error(self, context: ValidationContext,
+                       cancel_event: Optional[threading.Event] = None) -> ValidationResult:
         """
         Public interface for error validation with performance tracking.
         
         Args:
             context: Validation context containing error and metadata
+            cancel_event: Set by the pipeline once this validation is no longer needed
             
         Returns:
             ValidationResult with decision and supporting evidence
+            
+        Raises:
+            ValidationCancelledError: If ``cancel_event`` is set before validation starts
         """
+        self._check_cancelled(cancel_event)
         start_time = time.time()
         
         try:
@@ -272,6 +297,89 @@ class BasePassValidator(ABC):
             self._add_to_history(error_result)
             return error_result
     
+    def validate_errors(self, contexts: List[ValidationContext],
+                        shared: Optional[Dict[str, Any]] = None,
+                        cancel_event: Optional[threading.Event] = None) -> List[ValidationResult]:
+        """
+        Validate a batch of errors in one pass.
+        
+        Analysis that depends only on the text (such as the SpaCy parse) is
+        prepared once for the whole batch by _prepare_batch; each error is then
+        validated exactly as validate_error would.
+        
+        Args:
+            contexts: Validation contexts, typically all errors found in one block
+            shared: Analysis shared with the other validators of the same batch
+            cancel_event: Set by the pipeline once this batch is no longer needed;
+                checked after preparation and before each error
+            
+        Returns:
+            One ValidationResult per context, in the same order
+            
+        Raises:
+            ValidationCancelledError: If ``cancel_event`` is set before the batch is done
+        """
+        if shared is None:
+            shared = {}
+        
+        self._check_cancelled(cancel_event)
+        try:
+            batch_documents = self._prepare_batch(contexts, shared) or {}
+        except Exception:
+            # Preparation is an optimization; validate errors individually instead
+            batch_documents = {}
+        
+        self._batch_local.documents = batch_documents
+        try:
+            return [self.validate_error(context, cancel_event) for context in contexts]
+        finally:
+            self._batch_local.documents = {}
+    
+    def _check_cancelled(self, cancel_event: Optional[threading.Event]) -> None:
+        """Raise ValidationCancelledError if ``cancel_event`` has been set."""
+        if cancel_event is not None and cancel_event.is_set():
+            raise ValidationCancelledError(f"{self.validator_name} validation cancelled", self.validator_name)
+    
+    def _prepare_batch(self, contexts: List[ValidationContext], shared: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Precompute analysis for a batch. Override in validators that parse text.
+        
+        Returns:
+            Parsed documents keyed by text, consulted via _get_batch_document
+        """
+        return {}
+    
+    def _get_batch_document(self, text: str) -> Optional[Any]:
+        """Document prepared for ``text`` by the batch being validated, if any."""
+        documents = getattr(self._batch_local, 'documents', None)
+        return documents.get(text) if documents else None
+    
+    def _get_text_feature(self, text: str, key: Any, compute) -> Any:
+        """
+        Document-level feature of ``text``, computed once per text.
+        
+        Use for analysis that depends only on the text and ``key``, not on the
+        error being validated; every validation of the same text then reuses
+        it. The returned value is shared and must not be mutated.
+        """
+        namespace = getattr(self, '_profile_namespace', None)
+        if namespace is None:
+            namespace = self._profile_namespace = new_namespace()
+        return get_text_profile(text).get((namespace, key), compute)
+    
+    def _parse_batch_texts(self, nlp, contexts: List[ValidationContext], shared: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse every distinct text of a batch once with ``nlp``.
+        
+        Documents are stored in ``shared`` per pipeline, so validators that use
+        the same SpaCy model reuse each other's parses.
+        """
+        documents = shared.setdefault('documents', {}).setdefault(id(nlp), {})
+        texts = list(dict.fromkeys(context.text for context in contexts if context.text not in documents))
+        if texts:
+            documents.update(zip(texts, nlp.pipe(texts)))
+        return documents
+    
     def calculate_confidence_score(self, context: ValidationContext) -> ConfidenceBreakdown:
         """
         Calculate confidence score using the integrated confidence calculator.
@@ -301,13 +409,19 @@ class BasePassValidator(ABC):
         else:
             return ValidationConfidence.LOW
     
+    @property
+    def max_history_size(self) -> int:
+        """Capacity of the validation history ring buffer."""
+        return self.validation_history.maxlen
+    
+    @max_history_size.setter
+    def max_history_size(self, size: int) -> None:
+        # Resize the ring buffer, keeping the most recent results
+        self.validation_history = deque(self.validation_history, maxlen=max(1, size))
+    
     def _add_to_history(self, result: ValidationResult) -> None:
-        """Add validation result to history with size management."""
+        """Add validation result to history; the ring buffer drops the oldest beyond max_history_size."""
         self.validation_history.append(result)
-        
-        # Maintain history size limit
-        if len(self.validation_history) > self.max_history_size:
-            self.validation_history = self.validation_history[-self.max_history_size:]
     
     def get_performance_metrics(self) -> ValidationPerformanceMetrics:
         """Get performance metrics for this validator."""
@@ -321,6 +435,7 @@ class BasePassValidator(ABC):
             "validator_name": self.validator_name,
             "total_validations": metrics.total_validations,
             "average_validation_time": metrics.get_average_validation_time(),
+            "validation_time_ms": metrics.validation_time_stats.summary(scale=1000),
             "average_confidence": metrics.get_average_confidence(),
             "decision_rates": {
                 "accept_rate": metrics.get_decision_rate(ValidationDecision.ACCEPT),
@@ -335,7 +450,7 @@ class BasePassValidator(ABC):
     def clear_performance_metrics(self) -> None:
         """Clear performance metrics and history."""
         self.performance_metrics = ValidationPerformanceMetrics()
-        self.validation_history = []
+        self.validation_history = deque(maxlen=self.max_history_size)
     
     def set_config(self, config: Dict[str, Any]) -> None:
         """Set configuration for this validator."""
@@ -350,13 +465,12 @@ class BasePassValidator(ABC):
         
         if "max_history_size" in config:
             self.max_history_size = config["max_history_size"]
-            # Trim history if needed
-            if len(self.validation_history) > self.max_history_size:
-                self.validation_history = self.validation_history[-self.max_history_size:]
     
     def get_recent_validations(self, limit: int = 10) -> List[ValidationResult]:
         """Get recent validation results for debugging."""
-        return self.validation_history[-limit:] if self.validation_history else []
+        recent = list(islice(reversed(self.validation_history), limit))
+        recent.reverse()
+        return recent
     
     def get_validation_statistics(self) -> Dict[str, Any]:
         """Get detailed validation statistics."""
@@ -445,6 +559,15 @@ class ValidationError(Exception):
         super().__init__(message)
 
 
+class ValidationCancelledError(Exception):
+    """Exception raised when the pipeline cancels a validation that is no longer needed."""
+    
+    def __init__(self, message: str, validator_name: str = None):
+        self.message = message
+        self.validator_name = validator_name
+        super().__init__(message)
+
+
 class ValidationConfigError(Exception):
     """Exception raised when validator configuration is invalid."""
     
@@ -5,16 +5,24 @@ Uses discourse analysis to validate errors based on contextual appropriateness a
 """
 
 import time
-import spacy
 from typing import Dict, List, Tuple, Optional, Any, Set
 from dataclasses import dataclass
 from collections import defaultdict, Counter
 import re
 
+from nlp_processing import (
+    get_spacy_model, sentence_count, sentence_index_at_char, sentence_spans, token_index_at_char
+)
+
 from ..base_validator import (
     BasePassValidator, ValidationDecision, ValidationConfidence,
     ValidationEvidence, ValidationResult, ValidationContext
 )
+from ...confidence.bounded_cache import BoundedCache
+
+# Parsed Docs kept per validator
+ANALYSIS_CACHE_MAX_ENTRIES = 256
+ANALYSIS_CACHE_MAX_BYTES = 128 * 1024 * 1024
 
 
 @dataclass
@@ -120,17 +128,18 @@ class ContextValidator(BasePassValidator):
         
         # Load SpaCy model
         try:
-            self.nlp = spacy.load(spacy_model)
+            self.nlp = get_spacy_model(spacy_model)
             print(f"✓ Loaded SpaCy model: {spacy_model}")
         except OSError:
             try:
-                self.nlp = spacy.load("en_core_web_sm")
+                self.nlp = get_spacy_model("en_core_web_sm")
                 print(f"⚠️ Fallback: Loaded en_core_web_sm instead of {spacy_model}")
             except OSError:
                 raise RuntimeError(f"Could not load SpaCy model {spacy_model} or fallback model")
         
         # Analysis cache
-        self._analysis_cache: Dict[str, Any] = {}
+        self._analysis_cache = BoundedCache(max_entries=ANALYSIS_CACHE_MAX_ENTRIES,
+                                            max_bytes=ANALYSIS_CACHE_MAX_BYTES, name='context_validation')
         self._cache_hits = 0
         self._cache_misses = 0
         
@@ -284,9 +293,12 @@ class ContextValidator(BasePassValidator):
                 if coreference_analysis:
                     evidence.append(self._create_coreference_evidence(coreference_analysis, context))
             
-            # 2. Discourse flow analysis
+            # 2. Discourse flow analysis (depends only on the sentence window)
             if self.enable_discourse_analysis:
-                discourse_analysis = self._analyze_discourse_flow(error_context, context)
+                discourse_analysis = self._get_window_feature(
+                    context, error_context, ('discourse_flow',),
+                    lambda: self._analyze_discourse_flow(error_context, context)
+                )
                 if discourse_analysis:
                     evidence.append(self._create_discourse_evidence(discourse_analysis, context))
             
@@ -318,7 +330,7 @@ class ContextValidator(BasePassValidator):
                 validation_time=time.time() - start_time,
                 metadata={
                     'context_window_size': self.context_window_size,
-                    'sentence_count': len(list(doc.sents)),
+                    'sentence_count': sentence_count(doc),
                     'analysis_types_used': [e.evidence_type for e in evidence],
                     'spacy_model': self.spacy_model_name,
                     'contextual_features_detected': len(evidence)
@@ -490,14 +502,21 @@ class ContextValidator(BasePassValidator):
         
         return None
     
+    def _prepare_batch(self, contexts: List[ValidationContext], shared: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse each distinct text of the batch once."""
+        return self._parse_batch_texts(self.nlp, contexts, shared)
+    
     def _analyze_text_with_context(self, text: str):
         """Analyze text with SpaCy, using cache if enabled."""
-        if self.cache_analysis_results and text in self._analysis_cache:
+        cached = self._analysis_cache.get(text) if self.cache_analysis_results else None
+        if cached is not None:
             self._cache_hits += 1
-            return self._analysis_cache[text]
+            return cached
         
         self._cache_misses += 1
-        doc = self.nlp(text)
+        doc = self._get_batch_document(text)
+        if doc is None:
+            doc = self.nlp(text)
         
         if self.cache_analysis_results:
             self._analysis_cache[text] = doc
@@ -507,40 +526,47 @@ class ContextValidator(BasePassValidator):
     def _extract_contextual_information(self, doc, error_position: int, error_text: str) -> Optional[Dict[str, Any]]:
         """Extract contextual information around the error."""
         # Find the sentence containing the error
-        error_sent = None
-        for sent in doc.sents:
-            if sent.start_char <= error_position <= sent.end_char:
-                error_sent = sent
-                break
+        error_sent_idx = sentence_index_at_char(doc, error_position)
         
-        if not error_sent:
+        if error_sent_idx is None:
             return None
         
         # Get surrounding sentences for context
-        sentences = list(doc.sents)
-        error_sent_idx = sentences.index(error_sent)
-        
         context_start = max(0, error_sent_idx - self.context_window_size)
-        context_end = min(len(sentences), error_sent_idx + self.context_window_size + 1)
+        context_end = min(sentence_count(doc), error_sent_idx + self.context_window_size + 1)
         
-        context_sentences = sentences[context_start:context_end]
+        context_sentences = sentence_spans(doc, context_start, context_end)
+        error_sent = context_sentences[error_sent_idx - context_start]
         
         # Find the error token
         error_token = None
-        for token in error_sent:
-            if token.idx <= error_position <= token.idx + len(token.text):
-                error_token = token
-                break
+        token_index = token_index_at_char(doc, error_position, include_end=True)
+        if token_index is not None and error_sent.start <= token_index < error_sent.end:
+            error_token = doc[token_index]
         
         return {
             'error_sentence': error_sent,
             'error_token': error_token,
             'context_sentences': context_sentences,
-            'preceding_sentences': sentences[context_start:error_sent_idx],
-            'following_sentences': sentences[error_sent_idx + 1:context_end],
+            'preceding_sentences': context_sentences[:error_sent_idx - context_start],
+            'following_sentences': context_sentences[error_sent_idx - context_start + 1:],
+            'context_window': (context_start, context_end),
             'full_doc': doc
         }
     
+    def _get_window_feature(self, validation_context: ValidationContext, error_context: Dict[str, Any],
+                            key: Tuple, compute) -> Any:
+        """
+        Feature of the error's sentence window, computed once per text and window.
+        
+        Errors in the same sentence share a window, so analysis that depends
+        only on the window sentences (and ``key``) is reused between them.
+        """
+        window = error_context.get('context_window')
+        if window is None:
+            return compute()
+        return self._get_text_feature(validation_context.text, key + (window,), compute)
+    
     def _analyze_coreference(self, error_context: Dict[str, Any], validation_context: ValidationContext) -> Optional[CoreferenceValidation]:
         """Analyze coreference and pronoun resolution."""
         start_time = time.time()
@@ -644,23 +670,19 @@ class ContextValidator(BasePassValidator):
             context_sentences = error_context.get('context_sentences', [])
             error_token = error_context.get('error_token')
             
-            # Identify primary semantic field
-            semantic_field = self._identify_semantic_field(context_sentences)
-            
-            # Check semantic consistency
-            consistency_score = self._assess_semantic_consistency(context_sentences, semantic_field)
-            
-            # Find conflicting terms
-            conflicting_terms = self._find_semantic_conflicts(context_sentences, semantic_field)
+            # Window-level semantics, shared by errors in the same window
+            (semantic_field, consistency_score, conflicting_terms,
+             register_consistency, terminology_alignment) = self._get_window_feature(
+                validation_context, error_context, ('semantics',),
+                lambda: self._analyze_window_semantics(context_sentences)
+            )
             
             # Assess domain coherence
-            domain_coherence = self._assess_domain_coherence(context_sentences, validation_context)
-            
-            # Check register consistency
-            register_consistency = self._assess_register_consistency(context_sentences)
-            
-            # Evaluate terminology alignment
-            terminology_alignment = self._assess_terminology_alignment(context_sentences, semantic_field)
+            domain_coherence = self._get_window_feature(
+                validation_context, error_context,
+                ('domain_coherence', validation_context.domain or validation_context.content_type),
+                lambda: self._assess_domain_coherence(context_sentences, validation_context)
+            )
             
             # Detect semantic anomalies
             semantic_anomalies = self._detect_semantic_anomalies(context_sentences, error_token)
@@ -668,7 +690,7 @@ class ContextValidator(BasePassValidator):
             analysis = SemanticConsistencyCheck(
                 semantic_field=semantic_field,
                 consistency_score=consistency_score,
-                conflicting_terms=conflicting_terms,
+                conflicting_terms=list(conflicting_terms),
                 domain_coherence=domain_coherence,
                 register_consistency=register_consistency,
                 terminology_alignment=terminology_alignment,
@@ -689,27 +711,17 @@ class ContextValidator(BasePassValidator):
             context_sentences = error_context.get('context_sentences', [])
             error_token = error_context.get('error_token')
             
-            # Detect formality level
-            formality_level = self._detect_formality_level(context_sentences)
-            
-            # Assess audience appropriateness
-            audience_appropriateness = self._assess_audience_appropriateness(context_sentences, validation_context)
-            
-            # Check style consistency
-            style_consistency = self._assess_style_consistency(context_sentences, validation_context)
-            
-            # Evaluate tone alignment
-            tone_alignment = self._assess_tone_alignment(context_sentences, validation_context)
-            
-            # Check register appropriateness
-            register_appropriateness = self._assess_register_appropriateness(context_sentences, validation_context)
+            # Window-level assessments depend on the content and rule type, not the error
+            (formality_level, audience_appropriateness, style_consistency, tone_alignment,
+             register_appropriateness, appropriateness_factors) = self._get_window_feature(
+                validation_context, error_context,
+                ('appropriateness', validation_context.content_type, validation_context.rule_type),
+                lambda: self._analyze_window_appropriateness(context_sentences, validation_context)
+            )
             
             # Detect context mismatch
             context_mismatch = self._detect_context_mismatch(context_sentences, error_token, validation_context)
             
-            # Identify appropriateness factors
-            appropriateness_factors = self._identify_appropriateness_factors(context_sentences, validation_context)
-            
             analysis = ContextualAppropriateness(
                 formality_level=formality_level,
                 audience_appropriateness=audience_appropriateness,
@@ -717,7 +729,7 @@ class ContextValidator(BasePassValidator):
                 tone_alignment=tone_alignment,
                 register_appropriateness=register_appropriateness,
                 context_mismatch=context_mismatch,
-                appropriateness_factors=appropriateness_factors
+                appropriateness_factors=list(appropriateness_factors)
             )
             
             self._analysis_times['appropriateness_assessment'].append(time.time() - start_time)
@@ -726,6 +738,41 @@ class ContextValidator(BasePassValidator):
         except Exception:
             return None
     
+    def _analyze_window_semantics(self, context_sentences) -> Tuple[str, float, Tuple[str, ...], float, float]:
+        """Semantic field, consistency, conflicts, register and terminology scores of a window."""
+        # Identify primary semantic field
+        semantic_field = self._identify_semantic_field(context_sentences)
+        
+        return (
+            semantic_field,
+            # Check semantic consistency
+            self._assess_semantic_consistency(context_sentences, semantic_field),
+            # Find conflicting terms
+            tuple(self._find_semantic_conflicts(context_sentences, semantic_field)),
+            # Check register consistency
+            self._assess_register_consistency(context_sentences),
+            # Evaluate terminology alignment
+            self._assess_terminology_alignment(context_sentences, semantic_field)
+        )
+    
+    def _analyze_window_appropriateness(self, context_sentences,
+                                        validation_context: ValidationContext) -> Tuple[str, float, float, float, float, Tuple[str, ...]]:
+        """Formality, audience, style, tone, register and factor assessments of a window."""
+        return (
+            # Detect formality level
+            self._detect_formality_level(context_sentences),
+            # Assess audience appropriateness
+            self._assess_audience_appropriateness(context_sentences, validation_context),
+            # Check style consistency
+            self._assess_style_consistency(context_sentences, validation_context),
+            # Evaluate tone alignment
+            self._assess_tone_alignment(context_sentences, validation_context),
+            # Check register appropriateness
+            self._assess_register_appropriateness(context_sentences, validation_context),
+            # Identify appropriateness factors
+            tuple(self._identify_appropriateness_factors(context_sentences, validation_context))
+        )
+    
     # Helper methods for coreference analysis
     def _is_pronoun(self, token_text: str) -> bool:
         """Check if a token is a pronoun."""
@@ -1661,7 +1708,9 @@ class ContextValidator(BasePassValidator):
                 "cached_analyses": len(self._analysis_cache),
                 "cache_hits": self._cache_hits,
                 "cache_misses": self._cache_misses,
-                "hit_rate": self._get_cache_hit_rate()
+                "hit_rate": self._get_cache_hit_rate(),
+                "evictions": self._analysis_cache.evictions + self._analysis_cache.expirations,
+                "cached_bytes": self._analysis_cache.get_stats()['bytes']
             },
             "analysis_performance": {
                 analysis_type: {
@@ -16,6 +16,13 @@ from ..base_validator import (
     ValidationEvidence, ValidationResult, ValidationContext
 )
 
+from ..text_profile import text_digest
+from ...confidence.bounded_cache import BoundedCache
+
+# Domain analyses kept per validator
+DOMAIN_CACHE_MAX_ENTRIES = 2048
+DOMAIN_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
 # Import domain classification capability from confidence system
 try:
     from ...confidence import DomainClassifier, DomainAnalysis
@@ -137,7 +144,8 @@ class DomainValidator(BasePassValidator):
                 print(f"⚠️ Could not initialize domain classifier: {e}")
         
         # Analysis cache
-        self._domain_cache: Dict[str, Any] = {}
+        self._domain_cache = BoundedCache(max_entries=DOMAIN_CACHE_MAX_ENTRIES, max_bytes=DOMAIN_CACHE_MAX_BYTES,
+                                          name='domain_validation')
         self._cache_hits = 0
         self._cache_misses = 0
         
@@ -554,10 +562,11 @@ class DomainValidator(BasePassValidator):
         """Get domain analysis using domain classifier or fallback methods."""
         
         # Check cache first
-        cache_key = f"{text[:100]}_{content_type or 'unknown'}"
-        if self.cache_domain_analyses and cache_key in self._domain_cache:
+        cache_key = f"{text_digest(text)}_{content_type or 'unknown'}"
+        cached = self._domain_cache.get(cache_key) if self.cache_domain_analyses else None
+        if cached is not None:
             self._cache_hits += 1
-            return self._domain_cache[cache_key]
+            return cached
         
         self._cache_misses += 1
         
@@ -679,14 +688,24 @@ class DomainValidator(BasePassValidator):
             expected_precision = domain_info.get('precision_level', 'medium')
             actual_precision = self._assess_terminology_precision(error_text, context.text, primary_domain)
             
-            # Check terminology consistency
-            terminology_consistency = self._check_terminology_consistency(context.text, primary_domain)
+            # Document-level terminology features, shared by every error in the text
+            text = context.text
+            terminology_consistency = self._get_text_feature(
+                text, ('terminology_consistency', primary_domain),
+                lambda: self._check_terminology_consistency(text, primary_domain)
+            )
             
             # Find inappropriate terms
-            inappropriate_terms = self._find_inappropriate_terms(context.text, primary_domain)
+            inappropriate_terms = list(self._get_text_feature(
+                text, ('inappropriate_terms', primary_domain),
+                lambda: self._find_inappropriate_terms(text, primary_domain)
+            ))
             
             # Identify missing terminology
-            missing_terminology = self._identify_missing_terminology(context.text, primary_domain, context.rule_type)
+            missing_terminology = list(self._get_text_feature(
+                text, ('missing_terminology', primary_domain, context.rule_type),
+                lambda: self._identify_missing_terminology(text, primary_domain, context.rule_type)
+            ))
             
             # Generate alternative suggestions
             alternative_suggestions = self._generate_terminology_alternatives(error_text, primary_domain)
@@ -720,7 +739,10 @@ class DomainValidator(BasePassValidator):
             domain_expectations = self.domain_style_expectations.get(primary_domain, self.domain_style_expectations['general'])
             
             # Detect actual style features
-            detected_features = self._detect_style_features(context.text)
+            text = context.text
+            detected_features = dict(self._get_text_feature(
+                text, 'style_features', lambda: self._detect_style_features(text)
+            ))
             
             # Calculate consistency score
             consistency_score = self._calculate_style_consistency(domain_expectations, detected_features)
@@ -735,15 +757,16 @@ class DomainValidator(BasePassValidator):
             )
             
             # Check structure appropriateness
-            structure_appropriateness = self._assess_structure_appropriateness(
-                domain_expectations, detected_features, context.text
+            structure_appropriateness = self._get_text_feature(
+                text, ('structure_appropriateness', primary_domain),
+                lambda: self._assess_structure_appropriateness(domain_expectations, detected_features, text)
             )
             
             # Assess tone consistency
-            tone_consistency = self._assess_tone_consistency(
-                domain_expectations.get('tone', 'neutral'),
-                detected_features.get('tone', 'neutral'),
-                context.text
+            expected_tone = domain_expectations.get('tone', 'neutral')
+            tone_consistency = self._get_text_feature(
+                text, ('tone_consistency', expected_tone),
+                lambda: self._assess_tone_consistency(expected_tone, detected_features.get('tone', 'neutral'), text)
             )
             
             # Generate style recommendations
@@ -780,19 +803,34 @@ class DomainValidator(BasePassValidator):
             target_audience = self._determine_target_audience(primary_domain, content_type, context)
             
             # Assess content accessibility
-            content_accessibility = self._assess_content_accessibility(context.text, target_audience)
+            text = context.text
+            content_accessibility = self._get_text_feature(
+                text, ('content_accessibility', target_audience),
+                lambda: self._assess_content_accessibility(text, target_audience)
+            )
             
             # Check technical level match
-            technical_level_match = self._check_technical_level_match(context.text, target_audience)
+            technical_level_match = self._get_text_feature(
+                text, ('technical_level_match', target_audience),
+                lambda: self._check_technical_level_match(text, target_audience)
+            )
             
             # Assess language complexity
-            language_complexity = self._assess_language_complexity(context.text)
+            language_complexity = self._get_text_feature(
+                text, 'language_complexity', lambda: self._assess_language_complexity(text)
+            )
             
             # Identify assumed knowledge
-            assumed_knowledge = self._identify_assumed_knowledge(context.text, primary_domain)
+            assumed_knowledge = list(self._get_text_feature(
+                text, ('assumed_knowledge', primary_domain),
+                lambda: self._identify_assumed_knowledge(text, primary_domain)
+            ))
             
             # Find accessibility barriers
-            accessibility_barriers = self._find_accessibility_barriers(context.text, target_audience)
+            accessibility_barriers = list(self._get_text_feature(
+                text, ('accessibility_barriers', target_audience),
+                lambda: self._find_accessibility_barriers(text, target_audience)
+            ))
             
             # Calculate overall appropriateness score
             appropriateness_score = self._calculate_audience_appropriateness(
@@ -1328,7 +1366,7 @@ class DomainValidator(BasePassValidator):
         audience_info = self.audience_criteria.get(target_audience, self.audience_criteria['general_audience'])
         
         # Check for overly complex language
-        complexity = self._assess_language_complexity(text)
+        complexity = self._get_text_feature(text, 'language_complexity', lambda: self._assess_language_complexity(text))
         expected_complexity = 'simple' if audience_info.get('technical_level') == 'minimal' else 'moderate'
         
         if complexity == 'highly_complex' and expected_complexity in ['simple', 'moderate']:
@@ -1704,7 +1742,9 @@ class DomainValidator(BasePassValidator):
                 "cached_analyses": len(self._domain_cache),
                 "cache_hits": self._cache_hits,
                 "cache_misses": self._cache_misses,
-                "hit_rate": self._get_cache_hit_rate()
+                "hit_rate": self._get_cache_hit_rate(),
+                "evictions": self._domain_cache.evictions + self._domain_cache.expirations,
+                "cached_bytes": self._domain_cache.get_stats()['bytes']
             },
             "analysis_performance": {
                 analysis_type: {
@@ -5,15 +5,21 @@ Uses NLP analysis to validate errors based on linguistic structure.
 """
 
 import time
-import spacy
 from typing import Dict, List, Tuple, Optional, Any, Set
 from dataclasses import dataclass
 from collections import defaultdict
 
+from nlp_processing import closest_token_index, get_spacy_model
+
 from ..base_validator import (
     BasePassValidator, ValidationDecision, ValidationConfidence,
     ValidationEvidence, ValidationResult, ValidationContext
 )
+from ...confidence.bounded_cache import BoundedCache
+
+# Parsed Docs kept per validator
+NLP_CACHE_MAX_ENTRIES = 256
+NLP_CACHE_MAX_BYTES = 128 * 1024 * 1024
 
 
 @dataclass
@@ -97,18 +103,19 @@ class MorphologicalValidator(BasePassValidator):
         
         # Load SpaCy model
         try:
-            self.nlp = spacy.load(spacy_model)
+            self.nlp = get_spacy_model(spacy_model)
             print(f"✓ Loaded SpaCy model: {spacy_model}")
         except OSError:
             # Fallback to smaller model or raise error
             try:
-                self.nlp = spacy.load("en_core_web_sm")
+                self.nlp = get_spacy_model("en_core_web_sm")
                 print(f"⚠️ Fallback: Loaded en_core_web_sm instead of {spacy_model}")
             except OSError:
                 raise RuntimeError(f"Could not load SpaCy model {spacy_model} or fallback model")
         
         # NLP analysis cache
-        self._nlp_cache: Dict[str, Any] = {}
+        self._nlp_cache = BoundedCache(max_entries=NLP_CACHE_MAX_ENTRIES, max_bytes=NLP_CACHE_MAX_BYTES,
+                                       name='morphological_nlp')
         self._cache_hits = 0
         self._cache_misses = 0
         
@@ -257,14 +264,21 @@ class MorphologicalValidator(BasePassValidator):
         except Exception as e:
             return self._create_error_result(context, str(e), time.time() - start_time)
     
+    def _prepare_batch(self, contexts: List[ValidationContext], shared: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse each distinct text of the batch once."""
+        return self._parse_batch_texts(self.nlp, contexts, shared)
+    
     def _analyze_text(self, text: str):
         """Analyze text with SpaCy, using cache if enabled."""
-        if self.cache_nlp_results and text in self._nlp_cache:
+        cached = self._nlp_cache.get(text) if self.cache_nlp_results else None
+        if cached is not None:
             self._cache_hits += 1
-            return self._nlp_cache[text]
+            return cached
         
         self._cache_misses += 1
-        doc = self.nlp(text)
+        doc = self._get_batch_document(text)
+        if doc is None:
+            doc = self.nlp(text)
         
         if self.cache_nlp_results:
             self._nlp_cache[text] = doc
@@ -274,21 +288,8 @@ class MorphologicalValidator(BasePassValidator):
     def _locate_error_in_doc(self, doc, error_position: int, error_text: str):
         """Locate the error token in the SpaCy document."""
         # Find token that contains or is closest to the error position
-        best_token = None
-        min_distance = float('inf')
-        
-        for token in doc:
-            # Check if token contains the error position
-            if token.idx <= error_position <= token.idx + len(token.text):
-                best_token = token
-                break
-            
-            # Track closest token as fallback
-            distance = min(abs(token.idx - error_position), 
-                          abs(token.idx + len(token.text) - error_position))
-            if distance < min_distance:
-                min_distance = distance
-                best_token = token
+        token_index = closest_token_index(doc, error_position)
+        best_token = doc[token_index] if token_index is not None else None
         
         if best_token is None:
             return None, None
@@ -850,7 +851,9 @@ class MorphologicalValidator(BasePassValidator):
                 "cached_texts": len(self._nlp_cache),
                 "cache_hits": self._cache_hits,
                 "cache_misses": self._cache_misses,
-                "hit_rate": self._get_cache_hit_rate()
+                "hit_rate": self._get_cache_hit_rate(),
+                "evictions": self._nlp_cache.evictions + self._nlp_cache.expirations,
+                "cached_bytes": self._nlp_cache.get_stats()['bytes']
             },
             "analysis_performance": {
                 analysis_type: {
@@ -0,0 +1,150 @@
+"""
+TextProfile Class
+Document-level features computed once per text and shared by validators.
+
+DomainValidator and ContextValidator validate each error against the full
+text it was found in. Most of what they derive from that text (terminology
+consistency, style features, language complexity, discourse statistics of a
+sentence window) does not depend on the error at all, yet it was recomputed
+for every error in the block. A TextProfile memoizes those features by name,
+and profiles are looked up by a digest of the text so every validation of the
+same block or document reuses them.
+
+Profiles live for the duration of an analysis request: callers wrap a request
+in ``text_profile_scope()`` and the profiles are dropped once the last open
+scope exits. Outside any scope a small bounded number of profiles is kept.
+"""
+
+import hashlib
+import itertools
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator
+
+# Profiles kept at once (one per distinct block or document text)
+TEXT_PROFILE_MAX_ENTRIES = int(os.getenv('TEXT_PROFILE_MAX_ENTRIES', '256'))
+
+_namespaces = itertools.count()
+
+
+def text_digest(text: str) -> str:
+    """Stable digest identifying ``text``, used as its cache key."""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+
+def new_namespace() -> int:
+    """Unique prefix for the feature keys of one validator instance."""
+    return next(_namespaces)
+
+
+class TextProfile:
+    """Memoized features of a single text."""
+
+    def __init__(self, digest: str):
+        self.digest = digest
+        self._features: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the feature stored under ``key``, computing it on first use.
+
+        ``key`` must identify everything the feature depends on besides the
+        text itself. Callers must not mutate the returned value.
+        """
+        with self._lock:
+            if key in self._features:
+                self.hits += 1
+                return self._features[key]
+            self.misses += 1
+        # Computed outside the lock; a concurrent duplicate is harmless
+        value = compute()
+        with self._lock:
+            return self._features.setdefault(key, value)
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+
+class TextProfileStore:
+    """Bounded LRU of TextProfiles keyed by text digest, scoped to requests."""
+
+    def __init__(self, max_entries: int = TEXT_PROFILE_MAX_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self._profiles: 'OrderedDict[str, TextProfile]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._active_scopes = 0
+        self.evictions = 0
+
+    def get_profile(self, text: str) -> TextProfile:
+        digest = text_digest(text)
+        with self._lock:
+            profile = self._profiles.get(digest)
+            if profile is not None:
+                self._profiles.move_to_end(digest)
+                return profile
+            profile = TextProfile(digest)
+            self._profiles[digest] = profile
+            while len(self._profiles) > self.max_entries:
+                self._profiles.popitem(last=False)
+                self.evictions += 1
+            return profile
+
+    @contextmanager
+    def scope(self) -> Iterator['TextProfileStore']:
+        """
+        Keep profiles for the duration of an analysis request.
+
+        Scopes count across threads, so validators running on pipeline worker
+        threads share the request's profiles. Profiles are dropped when the
+        last open scope exits.
+        """
+        with self._lock:
+            self._active_scopes += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._active_scopes -= 1
+                if self._active_scopes == 0:
+                    self._profiles.clear()
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            profiles = list(self._profiles.values())
+            return {
+                'profiles': len(profiles),
+                'features': sum(len(profile) for profile in profiles),
+                'hits': sum(profile.hits for profile in profiles),
+                'misses': sum(profile.misses for profile in profiles),
+                'evictions': self.evictions,
+                'active_scopes': self._active_scopes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+
+_store = TextProfileStore()
+
+
+def get_text_profile(text: str) -> TextProfile:
+    """Return the shared TextProfile for ``text``."""
+    return _store.get_profile(text)
+
+
+def text_profile_scope():
+    """Context manager tying the shared profiles to an analysis request."""
+    return _store.scope()
+
+
+def get_text_profile_store() -> TextProfileStore:
+    return _store
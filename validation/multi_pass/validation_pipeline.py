@@ -4,11 +4,13 @@ Orchestrates multiple pass validators into a unified validation system with cons
 Provides early termination, decision aggregation, audit trail generation, and performance monitoring.
 """
 
+import threading
 import time
-from typing import List, Dict, Any, Optional, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Deque, List, Dict, Any, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, Counter
 
 from .base_validator import (
     BasePassValidator, ValidationDecision, ValidationConfidence,
@@ -17,6 +19,7 @@ from .base_validator import (
 from .pass_validators import (
     MorphologicalValidator, ContextValidator, DomainValidator, CrossRuleValidator
 )
+from ..monitoring.streaming_stats import StreamingStats
 
 # Import monitoring capabilities
 try:
@@ -101,12 +104,15 @@ class PipelineConfiguration:
     ])
     high_confidence_threshold: float = 0.9
     consensus_threshold: float = 0.8
-    timeout_seconds: float = 30.0
+    timeout_seconds: float = 30.0          # Validator budget per error; running validators are not interrupted
     
     # Performance settings
     enable_performance_monitoring: bool = True
     enable_audit_trail: bool = True
-    enable_parallel_validation: bool = False  # Future enhancement
+    enable_parallel_validation: bool = False  # Run validators concurrently on a shared thread pool
+    max_parallel_workers: int = 8         # Threads shared by all concurrent validations of a pipeline
+    max_execution_history: int = 1000     # Audit trails kept in execution_history
+    max_validator_samples: int = 1000     # Recent execution times kept per validator
     
     # Error handling
     continue_on_validator_error: bool = True
@@ -207,6 +213,15 @@ class PipelineResult:
     evidence_by_validator: Dict[str, List[ValidationEvidence]]
 
 
+# Validator execution order and the pipeline stage each validator runs in
+VALIDATOR_STAGES = [
+    ('morphological', PipelineStage.MORPHOLOGICAL_VALIDATION),
+    ('contextual', PipelineStage.CONTEXTUAL_VALIDATION),
+    ('domain', PipelineStage.DOMAIN_VALIDATION),
+    ('cross_rule', PipelineStage.CROSS_RULE_VALIDATION)
+]
+
+
 class ValidationPipeline:
     """
     Multi-pass validation pipeline that orchestrates multiple validators.
@@ -231,16 +246,34 @@ class ValidationPipeline:
         
         # Pipeline state
         self.pipeline_id = self._generate_pipeline_id()
-        self.execution_history: List[PipelineAuditTrail] = []
+        self.execution_history: Deque[PipelineAuditTrail] = deque(
+            maxlen=max(1, self.configuration.max_execution_history)
+        )
         
         # Performance tracking
-        self.performance_metrics = {
+        self.performance_metrics = self._new_performance_metrics()
+        
+        # Thread pool for parallel validation, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    def _new_performance_metrics(self) -> Dict[str, Any]:
+        """
+        Fresh performance counters.
+        
+        ``validator_performance`` keeps each validator's most recent execution
+        times; the ``*_stats`` entries aggregate every execution in constant memory.
+        """
+        max_samples = max(1, self.configuration.max_validator_samples)
+        return {
             'total_executions': 0,
             'successful_executions': 0,
             'early_terminations': 0,
             'consensus_achieved': 0,
             'average_execution_time': 0.0,
-            'validator_performance': defaultdict(list)
+            'validator_performance': defaultdict(lambda: deque(maxlen=max_samples)),
+            'execution_time_stats': StreamingStats(),
+            'validator_time_stats': defaultdict(StreamingStats)
         }
     
     def _initialize_validators(self):
@@ -280,11 +313,226 @@ class ValidationPipeline:
             PipelineResult with comprehensive validation analysis
         """
         start_time = time.time()
-        pipeline_id = self._generate_pipeline_id()
+        audit_trail = self._create_audit_trail(context, start_time)
+        
+        try:
+            # Stage 1: Initialization
+            self._initialize_execution(audit_trail)
+            
+            # Stage 2-5: Execute validators
+            validator_executions = self._execute_validators(
+                context, audit_trail, deadline=start_time + self.configuration.timeout_seconds
+            )
+            
+            return self._complete_validation(context, validator_executions, audit_trail, start_time)
+            
+        except Exception as e:
+            # Handle pipeline errors
+            return self._handle_pipeline_error(e, context, audit_trail, start_time)
+    
+    def validate_errors(self, contexts: List[ValidationContext]) -> List[PipelineResult]:
+        """
+        Execute the validation pipeline for a batch of error contexts.
+        
+        Each validator runs once over all errors that are still in play, stage
+        by stage, instead of once per error. Errors found in the same text share
+        one SpaCy parse across validators. Early termination, consensus and the
+        per-error results are the same as calling validate_error for each context.
+        
+        With parallel validation enabled, every validator runs over the whole
+        batch concurrently; results are still recorded stage by stage, so
+        validators past an error's early termination are ignored for it. Once
+        every error has terminated, or the batch's deadline of ``timeout_seconds``
+        per context has passed, validators still running are cancelled and stop
+        before their next error.
+        
+        Args:
+            contexts: Validation contexts, typically all errors found in one block
+            
+        Returns:
+            One PipelineResult per context, in the same order
+        """
+        if not contexts:
+            return []
+        
+        batch_start_time = time.time()
+        audit_trails = [self._create_audit_trail(context, batch_start_time) for context in contexts]
+        executions: List[List[ValidatorExecution]] = [[] for _ in contexts]
+        terminated = [False] * len(contexts)
+        failures: Dict[int, Exception] = {}
+        
+        # Analysis shared by all validators for this batch (e.g. parsed documents)
+        shared: Dict[str, Any] = {}
+        deadline = batch_start_time + self.configuration.timeout_seconds * len(contexts)
+        
+        for audit_trail in audit_trails:
+            self._initialize_execution(audit_trail)
+        
+        cancel_event = threading.Event()
+        pending = {}
+        if self.configuration.enable_parallel_validation:
+            pending = self._submit_batch_validators(contexts, shared, cancel_event)
+        
+        try:
+            for validator_name, stage in VALIDATOR_STAGES:
+                if validator_name not in self.validators:
+                    continue
+                
+                active = [i for i in range(len(contexts)) if not terminated[i] and i not in failures]
+                if not active:
+                    break
+                
+                if validator_name in pending:
+                    results, errors, average_time = self._collect_batch_stage(
+                        validator_name, pending[validator_name], active, deadline, cancel_event
+                    )
+                else:
+                    results, errors, average_time = self._run_batch_stage(
+                        validator_name, [contexts[i] for i in active], shared, deadline
+                    )
+                
+                for i, result, error in zip(active, results, errors):
+                    execution_time = result.validation_time if result is not None else average_time
+                    try:
+                        terminated[i] = self._record_validator_execution(
+                            validator_name, stage, result, error, execution_time,
+                            audit_trails[i], executions[i]
+                        )
+                    except Exception as e:
+                        failures[i] = e
+        finally:
+            self._cancel_pending(cancel_event, pending.values())
+        
+        pipeline_results = []
+        for i, context in enumerate(contexts):
+            # Time attributable to this error rather than to the whole batch
+            start_time = time.time() - sum(e.execution_time for e in executions[i])
+            if i in failures:
+                pipeline_results.append(self._handle_pipeline_error(failures[i], context, audit_trails[i], start_time))
+                continue
+            try:
+                pipeline_results.append(self._complete_validation(context, executions[i], audit_trails[i], start_time))
+            except Exception as e:
+                pipeline_results.append(self._handle_pipeline_error(e, context, audit_trails[i], start_time))
+        
+        return pipeline_results
+    
+    def _run_batch_stage(self, validator_name: str, batch_contexts: List[ValidationContext],
+                         shared: Dict[str, Any], deadline: float) -> Tuple[list, list, float]:
+        """Run one validator over a batch in the calling thread."""
+        count = len(batch_contexts)
+        if time.time() >= deadline:
+            return [None] * count, [self._timeout_error(validator_name)] * count, 0.0
+        
+        validator = self.validators[validator_name]
+        execution_start = time.time()
+        try:
+            results = validator.validate_errors(batch_contexts, shared)
+            errors = [None] * count
+        except Exception as e:
+            results = [None] * count
+            errors = [e] * count
+        
+        return results, errors, (time.time() - execution_start) / count
+    
+    def _submit_batch_validators(self, contexts: List[ValidationContext], shared: Dict[str, Any],
+                                 cancel_event: threading.Event) -> Dict[str, Any]:
+        """Start every validator on the whole batch concurrently."""
+        # Parse up front so concurrent validators read the shared documents instead of racing to parse
+        for validator_name, _ in VALIDATOR_STAGES:
+            if validator_name in self.validators:
+                try:
+                    self.validators[validator_name]._prepare_batch(contexts, shared)
+                except Exception:
+                    pass
+        
+        executor = self._get_executor()
+        return {
+            validator_name: executor.submit(
+                self._run_cancellable, cancel_event,
+                lambda validator=self.validators[validator_name]: validator.validate_errors(
+                    contexts, shared, cancel_event=cancel_event)
+            )
+            for validator_name, _ in VALIDATOR_STAGES
+            if validator_name in self.validators
+        }
+    
+    def _collect_batch_stage(self, validator_name: str, future, active: List[int], deadline: float,
+                             cancel_event: threading.Event) -> Tuple[list, list, float]:
+        """Wait for a concurrently running validator and pick the results of the active errors."""
+        count = len(active)
+        results, error, execution_time = self._wait_for(future, validator_name, deadline, cancel_event)
+        if error is not None:
+            return [None] * count, [error] * count, execution_time / max(1, count)
+        return [results[i] for i in active], [None] * count, execution_time / max(1, len(results))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """The pipeline's validator thread pool."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.configuration.max_parallel_workers),
+                    thread_name_prefix='validation-pipeline'
+                )
+            return self._executor
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the validator thread pool (it is recreated if the pipeline is used again)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    @staticmethod
+    def _run_cancellable(cancel_event: threading.Event, task: Callable[[], Any]) -> Tuple[Any, Optional[Exception], float]:
+        """
+        Run a validator task on a worker thread.
         
-        # Initialize audit trail
-        audit_trail = PipelineAuditTrail(
-            pipeline_id=pipeline_id,
+        Returns (value, error, execution_time); a task whose validation was
+        already terminated by the time it is picked up is skipped. Running tasks
+        are handed the same event: validators check it before each error they
+        validate and stop with a ValidationCancelledError once it is set.
+        """
+        if cancel_event.is_set():
+            return None, None, 0.0
+        execution_start = time.time()
+        try:
+            return task(), None, time.time() - execution_start
+        except Exception as e:
+            return None, e, time.time() - execution_start
+    
+    def _wait_for(self, future, validator_name: str, deadline: float,
+                  cancel_event: threading.Event) -> Tuple[Any, Optional[Exception], float]:
+        """
+        Result of a submitted validator task, or a timeout error once the deadline has passed.
+        
+        The deadline is shared by every validator of the call, so a timeout sets
+        ``cancel_event``: validators still running stop at their next error
+        and release their worker threads; their results are discarded.
+        """
+        wait_start = time.time()
+        try:
+            return future.result(timeout=max(0.0, deadline - wait_start))
+        except FutureTimeoutError:
+            cancel_event.set()
+            return None, self._timeout_error(validator_name), time.time() - wait_start
+    
+    def _timeout_error(self, validator_name: str) -> TimeoutError:
+        return TimeoutError(
+            f"{validator_name} validator did not finish within {self.configuration.timeout_seconds}s"
+        )
+    
+    @staticmethod
+    def _cancel_pending(cancel_event: threading.Event, futures) -> None:
+        """Stop validators that are no longer needed: queued ones never start, running ones stop at their next error."""
+        cancel_event.set()
+        for future in futures:
+            future.cancel()
+    
+    def _create_audit_trail(self, context: ValidationContext, start_time: float) -> PipelineAuditTrail:
+        """Create an empty audit trail for one error."""
+        return PipelineAuditTrail(
+            pipeline_id=self._generate_pipeline_id(),
             execution_start_time=start_time,
             execution_end_time=0.0,
             total_execution_time=0.0,
@@ -298,125 +546,186 @@ class ValidationPipeline:
             errors_encountered=[],
             warnings_generated=[]
         )
+    
+    def _initialize_execution(self, audit_trail: PipelineAuditTrail):
+        """Record the initialization stage of one error's pipeline execution."""
+        audit_trail.stages_executed.append(PipelineStage.INITIALIZATION)
         
-        try:
-            # Stage 1: Initialization
-            audit_trail.stages_executed.append(PipelineStage.INITIALIZATION)
-            
-            # Record pipeline execution start
-            if MONITORING_AVAILABLE:
-                record_pipeline_execution('initialization', 'started')
-            
-            # Stage 2-5: Execute validators
-            validator_executions = self._execute_validators(context, audit_trail)
-            
-            # Check for early termination
-            early_termination, termination_reason = self._check_early_termination(validator_executions)
-            
-            # Stage 6: Build consensus
-            audit_trail.stages_executed.append(PipelineStage.CONSENSUS_BUILDING)
-            consensus_start_time = time.time()
-            consensus_analysis = self._build_consensus(validator_executions, context)
-            audit_trail.consensus_analysis = consensus_analysis
-            
-            # Record consensus building duration
-            if MONITORING_AVAILABLE:
-                consensus_duration = time.time() - consensus_start_time
-                rule_type = context.additional_context.get('rule_type', 'unknown')
-                record_validation_duration('consensus_building', rule_type, consensus_duration)
-                record_pipeline_execution('consensus_building', 'completed')
-            
-            # Create final result
-            final_result = self._create_final_result(consensus_analysis, validator_executions, context)
-            audit_trail.final_result = final_result
-            
-            # Stage 7: Generate audit trail
-            if self.configuration.enable_audit_trail:
-                audit_trail.stages_executed.append(PipelineStage.AUDIT_TRAIL_GENERATION)
-                audit_trail = self._enhance_audit_trail(audit_trail, validator_executions)
-            
-            # Stage 8: Finalization
-            audit_trail.stages_executed.append(PipelineStage.FINALIZATION)
-            end_time = time.time()
-            audit_trail.execution_end_time = end_time
-            audit_trail.total_execution_time = end_time - start_time
-            
-            # Create pipeline result
-            pipeline_result = self._create_pipeline_result(
-                final_result, validator_executions, consensus_analysis,
-                audit_trail, early_termination, termination_reason
-            )
-            
-            # Update performance metrics
-            self._update_performance_metrics(pipeline_result)
-            
-            # Store execution history
-            self.execution_history.append(audit_trail)
-            
-            return pipeline_result
-            
-        except Exception as e:
-            # Handle pipeline errors
-            return self._handle_pipeline_error(e, context, audit_trail, start_time)
+        # Record pipeline execution start
+        if MONITORING_AVAILABLE:
+            record_pipeline_execution('initialization', 'started')
+    
+    def _complete_validation(self, context: ValidationContext,
+                             validator_executions: List[ValidatorExecution],
+                             audit_trail: PipelineAuditTrail, start_time: float) -> PipelineResult:
+        """Build consensus over the validator executions of one error and create its result."""
+        # Check for early termination
+        early_termination, termination_reason = self._check_early_termination(validator_executions)
+        
+        # Stage 6: Build consensus
+        audit_trail.stages_executed.append(PipelineStage.CONSENSUS_BUILDING)
+        consensus_start_time = time.time()
+        consensus_analysis = self._build_consensus(validator_executions, context)
+        audit_trail.consensus_analysis = consensus_analysis
+        
+        # Record consensus building duration
+        if MONITORING_AVAILABLE:
+            consensus_duration = time.time() - consensus_start_time
+            rule_type = context.additional_context.get('rule_type', 'unknown')
+            record_validation_duration('consensus_building', rule_type, consensus_duration)
+            record_pipeline_execution('consensus_building', 'completed')
+        
+        # Create final result
+        final_result = self._create_final_result(consensus_analysis, validator_executions, context)
+        audit_trail.final_result = final_result
+        
+        # Stage 7: Generate audit trail
+        if self.configuration.enable_audit_trail:
+            audit_trail.stages_executed.append(PipelineStage.AUDIT_TRAIL_GENERATION)
+            audit_trail = self._enhance_audit_trail(audit_trail, validator_executions)
+        
+        # Stage 8: Finalization
+        audit_trail.stages_executed.append(PipelineStage.FINALIZATION)
+        end_time = time.time()
+        audit_trail.execution_end_time = end_time
+        audit_trail.total_execution_time = end_time - start_time
+        
+        # Create pipeline result
+        pipeline_result = self._create_pipeline_result(
+            final_result, validator_executions, consensus_analysis,
+            audit_trail, early_termination, termination_reason
+        )
+        
+        # Update performance metrics
+        self._update_performance_metrics(pipeline_result)
+        
+        # Store execution history
+        self.execution_history.append(audit_trail)
+        
+        return pipeline_result
     
     def _execute_validators(self, context: ValidationContext, 
-                          audit_trail: PipelineAuditTrail) -> List[ValidatorExecution]:
-        """Execute all enabled validators."""
-        validator_executions = []
+                          audit_trail: PipelineAuditTrail,
+                          deadline: Optional[float] = None) -> List[ValidatorExecution]:
+        """
+        Execute all enabled validators.
+        
+        Validators that have not finished by ``deadline`` are recorded as
+        failed with a TimeoutError. The deadline is checked between validators;
+        a running validator is never interrupted, so sequentially an overrunning
+        validator still holds up the error until it returns, and only the
+        validators after it are skipped. With parallel validation enabled all
+        validators start at once and the error's latency approaches that of the
+        slowest validator; results are recorded in stage order, so early
+        termination and consensus match sequential execution. Once the deadline
+        passes there, queued validators are cancelled; a validator already
+        running on the error keeps its pool thread until it returns. Batches
+        (validate_errors) are cancelled between errors as well.
+        """
+        if deadline is None:
+            deadline = time.time() + self.configuration.timeout_seconds
+        if self.configuration.enable_parallel_validation:
+            return self._execute_validators_concurrently(context, audit_trail, deadline)
         
-        # Define validator execution order and stages
-        validator_stages = [
-            ('morphological', PipelineStage.MORPHOLOGICAL_VALIDATION),
-            ('contextual', PipelineStage.CONTEXTUAL_VALIDATION),
-            ('domain', PipelineStage.DOMAIN_VALIDATION),
-            ('cross_rule', PipelineStage.CROSS_RULE_VALIDATION)
-        ]
+        validator_executions = []
         
-        for validator_name, stage in validator_stages:
+        for validator_name, stage in VALIDATOR_STAGES:
             if validator_name not in self.validators:
                 continue
             
-            audit_trail.stages_executed.append(stage)
             validator = self.validators[validator_name]
             
             execution_start = time.time()
             result = None
             error = None
             
-            try:
-                # Execute validator
-                result = validator.validate_error(context)
-                
-            except Exception as e:
-                error = e
-                audit_trail.errors_encountered.append(f"{validator_name}: {str(e)}")
-                
-                if not self.configuration.continue_on_validator_error:
-                    raise
+            if execution_start >= deadline:
+                error = self._timeout_error(validator_name)
+            else:
+                try:
+                    # Execute validator
+                    result = validator.validate_error(context)
+                    
+                except Exception as e:
+                    error = e
             
             execution_time = time.time() - execution_start
             
-            # Create validator execution record
-            execution = ValidatorExecution(
-                validator_name=validator_name,
-                result=result,
-                execution_time=execution_time,
-                error=error,
-                stage=stage
-            )
-            
-            validator_executions.append(execution)
-            audit_trail.validator_executions.append(execution)
-            
-            # Check for early termination after each validator
-            if self.configuration.enable_early_termination:
-                early_term, reason = self._check_early_termination(validator_executions)
-                if early_term:
-                    execution.terminated_early = True
+            if self._record_validator_execution(validator_name, stage, result, error, execution_time,
+                                                audit_trail, validator_executions):
+                break
+        
+        return validator_executions
+    
+    def _execute_validators_concurrently(self, context: ValidationContext, audit_trail: PipelineAuditTrail,
+                                         deadline: float) -> List[ValidatorExecution]:
+        """Run all validators for one error on the thread pool, recording them in stage order."""
+        executor = self._get_executor()
+        cancel_event = threading.Event()
+        submitted = [
+            (validator_name, stage, executor.submit(
+                self._run_cancellable, cancel_event,
+                lambda validator=self.validators[validator_name]: validator.validate_error(
+                    context, cancel_event=cancel_event)
+            ))
+            for validator_name, stage in VALIDATOR_STAGES
+            if validator_name in self.validators
+        ]
+        
+        validator_executions = []
+        try:
+            for validator_name, stage, future in submitted:
+                result, error, execution_time = self._wait_for(future, validator_name, deadline, cancel_event)
+                if self._record_validator_execution(validator_name, stage, result, error, execution_time,
+                                                    audit_trail, validator_executions):
                     break
+        finally:
+            self._cancel_pending(cancel_event, [future for _, _, future in submitted])
         
         return validator_executions
     
+    def _record_validator_execution(self, validator_name: str, stage: PipelineStage,
+                                    result: Optional[ValidationResult], error: Optional[Exception],
+                                    execution_time: float, audit_trail: PipelineAuditTrail,
+                                    validator_executions: List[ValidatorExecution]) -> bool:
+        """
+        Record one validator's outcome for an error.
+        
+        Returns:
+            True if the pipeline should terminate early for this error
+        
+        Raises:
+            The validator's error if validators must not fail
+        """
+        audit_trail.stages_executed.append(stage)
+        
+        if error is not None:
+            audit_trail.errors_encountered.append(f"{validator_name}: {str(error)}")
+            
+            if not self.configuration.continue_on_validator_error:
+                raise error
+        
+        # Create validator execution record
+        execution = ValidatorExecution(
+            validator_name=validator_name,
+            result=result,
+            execution_time=execution_time,
+            error=error,
+            stage=stage
+        )
+        
+        validator_executions.append(execution)
+        audit_trail.validator_executions.append(execution)
+        
+        # Check for early termination after each validator
+        if self.configuration.enable_early_termination:
+            early_term, reason = self._check_early_termination(validator_executions)
+            if early_term:
+                execution.terminated_early = True
+                return True
+        
+        return False
+    
     def _check_early_termination(self, executions: List[ValidatorExecution]) -> Tuple[bool, Optional[TerminationCondition]]:
         """Check if early termination conditions are met."""
         if not self.configuration.enable_early_termination:
@@ -946,16 +1255,15 @@ class ValidationPipeline:
         if result.early_termination:
             self.performance_metrics['early_terminations'] += 1
         
-        # Update average execution time
-        total_time = self.performance_metrics['average_execution_time']
-        count = self.performance_metrics['total_executions']
-        
-        new_average = ((total_time * (count - 1)) + result.total_execution_time) / count
-        self.performance_metrics['average_execution_time'] = new_average
+        # Update running execution time statistics
+        execution_time_stats = self.performance_metrics['execution_time_stats']
+        execution_time_stats.add(result.total_execution_time)
+        self.performance_metrics['average_execution_time'] = execution_time_stats.mean
         
         # Update validator performance
         for validator_name, exec_time in result.individual_execution_times.items():
             self.performance_metrics['validator_performance'][validator_name].append(exec_time)
+            self.performance_metrics['validator_time_stats'][validator_name].add(exec_time)
     
     def get_pipeline_info(self) -> Dict[str, Any]:
         """Get comprehensive pipeline information."""
@@ -973,7 +1281,7 @@ class ValidationPipeline:
                 "enabled_validators": list(self.validators.keys()),
                 "minimum_validator_count": self.configuration.minimum_validator_count
             },
-            "performance_metrics": dict(self.performance_metrics),
+            "performance_metrics": self._export_performance_metrics(),
             "validator_info": {
                 name: validator.get_validator_info()
                 for name, validator in self.validators.items()
@@ -981,6 +1289,18 @@ class ValidationPipeline:
             "execution_history_count": len(self.execution_history)
         }
     
+    def _export_performance_metrics(self) -> Dict[str, Any]:
+        """Performance metrics as plain values (lists and summaries instead of buffers)."""
+        metrics = dict(self.performance_metrics)
+        metrics['validator_performance'] = {
+            name: list(times) for name, times in metrics['validator_performance'].items()
+        }
+        metrics['execution_time_stats'] = metrics['execution_time_stats'].summary()
+        metrics['validator_time_stats'] = {
+            name: stats.summary() for name, stats in metrics['validator_time_stats'].items()
+        }
+        return metrics
+    
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get performance summary for the pipeline."""
         metrics = self.performance_metrics
@@ -995,10 +1315,9 @@ class ValidationPipeline:
             if metrics['total_executions'] > 0 else 0.0
         )
         
-        validator_avg_times = {}
-        for validator_name, times in metrics['validator_performance'].items():
-            if times:
-                validator_avg_times[validator_name] = sum(times) / len(times)
+        validator_time_stats = {
+            name: stats for name, stats in metrics['validator_time_stats'].items() if stats.count
+        }
         
         return {
             "total_executions": metrics['total_executions'],
@@ -1006,20 +1325,18 @@ class ValidationPipeline:
             "consensus_rate": success_rate,  # Same as success rate for now
             "early_termination_rate": early_termination_rate,
             "average_execution_time_ms": metrics['average_execution_time'] * 1000,
+            "execution_time_ms": metrics['execution_time_stats'].summary(scale=1000),
             "validator_average_times_ms": {
-                name: time_sec * 1000
-                for name, time_sec in validator_avg_times.items()
+                name: stats.mean * 1000
+                for name, stats in validator_time_stats.items()
+            },
+            "validator_execution_times_ms": {
+                name: stats.summary(scale=1000)
+                for name, stats in validator_time_stats.items()
             }
         }
     
     def clear_history(self):
         """Clear execution history and reset performance metrics."""
         self.execution_history.clear()
-        self.performance_metrics = {
-            'total_executions': 0,
-            'successful_executions': 0,
-            'early_terminations': 0,
-            'consensus_achieved': 0,
-            'average_execution_time': 0.0,
-            'validator_performance': defaultdict(list)
-        }
\ No newline at end of file
+        self.performance_metrics = self._new_performance_metrics()
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Test suite for the BoundedCache used by the confidence layers and validators.
+Tests LRU eviction, byte and age limits, statistics and concurrent access.
+"""
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from validation.confidence.bounded_cache import BoundedCache, estimate_size
+from validation.confidence.domain_classifier import DomainClassifier
+
+
+class TestBoundedCacheLimits(unittest.TestCase):
+    """Test eviction by entry count, size and age."""
+    
+    def test_least_recently_used_entry_evicted(self):
+        """Reading an entry protects it from the next eviction."""
+        cache = BoundedCache(max_entries=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache.get('a'), 1)
+        cache['c'] = 3
+        
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get_stats()['evictions'], 1)
+    
+    def test_byte_limit(self):
+        """Entries are evicted until the estimated footprint fits the budget."""
+        cache = BoundedCache(max_entries=100, max_bytes=250, size_of=lambda value: 100)
+        for key in range(5):
+            cache[key] = key
+        
+        stats = cache.get_stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['bytes'], 200)
+        self.assertEqual(list(key for key in range(5) if key in cache), [3, 4])
+    
+    def test_value_larger_than_budget_not_cached(self):
+        """A single oversized value does not flush the rest of the cache."""
+        cache = BoundedCache(max_bytes=100, size_of=len)
+        cache['small'] = 'x' * 10
+        cache['huge'] = 'x' * 1000
+        
+        self.assertIn('small', cache)
+        self.assertNotIn('huge', cache)
+    
+    def test_ttl_expiry(self):
+        """Entries older than the TTL are misses."""
+        cache = BoundedCache(ttl_seconds=10)
+        with patch('validation.confidence.bounded_cache.time.monotonic', return_value=100.0):
+            cache['a'] = 1
+        with patch('validation.confidence.bounded_cache.time.monotonic', return_value=105.0):
+            self.assertEqual(cache.get('a'), 1)
+        with patch('validation.confidence.bounded_cache.time.monotonic', return_value=111.0):
+            self.assertIsNone(cache.get('a'))
+        
+        stats = cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['expirations']), (1, 1, 1))
+        self.assertEqual(len(cache), 0)
+    
+    def test_clear_resets_stats(self):
+        """Clearing drops entries, bytes and counters."""
+        cache = BoundedCache(max_bytes=1000)
+        cache['a'] = 'value'
+        cache.get('a')
+        cache.clear()
+        
+        stats = cache.get_stats()
+        self.assertEqual((stats['entries'], stats['bytes'], stats['hits']), (0, 0, 0))
+        with self.assertRaises(KeyError):
+            cache['a']
+
+
+class TestBoundedCacheConcurrency(unittest.TestCase):
+    """Test the cache under concurrent writers."""
+    
+    def test_concurrent_puts_respect_limits(self):
+        """Concurrent writers never leave the cache above its limits."""
+        cache = BoundedCache(max_entries=50, max_bytes=5000, size_of=lambda value: 64)
+        
+        def writer(offset):
+            for i in range(500):
+                cache[(offset, i)] = i
+                cache.get((offset, i - 1))
+        
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        stats = cache.get_stats()
+        self.assertLessEqual(stats['entries'], 50)
+        self.assertEqual(stats['bytes'], stats['entries'] * 64)
+        self.assertEqual(stats['evictions'], 8 * 500 - stats['entries'])
+
+
+class TestSizeEstimates(unittest.TestCase):
+    """Test value size estimation."""
+    
+    def test_nested_values_counted(self):
+        """Containers include the size of their contents."""
+        small = estimate_size({'text': 'x'})
+        large = estimate_size({'text': 'x' * 10000})
+        self.assertGreater(large - small, 9000)
+    
+    def test_shared_values_counted_once(self):
+        """A value referenced twice is only counted once."""
+        text = 'x' * 10000
+        self.assertLess(estimate_size([text, text]), 2 * estimate_size(text))
+
+
+class TestLayerCacheIntegration(unittest.TestCase):
+    """Test that confidence layers use bounded caches."""
+    
+    def test_domain_classifier_cache_bounded(self):
+        """The classifier keeps at most max_entries classifications and reports evictions."""
+        classifier = DomainClassifier()
+        classifier._classification_cache.max_entries = 2
+        
+        for i in range(4):
+            classifier.classify_content(f"Configure server number {i} with the API.")
+        
+        stats = classifier.get_performance_stats()
+        self.assertEqual(stats['classifications_cached'], 2)
+        self.assertEqual(stats['classification_cache']['evictions'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
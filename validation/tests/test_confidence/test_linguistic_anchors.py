@@ -9,6 +9,7 @@ import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from validation.confidence.bounded_cache import BoundedCache
 from validation.confidence.linguistic_anchors import LinguisticAnchors, AnchorMatch, AnchorAnalysis
 from validation.config.linguistic_anchors_config import LinguisticAnchorsConfig
 
@@ -32,7 +33,7 @@ class TestLinguisticAnchorsInitialization(unittest.TestCase):
         self.assertIsInstance(anchors.config, LinguisticAnchorsConfig)
         self.assertTrue(anchors.cache_compiled_patterns)
         self.assertIsInstance(anchors._pattern_cache, dict)
-        self.assertIsInstance(anchors._analysis_cache, dict)
+        self.assertIsInstance(anchors._analysis_cache, BoundedCache)
         
         # Should have pre-compiled patterns
         self.assertGreater(len(anchors._pattern_cache), 0)
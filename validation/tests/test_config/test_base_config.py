@@ -386,6 +386,27 @@ class TestConfigCaching(unittest.TestCase):
         config = config_manager.reload_config()
         self.assertIsNotNone(config)
         self.assertTrue(config_manager.is_cached())
+    
+    def test_instances_share_parsed_file(self):
+        """Test that a file is parsed once for every config instance reading it."""
+        first = TestBaseConfig(self.config_file).load_config()
+        
+        with patch('validation.config.base_config.yaml.safe_load') as safe_load:
+            second = TestBaseConfig(self.config_file).load_config()
+            safe_load.assert_not_called()
+        
+        self.assertEqual(first, second)
+        # Each instance gets its own copy
+        second['test_dict']['nested_key'] = 'changed'
+        self.assertEqual(TestBaseConfig(self.config_file).load_config()['test_dict']['nested_key'], 'nested_value')
+    
+    def test_shared_parse_follows_file_changes(self):
+        """Test that an edited file is parsed again."""
+        TestBaseConfig(self.config_file).load_config()
+        with open(self.config_file, 'w') as f:
+            yaml.dump({'test_string': 'edited_value', 'test_number': 7}, f)
+        
+        self.assertEqual(TestBaseConfig(self.config_file).load_config()['test_string'], 'edited_value')
 
 
 class TestSchemaValidator(unittest.TestCase):
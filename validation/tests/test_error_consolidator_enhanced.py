@@ -493,6 +493,83 @@ class TestErrorConsolidatorEdgeCases:
             pytest.fail(f"Should handle very low confidence errors gracefully, got: {e}")
 
 
+def _pairwise_groups(consolidator, sentence_errors):
+    """Reference: the original grouping, which scanned every group and remaining error."""
+    groups, remaining = {}, []
+    for error in sentence_errors:
+        span_key = tuple(error['span'])
+        same_span = [e for e in remaining if tuple(e['span']) == span_key]
+        if same_span:
+            if span_key not in groups:
+                groups[span_key] = [same_span[0]]
+                remaining.remove(same_span[0])
+            groups[span_key].append(error)
+            continue
+        group = next((g for g in groups.values() if consolidator._should_group_semantically(error, g[0])), None)
+        if group is not None:
+            group.append(error)
+            continue
+        existing = next((e for e in remaining if consolidator._should_group_semantically(error, e)), None)
+        if existing is not None:
+            remaining.remove(existing)
+            groups[(min(error['span'][0], existing['span'][0]), max(error['span'][1], existing['span'][1]))] = [existing, error]
+        else:
+            remaining.append(error)
+    return [sorted(e['message'] for e in g) for g in groups.values()] + [[e['message']] for e in remaining]
+
+
+class TestSentenceConsolidationIndex:
+    """Test that index-based sentence consolidation groups exactly like the pairwise scan."""
+    
+    TYPES = ['verbs', 'ambiguity', 'word_usage', 'word_usage_t', 'claims', 'inclusive_language',
+             'punctuation', 'commas', 'headings', 'terminology', 'numbers', 'sentence_length']
+    
+    @pytest.fixture
+    def consolidator(self):
+        consolidator = ErrorConsolidator(enable_enhanced_validation=False)
+        # Keep each merged group's members so the grouping itself can be compared
+        consolidator._merge_error_group = lambda group: {'members': group}
+        return consolidator
+    
+    def _errors(self, seed, count, length):
+        import random
+        rnd = random.Random(seed)
+        errors = []
+        for i in range(count):
+            start = rnd.randint(0, length)
+            span = (start, start + rnd.choice([0, 1, 4, 12, 60]))
+            if errors and rnd.random() < 0.15:
+                span = errors[rnd.randrange(len(errors))]['span']
+            errors.append({'type': rnd.choice(self.TYPES), 'span': span, 'message': f'error {i}',
+                           'suggestions': [], 'severity': 'low', 'sentence_index': 0})
+        return errors
+    
+    def _grouped_messages(self, consolidated):
+        return [sorted(member['message'] for member in e.get('members', [e])) for e in consolidated]
+    
+    def test_grouping_matches_pairwise_scan(self, consolidator):
+        for seed in range(50):
+            errors = self._errors(seed, count=40, length=300)
+            expected = _pairwise_groups(consolidator, errors)
+            assert self._grouped_messages(consolidator._consolidate_sentence_errors(errors)) == expected
+    
+    def test_distant_always_consolidated_pair_is_grouped(self, consolidator):
+        errors = [
+            {'type': 'verbs', 'span': (0, 5), 'message': 'passive', 'suggestions': [], 'severity': 'low'},
+            {'type': 'punctuation', 'span': (300, 301), 'message': 'comma', 'suggestions': [], 'severity': 'low'},
+            {'type': 'ambiguity', 'span': (900, 905), 'message': 'pronoun', 'suggestions': [], 'severity': 'low'},
+        ]
+        grouped = self._grouped_messages(consolidator._consolidate_sentence_errors(errors))
+        assert grouped == [['passive', 'pronoun'], ['comma']]
+    
+    def test_dense_sentence_performance(self, consolidator):
+        """Hundreds of candidates in one sentence stay well below quadratic cost."""
+        errors = self._errors(seed=7, count=800, length=6000)
+        start_time = time.time()
+        consolidator._consolidate_sentence_errors(errors)
+        assert time.time() - start_time < 0.5
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file
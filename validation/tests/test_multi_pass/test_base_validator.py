@@ -3,6 +3,7 @@ Comprehensive test suite for BasePassValidator class.
 Tests abstract interface, decision tracking, performance monitoring, and common functionality.
 """
 
+import threading
 import unittest
 import time
 from unittest.mock import Mock, patch
@@ -10,7 +11,7 @@ from unittest.mock import Mock, patch
 from validation.multi_pass.base_validator import (
     BasePassValidator, ValidationDecision, ValidationConfidence,
     ValidationEvidence, ValidationResult, ValidationContext,
-    ValidationPerformanceMetrics, ValidationError, ValidationConfigError
+    ValidationPerformanceMetrics, ValidationError, ValidationCancelledError, ValidationConfigError
 )
 from validation.confidence.confidence_calculator import ConfidenceCalculator, ConfidenceBreakdown
 
@@ -581,6 +582,44 @@ class TestValidationFunctionality(unittest.TestCase):
         self.assertEqual(low_level, ValidationConfidence.LOW)
 
 
+class TestCancellation(unittest.TestCase):
+    """Test cooperative cancellation of batch validation."""
+    
+    def setUp(self):
+        """Set up a validator that needs no language model."""
+        self.validator = ConcreteTestValidator("test_validator", confidence_calculator=Mock())
+        self.context = ValidationContext(
+            text="This is a test sentence with an error.",
+            error_position=30,
+            error_text="error"
+        )
+    
+    def test_cancelled_batch_stops_between_errors(self):
+        """A batch stops before its next error once the cancel event is set."""
+        cancel_event = threading.Event()
+        validate = self.validator._validate_error
+        
+        def validate_and_cancel(context):
+            cancel_event.set()
+            return validate(context)
+        
+        self.validator._validate_error = Mock(side_effect=validate_and_cancel)
+        
+        with self.assertRaises(ValidationCancelledError):
+            self.validator.validate_errors([self.context, self.context], cancel_event=cancel_event)
+        self.assertEqual(self.validator._validate_error.call_count, 1)
+        self.assertEqual(self.validator.performance_metrics.validation_errors, 0)
+    
+    def test_cancelled_before_start(self):
+        """No error is validated once the cancel event is already set."""
+        cancel_event = threading.Event()
+        cancel_event.set()
+        
+        with self.assertRaises(ValidationCancelledError):
+            self.validator.validate_error(self.context, cancel_event=cancel_event)
+        self.assertEqual(self.validator.performance_metrics.total_validations, 0)
+
+
 class TestPerformanceTracking(unittest.TestCase):
     """Test performance tracking functionality."""
     
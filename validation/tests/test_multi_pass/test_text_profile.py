@@ -0,0 +1,92 @@
+"""
+Test suite for TextProfile.
+Checks that document-level features are computed once per text and dropped with the request.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from validation.multi_pass.text_profile import TextProfileStore, text_digest, get_text_profile_store
+from validation.multi_pass.pass_validators.domain_validator import DomainValidator
+from validation.multi_pass import ValidationContext
+
+
+class TestTextProfileStore(unittest.TestCase):
+    """Test profile memoization, bounds and request scoping."""
+
+    def setUp(self):
+        self.store = TextProfileStore(max_entries=2)
+
+    def test_feature_computed_once_per_text(self):
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+
+        first = self.store.get_profile("Some text.").get('feature', compute)
+        second = self.store.get_profile("Some text.").get('feature', compute)
+        other = self.store.get_profile("Other text.").get('feature', compute)
+
+        self.assertEqual((first, second, other), (1, 1, 2))
+        self.assertEqual(self.store.get_stats()['hits'], 1)
+
+    def test_texts_sharing_a_prefix_do_not_collide(self):
+        prefix = "x" * 200
+        self.assertNotEqual(text_digest(prefix + "a"), text_digest(prefix + "b"))
+        self.assertIsNot(self.store.get_profile(prefix + "a"), self.store.get_profile(prefix + "b"))
+
+    def test_store_is_bounded(self):
+        for text in ("one", "two", "three"):
+            self.store.get_profile(text)
+
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.evictions, 1)
+
+    def test_profiles_dropped_when_last_scope_exits(self):
+        with self.store.scope():
+            with self.store.scope():
+                self.store.get_profile("text").get('feature', lambda: 1)
+            # An outer request is still running
+            self.assertEqual(len(self.store), 1)
+
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(self.store.get_stats()['active_scopes'], 0)
+
+
+class TestValidatorTextFeatures(unittest.TestCase):
+    """Test that validators reuse document-level features across errors."""
+
+    def setUp(self):
+        self.validator = DomainValidator()
+        self.text = "The API endpoint processes JSON requests. Configure the server before you deploy it."
+
+    def _context(self, position, error_text):
+        return ValidationContext(
+            text=self.text,
+            error_position=position,
+            error_text=error_text,
+            rule_type="terminology",
+            rule_name="technical_precision",
+            content_type="technical"
+        )
+
+    def test_whole_text_features_computed_once_per_text(self):
+        contexts = [self._context(4, "API"), self._context(17, "processes"), self._context(42, "Configure")]
+
+        with get_text_profile_store().scope():
+            with patch.object(self.validator, '_assess_language_complexity',
+                              wraps=self.validator._assess_language_complexity) as complexity:
+                results = self.validator.validate_errors(contexts)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(complexity.call_count, 1)
+
+    def test_validators_do_not_share_features(self):
+        other = DomainValidator()
+        store = get_text_profile_store()
+
+        with store.scope():
+            self.validator._get_text_feature(self.text, 'feature', lambda: 'first')
+            self.assertEqual(other._get_text_feature(self.text, 'feature', lambda: 'second'), 'second')
+
+
+if __name__ == '__main__':
+    unittest.main()
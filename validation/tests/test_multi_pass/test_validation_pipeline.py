@@ -4,6 +4,7 @@ Tests pipeline orchestration, consensus building, early termination, audit trail
 and performance monitoring across all validators.
 """
 
+import threading
 import unittest
 import time
 from unittest.mock import Mock, patch, MagicMock
@@ -595,6 +596,30 @@ class TestPerformanceMonitoring(unittest.TestCase):
         # Check that history and metrics are cleared
         self.assertEqual(len(self.pipeline.execution_history), 0)
         self.assertEqual(self.pipeline.performance_metrics['total_executions'], 0)
+    
+    def test_history_bounded_with_running_statistics(self):
+        """History is a ring buffer while summaries still cover every execution."""
+        pipeline = ValidationPipeline(PipelineConfiguration(max_execution_history=2, max_validator_samples=2))
+        
+        for i in range(4):
+            pipeline.validate_error(ValidationContext(
+                text=f"Bounded history test {i}.",
+                error_position=i,
+                error_text="test",
+                rule_type="history",
+                rule_name=f"bounded_test_{i}"
+            ))
+        
+        self.assertEqual(len(pipeline.execution_history), 2)
+        for times in pipeline.performance_metrics['validator_performance'].values():
+            self.assertEqual(len(times), 2)
+        
+        summary = pipeline.get_performance_summary()
+        self.assertEqual(summary['total_executions'], 4)
+        self.assertEqual(summary['execution_time_ms']['count'], 4)
+        self.assertLessEqual(summary['execution_time_ms']['p50'], summary['execution_time_ms']['p99'])
+        for stats in summary['validator_execution_times_ms'].values():
+            self.assertGreaterEqual(stats['count'], 4)
 
 
 class TestErrorHandlingAndEdgeCases(unittest.TestCase):
@@ -980,5 +1005,271 @@ class TestPipelineConfigurationFlexibility(unittest.TestCase):
             )
 
 
+class TestBatchValidation(unittest.TestCase):
+    """Test validate_errors against per-error validate_error."""
+    
+    def setUp(self):
+        """Create two identical pipelines and record what the batch pipeline parses."""
+        self.pipeline = ValidationPipeline(PipelineConfiguration(enable_early_termination=False))
+        self.reference_pipeline = ValidationPipeline(PipelineConfiguration(enable_early_termination=False))
+        
+        self.parsed_texts = []
+        nlp = self.pipeline.validators['morphological'].nlp
+        parsed_texts = self.parsed_texts
+        
+        class RecordingModel:
+            def __call__(self, text):
+                parsed_texts.append(text)
+                return nlp(text)
+            
+            def pipe(self, texts):
+                texts = list(texts)
+                parsed_texts.extend(texts)
+                return nlp.pipe(texts)
+        
+        # Both SpaCy-based validators share one model, as with the model registry
+        recording_model = RecordingModel()
+        self.pipeline.validators['morphological'].nlp = recording_model
+        self.pipeline.validators['contextual'].nlp = recording_model
+        
+        text = "The server is configured. It restarts the service. Then it logs the result."
+        self.contexts = [
+            ValidationContext(text=text, error_position=text.index(word), error_text=word,
+                              rule_type="word_usage", rule_name="BatchTestRule")
+            for word in ("server", "It", "service", "logs")
+        ]
+        self.contexts.append(ValidationContext(text="A second block of text.", error_position=2,
+                                               error_text="second", rule_type="word_usage"))
+    
+    def test_batch_matches_individual_results(self):
+        """Batch validation makes the same decisions as validating errors one by one."""
+        batch_results = self.pipeline.validate_errors(self.contexts)
+        individual_results = [self.reference_pipeline.validate_error(context) for context in self.contexts]
+        
+        self.assertEqual(len(batch_results), len(self.contexts))
+        for batch, individual in zip(batch_results, individual_results):
+            self.assertEqual(batch.validation_result.decision, individual.validation_result.decision)
+            self.assertAlmostEqual(batch.validation_result.confidence_score,
+                                   individual.validation_result.confidence_score)
+            self.assertEqual(set(batch.validator_results), set(individual.validator_results))
+            self.assertEqual(batch.audit_trail.stages_executed, individual.audit_trail.stages_executed)
+        
+        self.assertEqual(self.pipeline.performance_metrics['total_executions'], len(self.contexts))
+    
+    def test_each_text_parsed_once_per_batch(self):
+        """Validators share one parse of each distinct text in the batch."""
+        self.pipeline.validate_errors(self.contexts)
+        
+        self.assertEqual(sorted(self.parsed_texts), sorted({c.text for c in self.contexts}))
+    
+    def test_empty_batch(self):
+        """An empty batch returns no results."""
+        self.assertEqual(self.pipeline.validate_errors([]), [])
+
+
+
+class StubValidator:
+    """Stand-in validator that returns a fixed decision, optionally after a hook runs."""
+    
+    def __init__(self, name, decision=ValidationDecision.ACCEPT, confidence=0.95, before=None):
+        self.name = name
+        self.decision = decision
+        self.confidence = confidence
+        self.before = before
+        self.calls = 0
+    
+    def validate_error(self, context, cancel_event=None):
+        self.calls += 1
+        if self.before is not None:
+            self.before()
+        return ValidationResult(
+            validator_name=self.name, decision=self.decision,
+            confidence=ValidationConfidence.HIGH, confidence_score=self.confidence,
+            evidence=[], reasoning="stub", error_text=context.error_text,
+            error_position=context.error_position, validation_time=0.0
+        )
+    
+    def validate_errors(self, contexts, shared=None, cancel_event=None):
+        return [self.validate_error(context, cancel_event) for context in contexts]
+    
+    def _prepare_batch(self, contexts, shared):
+        return {}
+
+
+class BlockingValidator(BasePassValidator):
+    """Real validator whose every validation waits for a gate to open."""
+    
+    def __init__(self, name, gate):
+        super().__init__(name, confidence_calculator=Mock())
+        self.gate = gate
+        self.started = threading.Event()
+        self.calls = 0
+    
+    def _validate_error(self, context):
+        self.calls += 1
+        self.started.set()
+        self.gate.wait(5)
+        return ValidationResult(
+            validator_name=self.validator_name, decision=ValidationDecision.ACCEPT,
+            confidence=ValidationConfidence.HIGH, confidence_score=0.95,
+            evidence=[], reasoning="blocking", error_text=context.error_text,
+            error_position=context.error_position, validation_time=0.0
+        )
+    
+    def get_validator_info(self):
+        return {'name': self.validator_name}
+
+
+class FakeClock:
+    """Replacement for the pipeline module's ``time``; only moves when advanced."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def time(self):
+        return self.now
+
+
+class TestParallelValidation(unittest.TestCase):
+    """Test concurrent validator execution, cancellation and timeouts."""
+    
+    def setUp(self):
+        """Set up a context shared by the tests."""
+        self.context = ValidationContext(
+            text="Parallel validation test.", error_position=0, error_text="Parallel",
+            rule_type="test", rule_name="parallel_test"
+        )
+        self.pipelines = []
+        self.gate = threading.Event()
+    
+    def tearDown(self):
+        self.gate.set()
+        for pipeline in self.pipelines:
+            pipeline.shutdown()
+    
+    def _pipeline(self, validators, **config):
+        # The stub validators replace the real ones, which need SpaCy models
+        with patch.object(ValidationPipeline, '_initialize_validators'):
+            pipeline = ValidationPipeline(PipelineConfiguration(**config))
+        pipeline.validators = validators
+        self.pipelines.append(pipeline)
+        return pipeline
+    
+    def _stub_validators(self, decisions=None):
+        decisions = decisions or {}
+        return {
+            name: StubValidator(name, decisions.get(name, ValidationDecision.ACCEPT))
+            for name in ('morphological', 'contextual', 'domain', 'cross_rule')
+        }
+    
+    def _wait_for_gate(self):
+        self.assertTrue(self.gate.wait(5))
+    
+    def test_parallel_matches_sequential(self):
+        """Concurrent execution records the same validators, decisions and stages."""
+        for early_termination in (True, False):
+            with self.subTest(early_termination=early_termination):
+                decisions = {'contextual': ValidationDecision.REJECT}
+                sequential = self._pipeline(self._stub_validators(decisions),
+                                            enable_early_termination=early_termination)
+                parallel = self._pipeline(self._stub_validators(decisions),
+                                          enable_early_termination=early_termination,
+                                          enable_parallel_validation=True)
+                
+                expected = sequential.validate_error(self.context)
+                actual = parallel.validate_error(self.context)
+                
+                self.assertEqual(actual.validation_result.decision, expected.validation_result.decision)
+                self.assertEqual(set(actual.validator_results), set(expected.validator_results))
+                self.assertEqual(actual.audit_trail.stages_executed, expected.audit_trail.stages_executed)
+                self.assertEqual(actual.early_termination, expected.early_termination)
+    
+    def test_validators_run_concurrently(self):
+        """All four validators are running at the same time."""
+        barrier = threading.Barrier(4, timeout=5)
+        validators = self._stub_validators()
+        for validator in validators.values():
+            validator.before = barrier.wait
+        pipeline = self._pipeline(validators, enable_early_termination=False,
+                                  enable_parallel_validation=True)
+        
+        result = pipeline.validate_error(self.context)
+        
+        self.assertEqual(len(result.validator_results), 4)
+        self.assertEqual(result.audit_trail.errors_encountered, [])
+    
+    def test_early_termination_cancels_queued_validators(self):
+        """Validators still queued when the pipeline terminates early never run."""
+        validators = self._stub_validators()
+        validators['domain'].before = self._wait_for_gate
+        pipeline = self._pipeline(validators, enable_parallel_validation=True, max_parallel_workers=1)
+        
+        result = pipeline.validate_error(self.context)
+        self.gate.set()
+        pipeline.shutdown()
+        
+        self.assertTrue(result.early_termination)
+        self.assertEqual(set(result.validator_results), {'morphological', 'contextual'})
+        self.assertEqual(validators['cross_rule'].calls, 0)
+    
+    def test_early_termination_stops_running_batch(self):
+        """A validator still working through a batch stops at its next error once every error has terminated."""
+        validators = self._stub_validators()
+        domain = BlockingValidator('domain', self.gate)
+        validators['domain'] = domain
+        contexts = [self.context] * 3
+        pipeline = self._pipeline(validators, enable_parallel_validation=True)
+        
+        results = pipeline.validate_errors(contexts)
+        self.assertTrue(domain.started.wait(5))
+        self.gate.set()
+        pipeline.shutdown()
+        
+        self.assertTrue(all(result.early_termination for result in results))
+        self.assertEqual(domain.calls, 1)
+    
+    def test_timeout_stops_later_stages(self):
+        """Sequentially, validators after an overrunning one are recorded as timed out."""
+        clock = FakeClock()
+        validators = self._stub_validators()
+        validators['contextual'].before = lambda: setattr(clock, 'now', clock.now + 1.0)
+        pipeline = self._pipeline(validators, enable_early_termination=False, timeout_seconds=0.5)
+        
+        with patch('validation.multi_pass.validation_pipeline.time', clock):
+            result = pipeline.validate_error(self.context)
+        
+        errors = result.audit_trail.errors_encountered
+        self.assertTrue(any('domain validator did not finish within' in error for error in errors))
+        self.assertEqual(validators['domain'].calls, 0)
+        self.assertEqual(validators['cross_rule'].calls, 0)
+    
+    def test_timeout_abandons_running_validator(self):
+        """In parallel, a validator still running at the deadline is recorded as timed out."""
+        validators = self._stub_validators()
+        validators['contextual'].before = self._wait_for_gate
+        pipeline = self._pipeline(validators, enable_early_termination=False,
+                                  enable_parallel_validation=True, timeout_seconds=0.2)
+        
+        # The clock never passes the deadline, so only the blocked validator times out
+        with patch('validation.multi_pass.validation_pipeline.time', FakeClock()):
+            result = pipeline.validate_error(self.context)
+        
+        errors = result.audit_trail.errors_encountered
+        self.assertTrue(any('contextual validator did not finish within' in error for error in errors))
+        self.assertNotIn('contextual', result.validator_results)
+        self.assertIn('cross_rule', result.validator_results)
+    
+    def test_parallel_batch_matches_sequential(self):
+        """Batch validation gives the same results with concurrent validators."""
+        decisions = {'domain': ValidationDecision.REJECT}
+        contexts = [self.context, ValidationContext(text="Another text.", error_position=0, error_text="Another")]
+        sequential = self._pipeline(self._stub_validators(decisions))
+        parallel = self._pipeline(self._stub_validators(decisions), enable_parallel_validation=True)
+        
+        for expected, actual in zip(sequential.validate_errors(contexts), parallel.validate_errors(contexts)):
+            self.assertEqual(actual.validation_result.decision, expected.validation_result.decision)
+            self.assertEqual(set(actual.validator_results), set(expected.validator_results))
+
+
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
\ No newline at end of file
+    unittest.main(verbosity=2)
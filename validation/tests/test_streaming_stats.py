@@ -0,0 +1,102 @@
+"""
+Test Streaming Statistics
+
+Tests for the constant-memory aggregates used by validator and pipeline metrics.
+"""
+
+import random
+import threading
+
+import pytest
+
+from validation.monitoring.streaming_stats import QuantileSketch, StreamingStats
+
+
+def _exact_percentile(values, percent):
+    ordered = sorted(values)
+    return ordered[int(percent / 100.0 * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    """Test percentile accuracy and merging."""
+    
+    def setup_method(self):
+        """Setup for each test."""
+        self.rng = random.Random(42)
+        self.values = [self.rng.lognormvariate(-4, 1.5) for _ in range(20000)]
+    
+    def test_percentiles_within_relative_accuracy(self):
+        """P50/P95/P99 are within the sketch's relative error of the exact values."""
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in self.values:
+            sketch.add(value)
+        
+        for percent in (50, 95, 99):
+            exact = _exact_percentile(self.values, percent)
+            assert sketch.quantile(percent / 100.0) == pytest.approx(exact, rel=0.02)
+    
+    def test_merge_equals_single_sketch(self):
+        """Merging two sketches gives the same percentiles as one sketch over all values."""
+        combined, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i, value in enumerate(self.values):
+            combined.add(value)
+            (left if i % 2 else right).add(value)
+        
+        left.merge(right)
+        
+        assert left.count == combined.count
+        for q in (0.5, 0.95, 0.99):
+            assert left.quantile(q) == combined.quantile(q)
+    
+    def test_zero_and_empty(self):
+        """Zero values are tracked and an empty sketch reports zero."""
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) == 0.0
+        for value in (0.0, 0.0, 0.0, 1.0):
+            sketch.add(value)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(1.0, rel=0.01)
+
+
+class TestStreamingStats:
+    """Test running aggregates."""
+    
+    def test_summary(self):
+        """Count, mean, min and max are exact; percentiles stay within the observed range."""
+        stats = StreamingStats()
+        stats.extend([0.1, 0.2, 0.3, 0.4])
+        
+        summary = stats.summary(scale=1000)
+        assert summary['count'] == 4
+        assert summary['mean'] == pytest.approx(250.0)
+        assert (summary['min'], summary['max']) == pytest.approx((100.0, 400.0))
+        assert 100.0 <= summary['p50'] <= summary['p95'] <= summary['p99'] <= 400.0
+    
+    def test_concurrent_adds(self):
+        """Concurrent writers lose no values."""
+        stats = StreamingStats()
+        
+        def writer():
+            for _ in range(1000):
+                stats.add(0.5)
+        
+        threads = [threading.Thread(target=writer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert stats.count == 8000
+        assert stats.mean == pytest.approx(0.5)
+    
+    def test_merge(self):
+        """Merged stats cover both streams."""
+        first, second = StreamingStats(), StreamingStats()
+        first.extend([1.0, 2.0])
+        second.extend([3.0])
+        
+        first.merge(second)
+        
+        assert first.count == 3
+        assert first.mean == pytest.approx(2.0)
+        assert first.maximum == 3.0